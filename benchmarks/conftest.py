@@ -0,0 +1,111 @@
+"""Shared fixtures and machine readable output for the benchmark suite.
+
+    uv run pytest benchmarks -s --bench-json=bench.json
+
+Every benchmark hands its `Result` to the `record` fixture. With `--bench-json`
+the session writes them all to one file, stamped with the commit, so two runs
+can be diffed to spot a regression.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fakes import FakeBallchasing, FakeRscApi, build_guild, build_league
+from benchmarks.utils import Result
+
+RESULTS = pytest.StashKey[list[dict]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("rsc benchmarks")
+    group.addoption("--bench-json", default=None, help="Write benchmark results to this JSON file.")
+    group.addoption("--bench-players", type=int, default=5000, help="League players in the generated dataset.")
+    group.addoption("--bench-api-latency-ms", type=float, default=5.0, help="Simulated RSC API and ballchasing latency.")
+    group.addoption("--bench-discord-latency-ms", type=float, default=0.0, help="Simulated Discord REST latency.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[RESULTS] = []
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    path = session.config.getoption("--bench-json")
+    if not path:
+        return
+    opts = session.config.option
+    report = {
+        "commit": _commit(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": {
+            "players": opts.bench_players,
+            "api_latency_ms": opts.bench_api_latency_ms,
+            "discord_latency_ms": opts.bench_discord_latency_ms,
+        },
+        "results": session.config.stash[RESULTS],
+    }
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+@pytest.fixture
+def record(request: pytest.FixtureRequest):
+    """Report a `Result`: printed for humans, kept for `--bench-json`."""
+
+    def _record(result: Result) -> Result:
+        print(result)
+        request.config.stash[RESULTS].append({"test": request.node.nodeid, **result.as_dict()})
+        return result
+
+    return _record
+
+
+@pytest.fixture
+def bench_players(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--bench-players")
+
+
+@pytest.fixture
+def api_latency(request: pytest.FixtureRequest) -> float:
+    return request.config.getoption("--bench-api-latency-ms") / 1000
+
+
+@pytest.fixture
+def discord_latency(request: pytest.FixtureRequest) -> float:
+    return request.config.getoption("--bench-discord-latency-ms") / 1000
+
+
+@pytest.fixture
+def league(bench_players):
+    return build_league(players=bench_players, events=2000)
+
+
+@pytest.fixture
+def guild(league, bench_players, discord_latency):
+    return build_guild(league, spectators=bench_players // 2, latency=discord_latency)
+
+
+@pytest.fixture
+async def rsc_api(league, api_latency):
+    async with FakeRscApi(league, latency=api_latency) as api:
+        yield api
+
+
+@pytest.fixture
+async def bc(api_latency):
+    async with FakeBallchasing(latency=api_latency) as fake:
+        yield fake
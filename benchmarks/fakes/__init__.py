@@ -0,0 +1,31 @@
+"""Offline stand-ins for the RSC API, Discord and ballchasing.
+
+Everything a benchmark talks to is local and deterministic. The RSC API and
+ballchasing fakes are real aiohttp servers, so the cog's own HTTP clients do
+the serialization, pooling and paging they do in production. Discord is faked
+at the object level, since discord.py gives no seam below `Member.add_roles`.
+
+Every fake counts the requests it serves in `.requests`, keyed by route, so a
+benchmark can report round trips alongside wall time.
+"""
+
+from benchmarks.fakes.ballchasing_api import FakeBallchasing
+from benchmarks.fakes.cog import make_cog
+from benchmarks.fakes.config import FakeConfig
+from benchmarks.fakes.dataset import League, build_league
+from benchmarks.fakes.guild import FakeChannel, FakeGuild, FakeMember, FakeRole, build_guild
+from benchmarks.fakes.rsc_api import FakeRscApi
+
+__all__ = [
+    "FakeBallchasing",
+    "FakeChannel",
+    "FakeConfig",
+    "FakeGuild",
+    "FakeMember",
+    "FakeRole",
+    "FakeRscApi",
+    "League",
+    "build_guild",
+    "build_league",
+    "make_cog",
+]
@@ -0,0 +1,188 @@
+"""A local stand-in for ballchasing.com, plus the client the cog talks to it with.
+
+The server keeps groups and replays in memory and behaves like ballchasing
+where the cog depends on it: uploads of bytes it has seen before are a 409
+naming the existing replay, listings are paginated, and a fresh upload stays
+`pending` with no stats until it is processed. Nothing is ever processed here,
+which is the window the cog's upload ledger exists to cover.
+
+`python-ballchasing` has no configurable base URL, so `FakeBallchasing.client`
+implements the handful of `ballchasing.Api` methods the cog calls over HTTP to
+the server. Each method makes the same requests the library does.
+"""
+
+import asyncio
+import hashlib
+from collections import Counter
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import aiohttp
+import ballchasing
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ballchasing.exceptions import DuplicateReplay
+
+PAGE_SIZE = 200
+
+
+class FakeBallchasing:
+    """`async with FakeBallchasing() as bc:` then use `bc.client` as the guild's `ballchasing.Api`."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        # id -> {"id", "name", "parent"}
+        self.groups: dict[str, dict] = {}
+        # id -> {"id", "group", "md5", "status"}
+        self.replays: dict[str, dict] = {}
+        self._server: TestServer | None = None
+        self.client: BallchasingClient | None = None
+
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/groups", self.list_groups)
+        app.router.add_post("/api/groups", self.create_group)
+        app.router.add_get("/api/replays", self.list_replays)
+        app.router.add_get("/api/replays/{id}", self.get_replay)
+        app.router.add_patch("/api/replays/{id}", self.patch_replay)
+        app.router.add_post("/api/v2/upload", self.upload)
+        self.app = app
+
+    async def __aenter__(self) -> "FakeBallchasing":
+        self._server = TestServer(self.app)
+        await self._server.start_server()
+        self.client = BallchasingClient(str(self._server.make_url("")))
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self.client:
+            await self.client.close()
+        if self._server:
+            await self._server.close()
+
+    def add_group(self, name: str, parent: str | None = None) -> str:
+        group_id = f"{name.lower().replace(' ', '-')}-{len(self.groups):04d}"
+        self.groups[group_id] = {"id": group_id, "name": name, "parent": parent}
+        return group_id
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        route = request.match_info.route.resource
+        self.requests[f"{request.method} {route.canonical if route else request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    @staticmethod
+    def _paged(request: web.Request, rows: list[dict]) -> dict:
+        after = int(request.query.get("after", 0))
+        page = rows[after : after + PAGE_SIZE]
+        body: dict = {"list": page, "count": len(rows)}
+        if after + PAGE_SIZE < len(rows):
+            body["next"] = str(request.url.update_query(after=after + PAGE_SIZE))
+        return body
+
+    # Routes
+
+    async def list_groups(self, request: web.Request) -> web.Response:
+        parent = request.query.get("group")
+        name = request.query.get("name")
+        rows = [
+            {"id": g["id"], "name": g["name"]}
+            for g in self.groups.values()
+            if g["parent"] == parent and (name is None or name.casefold() in g["name"].casefold())
+        ]
+        return web.json_response(self._paged(request, rows))
+
+    async def create_group(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        group_id = self.add_group(body["name"], body.get("parent"))
+        return web.json_response({"id": group_id, "link": f"/api/groups/{group_id}"}, status=201)
+
+    async def list_replays(self, request: web.Request) -> web.Response:
+        group = request.query.get("group")
+        rows = [{"id": r["id"], "status": r["status"]} for r in self.replays.values() if r["group"] == group]
+        return web.json_response(self._paged(request, rows))
+
+    async def get_replay(self, request: web.Request) -> web.Response:
+        replay = self.replays.get(request.match_info["id"])
+        if replay is None:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response({"id": replay["id"], "status": replay["status"], "blue": None, "orange": None})
+
+    async def patch_replay(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        replay = self.replays.get(request.match_info["id"])
+        if replay is None:
+            return web.json_response({"error": "not found"}, status=404)
+        replay["group"] = body.get("group", replay["group"])
+        return web.Response(status=204)
+
+    async def upload(self, request: web.Request) -> web.Response:
+        data = await request.post()
+        md5 = hashlib.md5(data["file"].file.read()).hexdigest()
+        existing = next((r for r in self.replays.values() if r["md5"] == md5), None)
+        if existing:
+            return web.json_response({"error": "duplicate replay", "id": existing["id"]}, status=409)
+
+        replay_id = f"replay-{len(self.replays):06d}"
+        self.replays[replay_id] = {"id": replay_id, "group": request.query.get("group"), "md5": md5, "status": "pending"}
+        return web.json_response({"id": replay_id, "location": f"/replay/{replay_id}"}, status=201)
+
+
+def _replay(body: dict) -> SimpleNamespace:
+    status = ballchasing.ReplayStatus[body["status"].upper()] if body.get("status") else None
+    return SimpleNamespace(id=body["id"], status=status, match_guid=body.get("match_guid"), blue=None, orange=None)
+
+
+class BallchasingClient:
+    """The subset of `ballchasing.Api` the cog uses, pointed at a `FakeBallchasing`."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.auth_key = "bench"
+        self._session = aiohttp.ClientSession(headers={"Authorization": self.auth_key})
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def _json(self, method: str, path: str, **kwargs) -> tuple[int, dict]:
+        async with self._session.request(method, f"{self.base_url}{path}", **kwargs) as resp:
+            body = await resp.json() if resp.content_type == "application/json" else {}
+            return resp.status, body
+
+    async def _paginate(self, path: str, params: dict) -> AsyncIterator[dict]:
+        url: str | None = f"{self.base_url}{path}"
+        while url:
+            async with self._session.get(url, params=params) as resp:
+                body = await resp.json()
+            for row in body["list"]:
+                yield row
+            url, params = body.get("next"), {}
+
+    async def get_groups(self, group: str | None = None, name: str | None = None, **kwargs) -> AsyncIterator[SimpleNamespace]:
+        params = {k: v for k, v in {"group": group, "name": name}.items() if v is not None}
+        async for row in self._paginate("/api/groups", params):
+            yield SimpleNamespace(**row)
+
+    async def create_group(self, name: str, parent: str | None = None, **kwargs) -> SimpleNamespace:
+        _, body = await self._json("POST", "/api/groups", json={"name": name, "parent": parent})
+        return SimpleNamespace(**body)
+
+    async def get_group_replays(self, group_id: str, deep: bool = False, recurse: bool = False) -> AsyncIterator[SimpleNamespace]:
+        async for row in self._paginate("/api/replays", {"group": group_id}):
+            if deep:
+                # The library fetches every replay's detail for its stats.
+                _, row = await self._json("GET", f"/api/replays/{row['id']}")
+            yield _replay(row)
+
+    async def upload_replay_from_bytes(self, name: str, replay_data: bytes, visibility=None, group: str | None = None) -> SimpleNamespace:  # noqa: ANN001
+        form = aiohttp.FormData()
+        form.add_field("file", replay_data, filename=name)
+        status, body = await self._json("POST", "/api/v2/upload", params={"group": group or ""}, data=form)
+        if status == 409:
+            raise DuplicateReplay(body)
+        return SimpleNamespace(**body)
+
+    async def patch_replay(self, replay_id: str, **fields) -> None:
+        await self._json("PATCH", f"/api/replays/{replay_id}", json=fields)
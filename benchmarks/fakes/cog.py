@@ -0,0 +1,32 @@
+"""Build just enough of the RSC cog to run one subsystem for real."""
+
+from unittest.mock import MagicMock
+
+from rsc.abc import RSCMixIn
+
+
+def make_cog(*mixins: type[RSCMixIn], **attrs) -> RSCMixIn:
+    """Compose `mixins` into one object without running any `__init__`.
+
+    Skipping `__init__` is deliberate: it is what starts the background task
+    loops and registers Config groups against a real bot. Attributes the mixins
+    would have set there are passed in `attrs`; the ones every API backed mixin
+    needs are defaulted. `RSCMixIn` declares every cross-mixin method abstract
+    for type hinting, so the composite's abstract set is cleared afterwards.
+    """
+    cls = type("BenchCog", mixins, {})
+    cls.__abstractmethods__ = frozenset()
+    cog = object.__new__(cls)
+
+    defaults = {
+        "bot": MagicMock(),
+        "_api_conf": {},
+        "_api_clients": {},
+        "_league": {},
+        "_tier_cache": {},
+        "_franchise_cache": {},
+        "_team_cache": {},
+    }
+    for k, v in {**defaults, **attrs}.items():
+        setattr(cog, k, v)
+    return cog
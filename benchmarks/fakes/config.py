@@ -0,0 +1,68 @@
+"""An in-memory stand-in for Red's `Config`, counting reads and writes.
+
+Red's JSON driver rewrites the whole cog file on every `set()`, so write counts
+are a cost worth reporting next to request counts.
+"""
+
+from collections import Counter
+from copy import deepcopy
+
+
+class _Value:
+    __slots__ = ("_config", "_key", "_scope")
+
+    def __init__(self, config: "FakeConfig", scope: tuple[str, ...], key: str) -> None:
+        self._config = config
+        self._scope = scope
+        self._key = key
+
+    async def __call__(self):
+        self._config.requests["read"] += 1
+        return self._config._data(self._scope)[self._key]
+
+    async def set(self, value) -> None:  # noqa: ANN001
+        self._config.requests["write"] += 1
+        self._config._data(self._scope)[self._key] = value
+
+
+class _Group:
+    __slots__ = ("_config", "_scope")
+
+    def __init__(self, config: "FakeConfig", scope: tuple[str, ...]) -> None:
+        self._config = config
+        self._scope = scope
+
+    def __getattr__(self, key: str) -> _Value:
+        return _Value(self._config, self._scope, key)
+
+    async def all(self) -> dict:
+        self._config.requests["read"] += 1
+        return deepcopy(self._config._data(self._scope))
+
+
+class FakeConfig:
+    """`FakeConfig({"Events": defaults_guild})`, then `config.custom("Events", str(guild.id))`.
+
+    Each custom group is seeded from its registered defaults on first use.
+    `guild(...)` is the custom group "GUILD" keyed by guild id.
+    """
+
+    def __init__(self, defaults: dict[str, dict] | None = None) -> None:
+        self.defaults = defaults or {}
+        self.store: dict[tuple[str, ...], dict] = {}
+        self.requests: Counter[str] = Counter()
+
+    def _data(self, scope: tuple[str, ...]) -> dict:
+        data = self.store.get(scope)
+        if data is None:
+            data = self.store[scope] = deepcopy(self.defaults.get(scope[0], {}))
+        return data
+
+    def custom(self, group: str, *identifiers: str) -> _Group:
+        return _Group(self, (group, *identifiers))
+
+    def guild(self, guild) -> _Group:  # noqa: ANN001
+        return _Group(self, ("GUILD", str(guild.id)))
+
+    def seed(self, group: str, identifier: str, **values) -> None:
+        self._data((group, identifier)).update(values)
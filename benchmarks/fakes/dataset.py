@@ -0,0 +1,226 @@
+"""Deterministic league datasets for the benchmark fakes.
+
+Franchises come straight from `data/franchises.json`, so names, prefixes and
+GMs are real. Tiers, teams, league players, league events and tracker links
+are generated around them from a seeded RNG: the same arguments always produce
+the same league, which is what makes timings from two commits comparable.
+
+Records are plain dicts in the API's JSON shape. The RSC API fake serves them
+as is and the guild fake reads names and discord ids from them.
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from rsc.enums import EventAction, EventCategory, Platform, Status, TrackerLinksStatus
+
+DATA = Path(__file__).parent.parent.parent / "data"
+
+GUILD_ID = 395806681994493964
+LEAGUE_ID = 1
+SEASON = 22
+
+# Highest position first, matching how the API orders tiers.
+TIER_ORDER = ("Premier", "Master", "Elite", "Veteran", "Rival", "Challenger", "Prospect", "Contender", "Amateur")
+
+ROSTER_SIZE = 4
+# Everyone who is not rostered or a GM. Weighted toward the statuses a real
+# league holds most of between seasons.
+UNROSTERED_STATUSES = (
+    (Status.FREE_AGENT, 40),
+    (Status.DRAFT_ELIGIBLE, 25),
+    (Status.FORMER, 20),
+    (Status.PERM_FA, 10),
+    (Status.DROPPED, 5),
+)
+
+# Actions with no entry in `EVENT_HANDLERS`, so an events benchmark measures
+# polling and posting rather than whichever handler a dataset happens to hit.
+EVENT_KINDS = (
+    (EventCategory.TRANSACTION, EventAction.PLAYER_SIGNED),
+    (EventCategory.TRANSACTION, EventAction.PLAYER_CUT),
+    (EventCategory.TRANSACTION, EventAction.PLAYER_RESIGNED),
+    (EventCategory.ANNOUNCEMENT, EventAction.LEAGUE_NOTICE),
+)
+
+# Most links have been pulled at least once. The rest wait on the puller.
+TRACKER_STATUSES = (
+    (TrackerLinksStatus.PULLED, 70),
+    (TrackerLinksStatus.STALE, 10),
+    (TrackerLinksStatus.NEW, 8),
+    (TrackerLinksStatus.REPULL, 5),
+    (TrackerLinksStatus.FAILED, 4),
+    (TrackerLinksStatus.MISSING, 2),
+    (TrackerLinksStatus.INVALID, 1),
+)
+
+_BASE_DISCORD_ID = 500_000_000_000_000_000
+
+LEAGUE = {"id": LEAGUE_ID, "name": "RSC 3v3", "guild_id": GUILD_ID, "league_data": {"max_num_players": 4, "game_mode": "3v3"}}
+
+
+@dataclass
+class League:
+    seed: int
+    franchises: list[dict]
+    tiers: list[dict]
+    teams: list[dict]
+    players: list[dict]
+    events: list[dict] = field(default_factory=list)
+    trackers: list[dict] = field(default_factory=list)
+
+    def franchise_role_name(self, franchise: dict) -> str:
+        return f"{franchise['name']} ({franchise['gm']['rsc_name']})"
+
+
+def _tiers() -> list[dict]:
+    count = len(TIER_ORDER)
+    return [{"id": i + 1, "name": name, "color": None, "position": count - i} for i, name in enumerate(TIER_ORDER)]
+
+
+def _franchise_ref(franchise: dict) -> dict:
+    return {"id": franchise["id"], "name": franchise["name"], "gm": franchise["gm"], "prefix": franchise["prefix"]}
+
+
+def _player(
+    pk: int,
+    name: str,
+    discord_id: int,
+    status: Status,
+    tier: dict | None,
+    team: dict | None,
+    rng: random.Random,
+) -> dict:
+    mmr = rng.randrange(900, 2000, 5)
+    return {
+        "id": pk,
+        "league": LEAGUE,
+        "status": str(status),
+        "season": SEASON,
+        "captain": False,
+        "base_mmr": mmr,
+        "current_mmr": mmr,
+        "contract_length": 1 if team else None,
+        "team": team,
+        "last_updated": "2024-01-01T00:00:00Z",
+        "previous_teams": [],
+        "player": {"name": name, "rsc_id": f"RSC{pk:06d}", "discord_id": discord_id},
+        "tier": tier,
+        "subbing": False,
+        "subbed_out": False,
+    }
+
+
+def _events(count: int, rng: random.Random) -> list[dict]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    events = []
+    for i in range(1, count + 1):
+        category, action = EVENT_KINDS[rng.randrange(len(EVENT_KINDS))]
+        events.append(
+            {
+                "id": i,
+                "league": LEAGUE_ID,
+                "category": str(category),
+                "action": str(action),
+                "severity": "INF",
+                "actor": {"name": f"Admin{i % 7}", "discord_id": _BASE_DISCORD_ID - 1 - i % 7},
+                "object_id": i,
+                "payload": {"player": f"Player{i}", "note": "generated"},
+                "is_public": True,
+                "created_at": (start + timedelta(seconds=i)).isoformat(),
+            }
+        )
+    return events
+
+
+def _trackers(count: int, players: int, rng: random.Random) -> list[dict]:
+    """`count` tracker links spread over the first `players` players, last pulled within two years."""
+    end = datetime(2025, 6, 1, tzinfo=UTC)
+    statuses = [s for s, _ in TRACKER_STATUSES]
+    weights = [w for _, w in TRACKER_STATUSES]
+    platforms = list(Platform)
+    trackers = []
+    for i in range(1, count + 1):
+        n = rng.randrange(max(players, 1))
+        status = rng.choices(statuses, weights)[0]
+        platform = platforms[rng.randrange(len(platforms))]
+        updated = end - timedelta(seconds=rng.randrange(2 * 365 * 86400))
+        trackers.append(
+            {
+                "id": i,
+                "link": f"https://rocketleague.tracker.network/rocket-league/profile/{platform.lower()}/account{i}/overview",
+                "platform": str(platform),
+                "platform_id": f"{i:017d}",
+                "name": f"account{i}",
+                "status": str(status),
+                "last_updated": updated.isoformat() if status != TrackerLinksStatus.NEW else None,
+                "pulls": rng.randrange(1, 40) if status != TrackerLinksStatus.NEW else 0,
+                "discord_id": _BASE_DISCORD_ID + n,
+                "member_name": f"Player{n:05d}",
+                "rscid": f"RSC{n:06d}",
+            }
+        )
+    return trackers
+
+
+def build_league(players: int = 5000, events: int = 0, trackers: int = 0, seed: int = 1) -> League:
+    """A league with `players` league players, `events` league events, `trackers` tracker links
+    and every franchise from data/.
+
+    Each team gets a full roster first, then the remainder are spread across
+    the unrostered statuses. Every franchise GM is an unsigned GM on top.
+    """
+    rng = random.Random(seed)
+    tiers = _tiers()
+    tier_by_name = {t["name"]: t for t in tiers}
+    franchises = json.loads((DATA / "franchises.json").read_text())
+
+    teams: list[dict] = []
+    for f in franchises:
+        f["agms"] = []
+        ftiers = sorted(f["tiers"], key=lambda t: TIER_ORDER.index(t["name"]))
+        for idx, team in enumerate(f["teams"]):
+            tier = tier_by_name[ftiers[idx % len(ftiers)]["name"]]
+            teams.append({"id": team["id"], "name": team["name"], "franchise": _franchise_ref(f), "tier": tier})
+
+    result: list[dict] = []
+    pk = 1
+
+    for f in franchises:
+        gm = f["gm"]
+        result.append(_player(pk, gm["rsc_name"], gm["discord_id"], Status.UNSIGNED_GM, None, None, rng))
+        pk += 1
+
+    statuses = [s for s, _ in UNROSTERED_STATUSES]
+    weights = [w for _, w in UNROSTERED_STATUSES]
+    for n in range(players):
+        name = f"Player{n:05d}"
+        discord_id = _BASE_DISCORD_ID + n
+        team = teams[n // ROSTER_SIZE] if n < len(teams) * ROSTER_SIZE else None
+        if team:
+            team_ref = {"name": team["name"], "franchise": team["franchise"], "id": team["id"]}
+            result.append(_player(pk, name, discord_id, Status.ROSTERED, team["tier"], team_ref, rng))
+        else:
+            status = rng.choices(statuses, weights)[0]
+            tier = tiers[rng.randrange(len(tiers))] if status != Status.FORMER else None
+            result.append(_player(pk, name, discord_id, status, tier, None, rng))
+        pk += 1
+
+    # Up to two AGMs per franchise, each rostered player used at most once.
+    rostered = [p for p in result if p["status"] == Status.ROSTERED]
+    agms = rng.sample(rostered, min(len(rostered), 2 * len(franchises)))
+    for i, p in enumerate(agms):
+        franchises[i // 2]["agms"].append({"rsc_name": p["player"]["name"], "discord_id": p["player"]["discord_id"]})
+
+    return League(
+        seed=seed,
+        franchises=franchises,
+        tiers=tiers,
+        teams=teams,
+        players=result,
+        events=_events(events, rng),
+        trackers=_trackers(trackers, players, rng),
+    )
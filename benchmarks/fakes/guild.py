@@ -0,0 +1,247 @@
+"""A Discord guild with thousands of members, without a gateway.
+
+`MagicMock(spec=discord.Member)` is what the unit tests use, but building
+thousands of them costs seconds and tens of megabytes, which would swamp the
+memory numbers of anything iterating a guild. These are plain slotted objects
+that report the discord.py class from `__class__`, the same trick `spec` uses,
+so `isinstance` checks in the cog still pass.
+
+Every call that would be a REST request is counted in `FakeGuild.requests`
+under discord.py's route template, and optionally delayed by `latency`. Role
+changes go one request per role, as `Member.add_roles` does by default.
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+import discord
+
+from benchmarks.fakes.dataset import GUILD_ID, League
+from rsc import const
+
+# Roles `rsc.utils.utils` looks up by name. A missing one raises mid sync.
+LEAGUE_ROLES = (
+    const.AGM_ROLE,
+    const.CAPTAIN_ROLE,
+    const.DEV_LEAGUE_ROLE,
+    const.FORMER_GM_ROLE,
+    const.FORMER_PLAYER_ROLE,
+    const.FREE_AGENT_ROLE,
+    const.GM_ROLE,
+    const.IR_ROLE,
+    const.LEAGUE_ROLE,
+    const.MUTED_ROLE,
+    const.PERM_FA_ROLE,
+    const.PERM_FA_WAITING_ROLE,
+    const.SPECTATOR_ROLE,
+    const.SUBBED_OUT_ROLE,
+    const.DRAFT_ELIGIBLE,
+)
+
+_ROLE_ID_BASE = 900_000_000_000_000_000
+_CHANNEL_ID_BASE = 800_000_000_000_000_000
+_SPECTATOR_ID_BASE = 700_000_000_000_000_000
+
+
+class FakeRole:
+    __slots__ = ("guild", "id", "name", "position")
+
+    def __init__(self, guild: "FakeGuild", id: int, name: str, position: int) -> None:
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.position = position
+
+    @property
+    def __class__(self):  # noqa: ANN204
+        return discord.Role
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+    @property
+    def members(self) -> list["FakeMember"]:
+        # discord.py scans the member cache too.
+        return [m for m in self.guild.members if self in m.roles]
+
+    def is_default(self) -> bool:
+        return self.id == self.guild.id
+
+    def __repr__(self) -> str:
+        return f"<FakeRole id={self.id} name={self.name!r}>"
+
+
+class FakeMember:
+    __slots__ = ("guild", "id", "joined_at", "name", "nick", "roles")
+
+    bot = False
+    status = discord.Status.offline
+    activities = ()
+
+    def __init__(self, guild: "FakeGuild", id: int, name: str, nick: str | None = None) -> None:
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.nick = nick
+        self.roles: list[FakeRole] = [guild.default_role]
+        self.joined_at = datetime(2024, 1, 1, tzinfo=UTC)
+
+    @property
+    def __class__(self):  # noqa: ANN204
+        return discord.Member
+
+    @property
+    def display_name(self) -> str:
+        return self.nick or self.name
+
+    @property
+    def global_name(self) -> str:
+        return self.name
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def get_role(self, role_id: int) -> FakeRole | None:
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    async def add_roles(self, *roles: FakeRole, reason: str | None = None, atomic: bool = True) -> None:
+        if not atomic:
+            await self.edit(roles=[*self.roles, *(r for r in roles if r not in self.roles)])
+            return
+        for role in roles:
+            await self.guild.request("PUT", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            if role not in self.roles:
+                self.roles.append(role)
+
+    async def remove_roles(self, *roles: FakeRole, reason: str | None = None, atomic: bool = True) -> None:
+        if not atomic:
+            await self.edit(roles=[r for r in self.roles if r not in roles])
+            return
+        for role in roles:
+            await self.guild.request("DELETE", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            if role in self.roles:
+                self.roles.remove(role)
+
+    async def edit(self, *, nick: str | None = discord.utils.MISSING, roles: Iterable[FakeRole] = discord.utils.MISSING, **kwargs) -> None:
+        await self.guild.request("PATCH", "/guilds/{guild_id}/members/{user_id}")
+        if nick is not discord.utils.MISSING:
+            self.nick = nick
+        if roles is not discord.utils.MISSING:
+            self.roles = [self.guild.default_role, *(r for r in roles if not r.is_default())]
+
+    async def send(self, *args, **kwargs) -> None:
+        await self.guild.request("POST", "/users/@me/channels")
+        await self.guild.request("POST", "/channels/{channel_id}/messages")
+
+    def __repr__(self) -> str:
+        return f"<FakeMember id={self.id} name={self.name!r}>"
+
+
+class FakeChannel:
+    __slots__ = ("guild", "id", "name", "sent")
+
+    def __init__(self, guild: "FakeGuild", id: int, name: str) -> None:
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.sent: list[dict] = []
+
+    @property
+    def __class__(self):  # noqa: ANN204
+        return discord.TextChannel
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    async def send(self, content: str | None = None, **kwargs) -> None:
+        await self.guild.request("POST", "/channels/{channel_id}/messages")
+        self.sent.append({"content": content, **kwargs})
+
+
+class FakeGuild:
+    def __init__(self, id: int = GUILD_ID, name: str = "RSC 3v3", latency: float = 0.0) -> None:
+        self.id = id
+        self.name = name
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.icon = None
+        self.default_role = FakeRole(self, id, "@everyone", 0)
+        self.roles: list[FakeRole] = [self.default_role]
+        self.channels: list[FakeChannel] = []
+        self._members: dict[int, FakeMember] = {}
+        self.me = FakeMember(self, 1, "RSC Bot")
+
+    @property
+    def __class__(self):  # noqa: ANN204
+        return discord.Guild
+
+    async def request(self, method: str, route: str) -> None:
+        self.requests[f"{method} {route}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    @property
+    def members(self) -> list[FakeMember]:
+        return list(self._members.values())
+
+    @property
+    def member_count(self) -> int:
+        return len(self._members)
+
+    @property
+    def text_channels(self) -> list[FakeChannel]:
+        return list(self.channels)
+
+    def get_member(self, user_id: int) -> FakeMember | None:
+        return self._members.get(user_id)
+
+    def get_role(self, role_id: int) -> FakeRole | None:
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    def get_channel(self, channel_id: int) -> FakeChannel | None:
+        return next((c for c in self.channels if c.id == channel_id), None)
+
+    get_channel_or_thread = get_channel
+
+    def add_role(self, name: str) -> FakeRole:
+        role = FakeRole(self, _ROLE_ID_BASE + len(self.roles), name, len(self.roles))
+        self.roles.append(role)
+        return role
+
+    def add_member(self, id: int, name: str, nick: str | None = None) -> FakeMember:
+        member = self._members[id] = FakeMember(self, id, name, nick)
+        return member
+
+    def add_channel(self, name: str) -> FakeChannel:
+        channel = FakeChannel(self, _CHANNEL_ID_BASE + len(self.channels), name)
+        self.channels.append(channel)
+        return channel
+
+
+def build_guild(league: League, spectators: int = 0, latency: float = 0.0) -> FakeGuild:
+    """A guild holding every league player from `league` plus `spectators` non players.
+
+    Members start with no roles and no nickname, as if they had just joined,
+    so the first sync over this guild does the full amount of work.
+    """
+    guild = FakeGuild(latency=latency)
+    for name in LEAGUE_ROLES:
+        guild.add_role(name)
+    for tier in league.tiers:
+        guild.add_role(tier["name"])
+        guild.add_role(f"{tier['name']}FA")
+    for franchise in league.franchises:
+        guild.add_role(league.franchise_role_name(franchise))
+
+    for p in league.players:
+        player = p["player"]
+        if player["discord_id"] and guild.get_member(player["discord_id"]) is None:
+            guild.add_member(player["discord_id"], player["name"])
+    for i in range(spectators):
+        guild.add_member(_SPECTATOR_ID_BASE + i, f"Spectator{i:05d}")
+    return guild
@@ -0,0 +1,187 @@
+"""A local aiohttp server standing in for the RSC API.
+
+Serves a `League` on the same paths and in the same JSON envelopes the real
+API uses, so the generated `rscapi` client does its own request building,
+deserialization and offset paging against it. Only the filters the cog sends
+on the benchmarked paths are honoured; the rest are accepted and ignored.
+
+A route the fake does not know returns 404 and is still counted, so a
+benchmark touching a new endpoint fails loudly and names it.
+"""
+
+import asyncio
+from collections import Counter
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from rscapi import Configuration
+
+from benchmarks.fakes.dataset import League
+
+API_PREFIX = "/api/v1"
+DEFAULT_PAGE_SIZE = 100
+
+
+def _int(request: web.Request, key: str, default: int | None = None) -> int | None:
+    value = request.query.get(key)
+    return int(value) if value not in (None, "") else default
+
+
+def _page(request: web.Request, rows: list[dict]) -> dict:
+    """Django REST framework's limit/offset envelope. `limit=0` is every row, as on the RSC API."""
+    limit = _int(request, "limit", DEFAULT_PAGE_SIZE)
+    offset = _int(request, "offset", 0) or 0
+    if limit == 0:
+        return {"count": len(rows), "next": None, "previous": None, "results": rows[offset:]}
+    end = offset + limit
+    nxt = None
+    if end < len(rows):
+        nxt = str(request.url.update_query(offset=end, limit=limit))
+    return {"count": len(rows), "next": nxt, "previous": None, "results": rows[offset:end]}
+
+
+def _member(discord_id: int, username: str, rsc_name: str, rsc_id: str) -> dict:
+    return {
+        "username": username,
+        "rsc_id": rsc_id,
+        "elevated_roles": [],
+        "player_leagues": [],
+        "rsc_name": rsc_name,
+        "discord_id": discord_id,
+    }
+
+
+class FakeRscApi:
+    """`async with FakeRscApi(league) as api:` then point the cog at `api.configuration()`.
+
+    `latency` is added to every response. Loopback round trips are tens of
+    microseconds, which would hide exactly the per request cost a benchmark is
+    looking for.
+    """
+
+    def __init__(self, league: League, latency: float = 0.0) -> None:
+        self.league = league
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self._server: TestServer | None = None
+        # RSC members by discord ID. Seeded from the league, grows on POST.
+        self.members: dict[int, dict] = {}
+        self.reset_members()
+
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(f"{API_PREFIX}/league-players/", self.league_players)
+        app.router.add_get(f"{API_PREFIX}/tiers/", self.tiers)
+        app.router.add_get(f"{API_PREFIX}/franchises/", self.franchises)
+        app.router.add_get(f"{API_PREFIX}/teams/", self.teams)
+        app.router.add_get(f"{API_PREFIX}/integrations/events/", self.events)
+        app.router.add_get(f"{API_PREFIX}/members/", self.list_members)
+        app.router.add_post(f"{API_PREFIX}/members/", self.create_member)
+        app.router.add_get(f"{API_PREFIX}/tracker-links/", self.tracker_links)
+        self.app = app
+
+    async def __aenter__(self) -> "FakeRscApi":
+        self._server = TestServer(self.app)
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._server:
+            await self._server.close()
+
+    @property
+    def host(self) -> str:
+        if not self._server:
+            raise RuntimeError("FakeRscApi is not running.")
+        return str(self._server.make_url(API_PREFIX))
+
+    def configuration(self) -> Configuration:
+        """Client configuration for the cog, shaped like `RSC.prepare_api` builds it."""
+        return Configuration(host=self.host, api_key={"Api-Key": "bench"}, api_key_prefix={"Api-Key": "Api-Key"})
+
+    def reset_members(self) -> None:
+        """Forget every member created since start, keeping the league's own."""
+        self.members.clear()
+        for p in self.league.players:
+            player = p["player"]
+            if player["discord_id"]:
+                self.members[player["discord_id"]] = _member(player["discord_id"], player["name"], player["name"], player["rsc_id"])
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        route = request.match_info.route.resource
+        self.requests[f"{request.method} {route.canonical if route else request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    # Routes
+
+    async def league_players(self, request: web.Request) -> web.Response:
+        rows = self.league.players
+        if status := request.query.get("status"):
+            rows = [p for p in rows if p["status"] == status]
+        if discord_id := _int(request, "discord_id"):
+            rows = [p for p in rows if p["player"]["discord_id"] == discord_id]
+        if tier_name := request.query.get("tier_name"):
+            rows = [p for p in rows if p["tier"] and p["tier"]["name"] == tier_name]
+        if team_name := request.query.get("team_name"):
+            rows = [p for p in rows if p["team"] and p["team"]["name"] == team_name]
+        return web.json_response(_page(request, rows))
+
+    async def tiers(self, request: web.Request) -> web.Response:
+        rows = self.league.tiers
+        if name := request.query.get("name"):
+            rows = [t for t in rows if t["name"] == name]
+        return web.json_response(rows)
+
+    async def franchises(self, request: web.Request) -> web.Response:
+        rows = self.league.franchises
+        if gm_discord_id := _int(request, "gm_discord_id"):
+            rows = [f for f in rows if f["gm"]["discord_id"] == gm_discord_id]
+        if name := request.query.get("name"):
+            rows = [f for f in rows if f["name"] == name]
+        if prefix := request.query.get("prefix"):
+            rows = [f for f in rows if f["prefix"] == prefix]
+        return web.json_response(rows)
+
+    async def teams(self, request: web.Request) -> web.Response:
+        rows = self.league.teams
+        if franchise := request.query.get("franchise"):
+            rows = [t for t in rows if t["franchise"]["name"] == franchise]
+        if name := request.query.get("name"):
+            rows = [t for t in rows if t["name"] == name]
+        return web.json_response(rows)
+
+    async def events(self, request: web.Request) -> web.Response:
+        rows = self.league.events
+        if (id__gt := _int(request, "id__gt")) is not None:
+            rows = [e for e in rows if e["id"] > id__gt]
+        rows = sorted(rows, key=lambda e: e["id"], reverse=request.query.get("ordering") == "-id")
+        return web.json_response(_page(request, rows))
+
+    async def list_members(self, request: web.Request) -> web.Response:
+        if discord_id := _int(request, "discord_id"):
+            member = self.members.get(discord_id)
+            rows = [member] if member else []
+        else:
+            rows = list(self.members.values())
+        if rsc_name := request.query.get("rsc_name"):
+            rows = [m for m in rows if m["rsc_name"] == rsc_name]
+        return web.json_response(_page(request, rows))
+
+    async def create_member(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        if data["discord_id"] in self.members:
+            return web.json_response({"detail": "Member already exists."}, status=400)
+        member = self.members[data["discord_id"]] = _member(
+            data["discord_id"], data["username"], data["rsc_name"], f"RSC{900000 + len(self.members):06d}"
+        )
+        return web.json_response(member, status=201)
+
+    async def tracker_links(self, request: web.Request) -> web.Response:
+        rows = self.league.trackers
+        if status := request.query.get("status"):
+            rows = [t for t in rows if t["status"] == status]
+        if discord_id := _int(request, "discord_id"):
+            rows = [t for t in rows if t["discord_id"] == discord_id]
+        return web.json_response(_page(request, rows))
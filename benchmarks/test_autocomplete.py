@@ -0,0 +1,72 @@
+"""Slash command autocomplete over caches filled from the RSC API stub.
+
+Autocomplete has a 3 second deadline and fires on every keystroke, so the
+per call cost matters more than the total.
+
+    uv run pytest benchmarks/test_autocomplete.py -s
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.fakes import make_cog
+from benchmarks.fakes.dataset import GUILD_ID, LEAGUE_ID
+from benchmarks.utils import ameasure
+from rsc.franchises.franchises import FranchiseMixIn
+from rsc.teams.teams import TeamMixIn
+from rsc.tiers.tiers import TierMixIn
+
+pytestmark = pytest.mark.benchmark
+
+# Empty, common prefixes, a full name and a miss.
+QUERIES = ("", "t", "th", "the", "an", "elite", "shadows", "zzz")
+KEYSTROKES = 200
+
+
+@pytest.fixture
+async def cog(rsc_api, guild):
+    cog = make_cog(
+        FranchiseMixIn,
+        TeamMixIn,
+        TierMixIn,
+        _api_conf={GUILD_ID: rsc_api.configuration()},
+        _league={GUILD_ID: LEAGUE_ID},
+    )
+    yield cog
+    await cog.close_api_clients()
+
+
+async def test_populate_caches(cog, rsc_api, guild, record):
+    async def populate():
+        await cog.franchises(guild)
+        await cog.teams(guild)
+        await cog.tiers(guild)
+
+    record(await ameasure("autocomplete_caches", populate, runs=3, sources={"rsc_api": rsc_api.requests}))
+    assert cog._franchise_cache[GUILD_ID]
+    assert cog._team_cache[GUILD_ID]
+
+
+@pytest.mark.parametrize("name", ["franchise_autocomplete", "teams_autocomplete", "tier_autocomplete"])
+async def test_autocomplete(cog, rsc_api, guild, record, name):
+    await cog.franchises(guild)
+    await cog.teams(guild)
+    await cog.tiers(guild)
+
+    interaction = SimpleNamespace(guild_id=GUILD_ID)
+    autocomplete = getattr(cog, name)
+
+    async def keystrokes():
+        for i in range(KEYSTROKES):
+            await autocomplete(interaction, QUERIES[i % len(QUERIES)])
+
+    result = await ameasure(
+        f"{name}[x{KEYSTROKES}]",
+        keystrokes,
+        runs=5,
+        sources={"rsc_api": rsc_api.requests},
+        params={"keystrokes": KEYSTROKES, "queries": list(QUERIES)},
+    )
+    record(result)
+    assert not result.requests["rsc_api"]
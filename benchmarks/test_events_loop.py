@@ -0,0 +1,75 @@
+"""`rsc_events_loop` draining a league event backlog across several guilds.
+
+Each run starts every guild 300 events behind and runs a few loop ticks, with
+every guild due on each one. `SEND_PACING_DELAY` is zeroed: the pacing sleep is
+deliberate and would otherwise be most of the wall time.
+
+    uv run pytest benchmarks/test_events_loop.py -s
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from benchmarks.fakes import FakeConfig, FakeGuild, make_cog
+from benchmarks.fakes.dataset import GUILD_ID, LEAGUE_ID
+from benchmarks.utils import ameasure
+from rsc.events import events as events_module
+from rsc.events.events import EventMixIn, defaults_guild
+
+pytestmark = pytest.mark.benchmark
+
+BACKLOG = 300
+TICKS = 4
+
+
+@pytest.mark.parametrize("guild_count", [1, 8])
+async def test_events_loop(rsc_api, league, record, monkeypatch, guild_count, discord_latency):
+    monkeypatch.setattr(events_module, "SEND_PACING_DELAY", 0)
+
+    guilds = [FakeGuild(id=GUILD_ID + i, name=f"RSC {i}", latency=discord_latency) for i in range(guild_count)]
+    conf = rsc_api.configuration()
+    cog = make_cog(
+        EventMixIn,
+        config=FakeConfig({"Events": defaults_guild}),
+        _api_conf={g.id: conf for g in guilds},
+        _league={g.id: LEAGUE_ID for g in guilds},
+        _event_state={},
+    )
+    cog.bot.guilds = guilds
+    channels = {g.id: g.add_channel("league-events") for g in guilds}
+    start_id = league.events[-1]["id"] - BACKLOG
+
+    async def setup():
+        cog._event_state.clear()
+        for g in guilds:
+            cog.config.seed(
+                "Events",
+                str(g.id),
+                EventsEnabled=True,
+                EventChannel=channels[g.id].id,
+                ConfirmedId=start_id,
+                ConfirmedCreatedAt=datetime.now(UTC).isoformat(),
+                SeenIds=[],
+            )
+
+    async def run():
+        for _ in range(TICKS):
+            for state in cog._event_state.values():
+                state.next_due = 0.0
+            await EventMixIn.rsc_events_loop.coro(cog)
+
+    try:
+        result = await ameasure(
+            f"rsc_events_loop[guilds={guild_count}]",
+            run,
+            runs=3,
+            setup=setup,
+            sources={"rsc_api": rsc_api.requests, "discord[guild0]": guilds[0].requests, "config": cog.config.requests},
+            params={"guilds": guild_count, "ticks": TICKS, "backlog": BACKLOG},
+        )
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
+    assert channels[guilds[0].id].sent
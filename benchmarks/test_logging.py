@@ -0,0 +1,97 @@
+"""Event loop lag while the cog logs at DEBUG, with and without `QueuedLogging`.
+
+A heartbeat task sleeps 1ms at a time and records how late it wakes. Alongside
+it, a workload logs bursts of debug lines, each with a `pformat`ed payload the
+size of a trade or draft schema, through a file handler that takes
+`WRITE_DELAY` per record, as Red's file handler does on a slow or busy disk.
+"Direct" is the handler on the logger, as before; "queued" is the same handler
+behind `QueuedLogging`.
+
+    uv run pytest benchmarks/test_logging.py -s
+"""
+
+import asyncio
+import logging
+import time
+from pprint import pformat
+from statistics import median, quantiles
+
+import pytest
+
+from benchmarks.utils import Result
+from rsc.logs import Deferred, GuildLogAdapter, QueuedLogging
+
+pytestmark = pytest.mark.benchmark
+
+BURSTS = 40
+BURST_SIZE = 25
+WRITE_DELAY = 0.0005
+HEARTBEAT = 0.001
+PAYLOAD = {f"player_{i}": {"team": f"Team {i % 16}", "mmr": 1000 + i, "tier": "Elite"} for i in range(10)}
+
+
+class SlowFileHandler(logging.FileHandler):
+    def emit(self, record):
+        super().emit(record)
+        self.flush()
+        time.sleep(WRITE_DELAY)
+
+
+async def _lag_under_logging(log: GuildLogAdapter) -> list[float]:
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT)
+            lags.append(time.perf_counter() - start - HEARTBEAT)
+
+    async def workload():
+        for burst in range(BURSTS):
+            for i in range(BURST_SIZE):
+                log.debug("Schema %d.%d: %s", burst, i, Deferred(pformat, PAYLOAD))
+            await asyncio.sleep(HEARTBEAT)
+        done.set()
+
+    await asyncio.gather(heartbeat(), workload())
+    return lags
+
+
+def _result(name: str, lags: list[float]) -> Result:
+    p99 = quantiles(lags, n=100, method="inclusive")[98]
+    return Result(
+        name=name,
+        runs=len(lags),
+        best=min(lags),
+        median=median(lags),
+        peak_bytes=0,
+        params={"p99_ms": round(p99 * 1000, 3), "max_ms": round(max(lags) * 1000, 3), "records": BURSTS * BURST_SIZE},
+    )
+
+
+async def test_loop_lag_under_debug_logging(tmp_path, record):
+    logger = logging.getLogger("red.rsc.benchmarks.logging")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = SlowFileHandler(tmp_path / "rsc.log")
+    logger.addHandler(handler)
+    log = GuildLogAdapter(logger)
+    try:
+        direct = _result("debug logging direct", await _lag_under_logging(log))
+
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        try:
+            off_loop = _result("debug logging queued", await _lag_under_logging(log))
+        finally:
+            queued.stop()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    for result in (record(direct), record(off_loop)):
+        print(f"  p99 {result.params['p99_ms']}ms max {result.params['max_ms']}ms")
+
+    assert (tmp_path / "rsc.log").read_text().count("Schema") == 2 * BURSTS * BURST_SIZE
+    assert off_loop.median < direct.median
@@ -0,0 +1,74 @@
+"""A burst of joins through the `on_member_join` batch pipeline.
+
+Models a season start: 500 joins arrive at once, most of them league players
+the API already knows and the rest brand new members it has to create. Every
+member should cost exactly one PATCH, and the welcomes a handful of messages.
+
+    uv run pytest benchmarks/test_member_joins.py -s
+"""
+
+import pytest
+
+from benchmarks.fakes import FakeConfig, FakeGuild, make_cog
+from benchmarks.fakes.dataset import GUILD_ID
+from benchmarks.utils import ameasure
+from rsc.members.joins import JoinQueue
+from rsc.members.members import MemberMixIn
+from rsc.welcome.welcome import WelcomeMixIn, defaults_guild
+
+pytestmark = pytest.mark.benchmark
+
+JOINS = 500
+NEW_MEMBERS = 150
+
+
+async def test_join_burst(rsc_api, league, record, discord_latency):
+    guild = FakeGuild(latency=discord_latency)
+    roles = [guild.add_role("Spectator"), guild.add_role("Welcome")]
+    channel = guild.add_channel("welcome")
+
+    # GMs can appear twice in the league, so dedupe by discord ID
+    players = {p["player"]["discord_id"]: p["player"] for p in league.players if p["player"]["discord_id"]}
+    known = list(players.values())[: JOINS - NEW_MEMBERS]
+    joined = [guild.add_member(p["discord_id"], p["name"]) for p in known]
+    joined += [guild.add_member(GUILD_ID + 1 + i, f"Newcomer{i:03d}") for i in range(NEW_MEMBERS)]
+
+    config = FakeConfig({"Welcome": defaults_guild})
+    config.seed(
+        "Welcome", str(guild.id), WelcomeRoles=[r.id for r in roles], WelcomeChannel=channel.id, WelcomeMsg="Welcome {member.mention}!"
+    )
+    cog = make_cog(MemberMixIn, WelcomeMixIn, config=config, _api_conf={guild.id: rsc_api.configuration()})
+    cog._joins = JoinQueue(cog.process_joins, window=0.05)
+
+    async def setup():
+        rsc_api.reset_members()
+        channel.sent.clear()
+        for m in joined:
+            m.roles = [guild.default_role]
+            m.nick = None
+
+    async def burst():
+        for m in joined:
+            await cog.on_join_member_processing(m)
+        await cog._joins.join()
+
+    try:
+        result = await ameasure(
+            f"join_burst[joins={JOINS}]",
+            burst,
+            runs=3,
+            setup=setup,
+            sources={"rsc_api": rsc_api.requests, "discord": guild.requests, "config": config.requests},
+            params={"joins": JOINS, "new": NEW_MEMBERS},
+        )
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
+    discord_requests = result.requests["discord"]
+    assert discord_requests["PATCH /guilds/{guild_id}/members/{user_id}"] == JOINS
+    assert not any(route.startswith("PUT") for route in discord_requests)
+    assert discord_requests["POST /channels/{channel_id}/messages"] < JOINS // 10
+    assert result.requests["rsc_api"]["POST /api/v1/members/"] == NEW_MEMBERS
+    assert all(r in m.roles for m in joined for r in roles)
+    assert all(m.nick == p["name"] for m, p in zip(joined, known, strict=False))
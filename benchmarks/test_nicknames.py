@@ -0,0 +1,80 @@
+"""Display name parsing over a league sized corpus.
+
+Names come from the generated league: rostered players under their franchise
+prefix, everyone else under "FA", and a seeded share of them with accolades.
+Each pass reprefixes every name and reads its accolades, as a rebrand or a
+mass trophy does. The legacy pass is the helpers from before `NicknameCodec`,
+one string scan each.
+
+    uv run pytest benchmarks/test_nicknames.py -s
+"""
+
+import random
+
+import pytest
+
+from benchmarks.utils import timeit
+from rsc import const
+from rsc.types import Accolades
+from rsc.utils.nicknames import NicknameCodec
+
+pytestmark = pytest.mark.benchmark
+
+ACCOLADES = (const.TROPHY_EMOJI, const.STAR_EMOJI, const.DEV_LEAGUE_EMOJI, const.COOKIE_EMOJI, const.COMBINE_CUP_EMOJI)
+
+
+def _legacy_accolades(display_name: str) -> Accolades:
+    return Accolades(
+        trophy=display_name.count(const.TROPHY_EMOJI),
+        star=display_name.count(const.STAR_EMOJI),
+        devleague=display_name.count(const.DEV_LEAGUE_EMOJI) + display_name.count(const.COOKIE_EMOJI) * 4,
+        combine_cup=display_name.count(const.COMBINE_CUP_EMOJI),
+    )
+
+
+def _legacy_reprefix(display_name: str, prefix: str) -> str:
+    """What `format_discord_prefix` did: accolades, `remove_prefix`, then `strip_discord_accolades`."""
+    accolades = _legacy_accolades(display_name)
+    parts = display_name.split(" | ", maxsplit=1)
+    name = parts[-1].strip()
+    for emoji in ACCOLADES:
+        name = name.replace(emoji, "")
+    return f"{prefix} | {name.strip()} {accolades}".strip()
+
+
+@pytest.fixture
+def corpus(league) -> list[str]:
+    rng = random.Random(league.seed)
+    names = []
+    for p in league.players:
+        team = p["team"]
+        prefix = team["franchise"]["prefix"] if team else "FA"
+        accolades = ""
+        if rng.random() < 0.2:
+            accolades = str(Accolades(trophy=rng.randrange(3), star=rng.randrange(2), devleague=rng.randrange(6)))
+        names.append(f"{prefix} | {p['player']['name']} {accolades}".strip())
+    return names
+
+
+def test_nickname_codec(corpus):
+    def legacy():
+        for name in corpus:
+            _legacy_reprefix(name, "NEW")
+            _legacy_accolades(name)
+
+    def codec_pass(codec: NicknameCodec):
+        for name in corpus:
+            codec.reprefix(name, "NEW")
+            codec.parse(name).accolades
+
+    legacy_t = timeit("legacy", legacy, runs=10)
+    cold_t = timeit("codec cold", lambda: codec_pass(NicknameCodec()), runs=10)
+    warm = NicknameCodec()
+    codec_pass(warm)
+    warm_t = timeit("codec warm", lambda: codec_pass(warm), runs=10)
+
+    print(f"\n[{len(corpus)} names] {legacy_t}\n[{len(corpus)} names] {cold_t}\n[{len(corpus)} names] {warm_t}")
+
+    # Every name was parsed once, then served from the cache
+    assert warm.misses == len(set(corpus))
+    assert warm_t.median < legacy_t.median
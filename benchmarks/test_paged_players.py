@@ -0,0 +1,39 @@
+"""`LeagueMixIn.paged_players` over the whole league, through the real API client.
+
+    uv run pytest benchmarks/test_paged_players.py -s
+"""
+
+import pytest
+
+from benchmarks.fakes import make_cog
+from benchmarks.fakes.dataset import GUILD_ID, LEAGUE_ID
+from benchmarks.utils import ameasure
+from rsc.leagues.leagues import LeagueMixIn
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("per_page", [100, 500])
+async def test_paged_players(rsc_api, guild, league, record, per_page):
+    cog = make_cog(LeagueMixIn, _api_conf={GUILD_ID: rsc_api.configuration()}, _league={GUILD_ID: LEAGUE_ID})
+    seen = 0
+
+    async def run():
+        nonlocal seen
+        seen = 0
+        async for _ in cog.paged_players(guild, per_page=per_page):
+            seen += 1
+
+    try:
+        result = await ameasure(
+            f"paged_players[per_page={per_page}]",
+            run,
+            runs=3,
+            sources={"rsc_api": rsc_api.requests},
+            params={"players": len(league.players), "per_page": per_page},
+        )
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
+    assert seen == len(league.players)
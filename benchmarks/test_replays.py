@@ -0,0 +1,112 @@
+"""Replay parsing and `process_match_replays` against the ballchasing stub.
+
+A match night is modelled as every match reported at once by one team, then
+reported again by the other. The second round should upload nothing: the
+replays are still `pending` on the stub, so only the upload ledger can tell
+they are already there.
+
+    uv run pytest benchmarks/test_replays.py -s
+"""
+
+import asyncio
+import copy
+import dataclasses
+import json
+from hashlib import md5
+from pathlib import Path
+
+import pytest
+from rscapi.models.match import Match
+
+from benchmarks.fakes import FakeConfig, FakeGuild, make_cog
+from benchmarks.utils import ameasure
+from rsc.ballchasing import process
+from rsc.ballchasing.ballchasing import BallchasingMixIn, defaults_guild
+
+ROOT = Path(__file__).parent.parent
+REPLAYS = sorted((ROOT / "tests" / "fixtures" / "replays").glob("*.replay"))
+MATCH = json.loads((ROOT / "data" / "match.json").read_text())
+
+pytestmark = pytest.mark.benchmark
+
+
+def _matches(count: int) -> list[Match]:
+    matches = []
+    for i in range(count):
+        data = copy.deepcopy(MATCH)
+        data["id"] = 1000 + i
+        data["home_team"]["name"] = f"Home {i:02d}"
+        data["away_team"]["name"] = f"Away {i:02d}"
+        matches.append(Match.from_dict(data))
+    return matches
+
+
+async def test_build_candidates(record):
+    sources = [p.read_bytes() for p in REPLAYS]
+    result = await ameasure(
+        "build_candidates",
+        lambda: process.build_candidates(sources),
+        runs=3,
+        params={"replays": len(sources), "bytes": sum(len(s) for s in sources)},
+    )
+    record(result)
+
+
+@pytest.mark.parametrize("match_count", [1, 24])
+async def test_process_match_replays(bc, record, match_count):
+    guild = FakeGuild()
+    config = FakeConfig({"Ballchasing": defaults_guild})
+    cog = make_cog(
+        BallchasingMixIn,
+        config=config,
+        _ballchasing_api={guild.id: bc.client},
+        _bc_match_locks={},
+        _bc_group_locks={},
+        _bc_group_cache={},
+        _bc_upload_ledger={},
+    )
+
+    base = (await process.build_candidates([REPLAYS[0].read_bytes()]))[0]
+    matches = _matches(match_count)
+    # One distinct file per match. Ballchasing rejects byte identical uploads
+    # across its whole site, not just within a group.
+    candidates = {}
+    for m in matches:
+        data = base.data + m.id.to_bytes(4, "big")
+        candidates[m.id] = [dataclasses.replace(base, data=data, digest=md5(data).hexdigest())]
+
+    async def setup():
+        bc.groups.clear()
+        bc.replays.clear()
+        config.seed("Ballchasing", str(guild.id), TopLevelGroup=bc.add_group("RSC Bench"))
+        cog._bc_group_cache.clear()
+        cog._bc_upload_ledger.clear()
+
+    async def report_all():
+        return await asyncio.gather(*(cog.process_match_replays(guild, m, candidates[m.id]) for m in matches))
+
+    params = {"matches": match_count}
+    first = await ameasure(
+        f"process_match_replays[matches={match_count}]",
+        report_all,
+        runs=3,
+        setup=setup,
+        sources={"ballchasing": bc.requests},
+        params=params,
+    )
+    record(first)
+
+    await setup()
+    await report_all()
+    again = await ameasure(
+        f"process_match_replays[matches={match_count},rereport]",
+        report_all,
+        runs=3,
+        sources={"ballchasing": bc.requests},
+        params=params,
+    )
+    record(again)
+
+    results = await report_all()
+    assert all(r.uploaded == 0 for r in results)
+    assert "POST /api/v2/upload" not in again.requests["ballchasing"]
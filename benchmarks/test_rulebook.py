@@ -0,0 +1,111 @@
+"""Rulebook load and query latency, compiled artifact vs parsing the markdown.
+
+Load times include the thread hop `load_rulebooks` makes. Query baselines are
+the previous implementations: lowercasing every hit's text per search,
+filtering the whole book by number prefix per subtree render, and rendering
+every hit section then truncating to gather rules sub-agent context.
+
+    uv run pytest benchmarks/test_rulebook.py -s
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.utils import atimeit, timeit
+from rsc.llm import rulebook
+from rsc.llm.agent.subagents import _gather_sections, _pack_sections
+from rsc.llm.config import RULES_SUBAGENT_MAX_CONTEXT_CHARS, RULES_SUBAGENT_MAX_SECTIONS
+from rsc.llm.rulebook import RuleBook, load_rulebooks, render_rule, search_rules, select_book
+
+QUERIES = (
+    "can a permFA sub up to a higher tier",
+    "what happens if a team forfeits a match",
+    "how many players can a franchise keep on the roster",
+    "responsibilities of a committee member",
+    "penalty for toxic behavior in chat",
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def _legacy_render(book: RuleBook, number: str) -> str:
+    index = rulebook.loaded_rulebooks()[book]
+    entry = index.entries[number]
+    prefix = f"{number}."
+    return "\n".join([entry.text, *(index.entries[num].text for num in index.order if num.startswith(prefix))])
+
+
+def _legacy_rescore() -> None:
+    """The per-hit lowercasing `search_rules` used to do, on every match."""
+    for query in QUERIES:
+        phrase = " ".join(query.lower().split())
+        for hit in search_rules(query, limit=10_000):
+            _ = phrase in hit.entry.text.lower()
+            _ = hit.entry.title.lower()
+
+
+def _hit_sections(question: str, book: RuleBook) -> list[str]:
+    sections: list[str] = []
+    for hit in search_rules(question, book=book, limit=RULES_SUBAGENT_MAX_SECTIONS * 2):
+        if hit.entry.section not in sections:
+            sections.append(hit.entry.section)
+        if len(sections) >= RULES_SUBAGENT_MAX_SECTIONS:
+            break
+    return sections
+
+
+def _legacy_assemble(book: RuleBook, sections: list[str]) -> str:
+    """Sub-agent context before the rendered-section cache: render every hit section, then truncate."""
+    chunks = [text for section in sections if (text := render_rule(book, section, include_children=True))]
+    return "\n\n".join(chunks)[:RULES_SUBAGENT_MAX_CONTEXT_CHARS]
+
+
+def _assemble(book: RuleBook, sections: list[str]) -> str:
+    return "\n\n".join(rendered.text for rendered in _pack_sections(book, sections))[:RULES_SUBAGENT_MAX_CONTEXT_CHARS]
+
+
+async def test_rulebook_load(tmp_path: Path):
+    parse = await atimeit("parse", lambda: load_rulebooks(force=True), runs=10)
+    await load_rulebooks(force=True, cache_dir=tmp_path)
+    compiled = await atimeit("compiled", lambda: load_rulebooks(force=True, cache_dir=tmp_path), runs=10)
+
+    print(f"\n{parse}\n{compiled}")
+    assert compiled.median < parse.median
+
+
+async def test_rulebook_queries():
+    indexes = await load_rulebooks(force=True)
+    competitive = indexes[RuleBook.COMPETITIVE]
+    sections = [number for number in competitive.order if competitive.entries[number].depth == 1]
+
+    legacy_render = timeit("render legacy", lambda: [_legacy_render(RuleBook.COMPETITIVE, n) for n in sections])
+    render = timeit("render slice", lambda: [render_rule(RuleBook.COMPETITIVE, n) for n in sections])
+    legacy_search = timeit("search legacy", _legacy_rescore, runs=20)
+    search = timeit("search", lambda: [search_rules(q, limit=10_000) for q in QUERIES], runs=20)
+
+    print(f"\n{legacy_render}\n{render}\n{legacy_search}\n{search}")
+    assert [_legacy_render(RuleBook.COMPETITIVE, n) for n in sections] == [render_rule(RuleBook.COMPETITIVE, n) for n in sections]
+    assert render.median < legacy_render.median
+
+
+async def test_rules_subagent_gather():
+    """Section assembly alone, then the whole gather including search.
+
+    Search costs the same either way and dominates the end-to-end figure, so
+    the assembly step is timed separately over each question's hit sections.
+    """
+    await load_rulebooks(force=True)
+    questions = [(select_book(q), _hit_sections(q, select_book(q))) for q in QUERIES]
+
+    def cold():
+        rulebook._RENDERED.clear()
+        return [_assemble(book, sections) for book, sections in questions]
+
+    legacy = timeit("assemble legacy", lambda: [_legacy_assemble(book, sections) for book, sections in questions], runs=200)
+    cold_assemble = timeit("assemble cold", cold, runs=200)
+    warm = timeit("assemble warm", lambda: [_assemble(book, sections) for book, sections in questions], runs=200)
+    gather = timeit("gather warm (with search)", lambda: [_gather_sections(q, select_book(q)) for q in QUERIES], runs=20)
+
+    print(f"\n{legacy}\n{cold_assemble}\n{warm}\n{gather}")
+    assert warm.median < legacy.median
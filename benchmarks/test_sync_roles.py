@@ -0,0 +1,73 @@
+"""The nightly `sync_discord_roles` loop against a full size guild.
+
+Cold is every member freshly joined with no roles, the worst case. Warm is a
+second pass over an already synced guild, the common case, where any Discord
+request at all is wasted work.
+
+    uv run pytest benchmarks/test_sync_roles.py -s
+"""
+
+import pytest
+
+from benchmarks.fakes import FakeConfig, make_cog
+from benchmarks.fakes.dataset import GUILD_ID, LEAGUE_ID
+from benchmarks.utils import ameasure
+from rsc.admin.sync import AdminSyncMixIn
+from rsc.devleague.devleague import DevLeagueMixIn
+from rsc.franchises.franchises import FranchiseMixIn
+from rsc.leagues.leagues import LeagueMixIn
+from rsc.tiers.tiers import TierMixIn
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+async def cog(rsc_api, guild):
+    cog = make_cog(
+        AdminSyncMixIn,
+        TierMixIn,
+        FranchiseMixIn,
+        LeagueMixIn,
+        DevLeagueMixIn,
+        config=FakeConfig({"DevLeague": {"DevLeagueRoleUsers": []}}),
+        _api_conf={GUILD_ID: rsc_api.configuration()},
+        _league={GUILD_ID: LEAGUE_ID},
+    )
+    cog.bot.guilds = [guild]
+    yield cog
+    await cog.close_api_clients()
+
+
+def _reset(guild):
+    async def setup():
+        for m in guild.members:
+            m.roles = [guild.default_role]
+            m.nick = None
+
+    return setup
+
+
+async def test_sync_roles_cold(cog, rsc_api, guild, league, record):
+    result = await ameasure(
+        "sync_discord_roles[cold]",
+        lambda: AdminSyncMixIn.sync_discord_roles.coro(cog),
+        runs=2,
+        setup=_reset(guild),
+        sources={"rsc_api": rsc_api.requests, "discord": guild.requests, "config": cog.config.requests},
+        params={"players": len(league.players), "members": guild.member_count},
+    )
+    record(result)
+    assert result.requests["discord"]
+
+
+async def test_sync_roles_warm(cog, rsc_api, guild, league, record):
+    await AdminSyncMixIn.sync_discord_roles.coro(cog)
+
+    result = await ameasure(
+        "sync_discord_roles[warm]",
+        lambda: AdminSyncMixIn.sync_discord_roles.coro(cog),
+        runs=3,
+        sources={"rsc_api": rsc_api.requests, "discord": guild.requests, "config": cog.config.requests},
+        params={"players": len(league.players), "members": guild.member_count},
+    )
+    record(result)
@@ -0,0 +1,114 @@
+"""`/trackers recent` and `/trackers old` lookups over 50,000 tracker links.
+
+Both commands fetch every link of the status in one unbounded (`limit=0`)
+request. `sort` is how `recent` picked its 25 rows before, sorting the whole
+list; `nlargest` selects them with a heap instead. `old_new` is `/trackers old`
+for NEW links, which never have been pulled and is answered by one count-only
+request.
+
+    uv run pytest benchmarks/test_trackers.py -s
+"""
+
+import heapq
+from datetime import UTC, datetime
+
+import pytest
+
+from benchmarks.fakes import FakeGuild, FakeRscApi, build_league, make_cog
+from benchmarks.fakes.dataset import GUILD_ID
+from benchmarks.utils import ameasure
+from rsc.enums import TrackerLinksStatus
+from rsc.trackers.trackers import NEVER_UPDATED, TrackerMixIn
+
+pytestmark = pytest.mark.benchmark
+
+TRACKERS = 50_000
+STATUS = TrackerLinksStatus.PULLED
+CUTOFF = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def tracker_league():
+    return build_league(players=5000, trackers=TRACKERS)
+
+
+@pytest.fixture
+async def tracker_api(tracker_league, api_latency):
+    async with FakeRscApi(tracker_league, latency=api_latency) as api:
+        yield api
+
+
+@pytest.fixture
+def guild():
+    return FakeGuild(id=GUILD_ID, name="RSC")
+
+
+@pytest.fixture
+def cog(tracker_api):
+    return make_cog(TrackerMixIn, _api_conf={GUILD_ID: tracker_api.configuration()})
+
+
+def _key(t):
+    return t.last_updated or NEVER_UPDATED
+
+
+@pytest.mark.parametrize("select", ["sort", "nlargest"])
+async def test_trackers_recent(cog, tracker_api, guild, record, select):
+    async def run():
+        trackers = await cog.trackers(guild, STATUS)
+        if select == "sort":
+            return sorted(trackers, key=_key, reverse=True)[:25]
+        return heapq.nlargest(25, trackers, key=_key)
+
+    try:
+        result = await ameasure(
+            f"trackers[recent_{select}]",
+            run,
+            runs=3,
+            sources={"rsc_api": tracker_api.requests},
+            params={"trackers": TRACKERS},
+        )
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
+
+
+async def test_trackers_old(cog, tracker_api, guild, record):
+    async def run():
+        trackers = await cog.trackers(guild, STATUS)
+        return sum(1 for t in trackers if not t.last_updated or t.last_updated.date() < CUTOFF.date())
+
+    try:
+        result = await ameasure(
+            "trackers[old_pulled]",
+            run,
+            runs=3,
+            sources={"rsc_api": tracker_api.requests},
+            params={"trackers": TRACKERS},
+        )
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
+
+
+async def test_trackers_old_new(cog, tracker_api, tracker_league, guild, record):
+    new = sum(1 for t in tracker_league.trackers if t["status"] == TrackerLinksStatus.NEW)
+
+    async def run():
+        return await cog.tracker_count(guild, TrackerLinksStatus.NEW)
+
+    try:
+        result = await ameasure(
+            "trackers[old_new]",
+            run,
+            runs=3,
+            sources={"rsc_api": tracker_api.requests},
+            params={"trackers": TRACKERS, "new": new},
+        )
+        assert await run() == new
+    finally:
+        await cog.close_api_clients()
+
+    record(result)
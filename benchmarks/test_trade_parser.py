@@ -0,0 +1,128 @@
+"""Trade text parsing against a 32 franchise league.
+
+The fixture is `data/franchises.json`. Every franchise list request is given a
+fixed simulated latency so the numbers reflect round trips saved, not how fast
+a mock returns.
+
+    uv run pytest benchmarks/test_trade_parser.py -s
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+from rscapi.models.franchise_list import FranchiseList
+
+from benchmarks.utils import atimeit
+from rsc.franchises.index import FranchiseIndex
+from rsc.transactions.transactions import TransactionMixIn
+from rsc.utils import utils
+
+DATA = Path(__file__).parent.parent / "data" / "franchises.json"
+# Round trip to the RSC API from the bot host is typically 30-80ms.
+API_LATENCY = 0.03
+
+pytestmark = pytest.mark.benchmark
+
+
+def _create_mixin(**attrs):
+    saved = TransactionMixIn.__abstractmethods__
+    TransactionMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(TransactionMixIn)
+    finally:
+        TransactionMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+@pytest.fixture
+def franchises() -> list[FranchiseList]:
+    return [FranchiseList.from_dict(f) for f in json.loads(DATA.read_text())]
+
+
+@pytest.fixture
+def guild(franchises):
+    members = {}
+    for f in franchises:
+        m = MagicMock(spec=discord.Member)
+        m.id = f.gm.discord_id
+        m.display_name = f"{f.prefix} | {f.gm.rsc_name}"
+        members[m.id] = m
+
+    g = MagicMock(spec=discord.Guild)
+    g.id = 1
+    g.name = "Bench"
+    g.get_member = MagicMock(side_effect=members.get)
+    g.gm_members = list(members.values())
+    return g
+
+
+def _trade_text(franchises: list[FranchiseList], teams: int) -> str:
+    """A picks-only trade between the last `teams` franchises in role order.
+
+    Picks only, so player lookups (a separate API call per player) do not mask
+    the GM resolution being measured.
+    """
+    gms = [f.gm.rsc_name for f in franchises[-teams:]]
+    blocks = []
+    for i, gm in enumerate(gms):
+        source = gms[(i + 1) % len(gms)]
+        blocks.append(f"{gm} receives:\n{source}'s 1st Round Premier ({i + 1})\n{source}'s S30 2nd Round Elite")
+    return "\n---\n".join(blocks)
+
+
+async def _legacy_resolve(guild, franchises: list[FranchiseList], text: str) -> list[FranchiseList]:
+    """The GM resolution `parse_trade_text` used to do.
+
+    Two full GM role scans through `remove_prefix`, then one franchise request
+    per GM line.
+    """
+    resolved = []
+    for line in text.splitlines():
+        if not line.endswith(" receives:"):
+            continue
+        gm_str = line.removesuffix(" receives:").strip().lower()
+        for _ in range(2):
+            for m in guild.gm_members:
+                if (await utils.remove_prefix(m)).lower().startswith(gm_str):
+                    break
+        await asyncio.sleep(API_LATENCY)
+        resolved.append(next(f for f in franchises if f.gm.rsc_name.lower().startswith(gm_str)))
+    return resolved
+
+
+@pytest.mark.parametrize("teams", [2, 4, 8])
+async def test_trade_parser(guild, franchises, teams):
+    text = _trade_text(franchises, teams)
+    league_role = MagicMock(spec=discord.Role)
+    league_role.members = []
+
+    async def fetch_franchises(g, **kwargs):
+        await asyncio.sleep(API_LATENCY)
+        mixin._franchise_index[g.id] = FranchiseIndex.from_franchises(franchises)
+        return franchises
+
+    mixin = _create_mixin(_franchise_index={})
+    mixin.franchises = AsyncMock(side_effect=fetch_franchises)
+
+    with patch.object(utils, "get_league_role", AsyncMock(return_value=league_role)):
+        legacy = await atimeit("legacy", lambda: _legacy_resolve(guild, franchises, text), runs=5)
+
+        async def cold():
+            mixin.invalidate_franchise_index(guild)
+            return await mixin.parse_trade_text(guild, text)
+
+        cold_t = await atimeit("index cold", cold, runs=5)
+        mixin.franchises.reset_mock()
+        warm_t = await atimeit("index warm", lambda: mixin.parse_trade_text(guild, text), runs=50)
+
+    print(f"\n[{teams} teams] {legacy}\n[{teams} teams] {cold_t}\n[{teams} teams] {warm_t}")
+
+    # A warm parse is a pure in-memory pass.
+    mixin.franchises.assert_not_called()
+    assert warm_t.median < legacy.median
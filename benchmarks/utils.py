@@ -0,0 +1,112 @@
+"""Timing helpers shared by the benchmark suite."""
+
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from statistics import median
+
+
+@dataclass
+class Timing:
+    name: str
+    runs: int
+    best: float
+    median: float
+
+    def __str__(self) -> str:
+        return f"{self.name}: best {self.best * 1000:.3f}ms median {self.median * 1000:.3f}ms over {self.runs} runs"
+
+
+async def atimeit(name: str, fn: Callable[[], Awaitable[object]], runs: int = 50) -> Timing:
+    """Time an async callable. Reports best and median, not mean, to damp scheduler noise."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return Timing(name=name, runs=runs, best=min(samples), median=median(samples))
+
+
+def timeit(name: str, fn: Callable[[], object], runs: int = 50) -> Timing:
+    """Synchronous counterpart of `atimeit`."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return Timing(name=name, runs=runs, best=min(samples), median=median(samples))
+
+
+@dataclass
+class Result:
+    """One benchmark measurement, in the shape written to `--bench-json`."""
+
+    name: str
+    runs: int
+    best: float
+    median: float
+    peak_bytes: int
+    # source (rsc_api, discord, ...) -> route -> count, from the last timed run
+    requests: dict[str, dict[str, int]] = field(default_factory=dict)
+    params: dict[str, object] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        total = {source: sum(routes.values()) for source, routes in self.requests.items()}
+        reqs = " ".join(f"{source}={count}" for source, count in total.items())
+        return (
+            f"{self.name}: best {self.best * 1000:.3f}ms median {self.median * 1000:.3f}ms over {self.runs} runs, "
+            f"peak {self.peak_bytes / 1024:.0f}KiB {reqs}".rstrip()
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+async def ameasure(
+    name: str,
+    fn: Callable[[], Awaitable[object]],
+    *,
+    runs: int = 5,
+    setup: Callable[[], Awaitable[object]] | None = None,
+    sources: Mapping[str, Counter[str]] | None = None,
+    params: Mapping[str, object] | None = None,
+) -> Result:
+    """Time `fn`, count the requests it makes, and measure its peak allocation.
+
+    `setup` runs untimed before every call, for benchmarks that consume their
+    own state. `sources` are the fakes' request counters, cleared before each
+    run. Peak memory comes from one extra traced run: tracemalloc slows
+    allocation heavy code severalfold, so it never overlaps the timed ones.
+    """
+    sources = sources or {}
+    samples = []
+    for _ in range(runs):
+        if setup:
+            await setup()
+        for counter in sources.values():
+            counter.clear()
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    requests = {source: dict(sorted(counter.items())) for source, counter in sources.items()}
+
+    if setup:
+        await setup()
+    tracemalloc.start()
+    try:
+        await fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=name,
+        runs=runs,
+        best=min(samples),
+        median=median(samples),
+        peak_bytes=peak,
+        requests=requests,
+        params=dict(params or {}),
+    )
@@ -7,7 +7,6 @@ from os import PathLike
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-from aiohttp import web
 import discord
 from aiohttp.web_runner import AppRunner, TCPSite
 from discord.ext.commands import CogMeta as DPYCogMeta
@@ -58,10 +57,18 @@ from rsc.enums import (
     TrackerLinksStatus,
     TransactionType,
 )
+from rsc.assets import Asset, AssetHost
+from rsc.metrics import instrument_api_client
+from rsc.webhooks import WebhookRoute
 
 if TYPE_CHECKING:
+    from rsc.admin.membership import MembershipAudit
+    from rsc.combines.lobbies import CombineLobbyRegistry
     from rsc.combines.models import CombinesLobby
     from rsc.events.models import EventPage, LeagueEventData
+    from rsc.franchises.index import FranchiseIndex
+    from rsc.matches.cache import SeasonCache
+    from rsc.members.joins import WelcomePlan
     from rsc.utils.dm import DMHelper
 
 
@@ -91,6 +98,9 @@ class RSCMixIn(ABC):
 
     _dm_helper: "DMHelper"
 
+    # Static images uploaded once to each guild's asset channel. See attach_asset().
+    _asset_host: AssetHost
+
     # Core
 
     @asynccontextmanager
@@ -111,6 +121,7 @@ class RSCMixIn(ABC):
         client = cache.get(guild.id)
         if client is None:
             client = ApiClient(self._api_conf[guild.id])
+            instrument_api_client(client)
             cache[guild.id] = client
         yield client
 
@@ -126,9 +137,35 @@ class RSCMixIn(ABC):
             except Exception as exc:
                 logger.warning(f"Error closing API client for guild {guild_id}: {exc}")
 
+    def asset_host(self) -> AssetHost:
+        # Lazily initialized: a mixin used standalone has not run RSC.__init__.
+        host = getattr(self, "_asset_host", None)
+        if host is None:
+            host = self._asset_host = AssetHost()
+        return host
+
+    async def attach_asset(self, guild: discord.Guild, asset: Asset, files: list[discord.File]) -> str:
+        """URL that shows `asset` in an embed.
+
+        With an asset channel configured this is the copy uploaded there, so the
+        same bytes are not re-uploaded with every announcement. Otherwise, or if
+        that upload fails, `asset` is appended to `files` and referenced as an
+        attachment of the message being built.
+        """
+        channel = await self._get_asset_channel(guild)
+        if channel:
+            url = await self.asset_host().url(channel, asset)
+            if url:
+                return url
+        files.append(asset.file())
+        return f"attachment://{asset.name}"
+
     @abstractmethod
     async def timezone(self, guild: discord.Guild) -> ZoneInfo: ...
 
+    @abstractmethod
+    async def _get_asset_channel(self, guild: discord.Guild) -> discord.TextChannel | None: ...
+
     @abstractmethod
     async def _get_api_url(self, guild: discord.Guild) -> str | None: ...
 
@@ -171,6 +208,9 @@ class RSCMixIn(ABC):
     @abstractmethod
     async def _get_dates(self, guild: discord.Guild) -> str: ...
 
+    @abstractmethod
+    def membership_audit(self) -> "MembershipAudit": ...
+
     # @abstractmethod
     # async def _set_permfa_announce_chnanel(
     #     self, guild: discord.Guild, channel: discord.TextChannel
@@ -189,6 +229,9 @@ class RSCMixIn(ABC):
 
     # Combines
 
+    @abstractmethod
+    def combine_lobbies(self) -> "CombineLobbyRegistry": ...
+
     @abstractmethod
     async def combine_players_from_lobby(self, guild: discord.Guild, lobby: "CombinesLobby") -> list[discord.Member]: ...
 
@@ -292,6 +335,12 @@ class RSCMixIn(ABC):
     @abstractmethod
     async def agm_franchise_map(self, guild: discord.Guild) -> dict[int, FranchiseList]: ...
 
+    @abstractmethod
+    async def franchise_index(self, guild: discord.Guild) -> "FranchiseIndex": ...
+
+    @abstractmethod
+    def invalidate_franchise_index(self, guild: discord.Guild | int) -> None: ...
+
     # League
 
     @abstractmethod
@@ -310,7 +359,7 @@ class RSCMixIn(ABC):
     ) -> LeaguePlayer: ...
 
     @abstractmethod
-    async def league_player_update_handler(self, request: web.Request): ...
+    def league_webhook_routes(self) -> list[WebhookRoute]: ...
 
     @abstractmethod
     async def leagues(self, guild: discord.Guild) -> list[League]: ...
@@ -401,6 +450,17 @@ class RSCMixIn(ABC):
         per_page: int = 100,
     ) -> AsyncIterator[LeaguePlayer]: ...
 
+    @abstractmethod
+    def player_pages(
+        self,
+        guild: discord.Guild,
+        status: Status | None = None,
+        season: int | None = None,
+        per_page: int = 100,
+        prefetch: int = 4,
+        total: int | None = None,
+    ) -> AsyncIterator[list[LeaguePlayer]]: ...
+
     @abstractmethod
     async def league_seasons(self, guild: discord.Guild) -> list[Season]: ...
 
@@ -458,6 +518,12 @@ class RSCMixIn(ABC):
     @abstractmethod
     async def is_match_day(self, guild: discord.Guild) -> bool: ...
 
+    @abstractmethod
+    def season_cache(self) -> "SeasonCache": ...
+
+    @abstractmethod
+    def invalidate_season_cache(self, guild: discord.Guild | int) -> None: ...
+
     @abstractmethod
     async def matches(
         self,
@@ -798,6 +864,13 @@ class RSCMixIn(ABC):
         offset: int = 0,
     ) -> list[TrackerLink]: ...
 
+    @abstractmethod
+    async def tracker_count(
+        self,
+        guild: discord.Guild,
+        status: TrackerLinksStatus | None = None,
+    ) -> int: ...
+
     @abstractmethod
     async def tracker_stats(
         self,
@@ -896,6 +969,9 @@ class RSCMixIn(ABC):
     @abstractmethod
     async def _get_welcome_roles(self, guild: discord.Guild) -> list[discord.Role]: ...
 
+    @abstractmethod
+    async def welcome_plan(self, guild: discord.Guild) -> "WelcomePlan": ...
+
     @abstractmethod
     async def add_devleague_role(self, member: discord.Member): ...
 
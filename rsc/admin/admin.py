@@ -8,6 +8,7 @@ from redbot.core import app_commands
 from redbot.core.app_commands import Transform
 
 from rsc.abc import RSCMixIn
+from rsc.admin.membership import MembershipAudit
 from rsc.admin.modals import BulkRetireModal, LeagueDatesModal
 from rsc.admin.models import BulkRetireResult
 from rsc.embeds import (
@@ -56,6 +57,7 @@ defaults_guild = AdminSettings(
     IntentDmLastSeason=None,
     IntentDmLastRun=None,
     IntentDmLastExecutor=None,
+    MatchImports={},
     PermFAChannel=None,
     PermFAMsgIds=None,
     RetireAuditEnabled=True,
@@ -289,7 +291,7 @@ class AdminMixIn(RSCMixIn):
                     notes=notes,
                     override=True,
                 )
-                log.debug(f"Bulk Retire Result: {result}", guild=guild)
+                log.debug("Bulk Retire Result: %s", result, guild=guild)
 
                 if member:
                     await update_nonplaying_discord(
@@ -423,7 +425,7 @@ class AdminMixIn(RSCMixIn):
         channel = guild.get_channel(channel_id)
         if not isinstance(channel, discord.TextChannel):
             return None
-        log.debug(f"Intent Channel: {channel}")
+        log.debug("Intent Channel: %s", channel)
         return channel
 
     async def _set_intent_missing_role(self, guild: discord.Guild, role: discord.Role):
@@ -432,12 +434,19 @@ class AdminMixIn(RSCMixIn):
     async def _get_intent_missing_role(self, guild: discord.Guild) -> discord.Role | None:
         role_id = await self.config.custom("Admin", str(guild.id)).IntentMissingRole()
         role = guild.get_role(role_id)
-        log.debug(f"Intent Missing Role: {role}")
+        log.debug("Intent Missing Role: %s", role)
         return role
 
     async def _set_intent_missing_message(self, guild: discord.Guild, msg: str):
         await self.config.custom("Admin", str(guild.id)).IntentMissingMsg.set(msg)
 
+    def membership_audit(self) -> MembershipAudit:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        audit = getattr(self, "_membership_audit", None)
+        if audit is None:
+            audit = self._membership_audit = MembershipAudit()
+        return audit
+
     async def _get_intent_missing_message(self, guild: discord.Guild) -> str | None:
         return await self.config.custom("Admin", str(guild.id)).IntentMissingMsg()
 
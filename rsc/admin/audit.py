@@ -153,7 +153,7 @@ class AdminAuditMixIn(AdminMixIn):
 
         if user:
             async for entry in guild.audit_logs(action=audit_action, limit=limit, before=before_arg, after=after_arg, user=user):
-                log.debug(f"Entry: {entry}")
+                log.debug("Entry: %s", entry)
         else:
             async for entry in guild.audit_logs(action=audit_action, limit=limit, before=before_arg, after=after_arg):
-                log.debug(f"Entry: {entry}")
+                log.debug("Entry: %s", entry)
@@ -32,6 +32,8 @@ from rsc.teams import TeamMixIn
 from rsc.tiers import TierMixIn
 from rsc.types import RebrandTeamDict
 from rsc.utils import utils
+from rsc.utils.nicknames import apply_nicknames, errors_embed, plan_nicknames
+from rsc.utils.roles import interaction_progress
 from rsc.views import LinkButton
 
 if TYPE_CHECKING:
@@ -93,7 +95,7 @@ class AdminFranchiseMixIn(AdminMixIn):
 
         try:
             result = await self.create_team(guild, franchise=franchise, tier=tier, name=name)
-            log.debug(f"Result: {result}")
+            log.debug("Result: %s", result)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -234,7 +236,7 @@ class AdminFranchiseMixIn(AdminMixIn):
         # Remove old emoji. Discord API doesn't let us update it in place
         old_emoji = await utils.emoji_from_prefix(guild, fdata.prefix)
         if old_emoji:
-            log.debug(f"Deleting old franchise emoji: {old_emoji.name}")
+            log.debug("Deleting old franchise emoji: %s", old_emoji.name)
             await old_emoji.delete(reason="Updating emoji to new logo")
         else:
             await interaction.followup.send(content=f"Unable to find franchise emoji ({fdata.prefix}). It has not been removed.")
@@ -244,7 +246,7 @@ class AdminFranchiseMixIn(AdminMixIn):
         max_emoji_size = 256000  # 256kb
 
         # Make sure we have enough emoji slots
-        log.debug(f"[{guild.name}] Max Emojis: {max_emojis} Emoji Size: {max_emoji_size}")
+        log.debug("[%s] Max Emojis: %s Emoji Size: %s", guild.name, max_emojis, max_emoji_size)
         if len(guild.emojis) >= max_emojis:
             await interaction.followup.send(
                 embed=ErrorEmbed(
@@ -259,12 +261,12 @@ class AdminFranchiseMixIn(AdminMixIn):
             return
 
         # Validate image size for emoji/icon. Resize to 128x128 if needed.
-        log.debug(f"Img Size: {len(logo_bytes)}")
+        log.debug("Img Size: %s", len(logo_bytes))
         if len(logo_bytes) >= max_emoji_size:
             log.debug("Image is too large... resizing to 128x128")
             orig_size = len(logo_bytes)
             logo_bytes = await utils.img_to_thumbnail(logo_bytes, 128, 128, "PNG")
-            log.debug(f"New Img Size: {len(logo_bytes)}")
+            log.debug("New Img Size: %s", len(logo_bytes))
             # Final size validation
             if len(logo_bytes) >= max_emoji_size:
                 await interaction.followup.send(
@@ -301,7 +303,7 @@ class AdminFranchiseMixIn(AdminMixIn):
         log.debug("Franchise role display icon was updated.")
 
         # Validate emoji name
-        log.debug(f"Emoji Name: {fdata.prefix}")
+        log.debug("Emoji Name: %s", fdata.prefix)
         if not await utils.valid_emoji_name(fdata.prefix):
             await interaction.followup.send(
                 embed=YellowEmbed(
@@ -317,7 +319,7 @@ class AdminFranchiseMixIn(AdminMixIn):
 
         # Recreate emoji
         new_emoji = await guild.create_custom_emoji(name=fdata.prefix, image=logo_bytes, reason=f"{franchise} has a new logo")
-        log.debug(f"New franchise emoji: {new_emoji.name}")
+        log.debug("New franchise emoji: %s", new_emoji.name)
 
         full_logo_url = await self.full_logo_url(guild, result.logo)
 
@@ -463,7 +465,7 @@ class AdminFranchiseMixIn(AdminMixIn):
             tdetails.append(TeamRebrand(tier=r["tier_id"], name=r["name"]))  # noqa: PERF401
 
         # Rebrand Franchise
-        log.debug(f"Rebranding {franchise} to {rebrand_modal.name}")
+        log.debug("Rebranding %s to %s", franchise, rebrand_modal.name)
         rebrand = FranchiseRebrand(
             name=rebrand_modal.name,
             prefix=rebrand_modal.prefix,
@@ -496,20 +498,20 @@ class AdminFranchiseMixIn(AdminMixIn):
         # Update transaction channel
         trans_channel = await self.get_franchise_transaction_channel(guild, franchise)
         if trans_channel:
-            log.debug(f"Before position: {trans_channel.position}")
+            log.debug("Before position: %s", trans_channel.position)
             rebrand_fmt = await self.get_franchise_transaction_channel_name(rebrand_modal.name)
             trans_channel = await trans_channel.edit(name=rebrand_fmt)
             if trans_channel.category:
                 # Debug print
-                log.debug(f"Category Channel Count: {len(trans_channel.category.channels)}")
+                log.debug("Category Channel Count: %s", len(trans_channel.category.channels))
                 for c in trans_channel.category.channels:
-                    log.debug(f"Channel: {c.name} Position: {c.position}")
+                    log.debug("Channel: %s Position: %s", c.name, c.position)
 
                 channels = sorted(trans_channel.category.channels, key=lambda x: x.name)
                 min_idx = min(c.position for c in trans_channel.category.channels)
-                log.debug(f"Min Index: {min_idx}")
+                log.debug("Min Index: %s", min_idx)
                 idx = channels.index(trans_channel) + 1
-                log.debug(f"Transaction Channel Index: {idx} ({min_idx + idx})")
+                log.debug("Transaction Channel Index: %s (%s)", idx, min_idx + idx)
                 await trans_channel.edit(position=min_idx + idx)
         else:
             await interaction.followup.send(
@@ -527,15 +529,18 @@ class AdminFranchiseMixIn(AdminMixIn):
         await frole.edit(name=f"{rebrand_modal.name} ({new_fdata.gm.rsc_name})")
 
         # Update all prefix
-        try:
-            for m in frole.members:
-                name = await utils.remove_prefix(m)
-                await m.edit(nick=f"{rebrand_modal.prefix} | {name}")
-        except discord.Forbidden as exc:
-            await interaction.followup.send(
-                content=f"Unable to update nickname {m.mention}: `{exc}`",
-                ephemeral=True,
-            )
+        async def rebrand_nick(m: discord.Member) -> str:
+            return f"{rebrand_modal.prefix} | {await utils.remove_prefix(m)}"
+
+        plan = await plan_nicknames(frole.members, rebrand_nick)
+        await apply_nicknames(
+            guild,
+            plan,
+            reason="Franchise was rebranded",
+            progress=interaction_progress(rebrand_modal.interaction, "Franchise Rebrand"),
+        )
+        if plan.errors():
+            await interaction.followup.send(embed=errors_embed(plan, "Rebrand Nickname Errors"), ephemeral=True)
 
         # Update emoji
         if fdata.prefix:
@@ -682,7 +687,7 @@ class AdminFranchiseMixIn(AdminMixIn):
 
         # Delete role
         if frole:
-            log.debug(f"Deleting franchise role: {frole.name}")
+            log.debug("Deleting franchise role: %s", frole.name)
             await frole.delete(reason="Franchise has been deleted")
         else:
             log.error(f"Unable to find franchise role: {fdata.name}", guild=guild)
@@ -723,7 +728,7 @@ class AdminFranchiseMixIn(AdminMixIn):
             return await interaction.edit_original_response(embed=ErrorEmbed(description="General Manager role not found in guild."))
 
         try:
-            log.debug(f"Creating franchise: {name}")
+            log.debug("Creating franchise: %s", name)
             f: Franchise = await self.create_franchise(guild, name, prefix, gm)
         except RscException as exc:
             await interaction.edit_original_response(
@@ -745,7 +750,7 @@ class AdminFranchiseMixIn(AdminMixIn):
         frole_name = f"{name} ({f.gm.rsc_name})"
         existing_frole = discord.utils.get(guild.roles, name=frole_name)
         if not existing_frole:
-            log.debug(f"Creating new franchise role: {frole_name}")
+            log.debug("Creating new franchise role: %s", frole_name)
             frole = await guild.create_role(name=frole_name, reason="New franchise created")
         else:
             log.debug("Franchise role already exists")
@@ -858,7 +863,7 @@ class AdminFranchiseMixIn(AdminMixIn):
         former_agms = list(fdata.agms or [])
 
         try:
-            log.debug(f"Transferring {franchise} to {gm.id}")
+            log.debug("Transferring %s to %s", franchise, gm.id)
             f: Franchise = await self.transfer_franchise(guild, fdata.id, gm)
         except RscException as exc:
             return await interaction.edit_original_response(
@@ -915,16 +920,15 @@ class AdminFranchiseMixIn(AdminMixIn):
             await gm.remove_roles(new_gm_old_frole)
 
         # Update new GM roles and name
-        log.debug(f"Adding GM role to {gm.id}")
+        log.debug("Adding GM role to %s", gm.id)
         await gm.add_roles(gm_role, frole, reason="Promoted to GM")
         await gm.remove_roles(fa_role, captain_role, agm_role, reason="Promoted to GM")
-        await gm.edit(nick=await utils.format_discord_prefix(gm, prefix=f.prefix))
 
         # Remove TierFA role if it exists on new GM
         for role in gm.roles:
-            log.debug(f"GM Role: {role.name}")
+            log.debug("GM Role: %s", role.name)
             if role.name.endswith("FA"):
-                log.debug(f"Removing new GM tier FA role: {role}")
+                log.debug("Removing new GM tier FA role: %s", role)
                 await gm.remove_roles(role, reason="Promoted to GM")
                 break
 
@@ -940,10 +944,6 @@ class AdminFranchiseMixIn(AdminMixIn):
                 await old_gm.add_roles(former_gm_role)
 
             await old_gm.remove_roles(frole, gm_role, captain_role, reason="Removed from GM")
-            await old_gm.edit(
-                nick=f"FA | {await utils.remove_prefix(old_gm)}",
-                reason="Removed from GM",
-            )
 
             # Fetch tier and add tier FA roles
             old_gm_plist = await self.players(guild, discord_id=old_gm.id, limit=1)
@@ -952,11 +952,23 @@ class AdminFranchiseMixIn(AdminMixIn):
                 if old_gm_lp.tier and old_gm_lp.tier.name:
                     await old_gm.add_roles(fa_role, reason="Removed from GM")
                     old_gm_tier = old_gm_lp.tier.name
-                    log.debug(f"Old GM Tier: {old_gm_tier}")
+                    log.debug("Old GM Tier: %s", old_gm_tier)
                     old_gm_tierfa_role = await utils.get_tier_fa_role(guild, old_gm_tier)
-                    log.debug(f"Old GM Tier Role: {old_gm_tierfa_role}")
+                    log.debug("Old GM Tier Role: %s", old_gm_tierfa_role)
                     await old_gm.add_roles(old_gm_tierfa_role, reason="Removed from GM")
 
+        # New GM takes the franchise prefix, the old GM goes to FA. Neither
+        # nickname failing leaves the rest of the transfer undone.
+        async def transfer_nick(m: discord.Member) -> str:
+            if m == gm:
+                return await utils.format_discord_prefix(gm, prefix=f.prefix)
+            return f"FA | {await utils.remove_prefix(m)}"
+
+        plan = await plan_nicknames([m for m in (gm, old_gm) if m], transfer_nick)
+        await apply_nicknames(guild, plan, reason="Franchise was transferred to a new GM")
+        if plan.errors():
+            await interaction.followup.send(embed=errors_embed(plan, "Transfer Nickname Errors"), ephemeral=True)
+
         tchannel = await self.get_franchise_transaction_channel(guild, franchise)
 
         # The API dropped the franchise's AGMs as part of the transfer, so clear
@@ -20,6 +20,7 @@ from rsc.enums import ActivityCheckStatus
 from rsc.exceptions import RscException
 from rsc.logs import GuildLogAdapter
 from rsc.utils import utils
+from rsc.utils.roles import ProgressCallback, interaction_progress, sync_role
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
@@ -48,7 +49,7 @@ class AdminInactivityMixIn(AdminMixIn):
     async def setup_persistent_activity_check(self, guild: discord.Guild) -> None:
         # Check if inactivity check is present
         msg_id = await self._get_activity_check_msg_id(guild)
-        log.debug(f"Inactive Message ID: {msg_id}")
+        log.debug("Inactive Message ID: %s", msg_id)
         if not msg_id:
             return
 
@@ -69,7 +70,7 @@ class AdminInactivityMixIn(AdminMixIn):
             await self._set_actvity_check_msg_id(guild, None)
             return
 
-        log.debug(f"[{guild.name}] Making activity check persistent: {msg_id}")
+        log.debug("[%s] Making activity check persistent: %s", guild.name, msg_id)
         # Create and attach view to persistent message ID
         inactive_view = InactiveCheckView(guild=guild, league_id=league_id, api_conf=conf)
         self.bot.add_view(inactive_view, message_id=msg_id)
@@ -167,7 +168,7 @@ class AdminInactivityMixIn(AdminMixIn):
             view=inactive_view,
             allowed_mentions=discord.AllowedMentions(roles=True),
         )
-        log.debug(f"Saving inactive check message ID: {msg.id}")
+        log.debug("Saving inactive check message ID: %s", msg.id)
 
         # Store message
         await self._set_actvity_check_msg_id(guild, msg_id=msg.id)
@@ -233,7 +234,7 @@ class AdminInactivityMixIn(AdminMixIn):
             return
 
         returning = bool(status)
-        log.debug(f"Manual Activity Status: {returning}")
+        log.debug("Manual Activity Status: %s", returning)
 
         await interaction.response.defer()
         try:
@@ -244,7 +245,7 @@ class AdminInactivityMixIn(AdminMixIn):
                 executor=interaction.user,
                 override=override,
             )
-            log.debug(f"Active Result: {result}")
+            log.debug("Active Result: %s", result)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -316,7 +317,10 @@ class AdminInactivityMixIn(AdminMixIn):
         return [c for c in checks if not c.completed]
 
     async def _populate_activity_check_role(
-        self, guild: discord.Guild, missing_role: discord.Role
+        self,
+        guild: discord.Guild,
+        missing_role: discord.Role,
+        progress: ProgressCallback | None = None,
     ) -> tuple[list[discord.Member], list[discord.Member], int]:
         """Sync the missing role to match players who haven't completed the activity check.
 
@@ -333,42 +337,24 @@ class AdminInactivityMixIn(AdminMixIn):
         log.debug("Found %d missing activity checks for season %s", len(missing_checks), season.number)
 
         # Build set of discord IDs that should have the role
-        should_have: set[int] = set()
-        for check in missing_checks:
-            if check.discord_id:
-                should_have.add(check.discord_id)
-
-        # Members who currently have the role but shouldn't
-        currently_have = {m.id for m in missing_role.members}
-        to_remove = currently_have - should_have
-        for member_id in to_remove:
-            member = guild.get_member(member_id)
-            if member:
-                try:
-                    await member.remove_roles(missing_role, reason="Completed activity check")
-                except discord.HTTPException:
-                    pass
-
-        # Members who should have the role but don't
-        to_add = should_have - currently_have
-        assigned: list[discord.Member] = []
-        failed: list[discord.Member] = []
-        for member_id in to_add:
-            member = guild.get_member(member_id)
-            if not member:
-                continue
-            try:
-                await member.add_roles(missing_role, reason="Missing activity check")
-                assigned.append(member)
-            except discord.HTTPException:
-                failed.append(member)
-
-        # Total with role = already had + newly assigned
+        should_have = {check.discord_id for check in missing_checks if check.discord_id}
+
+        result = await sync_role(
+            guild,
+            missing_role,
+            should_have,
+            add_reason="Missing activity check",
+            remove_reason="Completed activity check",
+            progress=progress,
+        )
         log.debug(
-            f"Activity check role sync: +{len(assigned)} added, -{len(to_remove)} removed, {len(failed)} failed",
+            "Activity check role sync: +%s added, -%s removed, %s failed",
+            len(result.added),
+            len(result.removed),
+            len(result.failed),
             guild=guild,
         )
-        return assigned, failed, len(missing_checks)
+        return result.added, result.failed, len(missing_checks)
 
     @_inactive.command(name="populate", description="Populate the missing activity check role on players who haven't completed it")
     async def _admin_inactive_check_populate_cmd(self, interaction: discord.Interaction):
@@ -395,7 +381,9 @@ class AdminInactivityMixIn(AdminMixIn):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            assigned, failed, total_missing = await self._populate_activity_check_role(guild, missing_role)
+            assigned, failed, total_missing = await self._populate_activity_check_role(
+                guild, missing_role, progress=interaction_progress(interaction, "Activity Check")
+            )
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -450,7 +438,9 @@ class AdminInactivityMixIn(AdminMixIn):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            assigned, failed, total_missing = await self._populate_activity_check_role(guild, missing_role)
+            assigned, failed, total_missing = await self._populate_activity_check_role(
+                guild, missing_role, progress=interaction_progress(interaction, "Activity Check")
+            )
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -19,6 +19,7 @@ from rsc.embeds import (
 )
 from rsc.exceptions import LeagueNotConfigured, RscException
 from rsc.logs import GuildLogAdapter
+from rsc.utils.roles import interaction_progress, sync_role
 
 logger = logging.getLogger("red.rsc.admin.intents")
 log = GuildLogAdapter(logger)
@@ -66,7 +67,7 @@ class AdminIntentsMixIn(AdminMixIn):
                 executor=interaction.user,
                 admin_overrride=override,
             )
-            log.debug(f"Intent Result: {result}")
+            log.debug("Intent Result: %s", result)
         except RscException as exc:
             if exc.status == 409:
                 return await interaction.edit_original_response(
@@ -111,7 +112,7 @@ class AdminIntentsMixIn(AdminMixIn):
                 executor=interaction.user,
                 admin_overrride=override,
             )
-            log.debug(f"Intent Result: {result}")
+            log.debug("Intent Result: %s", result)
         except RscException as exc:
             if exc.status == 409:
                 return await interaction.edit_original_response(
@@ -236,44 +237,25 @@ class AdminIntentsMixIn(AdminMixIn):
                 )
             )
 
-        # Build set of members who should have the role (missing intent)
-        missing_members: set[discord.Member] = set()
-        for i in intents:
-            if not (i.player and i.player.player):
-                continue
-
-            pid = i.player.player.discord_id
-            if not pid:
-                continue
-
-            m = guild.get_member(pid)
-            if not m:
-                continue
-
-            missing_members.add(m)
+        # Discord IDs that should have the role (missing intent)
+        missing_ids = {i.player.player.discord_id for i in intents if i.player and i.player.player and i.player.player.discord_id}
 
-        # Members who currently have role but completed their intent
-        existing_members = set(intent_role.members)
-        to_remove = existing_members - missing_members
-        to_add = missing_members - existing_members
-
-        # Remove role from members who completed their intent
-        for m in to_remove:
-            await m.remove_roles(intent_role)
-
-        # Add role to newly missing members
-        for m in to_add:
-            await m.add_roles(intent_role)
+        result = await sync_role(
+            guild,
+            intent_role,
+            missing_ids,
+            add_reason="Missing intent to play",
+            remove_reason="Completed intent to play",
+            progress=interaction_progress(interaction, "Intent Role Sync"),
+        )
 
-        await interaction.edit_original_response(
-            embed=BlueEmbed(
-                title="Intent Role Sync",
-                description=(
-                    f"Added {intent_role.mention} to {len(to_add)} player(s)\n"
-                    f"Removed from {len(to_remove)} player(s) who completed their intent"
-                ),
-            )
+        desc = (
+            f"Added {intent_role.mention} to {len(result.added)} player(s)\n"
+            f"Removed from {len(result.removed)} player(s) who completed their intent"
         )
+        if result.failed:
+            desc += f"\nUnable to update {len(result.failed)} player(s)"
+        await interaction.edit_original_response(embed=BlueEmbed(title="Intent Role Sync", description=desc))
 
     # Intent DMs
     #
@@ -1,18 +1,19 @@
 import json
 import logging
-from typing import TYPE_CHECKING
 
 import discord
 from pydantic import ValidationError
 from redbot.core import app_commands
 
 from rsc.admin import AdminMixIn
+from rsc.admin.match_import import ImportProgress, MatchImporter, MatchImportLedger, MatchImportReport
 from rsc.admin.modals import BulkMatchModal
 from rsc.embeds import (
     ApiExceptionErrorEmbed,
     BlueEmbed,
     ErrorEmbed,
     ExceptionErrorEmbed,
+    OrangeEmbed,
     RedEmbed,
     YellowEmbed,
 )
@@ -21,9 +22,6 @@ from rsc.exceptions import RscException
 from rsc.logs import GuildLogAdapter
 from rsc.teams import TeamMixIn
 
-if TYPE_CHECKING:
-    from rsc.admin.models import CreateMatchData
-
 logger = logging.getLogger("red.rsc.admin.match")
 log = GuildLogAdapter(logger)
 
@@ -60,12 +58,12 @@ class AdminMatchMixIn(AdminMixIn):
         await interaction.response.defer()
         # Get team information
         try:
-            log.debug(f"Searching for home team: {home_team}")
+            log.debug("Searching for home team: %s", home_team)
             hlist = await self.teams(guild, name=home_team)
-            log.debug(f"Home Team Search: {hlist}")
-            log.debug(f"Searching for away team:{away_team}")
+            log.debug("Home Team Search: %s", hlist)
+            log.debug("Searching for away team:%s", away_team)
             alist = await self.teams(guild, name=away_team)
-            log.debug(f"Away Team Search: {alist}")
+            log.debug("Away Team Search: %s", alist)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -124,7 +122,7 @@ class AdminMatchMixIn(AdminMixIn):
                 away_team_id=ateam.id,
                 day=day,
             )
-            log.debug(f"Match Creation Result: {result}")
+            log.debug("Match Creation Result: %s", result)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -155,12 +153,12 @@ class AdminMatchMixIn(AdminMixIn):
         await interaction.response.defer()
         # Get team information
         try:
-            log.debug(f"Searching for home team: {home_team}")
+            log.debug("Searching for home team: %s", home_team)
             hlist = await self.teams(guild, name=home_team)
-            log.debug(f"Home Team Search: {hlist}")
-            log.debug(f"Searching for away team:{away_team}")
+            log.debug("Home Team Search: %s", hlist)
+            log.debug("Searching for away team:%s", away_team)
             alist = await self.teams(guild, name=away_team)
-            log.debug(f"Away Team Search: {alist}")
+            log.debug("Away Team Search: %s", alist)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -219,7 +217,7 @@ class AdminMatchMixIn(AdminMixIn):
                 away_team_id=ateam.id,
                 day=round.value,
             )
-            log.debug(f"Match Creation Result: {result}")
+            log.debug("Match Creation Result: %s", result)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -234,7 +232,8 @@ class AdminMatchMixIn(AdminMixIn):
 
     # Matches Group Commands
     @_matches.command(name="bulk", description="Create bulk RSC matches")
-    async def _matches_bulk_create_cmd(self, interaction: discord.Interaction):
+    @app_commands.describe(force="Create matches an earlier import already created, e.g. after they were deleted.")
+    async def _matches_bulk_create_cmd(self, interaction: discord.Interaction, force: bool = False):
         guild = interaction.guild
         if not guild:
             return
@@ -256,52 +255,71 @@ class AdminMatchMixIn(AdminMixIn):
         except (json.JSONDecodeError, ValidationError) as exc:
             return await bulk_modal.interaction.edit_original_response(embed=ExceptionErrorEmbed(exc_message=str(exc)))
 
-        # Create Match
-        success: list[CreateMatchData] = []
-        for m in matches:
-            log.debug(f"MD: {m.day} Home: {m.home_team} Away: {m.away_team}")
+        # The ledger is per season, so a schedule imported last season is not skipped
+        try:
+            season = await self.current_season(guild)
+        except RscException as exc:
+            return await bulk_modal.interaction.edit_original_response(embed=ApiExceptionErrorEmbed(exc))
+
+        if not (season and season.id):
+            return await bulk_modal.interaction.edit_original_response(
+                embed=ErrorEmbed(description="Unable to determine the current season from the API.")
+            )
+
+        async def report_progress(progress: ImportProgress):
             try:
-                # Get team IDs
-                log.debug(f"Searching for home team: {m.home_team}")
-                home_id = await self.team_id_by_name(guild, name=m.home_team)
-                log.debug(f"Home Team ID: {home_id}")
-                log.debug(f"Searching for away team:{m.away_team}")
-                away_id = await self.team_id_by_name(guild, name=m.away_team)
-                log.debug(f"Away Team ID: {away_id}")
-                result = await self.create_match(
-                    guild,
-                    match_type=m.match_type,
-                    match_format=m.match_format,
-                    home_team_id=home_id,
-                    away_team_id=away_id,
-                    day=m.day,
-                )
-                log.debug(f"Match Creation Result: {result}")
-                success.append(m)
-            except (RscException, ValidationError) as exc:
-                failembed = RedEmbed(
-                    title="Bulk Match Error",
-                    description=f"Exception:\n```{exc!s}```\n\nThe following matches succeeded.",
-                )
-                failembed.add_field(
-                    name="Day",
-                    value="\n".join([str(s.day) for s in success]),
-                    inline=True,
+                await bulk_modal.interaction.edit_original_response(
+                    embed=YellowEmbed(
+                        title="Bulk Match Creation",
+                        description=(
+                            f"Processed **{progress.done}/{progress.total}** matches. "
+                            f"{progress.created} created, {progress.skipped} skipped, {progress.failed} failed so far..."
+                        ),
+                    )
                 )
-                failembed.add_field(
-                    name="Home",
-                    value="\n".join([s.home_team for s in success]),
-                    inline=True,
-                )
-                failembed.add_field(
-                    name="Away",
-                    value="\n".join([s.away_team for s in success]),
-                    inline=True,
-                )
-                return await bulk_modal.interaction.edit_original_response(embed=failembed)
+            except discord.HTTPException as exc:
+                # Progress is cosmetic. Losing an edit must not stop the import.
+                log.debug("Unable to update bulk match progress: %s", exc, guild=guild)
 
-        embed = BlueEmbed(
-            title="Bulk Matches Added",
-            description=f"**{len(success)}** matches have been created in the API.",
-        )
-        await bulk_modal.interaction.edit_original_response(embed=embed)
+        importer = MatchImporter(self, self.match_import_ledger())
+        try:
+            report = await importer.run(guild, season.id, matches, progress=report_progress, force=force)
+        except RscException as exc:
+            return await bulk_modal.interaction.edit_original_response(embed=ApiExceptionErrorEmbed(exc))
+
+        await bulk_modal.interaction.edit_original_response(embed=self._build_match_import_embed(report))
+
+    def match_import_ledger(self) -> MatchImportLedger:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        ledger = getattr(self, "_match_import_ledger", None)
+        if ledger is None:
+            ledger = self._match_import_ledger = MatchImportLedger(self.config)
+        return ledger
+
+    def _build_match_import_embed(self, report: MatchImportReport) -> discord.Embed:
+        if report.invalid:
+            embed = RedEmbed(
+                title="Bulk Match Error",
+                description=f"**{len(report.invalid)}** match(es) are invalid. No matches were created.",
+            )
+            embed.add_field(
+                name="Invalid",
+                value=self._format_truncated_list([f"{o.describe()} - {o.error}" for o in report.invalid]),
+                inline=False,
+            )
+            return embed
+
+        description = f"**{len(report.created)}** matches have been created in the API."
+        if report.skipped:
+            description += f"\n**{len(report.skipped)}** matches were already created by an earlier import and were skipped."
+        embed_cls = OrangeEmbed if report.failed else BlueEmbed
+        embed = embed_cls(title="Bulk Matches Added", description=description)
+
+        if report.failed:
+            embed.add_field(
+                name="Failed",
+                value=self._format_truncated_list([f"{o.describe()} - {o.error}" for o in report.failed]),
+                inline=False,
+            )
+            embed.set_footer(text="Run the same import again to retry the failed matches. Created matches are skipped.")
+        return embed
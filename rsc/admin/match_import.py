@@ -0,0 +1,345 @@
+"""Bulk match import for `/admin matches bulk`.
+
+A pasted season schedule used to be created one match at a time: two
+`teams(name=...)` lookups per match, then `create_match`, all in series, and
+the first error abandoned the rest with no way to pick up where it stopped.
+
+`MatchImporter` works in three steps:
+
+* Every distinct team name is resolved once, from one unfiltered `teams()`
+  response. Only names with no exact match fall back to `team_id_by_name`,
+  which keeps its partial matching.
+* The whole batch is checked before anything is written. An unknown team, a
+  team playing itself or a match pasted twice stops the import with every bad
+  row listed, so a typo on row 300 no longer leaves 299 matches behind it.
+* Matches are created `MATCH_IMPORT_CONCURRENCY` at a time. Each outcome is
+  recorded in a `MatchImportLedger`, persisted per guild in the "Admin" Config
+  group, so running the same import again skips what was created and retries
+  only what failed. The ledger cannot see matches deleted from the API since,
+  so `force` creates every row again regardless.
+
+The ledger is written as soon as each match is created. A restart between the
+API call returning and that write is the one window in which a rerun can
+create a duplicate.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any, Protocol
+
+import discord
+from pydantic import ValidationError
+from redbot.core import Config
+from rscapi.models.match import Match
+from rscapi.models.team_list import TeamList
+
+from rsc.admin.models import CreateMatchData
+from rsc.enums import MatchFormat, MatchType
+from rsc.exceptions import RscException
+from rsc.logs import GuildLogAdapter
+
+logger = logging.getLogger("red.rsc.admin.match_import")
+log = GuildLogAdapter(logger)
+
+# Match creates in flight at once.
+MATCH_IMPORT_CONCURRENCY = 5
+# Finished matches between progress updates. Each one is an interaction edit.
+MATCH_IMPORT_PROGRESS_EVERY = 10
+
+
+class ImportStatus(StrEnum):
+    CREATED = "created"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    INVALID = "invalid"
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    season: int
+    status: ImportStatus
+    match_id: int | None = None
+    error: str | None = None
+    # Epoch seconds
+    at: float = 0.0
+
+    def to_config(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_config(cls, data: dict[str, Any]) -> "LedgerEntry":
+        return cls(
+            season=int(data["season"]),
+            status=ImportStatus(data["status"]),
+            match_id=data.get("match_id"),
+            error=data.get("error"),
+            at=data.get("at", 0.0),
+        )
+
+
+def match_key(season: int, match_type: MatchType, match_format: MatchFormat, day: int, home_id: int, away_id: int) -> str:
+    """Ledger key. One match per season, type, format, day and pairing."""
+    return f"{season}:{match_type}:{match_format}:{day}:{home_id}:{away_id}"
+
+
+class MatchImportLedger:
+    """Match key -> `LedgerEntry`, per guild, mirrored to Config.
+
+    Only the season being imported is kept. Loading for a new season drops
+    the previous one's entries, which can never match again.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._guilds: dict[int, dict[str, LedgerEntry]] = {}
+
+    def _group(self, guild_id: int):
+        return self._config.custom("Admin", str(guild_id)).MatchImports
+
+    async def load(self, guild_id: int, season: int) -> dict[str, LedgerEntry]:
+        entries = self._guilds.get(guild_id)
+        if entries is None:
+            stored: dict[str, dict[str, Any]] = await self._group(guild_id)()
+            entries = {}
+            for key, data in stored.items():
+                try:
+                    entries[key] = LedgerEntry.from_config(data)
+                except (KeyError, TypeError, ValueError) as exc:
+                    log.warning(f"Skipping unreadable match import record {key}: {exc}")
+            entries = self._guilds.setdefault(guild_id, entries)
+
+        stale = [k for k, e in entries.items() if e.season != season]
+        if stale:
+            for key in stale:
+                del entries[key]
+            await self._group(guild_id).set({k: e.to_config() for k, e in entries.items()})
+        return entries
+
+    async def record(self, guild_id: int, key: str, entry: LedgerEntry) -> None:
+        self._guilds.setdefault(guild_id, {})[key] = entry
+        await self._group(guild_id).set_raw(key, value=entry.to_config())
+
+
+class MatchSource(Protocol):
+    """The team and match API calls the importer needs, as `AdminMatchMixIn` provides them."""
+
+    async def teams(self, guild: discord.Guild) -> list[TeamList]: ...
+
+    async def team_id_by_name(self, guild: discord.Guild, name: str) -> int: ...
+
+    async def create_match(
+        self,
+        guild: discord.Guild,
+        match_type: MatchType,
+        match_format: MatchFormat,
+        home_team_id: int,
+        away_team_id: int,
+        day: int,
+    ) -> Match: ...
+
+
+@dataclass(slots=True)
+class MatchOutcome:
+    # Position in the pasted batch, from 1
+    row: int
+    match: CreateMatchData
+    status: ImportStatus
+    match_id: int | None = None
+    error: str | None = None
+
+    def describe(self) -> str:
+        return f"#{self.row} Day {self.match.day}: {self.match.home_team} vs {self.match.away_team}"
+
+
+@dataclass(slots=True)
+class PlannedMatch:
+    row: int
+    match: CreateMatchData
+    key: str
+    home_id: int
+    away_id: int
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    done: int
+    total: int
+    created: int
+    skipped: int
+    failed: int
+
+
+@dataclass(slots=True)
+class MatchImportReport:
+    outcomes: list[MatchOutcome]
+
+    def _with(self, status: ImportStatus) -> list[MatchOutcome]:
+        return [o for o in self.outcomes if o.status == status]
+
+    @property
+    def created(self) -> list[MatchOutcome]:
+        return self._with(ImportStatus.CREATED)
+
+    @property
+    def skipped(self) -> list[MatchOutcome]:
+        return self._with(ImportStatus.SKIPPED)
+
+    @property
+    def failed(self) -> list[MatchOutcome]:
+        return self._with(ImportStatus.FAILED)
+
+    @property
+    def invalid(self) -> list[MatchOutcome]:
+        return self._with(ImportStatus.INVALID)
+
+
+def index_teams(teams: Iterable[TeamList]) -> dict[str, int]:
+    """Team name -> id. The first team with an id wins, as in `team_id_by_name`."""
+    index: dict[str, int] = {}
+    for team in teams:
+        if team.name and team.id:
+            index.setdefault(team.name, team.id)
+    return index
+
+
+class MatchImporter:
+    """Validates a pasted schedule as a whole, then creates it concurrently against the ledger."""
+
+    def __init__(
+        self,
+        source: MatchSource,
+        ledger: MatchImportLedger,
+        concurrency: int = MATCH_IMPORT_CONCURRENCY,
+        progress_every: int = MATCH_IMPORT_PROGRESS_EVERY,
+    ) -> None:
+        self._source = source
+        self._ledger = ledger
+        self.concurrency = concurrency
+        self.progress_every = progress_every
+
+    async def resolve_teams(self, guild: discord.Guild, names: Iterable[str]) -> tuple[dict[str, int], dict[str, str]]:
+        """Team ids by name, and why each unresolved name failed.
+
+        Raises `RscException` if the team list itself cannot be fetched.
+        """
+        index = index_teams(await self._source.teams(guild))
+        wanted = set(names)
+        resolved = {name: index[name] for name in wanted if name in index}
+        unknown = sorted(wanted - resolved.keys())
+
+        errors: dict[str, str] = {}
+        results = await asyncio.gather(*(self._source.team_id_by_name(guild, name=name) for name in unknown), return_exceptions=True)
+        for name, result in zip(unknown, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, (RscException, ValueError)):
+                    raise result
+                errors[name] = str(result)
+            else:
+                resolved[name] = result
+        return resolved, errors
+
+    async def plan(
+        self, guild: discord.Guild, season: int, matches: list[CreateMatchData]
+    ) -> tuple[list[PlannedMatch], list[MatchOutcome]]:
+        """Resolve and check every row. Returns the rows to create and the invalid ones."""
+        names = {m.home_team for m in matches} | {m.away_team for m in matches}
+        team_ids, team_errors = await self.resolve_teams(guild, names)
+
+        planned: list[PlannedMatch] = []
+        invalid: list[MatchOutcome] = []
+        seen: dict[str, int] = {}
+        for row, m in enumerate(matches, start=1):
+            errors = [f"{name}: {team_errors[name]}" for name in dict.fromkeys((m.home_team, m.away_team)) if name in team_errors]
+            if errors:
+                invalid.append(MatchOutcome(row=row, match=m, status=ImportStatus.INVALID, error="; ".join(errors)))
+                continue
+            home_id, away_id = team_ids[m.home_team], team_ids[m.away_team]
+            if home_id == away_id:
+                invalid.append(MatchOutcome(row=row, match=m, status=ImportStatus.INVALID, error="A team cannot play itself"))
+                continue
+            key = match_key(season, m.match_type, m.match_format, m.day, home_id, away_id)
+            if key in seen:
+                invalid.append(MatchOutcome(row=row, match=m, status=ImportStatus.INVALID, error=f"Duplicate of row {seen[key]}"))
+                continue
+            seen[key] = row
+            planned.append(PlannedMatch(row=row, match=m, key=key, home_id=home_id, away_id=away_id))
+        return planned, invalid
+
+    async def run(
+        self,
+        guild: discord.Guild,
+        season: int,
+        matches: list[CreateMatchData],
+        progress: Callable[[ImportProgress], Awaitable[None]] | None = None,
+        force: bool = False,
+    ) -> MatchImportReport:
+        """Import `matches`. Nothing is created unless every row is valid.
+
+        A failed create does not stop the others. It is recorded as failed and
+        retried by the next run of the same import. With `force`, rows the
+        ledger records as created are created again, e.g. after the matches
+        were deleted.
+        """
+        planned, invalid = await self.plan(guild, season, matches)
+        if invalid:
+            return MatchImportReport(outcomes=invalid)
+
+        ledger = await self._ledger.load(guild.id, season)
+        outcomes: list[MatchOutcome] = []
+        pending: list[PlannedMatch] = []
+        for p in planned:
+            entry = ledger.get(p.key)
+            if entry and entry.status == ImportStatus.CREATED and not force:
+                outcomes.append(MatchOutcome(row=p.row, match=p.match, status=ImportStatus.SKIPPED, match_id=entry.match_id))
+            else:
+                pending.append(p)
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def create(p: PlannedMatch) -> MatchOutcome:
+            async with sem:
+                try:
+                    result = await self._source.create_match(
+                        guild,
+                        match_type=p.match.match_type,
+                        match_format=p.match.match_format,
+                        home_team_id=p.home_id,
+                        away_team_id=p.away_id,
+                        day=p.match.day,
+                    )
+                except (RscException, ValidationError, ValueError) as exc:
+                    log.warning(f"Unable to create match {p.key}: {exc}", guild=guild)
+                    await self._ledger.record(guild.id, p.key, LedgerEntry(season, ImportStatus.FAILED, error=str(exc), at=time.time()))
+                    return MatchOutcome(row=p.row, match=p.match, status=ImportStatus.FAILED, error=str(exc))
+                await self._ledger.record(guild.id, p.key, LedgerEntry(season, ImportStatus.CREATED, match_id=result.id, at=time.time()))
+                log.debug("Created match %s as %s", p.key, result.id, guild=guild)
+                return MatchOutcome(row=p.row, match=p.match, status=ImportStatus.CREATED, match_id=result.id)
+
+        tasks = [asyncio.create_task(create(p)) for p in pending]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                outcomes.append(await task)
+                if progress and (done % self.progress_every == 0 or done == len(tasks)):
+                    counts = dict.fromkeys(ImportStatus, 0)
+                    for o in outcomes:
+                        counts[o.status] += 1
+                    await progress(
+                        ImportProgress(
+                            done=len(outcomes),
+                            total=len(planned),
+                            created=counts[ImportStatus.CREATED],
+                            skipped=counts[ImportStatus.SKIPPED],
+                            failed=counts[ImportStatus.FAILED],
+                        )
+                    )
+        finally:
+            # Only reached with tasks left if a progress update raised
+            for task in tasks:
+                task.cancel()
+
+        outcomes.sort(key=lambda o: o.row)
+        return MatchImportReport(outcomes=outcomes)
@@ -9,6 +9,7 @@ from rscapi.models.league_player import LeaguePlayer
 from rscapi.models.name_change_history import NameChangeHistory
 
 from rsc.admin import AdminMixIn
+from rsc.admin.membership import AuditProgress
 from rsc.embeds import (
     ApiExceptionErrorEmbed,
     BlueEmbed,
@@ -36,7 +37,6 @@ log = GuildLogAdapter(logger)
 # Cache misses are confirmed over HTTP one at a time. The cap keeps a badly stale
 # cache from turning the report into hundreds of serialized requests.
 NOTINSERVER_VERIFY_LIMIT = 100
-NOTINSERVER_PROGRESS_INTERVAL = 100
 
 
 class AdminMembersMixIn(AdminMixIn):
@@ -74,7 +74,7 @@ class AdminMembersMixIn(AdminMixIn):
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=False)
             return
 
-        log.debug(f"History: {history}")
+        log.debug("History: %s", history)
         embed = BlueEmbed(title="Name History")
 
         if not history:
@@ -90,7 +90,7 @@ class AdminMembersMixIn(AdminMixIn):
         undated = [h for h in history if not h.date_changed]
         dated.sort(key=lambda x: cast("datetime", x.date_changed), reverse=True)
         history = dated + undated
-        log.debug(f"Post sort: {history}")
+        log.debug("Post sort: %s", history)
 
         def executor_name(h: NameChangeHistory) -> str:
             # Always the discord ID, never the RSC name. A name is not a stable
@@ -132,7 +132,7 @@ class AdminMembersMixIn(AdminMixIn):
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=False)
 
-        log.debug(f"Elevated roles for {member.id}: {roles}", guild=guild)
+        log.debug("Elevated roles for %s: %s", member.id, roles, guild=guild)
 
         embed = BlueEmbed(title="Elevated Roles")
 
@@ -211,7 +211,7 @@ class AdminMembersMixIn(AdminMixIn):
         try:
             if not plist:
                 # Not a league player. Only update the name, leave roles/prefix alone.
-                log.debug(f"{member.id} is not a league player. Only updating nickname.")
+                log.debug("%s is not a league player. Only updating nickname.", member.id)
                 await utils.update_discord_name(member=member, name=name, prefix=await utils.get_prefix(member))
             else:
                 lplayer = plist.pop(0)
@@ -291,7 +291,7 @@ class AdminMembersMixIn(AdminMixIn):
         # Use a string and convert it
         try:
             old_discord_id = int(old.strip())
-            log.debug(f"Looking up league player discord ID: {old_discord_id}")
+            log.debug("Looking up league player discord ID: %s", old_discord_id)
         except ValueError:
             return await interaction.response.send_message(embed=ErrorEmbed(description="Old Discord ID must be a number"))
 
@@ -348,7 +348,7 @@ class AdminMembersMixIn(AdminMixIn):
             tier_list = await self.tiers(guild)
             if tier:
                 tid = await self.tier_id_by_name(guild, tier=tier)
-                log.debug(f"Tier ID: {tid}")
+                log.debug("Tier ID: %s", tid)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
         except ValueError as exc:
@@ -365,7 +365,7 @@ class AdminMembersMixIn(AdminMixIn):
 
         # Patch Player
         try:
-            log.debug(f"Updating League Player ID: {lplayer.id}")
+            log.debug("Updating League Player ID: %s", lplayer.id)
             result = await self.update_league_player(
                 guild=guild,
                 player_id=lplayer.id,
@@ -632,7 +632,7 @@ class AdminMembersMixIn(AdminMixIn):
 
         # Check should get devleague role (only add to users one time in their career)
         add_devleague_role = await self.should_get_devleague_role(member)
-        log.debug(f"Add Dev League Role: {add_devleague_role}")
+        log.debug("Add Dev League Role: %s", add_devleague_role)
 
         # Sync roles and name in discord.
         #
@@ -712,7 +712,7 @@ class AdminMembersMixIn(AdminMixIn):
                 embed=ErrorEmbed(description="API returned a Season without an ID. Please open a modmail ticket.")
             )
 
-        log.debug(f"Player: {player.display_name} Discord ID: {player.id}")
+        log.debug("Player: %s Discord ID: %s", player.display_name, player.id)
         lp_list = await self.players(guild=guild, season=next_season.id, discord_id=player.id, limit=1)
         if not lp_list:
             return await interaction.followup.send(
@@ -724,7 +724,7 @@ class AdminMembersMixIn(AdminMixIn):
 
         lp = lp_list.pop(0)
 
-        log.debug(f"Player Status: {lp.status}")
+        log.debug("Player Status: %s", lp.status)
 
         if lp.status in (
             Status.PERM_FA,
@@ -816,60 +816,62 @@ class AdminMembersMixIn(AdminMixIn):
             )
 
         wanted = frozenset({status}) if status else ACTIVE_STATUSES
+        audit = self.membership_audit()
+
+        async def report_progress(progress: AuditProgress):
+            embed = YellowEmbed(
+                title="Checking League Players",
+                description=f"Checked {progress.checked}/{progress.total} players. {len(progress.missing)} not in server so far...",
+            )
+            if progress.missing:
+                embed.add_field(
+                    name="Not In Server (Unverified)",
+                    value=self._format_truncated_list([f"{lp.player.name} ({lp.player.discord_id})" for lp in progress.missing]),
+                    inline=False,
+                )
+            await interaction.edit_original_response(embed=embed)
+
+        # No status filter on the query itself. The API only accepts one status per
+        # call, so filtering server side would mean one full sweep per status. Every
+        # row carries its own status, so one sweep filtered locally is the same
+        # answer for a fraction of the requests.
+        try:
+            result = await audit.run(self, guild, statuses=wanted, season=season.id, progress=report_progress)
+        except RscException as exc:
+            return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
         missing: list[LeaguePlayer] = []
-        no_discord_id: list[LeaguePlayer] = []
         unverified: list[LeaguePlayer] = []
-        checked = 0
+        departed: list[int] = []
         verified = 0
         overflow = 0
 
-        try:
-            total = await self.total_players(guild, season=season.id)
-
-            # No status filter on the query itself. `paged_players` only accepts one
-            # status per call, so filtering server side would mean one full sweep per
-            # status. Every row carries its own status, so one sweep filtered locally
-            # is the same answer for a fraction of the requests.
-            async for lp in self.paged_players(guild=guild, season=season.id):
-                checked += 1
-                if lp.status is None or Status(lp.status) not in wanted:
-                    continue
-
-                if (checked % NOTINSERVER_PROGRESS_INTERVAL) == 0:
-                    await interaction.edit_original_response(
-                        embed=YellowEmbed(
-                            title="Checking League Players",
-                            description=f"Checked {checked}/{total} players. {len(missing)} not in server so far...",
-                        )
-                    )
+        for lp in result.missing:
+            # Discord already said they are gone, and their row has not changed since
+            if lp.player.discord_id in result.confirmed:
+                missing.append(lp)
+                continue
+
+            # The member set is a cache read. A member who joined mid-sweep or a
+            # partial chunk can still miss, so confirm every miss over HTTP rather
+            # than reporting someone as gone on the strength of a cache read.
+            if verified >= NOTINSERVER_VERIFY_LIMIT:
+                overflow += 1
+                unverified.append(lp)
+                continue
+
+            verified += 1
+            try:
+                await guild.fetch_member(lp.player.discord_id)
+            except discord.NotFound:
+                log.debug("Player %s (%s) is not in the server", lp.player.name, lp.player.discord_id, guild=guild)
+                missing.append(lp)
+                departed.append(lp.player.discord_id)
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to fetch member {lp.player.discord_id}: {exc}", guild=guild)
+                unverified.append(lp)
 
-                if not lp.player.discord_id:
-                    no_discord_id.append(lp)
-                    continue
-
-                if guild.get_member(lp.player.discord_id):
-                    continue
-
-                # A chunked cache should not miss, but a member who joined mid-sweep
-                # or a partial chunk still can. Confirm every miss over HTTP rather
-                # than reporting someone as gone on the strength of a cache read.
-                if verified >= NOTINSERVER_VERIFY_LIMIT:
-                    overflow += 1
-                    unverified.append(lp)
-                    continue
-
-                verified += 1
-                try:
-                    await guild.fetch_member(lp.player.discord_id)
-                except discord.NotFound:
-                    log.debug(f"Player {lp.player.name} ({lp.player.discord_id}) is not in the server", guild=guild)
-                    missing.append(lp)
-                except discord.HTTPException as exc:
-                    log.warning(f"Unable to fetch member {lp.player.discord_id}: {exc}", guild=guild)
-                    unverified.append(lp)
-        except RscException as exc:
-            return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
+        audit.record_departed(guild.id, season.id, departed)
 
         if overflow:
             log.warning(
@@ -881,9 +883,9 @@ class AdminMembersMixIn(AdminMixIn):
             interaction,
             season_number=season.number,
             status=status,
-            checked=checked,
+            checked=result.checked,
             missing=missing,
-            no_discord_id=no_discord_id,
+            no_discord_id=result.no_discord_id,
             unverified=unverified,
         )
 
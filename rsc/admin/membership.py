@@ -0,0 +1,208 @@
+"""Which league players are no longer in the discord server.
+
+`/admin members notinserver` and the departed player audit in `rsc.admin.retire`
+both answer this, and both used to page the whole league one request at a time
+and report only once the sweep was over. `MembershipAudit` is the shared engine.
+
+The guild's member ids go into a set up front. Pages come from `player_pages`,
+which keeps the next few requested while the current one is checked, and each
+row is a set lookup. A progress callback sees the running totals and the misses
+found so far as the pages land.
+
+The last sweep is kept per (guild, season) as a snapshot: each row's discord id
+and status, and the full row only where an audit could report it, i.e. it has
+no discord id or was not a member at the time. A repeat audit within
+`AUDIT_SNAPSHOT_TTL` is checked against the snapshot with no API calls, unless
+a member has left since and their row was not kept. After that, or once a
+player's status changes, the league is swept again and diffed against the
+snapshot. The API has no "changed since" filter, so the sweep itself cannot be
+skipped, but players Discord already confirmed gone whose row has not changed are
+reported as confirmed and need no `fetch_member` again.
+"""
+
+import asyncio
+import time
+from contextlib import aclosing
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+import discord
+from rscapi.models.league_player import LeaguePlayer
+
+from rsc.enums import Status
+
+AUDIT_SNAPSHOT_TTL = 600.0
+# Pages between progress callbacks. Each one is an interaction edit, and those
+# are rate limited.
+AUDIT_PROGRESS_PAGES = 2
+
+# (guild id, season id or None for every season)
+_Key = tuple[int, int | None]
+
+
+class PlayerSource(Protocol):
+    """`LeagueMixIn`, as far as the audit needs it."""
+
+    async def total_players(self, guild: discord.Guild, *, season: int | None = None) -> int: ...
+
+    def player_pages(
+        self, guild: discord.Guild, *, season: int | None = None, total: int | None = None
+    ) -> AsyncIterator[list[LeaguePlayer]]: ...
+
+
+@dataclass(slots=True)
+class AuditProgress:
+    checked: int
+    total: int
+    missing: list[LeaguePlayer]
+
+
+@dataclass(slots=True)
+class AuditResult:
+    """One audit. `missing` is in scope, has a discord id, and is absent from the member cache.
+
+    A cache miss is not proof of anything. `confirmed` holds the ids in `missing`
+    that an earlier run had Discord confirm as gone and whose row has not changed
+    since; the rest still need checking before anyone acts on them.
+    """
+
+    checked: int = 0
+    total: int = 0
+    active: int = 0
+    missing: list[LeaguePlayer] = field(default_factory=list)
+    no_discord_id: list[LeaguePlayer] = field(default_factory=list)
+    confirmed: set[int] = field(default_factory=set)
+    changed: int = 0
+    cached: bool = False
+
+
+# (discord id, status) of one row
+_Row = tuple[int | None, str | None]
+
+
+@dataclass(slots=True)
+class AuditSnapshot:
+    taken_at: float
+    # Every row swept, in order
+    rows: list[_Row]
+    # Position in `rows` -> the full row, for rows with no discord id or whose
+    # player was not a member when swept
+    kept: dict[int, LeaguePlayer]
+    # discord id -> status of its in scope row, to tell which rows changed
+    versions: dict[int, str]
+    departed: set[int] = field(default_factory=set)
+
+    def covers(self, members: set[int]) -> bool:
+        """True if every row now missing from `members` was kept."""
+        return all(i in self.kept for i, (discord_id, _) in enumerate(self.rows) if discord_id and discord_id not in members)
+
+
+def _row(lp: LeaguePlayer) -> _Row:
+    return (lp.player.discord_id if lp.player else None, lp.status)
+
+
+def _status(status: str | None) -> Status | None:
+    try:
+        return Status(status) if status is not None else None
+    except ValueError:
+        return None
+
+
+class MembershipAudit:
+    """League players checked against guild membership, with the last sweep kept per season."""
+
+    def __init__(self, ttl: float = AUDIT_SNAPSHOT_TTL, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._snapshots: dict[_Key, AuditSnapshot] = {}
+        self._locks: dict[_Key, asyncio.Lock] = {}
+
+    def snapshot(self, guild_id: int, season: int | None) -> AuditSnapshot | None:
+        return self._snapshots.get((guild_id, season))
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drop every snapshot for a guild, e.g. after a player's status changed."""
+        for key in [k for k in self._snapshots if k[0] == guild_id]:
+            del self._snapshots[key]
+
+    def record_departed(self, guild_id: int, season: int | None, discord_ids: Iterable[int]) -> None:
+        """Ids Discord confirmed gone, so the next audit need not ask again."""
+        if snapshot := self._snapshots.get((guild_id, season)):
+            snapshot.departed.update(discord_ids)
+
+    async def run(
+        self,
+        source: PlayerSource,
+        guild: discord.Guild,
+        statuses: frozenset[Status],
+        season: int | None = None,
+        progress: Callable[[AuditProgress], Awaitable[None]] | None = None,
+    ) -> AuditResult:
+        """Check every player of `season` with a status in `statuses` against the member cache.
+
+        Concurrent audits of the same season share one sweep. Raises whatever
+        `source` raises; a failed sweep leaves the previous snapshot in place.
+        """
+        key = (guild.id, season)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            members = {m.id for m in guild.members}
+            previous = self._snapshots.get(key)
+            result = AuditResult()
+            versions: dict[int, str] = {}
+            rows: list[_Row]
+            kept: dict[int, LeaguePlayer]
+
+            def check(row: _Row, lp: LeaguePlayer | None) -> None:
+                result.checked += 1
+                discord_id, status = row
+                if _status(status) not in statuses:
+                    return
+                if not discord_id:
+                    result.no_discord_id.append(lp)
+                    return
+                # The same player can hold a row in more than one season
+                if discord_id in versions:
+                    return
+                result.active += 1
+                versions[discord_id] = str(status)
+                if discord_id not in members:
+                    result.missing.append(lp)
+
+            if previous and self._clock() - previous.taken_at < self.ttl and previous.covers(members):
+                result.cached = True
+                result.total = len(previous.rows)
+                for i, row in enumerate(previous.rows):
+                    check(row, previous.kept.get(i))
+                rows, kept = previous.rows, previous.kept
+            else:
+                result.total = await source.total_players(guild, season=season)
+                rows, kept = [], {}
+                pages = 0
+                # Closed explicitly, so a failed progress update cancels the prefetch now
+                async with aclosing(source.player_pages(guild, season=season, total=result.total)) as stream:
+                    async for page in stream:
+                        for lp in page:
+                            row = _row(lp)
+                            if not row[0] or row[0] not in members:
+                                kept[len(rows)] = lp
+                            rows.append(row)
+                            check(row, lp)
+                        pages += 1
+                        if progress and pages % AUDIT_PROGRESS_PAGES == 0:
+                            await progress(AuditProgress(checked=result.checked, total=result.total, missing=list(result.missing)))
+
+            # Confirmed departures carry over while the player is still missing
+            # and their row is the one Discord was asked about
+            departed: set[int] = set()
+            if previous:
+                result.changed = sum(1 for pid, version in versions.items() if previous.versions.get(pid) != version)
+                missing_ids = {lp.player.discord_id for lp in result.missing}
+                departed = {pid for pid in previous.departed if pid in missing_ids and previous.versions.get(pid) == versions.get(pid)}
+            else:
+                result.changed = len(versions)
+            result.confirmed = set(departed)
+
+            taken_at = previous.taken_at if result.cached and previous else self._clock()
+            self._snapshots[key] = AuditSnapshot(taken_at=taken_at, rows=rows, kept=kept, versions=versions, departed=departed)
+            return result
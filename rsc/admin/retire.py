@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import time
 
 import discord
@@ -6,6 +7,7 @@ from discord.ext import tasks
 from redbot.core import app_commands
 
 from rsc.admin import AdminMixIn
+from rsc.admin.membership import AuditProgress
 from rsc.admin.models import DepartedReport
 from rsc.admin.views import ConfirmRetireView
 from rsc.embeds import (
@@ -117,10 +119,15 @@ class AdminRetireMixIn(AdminMixIn):
 
     # Audit
 
-    async def find_departed_players(self, guild: discord.Guild) -> DepartedReport:
+    async def find_departed_players(
+        self,
+        guild: discord.Guild,
+        progress: Callable[[AuditProgress], Awaitable[None]] | None = None,
+    ) -> DepartedReport:
         """Find league players who are active in the API but gone from the server.
 
         Read-only. Returns a report; acting on it is the caller's decision.
+        `progress` is handed each `AuditProgress` of the sweep.
         """
         report = DepartedReport()
 
@@ -147,32 +154,32 @@ class AdminRetireMixIn(AdminMixIn):
             log.warning(f"Aborting departed player audit: thin member cache ({cached}/{guild.member_count}).", guild=guild)
             return report
 
-        active: dict[int, str] = {}
-        async for player in self.paged_players(guild=guild):
-            discord_id = player.player.discord_id if player.player else None
-            if not discord_id:
-                continue
-            if player.status not in AUDIT_ACTIVE_STATUSES:
-                continue
-            active[discord_id] = self._describe_player(player)
-
-        report.total_active = len(active)
-        if not active:
+        audit = self.membership_audit()
+        result = await audit.run(self, guild, statuses=AUDIT_ACTIVE_STATUSES, progress=progress)
+
+        report.total_active = result.active
+        if not result.active:
             log.info("No active league players to audit.", guild=guild)
             return report
 
+        candidates = {lp.player.discord_id: self._describe_player(lp) for lp in result.missing}
+
         # G2 - only positively confirmed departures count. `left_guild` holds IDs
         # where `guild.fetch_member` raised NotFound, i.e. Discord itself said they
-        # are gone. `lookup_failed` is "could not tell" and is never actionable, and
-        # a bare `get_member` cache miss never reaches either bucket.
+        # are gone, on this run or an earlier one whose row is unchanged.
+        # `lookup_failed` is "could not tell" and is never actionable. Players in the
+        # member set never reach either bucket.
+        unconfirmed = [pid for pid in candidates if pid not in result.confirmed]
         _found, left_guild, lookup_failed = await self._resolve_members_by_id(
             guild,
-            list(active.keys()),
+            unconfirmed,
             fetch_limit=AUDIT_MEMBER_FETCH_LIMIT,
         )
+        newly_departed = left_guild
+        left_guild = [pid for pid in candidates if pid in result.confirmed] + left_guild
 
         report.lookup_failed = lookup_failed
-        report.labels = {pid: active[pid] for pid in left_guild + lookup_failed if pid in active}
+        report.labels = {pid: candidates[pid] for pid in left_guild + lookup_failed if pid in candidates}
 
         # G3 - a believability threshold on the result itself, in case a partially
         # populated cache slipped past G1.
@@ -189,6 +196,7 @@ class AdminRetireMixIn(AdminMixIn):
             )
             return report
 
+        audit.record_departed(guild.id, None, newly_departed)
         report.departed = left_guild
         log.info(
             f"Departed player audit: {len(left_guild)} departed, {len(lookup_failed)} unverified, {report.total_active} active.",
@@ -269,8 +277,16 @@ class AdminRetireMixIn(AdminMixIn):
 
         await utils.safe_defer(interaction, ephemeral=True)
 
+        async def report_progress(progress: AuditProgress):
+            await interaction.edit_original_response(
+                embed=YellowEmbed(
+                    title="Checking League Players",
+                    description=f"Checked {progress.checked}/{progress.total} players. {len(progress.missing)} not in server so far...",
+                )
+            )
+
         try:
-            report = await self.find_departed_players(guild)
+            report = await self.find_departed_players(guild, progress=report_progress)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
@@ -7,7 +7,7 @@ from rsc.admin import AdminMixIn
 from rsc.embeds import ApiExceptionErrorEmbed, BlueEmbed, ErrorEmbed, YellowEmbed
 from rsc.enums import Status
 from rsc.exceptions import LeagueNotConfigured, RscException
-from rsc.logs import GuildLogAdapter
+from rsc.logs import Deferred, GuildLogAdapter
 
 logger = logging.getLogger("red.rsc.admin.stats")
 log = GuildLogAdapter(logger)
@@ -66,10 +66,10 @@ class AdminStatsMixIn(AdminMixIn):
                 embed=ErrorEmbed(description="API returned a Season without an ID. Please open a modmail ticket.")
             )
 
-        log.debug(f"Next Season ID: {next_season.id}")
+        log.debug("Next Season ID: %s", next_season.id)
         intents = await self.player_intents(guild, season_id=next_season.id)
 
-        log.debug(f"Intent Count: {len(intents)}")
+        log.debug("Intent Count: %s", len(intents))
         if not intents:
             return await interaction.followup.send(
                 embed=YellowEmbed(
@@ -145,10 +145,10 @@ class AdminStatsMixIn(AdminMixIn):
                 embed=ErrorEmbed(description="API returned a Season without an ID. Please open a modmail ticket.")
             )
 
-        log.debug(f"Next Season ID: {next_season.id}")
+        log.debug("Next Season ID: %s", next_season.id)
         intents = await self.player_intents(guild, season_id=next_season.id)
 
-        log.debug(f"Intent Count: {len(intents)}")
+        log.debug("Intent Count: %s", len(intents))
         if not intents:
             return await interaction.followup.send(
                 embed=YellowEmbed(
@@ -159,7 +159,7 @@ class AdminStatsMixIn(AdminMixIn):
 
         franchise_intents: dict[str, dict[str, int]] = {}
 
-        log.debug(f"Intents[0]: {intents[0] if intents else 'No intents'}")
+        log.debug("Intents[0]: %s", intents[0] if intents else "No intents")
 
         for i in intents:
             if not i.player:
@@ -231,7 +231,7 @@ class AdminStatsMixIn(AdminMixIn):
         lplayers = await self.players(guild, season=season.id, limit=10000)
 
         total_des = len(lplayers)
-        log.debug(f"DE Player Length: {total_des}")
+        log.debug("DE Player Length: %s", total_des)
         if not lplayers:
             return await interaction.followup.send(
                 embed=YellowEmbed(
@@ -246,7 +246,7 @@ class AdminStatsMixIn(AdminMixIn):
 
         from pprint import pformat
 
-        log.debug(f"Final Results:\n\n{pformat(status_dict)}")
+        log.debug("Final Results:\n\n%s", Deferred(pformat, status_dict))
 
         embed = BlueEmbed(
             title="Current Season Stats",
@@ -302,7 +302,7 @@ class AdminStatsMixIn(AdminMixIn):
 
         de_count = await self.player_count(guild, season=next_season.id, status=Status.DRAFT_ELIGIBLE)
 
-        log.debug(f"DE Player Count: {de_count}")
+        log.debug("DE Player Count: %s", de_count)
         if not de_count:
             return await interaction.followup.send(
                 embed=YellowEmbed(
@@ -20,6 +20,7 @@ from rsc.embeds import (  # YellowEmbed,
 from rsc.enums import Status
 from rsc.exceptions import DiscordNameTooLong, RscException
 from rsc.logs import GuildLogAdapter
+from rsc.metrics import timed_loop
 from rsc.transactions.roles import (
     update_draft_eligible_discord,
     update_free_agent_discord,
@@ -53,6 +54,7 @@ class AdminSyncMixIn(AdminMixIn):
 
     # Tasks
     @tasks.loop(time=SYNC_LOOP_TIME)
+    @timed_loop("sync_discord_roles")
     async def sync_discord_roles(self):
         log.info("Discord role sync loop is running.")
         guilds: list[discord.Guild] = list(self.bot.guilds)
@@ -111,7 +113,7 @@ class AdminSyncMixIn(AdminMixIn):
                     franchise = flist.pop(0)
 
                 add_devleague_role = await self.should_get_devleague_role(m)
-                log.debug(f"Add Dev League Role: {add_devleague_role}")
+                log.debug("Add Dev League Role: %s", add_devleague_role)
 
                 log.debug("Syncing Player: %s (%d)", m.display_name, m.id, guild=guild)
                 synced += 1
@@ -508,7 +510,7 @@ class AdminSyncMixIn(AdminMixIn):
                     ),
                 }
 
-                log.debug(f"Syncing {t.name} score reporting channel", guild=guild)
+                log.debug("Syncing %s score reporting channel", t.name, guild=guild)
                 schannel = discord.utils.get(scorecategory.channels, name=f"{t.name}-score-reporting".lower())
                 if not schannel:
                     # Create score reporting channel
@@ -548,7 +550,7 @@ class AdminSyncMixIn(AdminMixIn):
                     ),
                 }
 
-                log.debug(f"Syncing {t.name} tier chat", guild=guild)
+                log.debug("Syncing %s tier chat", t.name, guild=guild)
                 tchannel = discord.utils.get(chatcategory.channels, name=f"{t.name}-chat".lower())
                 if not tchannel:
                     # Create tier chat channel
@@ -1012,7 +1014,7 @@ class AdminSyncMixIn(AdminMixIn):
 
                 # Devleague
                 add_devleague_role = await self.should_get_devleague_role(member)
-                log.debug(f"Add Dev League Role: {add_devleague_role}")
+                log.debug("Add Dev League Role: %s", add_devleague_role)
 
                 try:
                     await update_league_player_discord(
@@ -1088,7 +1090,7 @@ class AdminSyncMixIn(AdminMixIn):
         log.debug("Total FA: %d", total_fa, guild=guild)
         log.debug("Total PermFA: %d", total_pfa, guild=guild)
         log.debug("Combined Total: %d", total_players, guild=guild)
-        dFile = images.getProgressBar(
+        dFile = await images.progress_bar(
             x=10,
             y=10,
             w=225,
@@ -1141,7 +1143,7 @@ class AdminSyncMixIn(AdminMixIn):
                 log.debug("Updating progress bar", guild=guild)
                 progress = idx / total_players
 
-                dFile = images.getProgressBar(
+                dFile = await images.progress_bar(
                     x=10,
                     y=10,
                     w=225,
@@ -1169,7 +1171,7 @@ class AdminSyncMixIn(AdminMixIn):
         loading_embed.description = "Permanent Free Agent player synchronziation in progress"
 
         # Update progress bar for PermFA
-        dFile = images.getProgressBar(
+        dFile = await images.progress_bar(
             x=10,
             y=10,
             w=225,
@@ -1200,7 +1202,7 @@ class AdminSyncMixIn(AdminMixIn):
                     guild=guild,
                 )
                 continue
-            log.debug(f"Syncing PermFA: {m.display_name}", guild=guild)
+            log.debug("Syncing PermFA: %s", m.display_name, guild=guild)
 
             # Check if dry run
             if not dryrun:
@@ -1214,7 +1216,7 @@ class AdminSyncMixIn(AdminMixIn):
                 log.debug("Updating progress bar", guild=guild)
                 progress = idx / total_players
 
-                dFile = images.getProgressBar(
+                dFile = await images.progress_bar(
                     x=10,
                     y=10,
                     w=225,
@@ -1235,7 +1237,7 @@ class AdminSyncMixIn(AdminMixIn):
                         pass
 
         # Draw 100%
-        dFile = images.getProgressBar(
+        dFile = await images.progress_bar(
             x=10,
             y=10,
             w=225,
@@ -1291,10 +1293,10 @@ class AdminSyncMixIn(AdminMixIn):
         )
 
         total_de = len(plist)
-        log.debug(f"Total DE: {total_de}")
+        log.debug("Total DE: %s", total_de)
 
         # Draw initial progress bar
-        dFile = images.getProgressBar(
+        dFile = await images.progress_bar(
             x=10,
             y=10,
             w=225,
@@ -1326,7 +1328,7 @@ class AdminSyncMixIn(AdminMixIn):
             if not m:
                 log.warning(f"Couldn't find DE in guild: {player.player.name} ({player.player.discord_id})")
                 continue
-            log.debug(f"Updating DE: {m.display_name}")
+            log.debug("Updating DE: %s", m.display_name)
 
             if not dryrun:
                 try:
@@ -1339,7 +1341,7 @@ class AdminSyncMixIn(AdminMixIn):
                 log.debug("Updating progress bar")
                 progress = idx / total_de
 
-                dFile = images.getProgressBar(
+                dFile = await images.progress_bar(
                     x=10,
                     y=10,
                     w=225,
@@ -1351,7 +1353,7 @@ class AdminSyncMixIn(AdminMixIn):
                 await interaction.edit_original_response(embed=loading_embed, attachments=[dFile])
 
         # Draw 100%
-        dFile = images.getProgressBar(
+        dFile = await images.progress_bar(
             x=10,
             y=10,
             w=225,
@@ -1388,7 +1390,7 @@ class AdminSyncMixIn(AdminMixIn):
         if not sync_view.result:
             return
 
-        log.debug(f"Guild Feature: {guild.features}")
+        log.debug("Guild Feature: %s", guild.features)
         icons_allowed = "ROLE_ICONS" in guild.features
         for f in franchises:
             if not (f.name and f.gm):
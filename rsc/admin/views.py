@@ -76,7 +76,7 @@ class InactiveCheckView(discord.ui.View):
         await interaction.response.defer(ephemeral=True)
         try:
             result = await self.call_api(interaction.user, returning_status=True)
-            log.debug(f"Active Result: {result}")
+            log.debug("Active Result: %s", result)
         except RscException as exc:
             log.warning(f"[{self._guild.name}] Activity Check Error: {exc.reason}")
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
@@ -101,7 +101,7 @@ class InactiveCheckView(discord.ui.View):
         await interaction.response.defer(ephemeral=True)
         try:
             result = await self.call_api(interaction.user, returning_status=False)
-            log.debug(f"Active Result: {result}")
+            log.debug("Active Result: %s", result)
         except RscException as exc:
             log.warning(f"[{self._guild.name}] Activity Check Error: {exc.reason}")
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
@@ -126,7 +126,7 @@ class InactiveCheckView(discord.ui.View):
                 returning_status=returning_status,
             )
             try:
-                log.debug(f"[{player.id}] Activity Check: {data}")
+                log.debug("[%s] Activity Check: %s", player.id, data)
                 return await api.members_activity_check_create(player.id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -270,7 +270,7 @@ class IntentDMButton(discord.ui.DynamicItem[discord.ui.Button], template=INTENT_
         try:
             result = await cog.declare_intent(guild=guild, member=interaction.user.id, returning=self.returning)
             self.declared = True
-            log.debug(f"[{guild.name}] [Intent DM] Result for {interaction.user.id}: {result}")
+            log.debug("[%s] [Intent DM] Result for %s: %s", guild.name, interaction.user.id, result)
         except RscException as exc:
             if exc.status == 409:
                 return await self._finish(
@@ -478,7 +478,7 @@ class ActivityCheckDMButton(discord.ui.DynamicItem[discord.ui.Button], template=
         try:
             result = await cog.activity_check(guild, interaction.user.id, returning_status=self.active)
             self.submitted = True
-            log.debug(f"[{guild.name}] [Activity DM] Result for {interaction.user.id}: {result}")
+            log.debug("[%s] [Activity DM] Result for %s: %s", guild.name, interaction.user.id, result)
         except RscException as exc:
             # This endpoint has no 409, so a duplicate submission cannot be told
             # apart from a real failure by status code. Ask the API who is still
@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import hashlib
+import io
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import discord
+
+from rsc.enums import TransactionType
+
+log = logging.getLogger("red.rsc.assets")
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+# Re-upload an asset this many seconds before its CDN link expires, so an embed
+# sent just before expiry does not go out with an image that dies minutes later.
+ASSET_REFRESH_MARGIN = 3600.0
+
+TRANSACTION_IMAGES: dict[TransactionType, str] = {
+    # A cut off Inactive Reserve is still a release.
+    TransactionType.CUT: "Released.png",
+    TransactionType.IR_CUT: "Released.png",
+    TransactionType.PICKUP: "Signed.png",
+    TransactionType.RESIGN: "Resigned.png",
+    TransactionType.SUBSTITUTION: "Subbed.png",
+    TransactionType.TEMP_FA: "Subbed.png",
+    TransactionType.TRADE: "Traded.png",
+    TransactionType.RETIRE: "Retired.png",
+    TransactionType.INACTIVE_RESERVE: "InactiveReserve.png",
+    TransactionType.IR_RETURN: "InactiveReserve.png",
+}
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A static image resource, read and hashed once per process."""
+
+    name: str
+    digest: str
+    data: bytes = field(repr=False)
+
+    def file(self) -> discord.File:
+        """A fresh attachment. A `discord.File` is consumed by the send it goes out with."""
+        return discord.File(io.BytesIO(self.data), filename=self.name)
+
+
+@functools.cache
+def load_asset(path: Path) -> Asset:
+    data = path.read_bytes()
+    return Asset(name=path.name, digest=hashlib.sha256(data).hexdigest(), data=data)
+
+
+def fa_asset_path(tier: str, tiny: bool = False) -> Path | None:
+    if tiny:  # noqa: SIM108
+        path = RESOURCES_ROOT / f"FA/64x64/{tier}FA_64x64.png"
+    else:
+        path = RESOURCES_ROOT / f"FA/{tier}FA.png"
+    return path if path.is_file() else None
+
+
+def fa_asset(tier: str, tiny: bool = False) -> Asset | None:
+    path = fa_asset_path(tier, tiny=tiny)
+    return load_asset(path) if path else None
+
+
+def transaction_asset(action: TransactionType) -> Asset:
+    name = TRANSACTION_IMAGES.get(action)
+    if not name:
+        raise NotImplementedError
+    return load_asset(RESOURCES_ROOT / "transactions" / name)
+
+
+def resource_asset(*parts: str) -> Asset:
+    """Any other image under `rsc/resources`, e.g. `resource_asset("combines", "combines_login.png")`."""
+    return load_asset(RESOURCES_ROOT.joinpath(*parts))
+
+
+def attachment_expiry(url: str) -> float | None:
+    """Unix time a signed Discord CDN link stops working, from its `ex` parameter."""
+    ex = parse_qs(urlsplit(url).query).get("ex")
+    if not ex:
+        return None
+    try:
+        return float(int(ex[0], 16))
+    except ValueError:
+        return None
+
+
+@dataclass
+class HostedAsset:
+    url: str
+    message_id: int
+    expires_at: float | None
+
+
+class AssetHost:
+    """Upload each asset once to an asset channel and reuse its CDN link in embeds.
+
+    Links are keyed by channel and content hash, so two resources with the same
+    bytes share one upload. A link is uploaded again once it is close to
+    expiring, or after its message is deleted (see `forget_messages`).
+    """
+
+    def __init__(self, *, margin: float = ASSET_REFRESH_MARGIN, clock: Callable[[], float] = time.time) -> None:
+        self.margin = margin
+        self._clock = clock
+        self._hosted: dict[tuple[int, str], HostedAsset] = {}
+        self._locks: dict[tuple[int, str], asyncio.Lock] = {}
+        self.uploads = 0
+
+    def _fresh(self, hosted: HostedAsset | None) -> bool:
+        if hosted is None:
+            return False
+        return hosted.expires_at is None or self._clock() < hosted.expires_at - self.margin
+
+    async def url(self, channel: discord.TextChannel, asset: Asset) -> str | None:
+        """CDN link to `asset`, uploading it to `channel` if needed. `None` if the upload failed."""
+        key = (channel.id, asset.digest)
+        hosted = self._hosted.get(key)
+        if self._fresh(hosted):
+            return hosted.url  # type: ignore[union-attr]
+
+        # Concurrent announcements for the same asset wait on one upload.
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            hosted = self._hosted.get(key)
+            if self._fresh(hosted):
+                return hosted.url  # type: ignore[union-attr]
+
+            try:
+                msg = await channel.send(file=asset.file())
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to upload {asset.name} to asset channel {channel.id}: {exc}")
+                return None
+            self.uploads += 1
+            if not msg.attachments:
+                return None
+
+            url = msg.attachments[0].url
+            self._hosted[key] = HostedAsset(url=url, message_id=msg.id, expires_at=attachment_expiry(url))
+            log.debug("Uploaded asset %s to channel %s", asset.name, channel.id)
+            return url
+
+    def forget_messages(self, message_ids: Iterable[int]) -> None:
+        """Drop links whose upload message was deleted."""
+        ids = set(message_ids)
+        for key in [k for k, v in self._hosted.items() if v.message_id in ids]:
+            del self._hosted[key]
+
+    def forget_channel(self, channel_id: int) -> None:
+        for key in [k for k in self._hosted if k[0] == channel_id]:
+            del self._hosted[key]
@@ -413,9 +413,9 @@ class BallchasingMixIn(RSCMixIn):
             return
         log.debug("Report match modal finished...")
 
-        log.debug(f"Home Wins: {report_modal.home_wins}")
-        log.debug(f"Away Wins: {report_modal.away_wins}")
-        log.debug(f"Num Replays: {len(report_modal.replays)}")
+        log.debug("Home Wins: %s", report_modal.home_wins)
+        log.debug("Away Wins: %s", report_modal.away_wins)
+        log.debug("Num Replays: %s", len(report_modal.replays))
 
         home_wins = report_modal.home_wins
         away_wins = report_modal.away_wins
@@ -441,7 +441,7 @@ class BallchasingMixIn(RSCMixIn):
                     embed=ErrorEmbed(description=f"`{replay.filename}` is not a valid replay file."),
                     ephemeral=True,
                 )
-        log.debug(f"Replay Count: {len(replay_files)}")
+        log.debug("Replay Count: %s", len(replay_files))
 
         # Read and parse every replay once. Everything downstream works off these
         # bytes instead of re-fetching the attachment.
@@ -480,7 +480,7 @@ class BallchasingMixIn(RSCMixIn):
         start_date = today - timedelta(days=7)
         end_date = today + timedelta(days=7)
 
-        log.debug(f"Searching for match: {home} vs {away}. Start: {start_date}, End: {end_date}")
+        log.debug("Searching for match: %s vs %s. Start: %s, End: %s", home, away, start_date, end_date)
         mlist: list[Match] = await self.find_match(
             guild,
             match_type=MatchType.ANY,
@@ -498,8 +498,8 @@ class BallchasingMixIn(RSCMixIn):
             )
 
         log.debug("Searching for valid teams in match data")
-        log.debug(f"Home Team: {home}")
-        log.debug(f"Away Team: {away}")
+        log.debug("Home Team: %s", home)
+        log.debug("Away Team: %s", away)
 
         # Check if we got a match with matching home/away team names
         match = await self.get_match_from_list(home=home, away=away, matches=mlist)
@@ -523,7 +523,7 @@ class BallchasingMixIn(RSCMixIn):
                 embed=ErrorEmbed(description=f"Match **{home}** vs **{away}** is missing tier information in the API."),
                 ephemeral=True,
             )
-        log.debug(f"Found match: {match}", match=match)
+        log.debug("Found match: %s", match, match=match)
 
         # Check score against match format for validation
         total_wins = home_wins + away_wins
@@ -607,7 +607,7 @@ class BallchasingMixIn(RSCMixIn):
                         executor=member,
                         override=override,
                     )
-                    log.debug(f"Match Result: {match_result}", match=match)
+                    log.debug("Match Result: %s", match_result, match=match)
                 except RscException as exc:
                     await self.report_upload_failures(guild, match=match, upload=upload)
                     if hasattr(exc, "status") and exc.status == 500:
@@ -695,13 +695,15 @@ class BallchasingMixIn(RSCMixIn):
         concurrent callers would duplicate each other's work.
         """
         log.debug(
-            f"Processing match: {match.home_team.name} vs {match.away_team.name}",
+            "Processing match: %s vs %s",
+            match.home_team.name,
+            match.away_team.name,
             guild=guild,
             match=match,
         )
         # Get BC top level group
         tlg = await self._get_top_level_group(guild)
-        log.debug(f"Top Level Group: {tlg}", guild=guild, match=match)
+        log.debug("Top Level Group: %s", tlg, guild=guild, match=match)
         if not tlg:
             raise ValueError("Top level ballchasing group is not configured in guild.")
 
@@ -720,14 +722,14 @@ class BallchasingMixIn(RSCMixIn):
                 match=match,
                 cache=self._bc_group_cache.setdefault(guild.id, {}),
             )
-        log.debug(f"Match Group ID: {match_group_id}", guild=guild, match=match)
+        log.debug("Match Group ID: %s", match_group_id, guild=guild, match=match)
 
         # Get replays from group if any
-        log.debug(f"Getting existing replays from {match_group_id}", guild=guild, match=match)
+        log.debug("Getting existing replays from %s", match_group_id, guild=guild, match=match)
         bc_replays: list[ballchasing.models.Replay] = await utils.async_iter_gather(
             bapi.get_group_replays(group_id=match_group_id, deep=True)
         )
-        log.debug(f"Existing Replay Count: {len(bc_replays)}", guild=guild, match=match)
+        log.debug("Existing Replay Count: %s", len(bc_replays), guild=guild, match=match)
 
         # Check for collisions in ballchasing (duplicate replays)
         collisions = await process.replay_group_collisions(
@@ -735,7 +737,7 @@ class BallchasingMixIn(RSCMixIn):
             bc_replays=bc_replays,
             ledger=self._ledger_read(guild, match_group_id),
         )
-        log.debug(f"Duplicate replays skipped: {len(collisions.duplicates)}", guild=guild, match=match)
+        log.debug("Duplicate replays skipped: %s", len(collisions.duplicates), guild=guild, match=match)
 
         result = process.ReplayUploadResult(group=match_group_id)
         for candidate, replay_id in collisions.duplicates:
@@ -768,7 +770,7 @@ class BallchasingMixIn(RSCMixIn):
         if result is None:
             result = process.ReplayUploadResult(group=group)
 
-        log.debug(f"Uploading replays to group: {group}", guild=guild, match=match)
+        log.debug("Uploading replays to group: %s", group, guild=guild, match=match)
         pending = list(candidates)
         while pending:
             candidate = pending.pop(0)
@@ -786,7 +788,7 @@ class BallchasingMixIn(RSCMixIn):
                 outcome.replay_id = resp.id
             except DuplicateReplay as exc:
                 # Ballchasing already has these exact bytes. Move it into our group.
-                log.debug(f"Duplicate replay on ballchasing: {exc}", guild=guild, match=match)
+                log.debug("Duplicate replay on ballchasing: %s", exc, guild=guild, match=match)
                 if not exc.id:
                     outcome.error = "Ballchasing reported a duplicate replay but did not say which one."
                 else:
@@ -822,7 +824,7 @@ class BallchasingMixIn(RSCMixIn):
             if outcome.replay_id and candidate.fingerprint:
                 self._ledger_record(guild, group=group, fingerprint=candidate.fingerprint, replay_id=outcome.replay_id)
 
-        log.debug(f"Ballchasing IDs: {result.replay_ids}", guild=guild, match=match)
+        log.debug("Ballchasing IDs: %s", result.replay_ids, guild=guild, match=match)
         return result
 
     async def report_upload_failures(self, guild: discord.Guild, match: Match, upload: process.ReplayUploadResult) -> None:
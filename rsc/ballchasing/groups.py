@@ -20,7 +20,7 @@ async def purge_ballchasing_group(bapi: ballchasing.Api, guild: discord.Guild, g
     try:
         async with asyncio.TaskGroup() as tg:
             async for replay in bapi.get_group_replays(group_id=group, deep=False, recurse=False):
-                log.debug(f"Deleting replay: {replay.id}", guild=guild)
+                log.debug("Deleting replay: %s", replay.id, guild=guild)
                 tg.create_task(bapi.delete_replay(replay.id))
     except ExceptionGroup as eg:
         for err in eg.exceptions:
@@ -72,9 +72,9 @@ async def find_or_create_group(
         group_id = await _search_children(bapi, parent=parent, name=name, server_filter=False)
 
     if group_id:
-        log.debug(f"Found existing ballchasing group '{name}': {group_id}", guild=guild)
+        log.debug("Found existing ballchasing group '%s': %s", name, group_id, guild=guild)
     else:
-        log.debug(f"Creating ballchasing group: {name}", guild=guild)
+        log.debug("Creating ballchasing group: %s", name, guild=guild)
         result = await bapi.create_group(
             name=name,
             parent=parent,
@@ -111,7 +111,7 @@ async def rsc_match_bc_group(
     # Already reported. The API stores the group we used, so there is nothing to
     # look up and nothing to race.
     if match.results and (existing := (match.results.ballchasing_group or "").strip()):
-        log.debug(f"Reusing reported ballchasing group: {existing}", guild=guild, match=match)
+        log.debug("Reusing reported ballchasing group: %s", existing, guild=guild, match=match)
         return existing
 
     if not match.home_team.tier:
@@ -132,5 +132,5 @@ async def rsc_match_bc_group(
     for name in names:
         group = await find_or_create_group(bapi, name=name, parent=group, cache=cache, guild=guild)
 
-    log.debug(f"Resulting match group ID: {group}", guild=guild, match=match)
+    log.debug("Resulting match group ID: %s", group, guild=guild, match=match)
     return group
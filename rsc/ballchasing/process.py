@@ -12,6 +12,7 @@ from replay_parser import ReplayParser
 from replay_parser.models import Replay as ParsedReplay
 
 from rsc.logs import GuildLogAdapter
+from rsc.utils.executor import offload
 
 logger = logging.getLogger("red.rsc.ballchasing.process")
 log = GuildLogAdapter(logger)
@@ -177,7 +178,7 @@ def bc_fingerprint(replay: ballchasing.models.Replay) -> str | None:
 
 
 def _parse_bytes(data: bytes) -> ParsedReplay:
-    """Parse replay bytes. Synchronous and CPU bound. Call via `asyncio.to_thread`."""
+    """Parse replay bytes. Synchronous and CPU bound. Call via `offload`."""
     # ReplayParser is stateful, so it is not shared between calls.
     return ReplayParser(debug=False).parse(replay_file=BytesIO(data), net_stream=False)
 
@@ -206,10 +207,10 @@ async def build_candidates(sources: Sequence[discord.Attachment | str | bytes])
     candidates: list[ReplayCandidate] = []
     for label, data in reads:
         # Parsing is pure Python and GIL bound, so running these concurrently
-        # buys nothing. The thread is only here to keep the gateway heartbeat
+        # buys nothing. The CPU pool is only here to keep the gateway heartbeat
         # alive while we chew through the header.
         try:
-            parsed = await asyncio.to_thread(_parse_bytes, data)
+            parsed = await offload(_parse_bytes, data)
         except Exception as exc:
             log.warning(f"Unable to parse replay {label}: {exc}")
             raise ReplayParseError(label) from exc
@@ -287,6 +288,6 @@ async def replay_group_collisions(
         if existing is None:
             report.upload.append(candidate)
             continue
-        log.debug(f"Skipping duplicate replay {candidate.label} (existing: {existing})")
+        log.debug("Skipping duplicate replay %s (existing: %s)", candidate.label, existing)
         report.duplicates.append((candidate, existing))
     return report
@@ -13,12 +13,12 @@ log = logging.getLogger("red.rsc.combines.api")
 async def combines_active(url: str, player: discord.Member) -> list[models.CombinesLobby] | models.CombinesStatus:
     async with aiohttp.ClientSession(trust_env=True) as session:
         url = urljoin(url, "active")
-        log.debug(f"URL: {url}")
+        log.debug("URL: %s", url)
 
         params = {"discord_id": player.id, "guild_id": player.guild.id}
 
         async with session.get(url, params=params) as resp:
-            log.debug(f"Server Response: {resp.status}")
+            log.debug("Server Response: %s", resp.status)
             if resp.status == 502:
                 raise BadGateway("Unable to reach combines API. Bad gateway")
 
@@ -26,7 +26,7 @@ async def combines_active(url: str, player: discord.Member) -> list[models.Combi
             if not data:
                 return []
 
-            log.debug(f"data: {data}")
+            log.debug("data: %s", data)
 
             data = await resp.json()
             if data.get("status") and data.get("message"):
@@ -45,10 +45,10 @@ async def combines_lobby(url: str, executor: discord.Member, lobby_id: int | Non
         url = urljoin(url, "lobby/")
         if lobby_id:
             url = urljoin(url, str(lobby_id))
-        log.debug(f"URL: {url}")
+        log.debug("URL: %s", url)
 
         async with session.get(url, params=params) as resp:
-            log.debug(f"Server Response: {resp.status}")
+            log.debug("Server Response: %s", resp.status)
             if resp.status == 502:
                 raise BadGateway("Unable to reach combines API. Bad gateway")
 
@@ -65,10 +65,10 @@ async def combines_lobby(url: str, executor: discord.Member, lobby_id: int | Non
 async def combines_check_in(url: str, player: discord.Member) -> models.CombinesStatus:
     async with aiohttp.ClientSession(trust_env=True) as session:
         url = urljoin(url, "check_in")
-        log.debug(f"URL: {url}")
+        log.debug("URL: %s", url)
         params = {"discord_id": player.id, "guild_id": player.guild.id}
         async with session.get(url, params=params) as resp:
-            log.debug(f"Server Response: {resp.status}")
+            log.debug("Server Response: %s", resp.status)
             if resp.status == 502:
                 raise BadGateway("Unable to reach combines API. Bad gateway")
             data = await resp.json()
@@ -78,10 +78,10 @@ async def combines_check_in(url: str, player: discord.Member) -> models.Combines
 async def combines_check_out(url: str, player: discord.Member) -> models.CombinesStatus:
     async with aiohttp.ClientSession(trust_env=True) as session:
         url = urljoin(url, "check_out")
-        log.debug(f"URL: {url}")
+        log.debug("URL: %s", url)
         params = {"discord_id": player.id, "guild_id": player.guild.id}
         async with session.get(url, params=params) as resp:
-            log.debug(f"Server Response: {resp.status}")
+            log.debug("Server Response: %s", resp.status)
             if resp.status == 502:
                 raise BadGateway("Unable to reach combines API. Bad gateway")
             data = await resp.json()
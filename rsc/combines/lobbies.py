@@ -0,0 +1,303 @@
+"""Registry of live combine lobbies and their delayed teardown.
+
+Teardown used to sleep 30 seconds in its own task, then walk every channel in
+the guild for names ending in "<lobby>-home" or "<lobby>-away" and delete the
+matches one at a time. With dozens of lobbies finishing together that is a
+full channel scan per lobby and a long serial run of deletes.
+
+Lobbies are now recorded when their channels are created, keyed by lobby id
+and persisted in the "Combines" Config group so they survive a restart. A
+finished lobby is stamped with its teardown time and handed to a single
+`LobbyTeardownScheduler`, which deletes whatever is due in paced batches.
+
+`CombineCategories` spreads new lobbies over the combine category and its
+numbered overflows, one pick at a time per guild.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import discord
+from redbot.core import Config
+
+log = logging.getLogger("red.rsc.combines.lobbies")
+
+# Seconds between a lobby finishing and its channels going away, so players
+# are not dropped from voice mid-sentence.
+LOBBY_TEARDOWN_DELAY = 30.0
+# Channel deletes in flight at once, and seconds between batches. Each channel
+# is its own route, but they all draw on the bot's global request budget.
+LOBBY_DELETE_BATCH = 5
+LOBBY_DELETE_PACING_DELAY = 1.0
+# A category holds at most 50 channels. Past this many, lobbies go to the
+# numbered overflow categories "<name>-2" to "<name>-4".
+COMBINE_CATEGORY_FULL = 40
+COMBINE_OVERFLOW_CATEGORIES = range(2, 5)
+
+
+@dataclass(slots=True)
+class LobbyRecord:
+    guild_id: int
+    lobby_id: int
+    channel_ids: list[int] = field(default_factory=list)
+    announce_channel_id: int | None = None
+    announce_message_id: int | None = None
+    # Epoch seconds. Wall clock rather than monotonic, since it has to mean the
+    # same thing after a restart.
+    teardown_at: float | None = None
+
+    def to_config(self) -> dict[str, Any]:
+        data = asdict(self)
+        del data["guild_id"], data["lobby_id"]
+        return data
+
+    @classmethod
+    def from_config(cls, guild_id: int, lobby_id: int, data: dict[str, Any]) -> "LobbyRecord":
+        return cls(
+            guild_id=guild_id,
+            lobby_id=lobby_id,
+            channel_ids=[int(c) for c in data.get("channel_ids", [])],
+            announce_channel_id=data.get("announce_channel_id"),
+            announce_message_id=data.get("announce_message_id"),
+            teardown_at=data.get("teardown_at"),
+        )
+
+
+async def delete_channels(channels: Sequence[discord.abc.GuildChannel], reason: str) -> int:
+    """Delete `channels` in paced batches. Returns how many were deleted.
+
+    A channel already gone counts as done. Any other failure is logged and
+    skipped rather than stopping the rest.
+    """
+    deleted = 0
+    for start in range(0, len(channels), LOBBY_DELETE_BATCH):
+        if start:
+            await asyncio.sleep(LOBBY_DELETE_PACING_DELAY)
+        batch = channels[start : start + LOBBY_DELETE_BATCH]
+        results = await asyncio.gather(*(c.delete(reason=reason) for c in batch), return_exceptions=True)
+        for channel, result in zip(batch, results, strict=True):
+            if isinstance(result, discord.NotFound):
+                continue
+            if isinstance(result, Exception):
+                log.warning(f"Unable to delete combine channel {channel.name} ({channel.id}): {result}")
+                continue
+            log.debug("Deleted %s", channel.name)
+            deleted += 1
+    return deleted
+
+
+class CombineLobbyRegistry:
+    """Lobby id -> `LobbyRecord`, per guild, mirrored to Config.
+
+    A guild's lobbies are read from Config once, on first use, and served from
+    memory afterwards. Single lobbies are written with `set_raw`, so creating
+    60 lobbies at once is 60 small writes rather than 60 rewrites of the lot.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._guilds: dict[int, dict[int, LobbyRecord]] = {}
+
+    def _group(self, guild_id: int):
+        return self._config.custom("Combines", str(guild_id)).Lobbies
+
+    async def load(self, guild_id: int) -> dict[int, LobbyRecord]:
+        lobbies = self._guilds.get(guild_id)
+        if lobbies is not None:
+            return lobbies
+        stored: dict[str, dict[str, Any]] = await self._group(guild_id)()
+        lobbies = {}
+        for key, data in stored.items():
+            try:
+                lobbies[int(key)] = LobbyRecord.from_config(guild_id, int(key), data)
+            except (TypeError, ValueError) as exc:
+                log.warning(f"Skipping unreadable combine lobby record {key}: {exc}")
+        # Another caller may have loaded while this one awaited Config. Keep
+        # the first, since it may already hold lobbies added since.
+        return self._guilds.setdefault(guild_id, lobbies)
+
+    async def get(self, guild_id: int, lobby_id: int) -> LobbyRecord | None:
+        return (await self.load(guild_id)).get(lobby_id)
+
+    async def add(self, record: LobbyRecord) -> None:
+        lobbies = await self.load(record.guild_id)
+        lobbies[record.lobby_id] = record
+        await self._group(record.guild_id).set_raw(str(record.lobby_id), value=record.to_config())
+
+    async def mark_teardown(self, guild_id: int, lobby_id: int, at: float) -> LobbyRecord | None:
+        """Stamp a lobby with its teardown time. Returns None for an unknown lobby."""
+        record = await self.get(guild_id, lobby_id)
+        if record is None:
+            return None
+        record.teardown_at = at
+        await self._group(guild_id).set_raw(str(lobby_id), value=record.to_config())
+        return record
+
+    async def remove(self, guild_id: int, lobby_ids: Iterable[int]) -> list[LobbyRecord]:
+        """Forget lobbies in one Config write. Returns the records removed."""
+        lobbies = await self.load(guild_id)
+        removed = [r for lobby_id in lobby_ids if (r := lobbies.pop(lobby_id, None))]
+        if removed:
+            await self._group(guild_id).set({str(k): r.to_config() for k, r in lobbies.items()})
+        return removed
+
+    async def clear(self, guild_id: int) -> list[LobbyRecord]:
+        """Forget every lobby in a guild, e.g. when combines are stopped."""
+        return await self.remove(guild_id, list(await self.load(guild_id)))
+
+    def pending_teardowns(self, guild_id: int) -> list[LobbyRecord]:
+        """Loaded lobbies already stamped for teardown, for rescheduling after a restart."""
+        return [r for r in self._guilds.get(guild_id, {}).values() if r.teardown_at is not None]
+
+
+class CombineCategories:
+    """Which category the next lobby in one guild goes into.
+
+    Lobbies are built by several webhook workers at once. Picking a category
+    and creating the lobby's channels in it happen under `lock`, so two
+    workers never both find the primary full and each create "<name>-2".
+    Categories and channels the bot created are counted until the gateway
+    delivers them into the guild's cache, which can lag the REST response.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self._created: dict[str, discord.CategoryChannel] = {}
+        self._placed: dict[int, set[int]] = {}
+
+    def count(self, category: discord.CategoryChannel) -> int:
+        cached = {c.id for c in category.channels}
+        placed = self._placed.get(category.id, set())
+        placed -= cached
+        return len(cached) + len(placed)
+
+    def placed(self, category: discord.CategoryChannel, channel: discord.abc.GuildChannel) -> None:
+        self._placed.setdefault(category.id, set()).add(channel.id)
+
+    async def pick(self, guild: discord.Guild, primary: discord.CategoryChannel) -> discord.CategoryChannel:
+        """The first category with room, creating the next overflow if needed. Call under `lock`."""
+        log.debug("Combine category has %s channels", self.count(primary))
+        if self.count(primary) <= COMBINE_CATEGORY_FULL:
+            return primary
+
+        log.debug("Combine category is full, looking for next available category")
+        for i in COMBINE_OVERFLOW_CATEGORIES:
+            name = f"{primary.name}-{i}"
+            log.debug("Checking next combine category: %s", name)
+            category = discord.utils.get(guild.channels, name=name)
+            if category:
+                self._created.pop(name, None)
+            else:
+                category = self._created.get(name)
+
+            if not category:
+                log.debug("Next combine category does not exist, creating: %s", name)
+                category = await guild.create_category(name=name, reason="Combines channels have maxed out.")
+                self._created[name] = category
+                return category
+
+            if not isinstance(category, discord.CategoryChannel):
+                log.warning(f"Combine category is already in use and not a category: {category}")
+                continue
+
+            if self.count(category) <= COMBINE_CATEGORY_FULL:
+                log.debug("Found next available combine category: %s", name)
+                return category
+        return primary
+
+
+class LobbyTeardownScheduler:
+    """Deletes finished lobbies' channels once their teardown time passes.
+
+    One task serves every guild. It sleeps until the earliest deadline, then
+    takes everything due at that moment and deletes it through
+    `delete_channels`, so lobbies finishing together share batches instead of
+    racing each other.
+
+    Usage:
+        scheduler = LobbyTeardownScheduler(registry, bot.get_guild)
+        scheduler.schedule(record)
+        # ... later ...
+        await scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        registry: CombineLobbyRegistry,
+        get_guild: Callable[[int], discord.Guild | None],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._registry = registry
+        self._get_guild = get_guild
+        self._clock = clock
+        self._heap: list[tuple[float, int, int]] = []
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, record: LobbyRecord) -> None:
+        if record.teardown_at is None:
+            raise ValueError(f"Combine lobby {record.lobby_id} has no teardown time.")
+        heapq.heappush(self._heap, (record.teardown_at, record.guild_id, record.lobby_id))
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="combine-lobby-teardown")
+
+    async def run_due(self, now: float | None = None) -> int:
+        """Tear down every lobby due at `now`. Returns how many channels were deleted."""
+        now = self._clock() if now is None else now
+        due: dict[int, list[int]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, guild_id, lobby_id = heapq.heappop(self._heap)
+            due.setdefault(guild_id, []).append(lobby_id)
+
+        deleted = 0
+        for guild_id, lobby_ids in due.items():
+            deleted += await self._teardown(guild_id, lobby_ids)
+        return deleted
+
+    async def _teardown(self, guild_id: int, lobby_ids: list[int]) -> int:
+        guild = self._get_guild(guild_id)
+        if guild is None:
+            log.warning(f"Bot is not in combine guild {guild_id}. Keeping {len(lobby_ids)} lobby record(s).")
+            return 0
+
+        # Lobbies cleared since they were scheduled (combines stopped, rooms
+        # deleted) come back as None and are skipped.
+        records = [r for lobby_id in lobby_ids if (r := await self._registry.get(guild_id, lobby_id))]
+        channels = [c for r in records for cid in r.channel_ids if (c := guild.get_channel(cid))]
+        log.debug("Tearing down %d combine lobbies (%d channels)", len(records), len(channels))
+        deleted = await delete_channels(channels, reason="Combine lobby has finished.")
+        await self._registry.remove(guild_id, [r.lobby_id for r in records])
+        return deleted
+
+    async def _run(self) -> None:
+        while self._heap:
+            self._wake.clear()
+            wait = self._heap[0][0] - self._clock()
+            if wait > 0:
+                try:
+                    # Woken early when something due sooner is scheduled
+                    await asyncio.wait_for(self._wake.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+                continue
+            try:
+                await self.run_due()
+            except Exception as exc:
+                log.exception(f"Error tearing down combine lobbies: {exc}", exc_info=exc)
+
+    async def stop(self) -> None:
+        """Stop the task. Stamped lobbies stay in Config and are rescheduled on the next load."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._heap.clear()
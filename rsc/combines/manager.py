@@ -1,12 +1,13 @@
 import logging
 import re
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import discord
 from redbot.core import app_commands
 
 from rsc.abc import RSCMixIn
+from rsc.assets import resource_asset
+from rsc.combines.lobbies import delete_channels
 from rsc.const import (
     COMBINES_HELP_1,
     COMBINES_HELP_2,
@@ -27,10 +28,13 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("red.rsc.combines.manager")
 
+COMBINE_VC_REGEX = re.compile(r"^\w+-\d+-(home|away)$", flags=re.IGNORECASE)
+
 defaults_guild = CombineSettings(
     Active=False,
     CombinesApi=None,
     CombinesCategory=None,
+    Lobbies={},
 )
 
 
@@ -133,7 +137,7 @@ class CombineManagerMixIn(RSCMixIn):
         league_role = await utils.get_league_role(guild)
         muted_role = discord.utils.get(guild.roles, name=MUTED_ROLE)
         admin_role = discord.utils.get(guild.roles, name="Admin")
-        log.debug(f"[{guild}] Default Role: {guild.default_role}")
+        log.debug("[%s] Default Role: %s", guild, guild.default_role)
 
         if not league_role:
             return await interaction.followup.send(embed=ErrorEmbed(description="League role does not exist."))
@@ -283,6 +287,7 @@ class CombineManagerMixIn(RSCMixIn):
             if extra_cat:
                 await self.delete_combine_category(extra_cat)
 
+        await self.combine_lobbies().clear(guild.id)
         await self._set_combines_active(guild, active=False)
         await interaction.followup.send(
             embed=GreenEmbed(
@@ -315,6 +320,7 @@ class CombineManagerMixIn(RSCMixIn):
             if extra_cat:
                 # Delete entire category that isn't the primary
                 await self.delete_combine_category(extra_cat)
+        await self.combine_lobbies().clear(guild.id)
 
         await interaction.followup.send(
             embed=GreenEmbed(
@@ -327,32 +333,19 @@ class CombineManagerMixIn(RSCMixIn):
 
     async def delete_combine_category(self, category: discord.CategoryChannel):
         """Delete a combine category and it's associated channels"""
-        log.debug(f"[{category.guild}] Deleting combine category: {category.name}")
-        channels = category.channels
-        for c in channels:
-            await c.delete(reason="Combines have ended.")
+        log.debug("[%s] Deleting combine category: %s", category.guild, category.name)
+        await delete_channels(list(category.channels), reason="Combines have ended.")
         await category.delete(reason="Combines have ended.")
 
     async def delete_combine_game_rooms(self, category: discord.CategoryChannel):
         """Delete a combine category and it's associated channels"""
-        log.debug(f"[{category.guild}] Deleting combine category game rooms: {category.name}")
-
-        combine_vc_regex = re.compile(r"^\w+-\d+-(home|away)$", flags=re.IGNORECASE)
-
-        vclist = category.channels
-        for vc in vclist:
-            if not isinstance(vc, discord.VoiceChannel):
-                continue
-
-            if not vc.category:
-                continue
+        log.debug("[%s] Deleting combine category game rooms: %s", category.guild, category.name)
 
-            if not vc.category.name.lower().startswith("combines"):
-                continue
+        if not category.name.lower().startswith("combines"):
+            return
 
-            if combine_vc_regex.match(vc.name):
-                log.debug(f"Deleting {vc.name}")
-                await vc.delete(reason="Combine lobby has finished.")
+        vclist = [vc for vc in category.channels if isinstance(vc, discord.VoiceChannel) and COMBINE_VC_REGEX.match(vc.name)]
+        await delete_channels(vclist, reason="Combine lobby has finished.")
 
     async def send_combines_help_msg(self, channel: discord.TextChannel):
         await channel.send(content=COMBINES_HELP_1)
@@ -360,17 +353,21 @@ class CombineManagerMixIn(RSCMixIn):
         await channel.send(content=COMBINES_HELP_3)
 
     async def send_combines_how_to_play(self, channel: discord.TextChannel):
-        resources_root = Path(__file__).parent.parent / "resources" / "combines"
-
-        login_img = discord.File(resources_root / "combines_login.png")
-        checkin_img = discord.File(resources_root / "combines_check_in.png")
-        announce_img = discord.File(resources_root / "combines_announcement.png")
-        report_img = discord.File(resources_root / "combines_report.png")
-
-        await channel.send(content=COMBINES_HOW_TO_PLAY_1, file=login_img)
-        await channel.send(content=COMBINES_HOW_TO_PLAY_2, file=checkin_img)
-        await channel.send(content=COMBINES_HOW_TO_PLAY_3, file=announce_img)
-        await channel.send(content=COMBINES_HOW_TO_PLAY_4, file=report_img)
+        steps = [
+            (COMBINES_HOW_TO_PLAY_1, "combines_login.png"),
+            (COMBINES_HOW_TO_PLAY_2, "combines_check_in.png"),
+            (COMBINES_HOW_TO_PLAY_3, "combines_announcement.png"),
+            (COMBINES_HOW_TO_PLAY_4, "combines_report.png"),
+        ]
+        for content, img in steps:
+            files: list[discord.File] = []
+            url = await self.attach_asset(channel.guild, resource_asset("combines", img), files)
+            if files:
+                await channel.send(content=content, files=files)
+            else:
+                embed = BlueEmbed()
+                embed.set_image(url=url)
+                await channel.send(content=content, embed=embed)
         await channel.send(content=COMBINES_HOW_TO_PLAY_5)
 
     # Config
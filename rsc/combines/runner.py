@@ -1,102 +1,116 @@
-import asyncio
-import json
 import logging
+import time
 
-from aiohttp import web
 import discord
-import pydantic
 
 from rsc.abc import RSCMixIn
 from rsc.combines import models
+from rsc.combines.lobbies import LOBBY_TEARDOWN_DELAY, CombineCategories, CombineLobbyRegistry, LobbyRecord, LobbyTeardownScheduler
 from rsc.embeds import BlueEmbed
 from rsc.exceptions import CombinesNotActive, NotInGuild
 from rsc.utils import utils
 from rsc.views import LinkButton
+from rsc.webhooks import WebhookJob, WebhookRejectedError, WebhookRoute
 
 log = logging.getLogger("red.rsc.combines.runner")
 
-background_tasks = set()
-
 
 class CombineRunnerMixIn(RSCMixIn):
     def __init__(self):
         log.debug("Initializing CombineMixIn:Runner")
         super().__init__()
 
-    async def combines_event_handler(self, request: web.Request):
-        log.debug("Received combines event")
+    # Webhooks
+
+    def combines_webhook_routes(self) -> list[WebhookRoute]:
+        return [
+            WebhookRoute("combines_match", self._prepare_combines_match, self._handle_combines_lobby),
+            WebhookRoute("combines_event", self._prepare_combines_event, self._handle_combines_event),
+        ]
+
+    async def _prepare_combines_match(self, data: dict) -> list[WebhookJob]:
+        """One job per lobby, so the worker pool builds lobbies side by side."""
+        log.debug("Processing combine lobbies")
+        lobbies = [models.CombinesLobby(**v) for v in data.values()]
+
+        # Refused up front rather than accepted and dropped, so upstream keeps
+        # retrying until the bot can actually create the lobbies.
+        for guild_id in {lobby.guild_id for lobby in lobbies}:
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                raise WebhookRejectedError(503, f"Bot is not in the specified combine guild ID: {guild_id}")
+            if not await self._get_combines_active(guild):
+                raise WebhookRejectedError(503, f"Combines are not active in guild ID: {guild_id}")
+
+        return [lobby.model_dump(mode="json") for lobby in lobbies]
 
+    async def _handle_combines_lobby(self, job: WebhookJob):
         try:
-            data = await request.json()
-            from pprint import pformat
-
-            log.debug(f"body:\n\n{pformat(data)}\n\n")
-            event = models.CombineEvent(**data)
-        except json.JSONDecodeError:
-            log.warning("Received combines webhook with no JSON data")
-            return web.Response(status=400)  # 400 Bad Request
-        except pydantic.ValidationError as exc:
-            log.exception("Error deserializing combine game lobby", exc_info=exc)
-            return web.Response(status=400)  # 400 Bad Request
+            await self.create_combine_lobby_channel(models.CombinesLobby(**job))
+        except (NotInGuild, CombinesNotActive):
+            # Checked when the request was accepted; only reachable if the bot
+            # left the guild or combines were stopped in the meantime.
+            log.warning(f"Dropping combine lobby {job.get('id')}: combines are no longer available.")
 
-        # Only support RSC NA 3v3 right now
-        log.debug(f"Looking for Guild ID: {event.guild_id}")
-        guild: discord.Guild | None = None
-        for g in self.bot.guilds:
-            if g.id == event.guild_id:  # nickmdev
-                guild = g
-                break
+    async def _prepare_combines_event(self, data: dict) -> list[WebhookJob]:
+        event = models.CombineEvent(**data)
 
-        if not guild:
-            log.error("Bot is not in the configured combines guild")
-            return web.Response(status=503)  # 503 Service Unavailable
+        # Only support RSC NA 3v3 right now
+        log.debug("Looking for Guild ID: %s", event.guild_id)
+        if not self.bot.get_guild(event.guild_id):
+            raise WebhookRejectedError(503, "Bot is not in the configured combines guild")
 
         match event.message_type:
             case models.CombineEventType.Finished:
                 if not event.match_id:
-                    log.warning("Received finished combine lobby but no lobby id.")
-                    return web.Response(status=400)  # 400 Bad Request
-                else:
-                    task = asyncio.create_task(self.teardown_combine_lobby(guild, lobby_id=event.match_id))
-                    background_tasks.add(task)
-                    task.add_done_callback(background_tasks.discard)
-                    return web.Response(status=200)  # 200 OK
+                    raise WebhookRejectedError(400, "Received finished combine lobby but no lobby id.")
+                return [event.model_dump(mode="json")]
             case _:
-                return web.Response(status=501)  # 400 Not Implemented
-
-    async def start_combines_game(self, request: web.Request):
-        log.debug("Received request to create combine game")
-
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            log.warning("Received combines webhook with no JSON data")
-            return web.Response(status=400)  # 400 Bad Request
-
-        log.debug("Processing combine lobbies")
-        lobby_list: list[models.CombinesLobby] = []
-        try:
-            for v in data.values():
-                log.debug(f"Combine Raw Lobby: {v}")
-                lobby_list.append(models.CombinesLobby(**v))
-        except pydantic.ValidationError as exc:
-            log.exception("Error deserializing combine game lobby", exc_info=exc)
-            return web.Response(status=400)  # 400 Bad Request
-
-        if not lobby_list:
-            log.warning("Received combines HTTP request with no data")
-            return web.Response(status=400)  # 400 Bad Request
-
-        log.debug("Sending combine lobbies to creation")
-        for lobby in lobby_list:
-            try:
-                await self.create_combine_lobby_channel(lobby)
-            except (NotInGuild, CombinesNotActive):
-                return web.Response(status=503)  # 503 Service Unavailable
-
-        # Send HTTP 200 OK
-        log.debug("Sending HTTP response.")
-        return web.Response(status=200)
+                raise WebhookRejectedError(501, f"Unsupported combine event: {event.message_type}")
+
+    async def _handle_combines_event(self, job: WebhookJob):
+        event = models.CombineEvent(**job)
+        guild = self.bot.get_guild(event.guild_id)
+        if not guild or not event.match_id:
+            return
+        await self.teardown_combine_lobby(guild, lobby_id=event.match_id)
+
+    # Lobby registry
+
+    def combine_lobbies(self) -> CombineLobbyRegistry:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        registry = getattr(self, "_combine_lobbies", None)
+        if registry is None:
+            registry = self._combine_lobbies = CombineLobbyRegistry(self.config)
+        return registry
+
+    def _combine_teardown(self) -> LobbyTeardownScheduler:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        scheduler = getattr(self, "_combine_teardown_scheduler", None)
+        if scheduler is None:
+            scheduler = self._combine_teardown_scheduler = LobbyTeardownScheduler(self.combine_lobbies(), self.bot.get_guild)
+        return scheduler
+
+    def _combine_categories(self, guild_id: int) -> CombineCategories:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        categories = getattr(self, "_combine_category_picks", None)
+        if categories is None:
+            categories = self._combine_category_picks = {}
+        return categories.setdefault(guild_id, CombineCategories())
+
+    async def recover_combine_lobbies(self, guild: discord.Guild):
+        """Load a guild's lobby registry and reschedule teardowns cut short by a restart."""
+        await self.combine_lobbies().load(guild.id)
+        pending = self.combine_lobbies().pending_teardowns(guild.id)
+        if pending:
+            log.info(f"Rescheduling teardown of {len(pending)} combine lobbies in {guild.name}.")
+        for record in pending:
+            self._combine_teardown().schedule(record)
+
+    async def close_combine_teardown(self):
+        scheduler = getattr(self, "_combine_teardown_scheduler", None)
+        if scheduler is not None:
+            await scheduler.stop()
 
     async def create_combine_lobby_channel(
         self,
@@ -104,12 +118,7 @@ class CombineRunnerMixIn(RSCMixIn):
     ) -> list[discord.VoiceChannel]:
         log.debug("Creating combine lobby channels.")
 
-        guild: discord.Guild | None = None
-        for g in self.bot.guilds:
-            if g.id == lobby.guild_id:
-                guild = g
-                break
-
+        guild = self.bot.get_guild(lobby.guild_id)
         if not guild:
             log.warning(f"Bot is not in the specified combine guild ID: {lobby.guild_id}")
             raise NotInGuild
@@ -124,7 +133,7 @@ class CombineRunnerMixIn(RSCMixIn):
         if not combine_category:
             log.error("Combine category not configured. Can't create game.")
             return []
-        log.debug(f"Combine category: {combine_category.name} {combine_category.id}")
+        log.debug("Combine category: %s %s", combine_category.name, combine_category.id)
 
         exists = discord.utils.get(guild.channels, name=f"{lobby.tier}-{lobby.id}-home")
         if exists:
@@ -137,40 +146,12 @@ class CombineRunnerMixIn(RSCMixIn):
             return []
 
         players = await self.combine_players_from_lobby(guild, lobby)
-        log.debug(f"Players: {players}")
+        log.debug("Players: %s", players)
 
         if not players:
             log.error(f"Combine {lobby.id} has no players associated with it")
             return []
 
-        # Check if category is full (Max: 50)
-        log.debug("Finding valid combine category")
-        log.debug(f"Combine category has {len(combine_category.channels)} channels")
-        if len(combine_category.channels) > 40:
-            log.debug("Combine category is full, looking for next available category")
-            for i in range(2, 5):
-                next_category = discord.utils.get(guild.channels, name=f"{combine_category.name}-{i}")
-                log.debug(f"Checking next combine category: {combine_category.name}-{i}")
-
-                if not next_category:
-                    log.debug(f"Next combine category does not exist, creating: {combine_category.name}-{i}")
-                    next_category = await guild.create_category(
-                        name=f"{combine_category.name}-{i}",
-                        reason="Combines channels have maxed out.",
-                    )
-                    combine_category = next_category
-                    break
-
-                if not isinstance(next_category, discord.CategoryChannel):
-                    log.warning(f"Combine category is already in use and not a category: {next_category}")
-                    continue
-
-                if len(next_category.channels) <= 40:
-                    log.debug(f"Found next available combine category: {combine_category.name}-{i}")
-                    combine_category = next_category
-                    break
-        log.debug(f"Combine Category: {combine_category.name}")
-
         # Set up channel permissions
         muted_role = await utils.get_muted_role(guild)
         league_role = await utils.get_league_role(guild)
@@ -199,24 +180,41 @@ class CombineRunnerMixIn(RSCMixIn):
         if muted_role:
             player_overwrites[muted_role] = discord.PermissionOverwrite(view_channel=True, connect=False, speak=False)
 
-        # Create Lobby
-        log.debug("Creating combine lobby voice channels")
-        home_channel = await combine_category.create_voice_channel(
-            name=f"{lobby.tier}-{lobby.id}-home",
-            overwrites=player_overwrites,
-            reason=f"Starting combine lobby {lobby.id}",
-            user_limit=5,
-        )
-        away_channel = await combine_category.create_voice_channel(
-            name=f"{lobby.tier}-{lobby.id}-away",
-            overwrites=player_overwrites,
-            reason=f"Starting combine lobby {lobby.id}",
-            user_limit=5,
-        )
+        # Create Lobby. Held until both channels exist, so the next lobby
+        # counts them when it picks a category.
+        categories = self._combine_categories(guild.id)
+        async with categories.lock:
+            log.debug("Finding valid combine category")
+            combine_category = await categories.pick(guild, combine_category)
+            log.debug("Combine Category: %s", combine_category.name)
+
+            log.debug("Creating combine lobby voice channels")
+            home_channel = await combine_category.create_voice_channel(
+                name=f"{lobby.tier}-{lobby.id}-home",
+                overwrites=player_overwrites,
+                reason=f"Starting combine lobby {lobby.id}",
+                user_limit=5,
+            )
+            categories.placed(combine_category, home_channel)
+            away_channel = await combine_category.create_voice_channel(
+                name=f"{lobby.tier}-{lobby.id}-away",
+                overwrites=player_overwrites,
+                reason=f"Starting combine lobby {lobby.id}",
+                user_limit=5,
+            )
+            categories.placed(combine_category, away_channel)
 
         # Announce
         log.debug("Announcing combine lobby!")
-        await self.announce_combines_lobby(guild, lobby=lobby, channels=[home_channel, away_channel])
+        record = LobbyRecord(guild_id=guild.id, lobby_id=lobby.id, channel_ids=[home_channel.id, away_channel.id])
+        try:
+            msg = await self.announce_combines_lobby(guild, lobby=lobby, channels=[home_channel, away_channel])
+            record.announce_channel_id = msg.channel.id
+            record.announce_message_id = msg.id
+        finally:
+            # Registered even if the announcement fails, or the channels would
+            # never be torn down.
+            await self.combine_lobbies().add(record)
 
         return [home_channel, away_channel]
 
@@ -283,26 +281,22 @@ class CombineRunnerMixIn(RSCMixIn):
 
         return msg
 
-    async def teardown_combine_lobby(self, guild: discord.Guild, lobby_id: int):
-        # Make teardown less abrupt for players
-        await asyncio.sleep(30)
-
-        log.debug(f"Tearing down combine lobby: {lobby_id}")
-
-        # Loop guild since we don't know the lobby tier
-        gchannels = guild.channels
-        for channel in gchannels:
-            if not channel.category:
-                continue
-
-            if not channel.category.name.lower().startswith("combines"):
-                continue
-
-            if channel.name.endswith(f"{lobby_id}-home"):
-                log.debug(f"Deleting {channel.name}")
-                await channel.delete(reason="Combine lobby has finished.")
-                continue
-
-            if channel.name.endswith(f"{lobby_id}-away"):
-                log.debug(f"Deleting {channel.name}")
-                await channel.delete(reason="Combine lobby has finished.")
+    async def teardown_combine_lobby(self, guild: discord.Guild, lobby_id: int, delay: float = LOBBY_TEARDOWN_DELAY):
+        """Schedule a finished lobby's channels for deletion after `delay` seconds."""
+        log.debug("Scheduling teardown of combine lobby: %s", lobby_id)
+        at = time.time() + delay
+        registry = self.combine_lobbies()
+        record = await registry.mark_teardown(guild.id, lobby_id, at)
+        if record is None:
+            # Created before the registry existed. Found by name once, then
+            # torn down like any other lobby.
+            suffixes = (f"-{lobby_id}-home", f"-{lobby_id}-away")
+            channel_ids = [
+                c.id for c in guild.channels if c.category and c.category.name.lower().startswith("combines") and c.name.endswith(suffixes)
+            ]
+            if not channel_ids:
+                log.warning(f"No channels found for finished combine lobby: {lobby_id}")
+                return
+            record = LobbyRecord(guild_id=guild.id, lobby_id=lobby_id, channel_ids=channel_ids, teardown_at=at)
+            await registry.add(record)
+        self._combine_teardown().schedule(record)
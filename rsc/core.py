@@ -11,6 +11,7 @@ import validators
 from pydantic import ValidationError
 from redbot.core import Config, app_commands, commands
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 from rscapi import ApiClient, Configuration
 from rscapi.exceptions import ApiException
 
@@ -28,6 +29,7 @@ from rsc.admin.members import AdminMembersMixIn
 from rsc.admin.stats import AdminStatsMixIn
 from rsc.admin.sync import AdminSyncMixIn
 from rsc.admin.views import ActivityCheckDMButton, IntentDMButton
+from rsc.assets import AssetHost
 from rsc.ballchasing import BallchasingMixIn
 from rsc.combines import CombineMixIn
 from rsc.developer import DeveloperMixIn
@@ -43,7 +45,20 @@ from rsc.freeagents import FreeAgentMixIn
 from rsc.leagues import LeagueMixIn
 from rsc.llm import LLMMixIn
 from rsc.llm.rulebook import load_rulebooks
-from rsc.logs import GuildLogAdapter
+from rsc.logs import GuildLogAdapter, QueuedLogging
+from rsc.metrics import (
+    AGENT_SECONDS,
+    AGENT_TOOL_SECONDS,
+    API_REQUEST_SECONDS,
+    DISCORD_REQUEST_SECONDS,
+    EVENT_LOOP_LAG_SECONDS,
+    LOOP_SECONDS,
+    METRICS,
+    Histogram,
+    Sample,
+    instrument_discord_http,
+    uninstrument_discord_http,
+)
 from rsc.matches import MatchMixIn
 from rsc.members import MemberMixIn
 from rsc.moderator import ModeratorMixIn, ThreadMixIn
@@ -57,8 +72,11 @@ from rsc.trackers import TrackerMixIn
 from rsc.transactions import TransactionMixIn
 from rsc.utils import UtilsMixIn
 from rsc.utils.dm import DMHelper
+from rsc.utils.executor import shutdown_cpu_executor
 from rsc.utils.trophy import TrophyMixIn
 from rsc.views import LeagueSelectView, RSCSetupModal
+from rsc.watchdog import LoopWatchdog
+from rsc.webhooks import WebhookIngest, WebhookJournal
 from rsc.welcome import WelcomeMixIn
 
 logger = logging.getLogger("red.rsc.core")
@@ -69,11 +87,25 @@ HIDDEN_COMMANDS = ["feet"]
 defaults_guild = {
     "ApiKey": None,
     "ApiUrl": None,
+    "AssetChannel": None,
     "League": None,
     "ModmailBot": None,
     "TimeZone": "UTC",
 }
 
+defaults_global = {
+    # Serve /metrics on the localhost web app. Off by default: nothing scrapes
+    # it unless someone has set that up.
+    "PrometheusMetrics": False,
+}
+
+# Rows per section in `/rsc perf`. Sorted by total time, so the tail is the
+# part nobody needs to see.
+PERF_MAX_ROWS = 12
+# Stalls shown by `/rsc stalls`, and the characters of stack kept for each.
+STALLS_MAX_FIELDS = 5
+STALL_FIELD_MAX = 1024
+
 
 class RSC(
     AdminAGMMixIn,
@@ -120,6 +152,7 @@ class RSC(
         self.config = Config.get_conf(self, identifier=6349109713, force_registration=True)
 
         self.config.register_guild(**defaults_guild)
+        self.config.register_global(**defaults_global)
 
         # Define state of API connection
         self._api_conf: dict[int, Configuration] = {}
@@ -131,15 +164,30 @@ class RSC(
         # Web runner state. Assigned by start_webapp(), which is idempotent.
         self._web_runner = None
         self._web_site = None
+        self._webhooks: WebhookIngest | None = None
 
         # setup() runs from both cog_load() and on_ready(). Serialize it so a
         # reconnect firing mid-setup cannot interleave with the first run.
         self._setup_lock = asyncio.Lock()
 
+        # CDN links to static images uploaded to each guild's asset channel
+        self._asset_host = AssetHost()
+
         # Shared rate-limited DM queue
         self._dm_helper = DMHelper()
         self._dm_helper.start()
 
+        # Time every Discord REST call. Undone in cog_unload().
+        instrument_discord_http(self.bot.http)
+
+        # Event loop lag and stalls, see `/rsc stalls`
+        self._watchdog = LoopWatchdog()
+        self._watchdog.start()
+
+        # Log handlers run on a background thread. Undone last in cog_unload().
+        self._queued_logging = QueuedLogging()
+        self._queued_logging.start()
+
         super().__init__()
         log.info("RSC Bot has been started.")
 
@@ -168,12 +216,27 @@ class RSC(
         # Discard rather than drain. Draining sends one DM per `rate` seconds, so a
         # large queued batch would block the reload for many minutes.
         await self._dm_helper.stop(drain=False)
+        await self._join_queue().close()
         await self.close_ballchasing_sessions()
+        await self.close_combine_teardown()
+        await self.flush_llm_usage()
+        await self.close_llm_clients()
         await self.close_api_clients()
+        uninstrument_discord_http(self.bot.http)
+        await self._watchdog.stop()
+        shutdown_cpu_executor()
         if self._web_runner is not None:
             await self._web_runner.cleanup()
             self._web_runner = None
             self._web_site = None
+        # After the listener is gone, so nothing is accepted that no worker
+        # will pick up. Jobs still running are replayed on the next load.
+        if self._webhooks is not None:
+            await self._webhooks.stop()
+            self._webhooks = None
+        # Last, so the teardown above is logged. Writes out what is still queued
+        # and hands the loggers back before the reloaded cog queues them again.
+        self._queued_logging.stop()
 
     async def setup(self):
         """Prepare the bot API and caches. Requires API configuration"""
@@ -197,11 +260,13 @@ class RSC(
             # guild's failure from aborting the others -- previously an error
             # type outside the except* handlers below unwound the whole loop and
             # every remaining guild was silently left with empty caches.
-            # Parse the rulebooks once, off the event loop, so the first rules
-            # question does not wait on it. Failure is not fatal: the agent
-            # rebuilds lazily, it just pays the cost on that first question.
+            # Load the rulebooks once, off the event loop, so the first rules
+            # question does not wait on it. The compiled form in the cog data
+            # directory makes this one file read unless the rules changed.
+            # Failure is not fatal: the agent rebuilds lazily, it just pays the
+            # cost on that first question.
             try:
-                await load_rulebooks()
+                await load_rulebooks(cache_dir=cog_data_path(self) / "rulebooks")
             except OSError as exc:
                 log.error(f"Could not load rulebooks: {exc}", exc_info=exc)
 
@@ -244,6 +309,9 @@ class RSC(
                 # API configuration. This used to live in the FA loop's
                 # before_loop hook, which looped over all guilds unconditionally.
                 tg.create_task(self._populate_free_agent_cache(guild))
+                # Config only as well. Resumes combine lobby teardowns that a
+                # restart cut short.
+                tg.create_task(self.recover_combine_lobbies(guild))
                 if has_api:
                     tg.create_task(self.prepare_ballchasing(guild))
                 if has_league:
@@ -353,16 +421,27 @@ class RSC(
 
         self._web_app = web.Application()
 
-        # Combines
-        self._web_app.router.add_post("/combines_match", self.start_combines_game)
-        self._web_app.router.add_post("/combines_event", self.combines_event_handler)
-        self._web_app.router.add_post("/league_player_update", self.league_player_update_handler)
+        # Combines and league webhooks are journaled and answered 202 at once.
+        # See rsc.webhooks.
+        webhooks = WebhookIngest(
+            WebhookJournal(cog_data_path(self) / "webhooks.jsonl"),
+            [*self.combines_webhook_routes(), *self.league_webhook_routes()],
+        )
+        for name in ("combines_match", "combines_event", "league_player_update"):
+            self._web_app.router.add_post(f"/{name}", webhooks.handler(name))
+
+        # Metrics
+        self._web_app.router.add_get("/metrics", self.metrics_handler)
 
         # Runner and Site
         runner = web.AppRunner(self._web_app)
         await runner.setup()
         site = web.TCPSite(runner, "localhost", 8008)
 
+        # Before the site accepts posts, so the journal is loaded before the
+        # first accept() and there are workers to take what it queues.
+        await webhooks.start()
+
         try:
             # Awaited rather than fired into a task. A bind failure used to
             # surface only as "Task exception was never retrieved" at GC time.
@@ -371,11 +450,19 @@ class RSC(
             # Non-fatal. The webhook endpoints are dead, but the guild caches
             # below are what the bot needs to be usable in Discord.
             log.error(f"Unable to bind web app to localhost:8008: {exc}")
+            await webhooks.stop()
             await runner.cleanup()
             return
 
         self._web_runner = runner
         self._web_site = site
+        self._webhooks = webhooks
+
+    async def metrics_handler(self, request: web.Request) -> web.Response:
+        """Prometheus text exposition of `METRICS`, when enabled."""
+        if not await self.config.PrometheusMetrics():
+            raise web.HTTPNotFound
+        return web.Response(text=METRICS.render_prometheus(), content_type="text/plain", charset="utf-8")
 
     # Autocomplete
 
@@ -458,6 +545,22 @@ class RSC(
             ephemeral=True,
         )
 
+    @RSCSettingsMixIn.rsc_settings.command(name="assetchannel", description="Configure the channel static images are uploaded to.")
+    @app_commands.describe(
+        channel="Channel the bot uploads transaction and combine images to. Leave empty to attach them to every message."
+    )
+    @bot_owner_required()
+    async def _rsc_set_asset_channel(self, interaction: discord.Interaction, channel: discord.TextChannel | None = None):
+        if not interaction.guild:
+            return
+
+        await self._set_asset_channel(interaction.guild, channel)
+        if channel:
+            desc = f"Asset channel has been set to {channel.mention}"
+        else:
+            desc = "Asset channel has been cleared. Images will be attached to each message."
+        await interaction.response.send_message(embed=SuccessEmbed(description=desc), ephemeral=True)
+
     @RSCSettingsMixIn.rsc_settings.command(name="settings", description="Display the current RSC API settings.")
     async def _rsc_settings(self, interaction: discord.Interaction):
         guild = interaction.guild
@@ -468,6 +571,9 @@ class RSC(
         url = await self._get_api_url(guild) or "Not Configured"
         tz = await self._get_timezone(guild)
 
+        asset_channel = await self._get_asset_channel(guild)
+        asset_str = asset_channel.mention if asset_channel else "Not Configured"
+
         modmail_id = await self._get_modmail_bot(guild)
         modmail_str = f"<@{modmail_id}>"
         if not await self.config.guild(guild).ModmailBot():
@@ -492,6 +598,7 @@ class RSC(
         settings_embed.add_field(name="League", value=league_str, inline=False)
         settings_embed.add_field(name="ModMail Bot", value=modmail_str, inline=False)
         settings_embed.add_field(name="Time Zone", value=tz, inline=False)
+        settings_embed.add_field(name="Asset Channel", value=asset_str, inline=False)
         await interaction.response.send_message(embed=settings_embed, ephemeral=True)
 
     @RSCSettingsMixIn.rsc_settings.command(name="league", description="Set the league this guild correlates to in the API")
@@ -576,6 +683,74 @@ class RSC(
         logging.getLogger("ballchasing").setLevel(level)
         await interaction.response.send_message(f"Logging level is now **{level}**", ephemeral=True)
 
+    @RSCSettingsMixIn.rsc_settings.command(name="perf", description="Display request and task latency since the bot started")
+    async def _rsc_perf(self, interaction: discord.Interaction):
+        embeds = [
+            self._perf_embed("RSC API", METRICS.samples(API_REQUEST_SECONDS), ("method", "endpoint")),
+            self._perf_embed("Discord", METRICS.samples(DISCORD_REQUEST_SECONDS), ("method", "route")),
+            self._perf_embed("Task Loops", METRICS.samples(LOOP_SECONDS), ("loop",)),
+            self._perf_embed(
+                "LLM Agent",
+                [*METRICS.samples(AGENT_SECONDS), *METRICS.samples(AGENT_TOOL_SECONDS)],
+                ("surface", "tool"),
+            ),
+        ]
+        await interaction.response.send_message(embeds=embeds, ephemeral=True)
+
+    @staticmethod
+    def _perf_embed(title: str, samples: list[Sample], label_keys: tuple[str, ...]) -> discord.Embed:
+        rows = [(s.labels, s.metric) for s in samples if isinstance(s.metric, Histogram) and s.metric.count]
+        if not rows:
+            return BlueEmbed(title=title, description="No samples yet.")
+
+        rows.sort(key=lambda row: row[1].total, reverse=True)
+        lines = [f"{'(ms)':<40} {'count':>6} {'p50':>6} {'p99':>6} {'max':>6}"]
+        for labels, hist in rows[:PERF_MAX_ROWS]:
+            name = " ".join(labels[k] for k in label_keys if k in labels)
+            p50, p99, worst = (v * 1000 for v in (hist.quantile(0.5), hist.quantile(0.99), hist.max))
+            lines.append(f"{name[:40]:<40} {hist.count:>6} {p50:>6.0f} {p99:>6.0f} {worst:>6.0f}")
+        if len(rows) > PERF_MAX_ROWS:
+            lines.append(f"... {len(rows) - PERF_MAX_ROWS} more")
+        return BlueEmbed(title=title, description="```\n" + "\n".join(lines) + "\n```")
+
+    @RSCSettingsMixIn.rsc_settings.command(name="stalls", description="Display recent event loop stalls")
+    async def _rsc_stalls(self, interaction: discord.Interaction):
+        lag = METRICS.histogram(EVENT_LOOP_LAG_SECONDS)
+        stalls = list(self._watchdog.stalls)
+        embed = BlueEmbed(
+            title="Event Loop",
+            description=(
+                f"Lag p50 **{lag.quantile(0.5) * 1000:.0f}ms**, p99 **{lag.quantile(0.99) * 1000:.0f}ms**, "
+                f"max **{lag.max * 1000:.0f}ms** over {lag.count} samples.\n"
+                f"Stalls over {self._watchdog.threshold * 1000:.0f}ms: **{len(stalls)}**"
+            ),
+        )
+        # Newest first. Embeds cap at 25 fields and 1024 characters a field.
+        for stall in reversed(stalls[-STALLS_MAX_FIELDS:]):
+            frames = "".join(stall.stack[-3:])[-(STALL_FIELD_MAX - 8) :] or "No stack captured."
+            embed.add_field(
+                name=f"{stall.seconds * 1000:.0f}ms at {discord.utils.format_dt(stall.at, 'T')} in {stall.task or 'loop callback'}"[:256],
+                value=f"```\n{frames}\n```",
+                inline=False,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @RSCSettingsMixIn.rsc_settings.command(name="perfreset", description="Clear all recorded performance metrics")
+    @bot_owner_required()
+    async def _rsc_perf_reset(self, interaction: discord.Interaction):
+        METRICS.reset()
+        await interaction.response.send_message(embed=SuccessEmbed(description="Performance metrics cleared."), ephemeral=True)
+
+    @RSCSettingsMixIn.rsc_settings.command(
+        name="prometheus",
+        description="Serve metrics in Prometheus format at localhost:8008/metrics",
+    )
+    @bot_owner_required()
+    async def _rsc_prometheus(self, interaction: discord.Interaction, enabled: bool):
+        await self.config.PrometheusMetrics.set(enabled)
+        state = "enabled" if enabled else "disabled"
+        await interaction.response.send_message(embed=SuccessEmbed(description=f"Prometheus metrics endpoint {state}."), ephemeral=True)
+
     # Non-Group Commands
 
     @app_commands.command(name="whatami", description="What am I?")
@@ -605,7 +780,7 @@ class RSC(
             cmd_list: list[discord.app_commands.Command] = []
             for cmd in cmds:
                 if cmd.default_permissions and (interaction.user.guild_permissions & cmd.default_permissions).value == 0:
-                    log.debug(f"Insufficient Perms for help: {cmd.name}", guild=guild)
+                    log.debug("Insufficient Perms for help: %s", cmd.name, guild=guild)
                     continue
 
                 # super secret tech
@@ -657,7 +832,7 @@ class RSC(
                 if c.name == "feet":
                     continue
                 if c.qualified_name == command:
-                    log.debug(f"Qualified Name: {c.qualified_name}", guild=guild)
+                    log.debug("Qualified Name: %s", c.qualified_name, guild=guild)
                     cmd = c
 
             if not cmd:
@@ -725,6 +900,21 @@ class RSC(
     async def _set_modmail_bot(self, guild: discord.Guild, member: discord.Member | discord.User | None):
         await self.config.guild(guild).ModmailBot.set(member.id if member else None)
 
+    async def _set_asset_channel(self, guild: discord.Guild, channel: discord.TextChannel | None):
+        old = await self.config.guild(guild).AssetChannel()
+        await self.config.guild(guild).AssetChannel.set(channel.id if channel else None)
+        if old:
+            self.asset_host().forget_channel(old)
+
+    async def _get_asset_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
+        channel_id = await self.config.guild(guild).AssetChannel()
+        if not channel_id:
+            return None
+        channel = guild.get_channel(channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            return None
+        return channel
+
     async def _get_modmail_bot(self, guild: discord.Guild) -> int:
         """ModMail bot discord ID. Falls back to `DEFAULT_MODMAIL_BOT_ID` if unconfigured."""
         return await self.config.guild(guild).ModmailBot() or DEFAULT_MODMAIL_BOT_ID
@@ -85,5 +85,5 @@ class DeveloperMixIn(RSCMixIn):
                 latest_log_path = fh.baseFilename
                 break
 
-        log.debug(f"Latest log file: {latest_log_path}")
+        log.debug("Latest log file: %s", latest_log_path)
         return latest_log_path
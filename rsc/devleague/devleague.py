@@ -6,12 +6,14 @@ from redbot.core import app_commands
 
 from rsc.abc import RSCMixIn
 from rsc.devleague import api
+from rsc.devleague.registry import DevLeagueRegistry
 from rsc.embeds import BlueEmbed, ErrorEmbed, OrangeEmbed, SuccessEmbed
 from rsc.utils import utils
 
 log = logging.getLogger("red.rsc.devleague")
 
-defaults_guild = {"DevLeagueRoleUsers": None}
+# DevLeagueRoleUsers is the pre-registry list, migrated by DevLeagueRegistry.
+defaults_guild = {"DevLeagueRoleUsers": None, "DevLeagueMembers": {}}
 
 BUFMAX = 1984
 
@@ -188,10 +190,7 @@ class DevLeagueMixIn(RSCMixIn):
         if devleague_role not in member.roles:
             await member.add_roles(devleague_role, reason="Player opted in to Dev League")
 
-        users = await self._get_devleague_role_users(member.guild) or []
-        if member.id not in users:
-            users.append(member.id)
-            await self._save_devleague_role_users(member.guild, value=users)
+        await self.devleague_registry().add(member.guild.id, member.id)
 
     async def remove_devleague_role(self, member: discord.Member):
         """Remove Dev League role but keep in users list so they don't get it again automatically"""
@@ -200,19 +199,14 @@ class DevLeagueMixIn(RSCMixIn):
         if devleague_role in member.roles:
             await member.remove_roles(devleague_role, reason="Player opted out of Dev League")
 
-        users = await self._get_devleague_role_users(member.guild) or []
-        if member.id not in users:
-            users.append(member.id)
-            await self._save_devleague_role_users(member.guild, value=users)
+        await self.devleague_registry().add(member.guild.id, member.id)
 
     async def should_get_devleague_role(self, member: discord.Member) -> bool:
-        users = await self._get_devleague_role_users(member.guild) or []
-        return member.id not in users
-
-    # region Config
-
-    async def _save_devleague_role_users(self, guild: discord.Guild, value: list[int]):
-        await self.config.custom("DevLeague", str(guild.id)).DevLeagueRoleUsers.set(value)
-
-    async def _get_devleague_role_users(self, guild: discord.Guild):
-        return await self.config.custom("DevLeague", str(guild.id)).DevLeagueRoleUsers()
+        return await self.devleague_registry().is_eligible(member)
+
+    def devleague_registry(self) -> DevLeagueRegistry:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        registry = getattr(self, "_devleague_registry", None)
+        if registry is None:
+            registry = self._devleague_registry = DevLeagueRegistry(self.config)
+        return registry
@@ -0,0 +1,89 @@
+"""Members who have opted in or out of Dev League themselves.
+
+Anyone who has used `/devleague optin` or `/devleague optout` manages their own
+Dev League role from then on, and role syncs must leave it alone. That used to
+be a list in Config that `should_get_devleague_role` read back for every
+member it was asked about, so a daily role sync deserialized it once per league
+player and scanned it linearly each time.
+
+`DevLeagueRegistry` reads a guild's members into a set once and answers from
+memory. Each new member is written on its own with `set_raw`, under a per guild
+lock, instead of a read/append/write of the whole list.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+import discord
+from redbot.core import Config
+
+log = logging.getLogger("red.rsc.devleague.registry")
+
+
+class DevLeagueRegistry:
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._members: dict[int, set[int]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    def _group(self, guild_id: int):
+        return self._config.custom("DevLeague", str(guild_id))
+
+    def _lock(self, guild_id: int) -> asyncio.Lock:
+        return self._locks.setdefault(guild_id, asyncio.Lock())
+
+    async def load(self, guild_id: int) -> set[int]:
+        """A guild's members, read from Config on first use."""
+        members = self._members.get(guild_id)
+        if members is not None:
+            return members
+        async with self._lock(guild_id):
+            # Loaded by whoever held the lock first
+            members = self._members.get(guild_id)
+            if members is None:
+                members = self._members[guild_id] = await self._read(guild_id)
+        return members
+
+    async def _read(self, guild_id: int) -> set[int]:
+        group = self._group(guild_id)
+        stored: dict[str, bool] = await group.DevLeagueMembers()
+        members = {int(member_id) for member_id in stored}
+
+        legacy: list[int] | None = await group.DevLeagueRoleUsers()
+        if legacy:
+            # Written by older versions as one list. Moved over in a single
+            # write and cleared, so this runs once per guild.
+            members.update(legacy)
+            await group.DevLeagueMembers.set({str(member_id): True for member_id in members})
+            await group.DevLeagueRoleUsers.clear()
+            log.info(f"Migrated {len(legacy)} Dev League role user(s) for guild {guild_id}.")
+        return members
+
+    async def add(self, guild_id: int, member_id: int) -> bool:
+        """Record a member's choice. Returns False if they were already recorded."""
+        members = await self.load(guild_id)
+        async with self._lock(guild_id):
+            if member_id in members:
+                return False
+            await self._group(guild_id).DevLeagueMembers.set_raw(str(member_id), value=True)
+            members.add(member_id)
+        return True
+
+    async def is_eligible(self, member: discord.Member) -> bool:
+        """Whether role syncs may hand `member` the Dev League role."""
+        return member.id not in await self.load(member.guild.id)
+
+    async def filter_eligible(self, members: Iterable[discord.Member]) -> list[discord.Member]:
+        """The members role syncs may hand the Dev League role, in order.
+
+        Each guild's set is loaded once however many members are passed.
+        """
+        eligible = []
+        for member in members:
+            recorded = self._members.get(member.guild.id)
+            if recorded is None:
+                recorded = await self.load(member.guild.id)
+            if member.id not in recorded:
+                eligible.append(member)
+        return eligible
@@ -639,7 +639,7 @@ class AnsiColor(IntEnum):
         red = b[0]
         green = b[1]
         blue = b[2]
-        log.debug(f"Red: {red} Green: {green} Blue: {blue}")
+        log.debug("Red: %s Green: %s Blue: %s", red, green, blue)
 
         if red == green and green == blue:
             if red < 8:
@@ -657,7 +657,7 @@ class AnsiColor(IntEnum):
 
     @staticmethod
     def ansi256_to_ansi(code: int) -> int:
-        log.debug(f"Code: {code}")
+        log.debug("Code: %s", code)
         if code < 8:
             return 30 + code
 
@@ -701,7 +701,7 @@ class AnsiColor(IntEnum):
         a256code = AnsiColor.rgb_to_ansii256(hex)
         acode = AnsiColor.ansi256_to_ansi(a256code)
 
-        log.debug(f"RGB -> Ansi Code: {acode}")
+        log.debug("RGB -> Ansi Code: %s", acode)
 
         if bold:
             aformat = 1
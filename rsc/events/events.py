@@ -40,6 +40,7 @@ from rsc.events.models import (
 from rsc.events.views import ConfirmCursorView, EventFilterView
 from rsc.exceptions import RscException
 from rsc.logs import GuildLogAdapter
+from rsc.metrics import LOOP_ERRORS, METRICS, timed_loop
 from rsc.settings import RSCSettingsMixIn
 from rsc.types import EventSettings
 
@@ -93,6 +94,7 @@ class EventMixIn(RSCMixIn):
     # Tasks
 
     @tasks.loop(seconds=EVENT_LOOP_TICK)
+    @timed_loop("rsc_events_loop")
     async def rsc_events_loop(self):
         """Base tick. Each guild polls on its own configured interval."""
         for guild in list(self.bot.guilds):
@@ -108,6 +110,7 @@ class EventMixIn(RSCMixIn):
                 # stops permanently, and ApiException/RscException/ValidationError
                 # are not among them. Contain every failure to the guild it came
                 # from so one bad guild cannot kill the loop.
+                METRICS.counter(LOOP_ERRORS, loop="rsc_events_loop").inc()
                 await self._record_failure(guild, state, exc)
             finally:
                 interval = await self._get_event_interval(guild)
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING
 
 import discord
 
-from rsc.enums import EventAction
+from rsc.enums import EventAction, EventCategory
 
 if TYPE_CHECKING:
     from rsc.abc import RSCMixIn
@@ -40,8 +40,28 @@ async def handle_player_traded(cog: "RSCMixIn", guild: discord.Guild, event: "Le
     await process_trade_event(cog, guild, event)
 
 
+async def handle_object_changed(cog: "RSCMixIn", guild: discord.Guild, event: "LeagueEventData") -> None:
+    """A franchise, GM, name or match changed in the API.
+
+    The payload does not say reliably which kind of object moved, and a rebuild
+    is a single franchise list request, so any object event drops the index
+    rather than trying to patch it.
+
+    The feed has no dedicated match result action. A score reported on the
+    website arrives as an object update, so the cached schedules and standings
+    are dropped on the same signal.
+    """
+    if event.event_category is not EventCategory.OBJECT:
+        return
+    cog.invalidate_franchise_index(guild)
+    cog.invalidate_season_cache(guild)
+
+
 #: Optional side effects keyed by action. An action with no entry is logged and
 #: dispatched but triggers nothing else.
 EVENT_HANDLERS: dict[EventAction, EventHandler] = {
     EventAction.PLAYER_TRADED: handle_player_traded,
+    EventAction.NAME_CHANGE: handle_object_changed,
+    EventAction.TRANSFER: handle_object_changed,
+    EventAction.UPDATE: handle_object_changed,
 }
@@ -8,14 +8,14 @@ log = logging.getLogger("red.rsc.exceptions")
 
 
 async def translate_api_error(exc: RscApiException):
-    log.debug(f"ApiException Status: {exc.status}")
+    log.debug("ApiException Status: %s", exc.status)
     if exc.status == 500:
         return InternalServerError(response=exc)
 
     if not exc.body:
         return RscException(response=exc)
 
-    log.debug(f"ApiException Body: {exc.body}")
+    log.debug("ApiException Body: %s", exc.body)
     body = json.loads(exc.body)
     reason = body.get("detail")
 
@@ -54,13 +54,13 @@ class RscException(Exception):  # noqa: N818
         self.status = None
         self.extra = None
         self.type = None
-        log.debug(f"ExceptionType: {type(self.response)}")
+        log.debug("ExceptionType: %s", type(self.response))
         if self.response is not None and isinstance(self.response, RscApiException):
             self.status = self.response.status
             try:
                 if self.response.body:
                     body = json.loads(self.response.body)
-                    log.debug(f"Response Body: {body}")
+                    log.debug("Response Body: %s", body)
                     if body.get("detail"):
                         log.debug("Found 'detail' in response body")
                         self.reason = body.get("detail")
@@ -1,7 +1,7 @@
 import logging
 from os import PathLike
 from typing import cast
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import discord
 from pydantic import ValidationError
@@ -20,6 +20,7 @@ from rsc.abc import RSCMixIn
 from rsc.const import API_TIMEOUT
 from rsc.embeds import BlueEmbed
 from rsc.exceptions import RscException
+from rsc.franchises.index import FranchiseIndex
 from rsc.utils.cache import merge_name_cache
 
 log = logging.getLogger("red.rsc.franchises")
@@ -29,6 +30,9 @@ class FranchiseMixIn(RSCMixIn):
     def __init__(self):
         log.debug("Initializing FranchiseMixIn")
         self._franchise_cache: dict[int, list[str]] = {}
+        # Full franchise records, rebuilt from every unfiltered franchises()
+        # call. See rsc.franchises.index.
+        self._franchise_index: dict[int, FranchiseIndex] = {}
         super().__init__()
 
     # Autocomplete
@@ -148,6 +152,30 @@ class FranchiseMixIn(RSCMixIn):
             raise AttributeError("Franchise data has no ID attached.")
         await self.delete_franchise(guild, f.id)
 
+    async def franchise_index(self, guild: discord.Guild) -> FranchiseIndex:
+        """The guild's franchise lookup index, built on first use.
+
+        Costs one unfiltered `franchises()` call when the index is missing or was
+        invalidated, and nothing after that.
+        """
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        indexes = getattr(self, "_franchise_index", None)
+        if indexes is None:
+            indexes = self._franchise_index = {}
+
+        index = indexes.get(guild.id)
+        if index is None:
+            await self.franchises(guild)
+            index = indexes.setdefault(guild.id, FranchiseIndex(()))
+        return index
+
+    def invalidate_franchise_index(self, guild: discord.Guild | int) -> None:
+        """Drop the guild's franchise index so the next lookup rebuilds it."""
+        guild_id = guild if isinstance(guild, int) else guild.id
+        indexes = getattr(self, "_franchise_index", None)
+        if indexes and indexes.pop(guild_id, None) is not None:
+            log.debug("Franchise index invalidated for guild %s", guild_id)
+
     async def full_logo_url(self, guild: discord.Guild, logo_url: str) -> str:
         host = await self._get_api_url(guild)
         if not host:
@@ -197,8 +225,14 @@ class FranchiseMixIn(RSCMixIn):
                 merged = merge_name_cache(cached, (f.name for f in flist if f.name), full_refresh=full_refresh)
                 merged.sort()
                 if merged != cached:
-                    log.debug(f"[{guild.name}] Franchise cache now holds {len(merged)} franchises")
+                    log.debug("[%s] Franchise cache now holds %s franchises", guild.name, len(merged))
                 self._franchise_cache[guild.id] = merged
+
+            if full_refresh:
+                indexes = getattr(self, "_franchise_index", None)
+                if indexes is None:
+                    indexes = self._franchise_index = {}
+                indexes[guild.id] = FranchiseIndex.from_franchises(flist)
             return flist
 
     async def franchise_by_id(self, guild: discord.Guild, id: int) -> Franchise | None:
@@ -216,10 +250,16 @@ class FranchiseMixIn(RSCMixIn):
             api = FranchisesApi(client)
             try:
                 logo_param = str(logo) if isinstance(logo, PathLike) else logo
-                return await api.franchises_upload_logo_update(id=id, logo=logo_param)
+                result = await api.franchises_upload_logo_update(id=id, logo=logo_param)
             except ApiException as exc:
                 raise RscException(response=exc)
 
+        # Only the logo changed, so patch it rather than drop the whole index.
+        indexes = getattr(self, "_franchise_index", None)
+        if indexes and guild.id in indexes:
+            indexes[guild.id] = indexes[guild.id].updated(id, logo=result.logo)
+        return result
+
     async def create_franchise(
         self,
         guild: discord.Guild,
@@ -241,15 +281,17 @@ class FranchiseMixIn(RSCMixIn):
             except ValidationError as exc:
                 raise RscException(message=f"Invalid franchise data: {exc.errors()[0]['msg']}")
 
-            log.debug(f"Create Franchise Data: {data}")
+            log.debug("Create Franchise Data: %s", data)
             try:
                 result = await api.franchises_create(data)
             except ApiException as exc:
                 raise RscException(response=exc)
 
+            self.invalidate_franchise_index(guild)
+
             # Populate cache
             if result.name not in self._franchise_cache[guild.id]:
-                log.debug(f"Adding {result.name} to franchise cache")
+                log.debug("Adding %s to franchise cache", result.name)
                 self._franchise_cache[guild.id].append(result.name)
                 self._franchise_cache[guild.id].sort()
 
@@ -262,25 +304,30 @@ class FranchiseMixIn(RSCMixIn):
                 await api.franchises_destroy(id)
             except ApiException as exc:
                 raise RscException(response=exc)
+            self.invalidate_franchise_index(guild)
 
     async def rebrand_franchise(self, guild: discord.Guild, id: int, rebrand: FranchiseRebrand) -> Franchise:
         async with self.api_client(guild) as client:
             api = FranchisesApi(client)
             try:
-                log.debug(f"Rebrand Params: {rebrand}")
-                return await api.franchises_rebrand_update(id, rebrand)
+                log.debug("Rebrand Params: %s", rebrand)
+                result = await api.franchises_rebrand_update(id, rebrand)
             except ApiException as exc:
                 raise RscException(response=exc)
+            self.invalidate_franchise_index(guild)
+            return result
 
     async def transfer_franchise(self, guild: discord.Guild, id: int, gm: discord.Member) -> Franchise:
         async with self.api_client(guild) as client:
             api = FranchisesApi(client)
             try:
                 data = FranchiseTransferRequest(general_manager=gm.id, league=self._league[guild.id])
-                log.debug(f"Transfer Params: {data}")
-                return await api.franchises_transfer_franchise_update(id, data)
+                log.debug("Transfer Params: %s", data)
+                result = await api.franchises_transfer_franchise_update(id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
+            self.invalidate_franchise_index(guild)
+            return result
 
     async def add_agm(
         self, guild: discord.Guild, id: int, agm: discord.Member | discord.User | int, executor: discord.Member | discord.User | int
@@ -302,10 +349,12 @@ class FranchiseMixIn(RSCMixIn):
             api = FranchisesApi(client)
             try:
                 data = FranchiseAGMRequest(agm=agm_id, executor=executor_id)
-                log.debug(f"Add AGM Params: franchise={id} {data}")
-                return await api.franchises_add_agm_update(id=id, franchise_agm_request=data)
+                log.debug("Add AGM Params: franchise=%s %s", id, data)
+                result = await api.franchises_add_agm_update(id=id, franchise_agm_request=data)
             except ApiException as exc:
                 raise RscException(response=exc)
+        self._index_agms(guild, id, result)
+        return result
 
     async def remove_agm(
         self, guild: discord.Guild, id: int, agm: discord.Member | discord.User | int, executor: discord.Member | discord.User | int
@@ -323,10 +372,19 @@ class FranchiseMixIn(RSCMixIn):
             api = FranchisesApi(client)
             try:
                 data = FranchiseAGMRequest(agm=agm_id, executor=executor_id)
-                log.debug(f"Remove AGM Params: franchise={id} {data}")
-                return await api.franchises_remove_agm_update(id=id, franchise_agm_request=data)
+                log.debug("Remove AGM Params: franchise=%s %s", id, data)
+                result = await api.franchises_remove_agm_update(id=id, franchise_agm_request=data)
             except ApiException as exc:
                 raise RscException(response=exc)
+        self._index_agms(guild, id, result)
+        return result
+
+    def _index_agms(self, guild: discord.Guild, id: int, franchise: Franchise) -> None:
+        """Write a franchise's new AGM list through to the guild's franchise index, if it has one."""
+        indexes = getattr(self, "_franchise_index", None)
+        if indexes and guild.id in indexes:
+            agm_ids = tuple(a.discord_id for a in (franchise.agms or []) if a.discord_id)
+            indexes[guild.id] = indexes[guild.id].updated(id, agm_ids=agm_ids)
 
     async def franchises_agm_of(self, guild: discord.Guild, discord_id: int) -> list[FranchiseList]:
         """Every franchise in this league that lists `discord_id` as an AGM.
@@ -391,6 +449,20 @@ class FranchiseMixIn(RSCMixIn):
         return result
 
     async def franchise_logo(self, guild: discord.Guild, id: int) -> str | None:
+        """Full URL of a franchise's logo, or `None` if it has none.
+
+        Served from the franchise index, which holds every logo from the same
+        list request. A warm lookup makes no request, and no config read either
+        when the API returned a full URL. Only a franchise the index does not
+        know yet falls back to the logo endpoint.
+        """
+        entry = (await self.franchise_index(guild)).by_id(id)
+        if entry is not None:
+            if not entry.logo or urlparse(entry.logo).netloc:
+                return entry.logo
+            host = await self._get_api_url(guild)
+            return urljoin(host, entry.logo) if host else None
+
         host = await self._get_api_url(guild)
         if not host:
             return None
@@ -402,7 +474,7 @@ class FranchiseMixIn(RSCMixIn):
                 if not (logo and logo.logo):
                     return None
                 full_url = urljoin(host, logo.logo)
-                log.debug(f"Franchise Logo: {full_url}")
+                log.debug("Franchise Logo: %s", full_url)
                 return full_url
             except NotFoundException:
                 return None
@@ -0,0 +1,156 @@
+"""In-memory franchise lookup index.
+
+Built from one unfiltered `franchises()` response and held per guild alongside
+`_franchise_cache`. Anything that needs to turn free text into a franchise --
+the trade parser above all -- reads from here instead of scanning the GM role
+and asking the API once per GM.
+
+GM display names are deliberately NOT captured at build time. Nicknames change
+far more often than franchises do, and the guild member cache already holds the
+live value, so `match_gm` resolves them on lookup. The index only has to be
+rebuilt when the API side changes: a rebrand, transfer, create or delete, or an
+object event from the league feed.
+
+The list response also carries each franchise's logo and AGMs, so the roster,
+franchise, trade and transaction embeds read those from here as well rather
+than asking the logo endpoint and re-fetching the franchise on every render.
+A logo upload patches its entry in place instead of dropping the whole index.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+import discord
+from rscapi.models.franchise_list import FranchiseList
+
+from rsc.utils.utils import strip_franchise_prefix, strip_trailing_accolades
+
+
+def normalize_name(value: str) -> str:
+    """Lookup key for a franchise, prefix or GM name.
+
+    Drops a "TQD | " style prefix and trailing accolades so a pasted nickname
+    and the stored RSC name produce the same key.
+    """
+    return strip_trailing_accolades(strip_franchise_prefix(value)).casefold()
+
+
+@dataclass(frozen=True, slots=True)
+class FranchiseIndexEntry:
+    id: int
+    name: str
+    prefix: str | None
+    gm_id: int | None
+    gm_name: str | None
+    teams: tuple[str, ...] = ()
+    # As the API returns it: usually a full URL, but may be relative to the API host.
+    logo: str | None = None
+    agm_ids: tuple[int, ...] = ()
+
+
+class FranchiseIndex:
+    """Franchise records keyed by id, GM, normalized name and prefix.
+
+    Immutable once built. Refreshing means building a new one and swapping it
+    in, so a parse running concurrently with a rebuild never sees a half filled
+    index.
+    """
+
+    def __init__(self, entries: Iterable[FranchiseIndexEntry]) -> None:
+        self.entries: tuple[FranchiseIndexEntry, ...] = tuple(entries)
+        self._by_id: dict[int, FranchiseIndexEntry] = {}
+        self._by_gm: dict[int, FranchiseIndexEntry] = {}
+        self._by_name: dict[str, FranchiseIndexEntry] = {}
+        self._by_prefix: dict[str, FranchiseIndexEntry] = {}
+        for entry in self.entries:
+            self._by_id[entry.id] = entry
+            self._by_name[entry.name.casefold()] = entry
+            if entry.prefix:
+                self._by_prefix[entry.prefix.casefold()] = entry
+            if entry.gm_id:
+                self._by_gm[entry.gm_id] = entry
+
+    @classmethod
+    def from_franchises(cls, franchises: Iterable[FranchiseList]) -> "FranchiseIndex":
+        entries = []
+        for f in franchises:
+            # `franchises()` already rejects a nameless franchise. An id-less one
+            # cannot be traded with, so it is left out rather than indexed.
+            if not (f.id and f.name):
+                continue
+            entries.append(
+                FranchiseIndexEntry(
+                    id=f.id,
+                    name=f.name,
+                    prefix=f.prefix,
+                    gm_id=f.gm.discord_id if f.gm else None,
+                    gm_name=f.gm.rsc_name if f.gm else None,
+                    teams=tuple(t.name for t in (getattr(f, "teams", None) or []) if t.name),
+                    logo=getattr(f, "logo", None) or None,
+                    agm_ids=tuple(a.discord_id for a in (getattr(f, "agms", None) or []) if a.discord_id),
+                )
+            )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def updated(self, franchise_id: int, **changes) -> "FranchiseIndex":
+        """A copy with one entry's fields changed. Returns `self` if the franchise is not indexed."""
+        if franchise_id not in self._by_id:
+            return self
+        return FranchiseIndex(replace(e, **changes) if e.id == franchise_id else e for e in self.entries)
+
+    def by_id(self, franchise_id: int) -> FranchiseIndexEntry | None:
+        return self._by_id.get(franchise_id)
+
+    def by_gm(self, discord_id: int) -> FranchiseIndexEntry | None:
+        return self._by_gm.get(discord_id)
+
+    def by_name(self, name: str) -> FranchiseIndexEntry | None:
+        return self._by_name.get(name.strip().casefold())
+
+    def by_prefix(self, prefix: str) -> FranchiseIndexEntry | None:
+        return self._by_prefix.get(prefix.strip().casefold())
+
+    def _gm_keys(self, entry: FranchiseIndexEntry, guild: discord.Guild | None) -> set[str]:
+        keys = set()
+        if entry.gm_name:
+            keys.add(normalize_name(entry.gm_name))
+        if guild and entry.gm_id:
+            member = guild.get_member(entry.gm_id)
+            if member:
+                keys.add(normalize_name(member.display_name))
+        keys.discard("")
+        return keys
+
+    def match_gm(self, text: str, guild: discord.Guild | None = None) -> list[FranchiseIndexEntry]:
+        """Franchises a trade line's GM text could refer to.
+
+        Tried in order, stopping at the first step with any match:
+
+        1. Exact GM name, against both the RSC name and the GM's current
+           nickname when `guild` is given.
+        2. Exact franchise name, then exact prefix.
+        3. GM names starting with the text. This is what the old role scan did,
+           and what lets "nick receives:" find "nickm".
+
+        More than one result means the text is ambiguous. The caller decides
+        what to do about it; the old scan silently took whichever GM sorted
+        first in the role.
+        """
+        key = normalize_name(text)
+        if not key:
+            return []
+
+        keyed = [(entry, self._gm_keys(entry, guild)) for entry in self.entries]
+
+        exact = [entry for entry, keys in keyed if key in keys]
+        if exact:
+            return exact
+
+        named = self._by_name.get(key) or self._by_prefix.get(text.strip().casefold())
+        if named:
+            return [named]
+
+        return [entry for entry, keys in keyed if any(k.startswith(key) for k in keys)]
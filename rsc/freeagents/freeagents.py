@@ -45,7 +45,7 @@ class FreeAgentMixIn(RSCMixIn):
         """Populate checked in free agents to cache"""
         fa_checkins = await self._get_check_ins(guild)
         self._check_ins[guild.id] = fa_checkins
-        log.debug(f"FA Cache: {self._check_ins[guild.id]}")
+        log.debug("FA Cache: %s", self._check_ins[guild.id])
 
     # Tasks
 
@@ -68,7 +68,7 @@ class FreeAgentMixIn(RSCMixIn):
             for player in v:
                 checkin_date = datetime.fromisoformat(player["date"])
                 if checkin_date.date() <= yesterday.date():
-                    log.debug(f"[{guild.name} Expiring FA check in: {player['player']}")
+                    log.debug("[%s Expiring FA check in: %s", guild.name, player["player"])
                     await self.remove_checkin(guild, player)
 
     @expire_free_agent_checkins_loop.before_loop
@@ -395,13 +395,13 @@ class FreeAgentMixIn(RSCMixIn):
 
     async def update_freeagent_visibility(self, guild: discord.Guild, player: discord.Member, visibility: bool):
         """Remove free agent check in for guild"""
-        log.debug(f"Changing checkin visibility for {player.id} to {visibility}")
+        log.debug("Changing checkin visibility for %s to %s", player.id, visibility)
         checkins = await self._get_check_ins(guild)
-        log.debug(f"Current Checkins: {checkins}")
+        log.debug("Current Checkins: %s", checkins)
         for c in checkins:
             if c["player"] == player.id:
                 c["visible"] = visibility
-        log.debug(f"New Checkins: {checkins}")
+        log.debug("New Checkins: %s", checkins)
         self._check_ins[guild.id] = checkins
         await self._save_check_ins(guild, checkins)
 
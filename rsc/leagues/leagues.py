@@ -1,8 +1,9 @@
+import asyncio
 import logging
+from collections import deque
 from collections.abc import AsyncIterator
 from datetime import datetime
 
-from aiohttp import web
 import discord
 from redbot.core import app_commands
 from rscapi import LeaguePlayersApi, LeaguesApi
@@ -20,18 +21,30 @@ from rsc.exceptions import RscException
 from rsc.tiers import TierMixIn
 from rsc.utils import utils
 from rsc.utils.pagify import Pagify
+from rsc.webhooks import WebhookJob, WebhookRoute
 
 log = logging.getLogger("red.rsc.leagues")
 
+# Pages `player_pages` keeps in flight ahead of its consumer.
+PLAYER_PAGE_PREFETCH = 4
+
 
 class LeagueMixIn(RSCMixIn):
     def __init__(self):
         log.debug("Initializing LeagueMixIn")
         super().__init__()
 
-    # Web App
+    # Webhooks
+
+    def league_webhook_routes(self) -> list[WebhookRoute]:
+        return [WebhookRoute("league_player_update", self._prepare_league_player_update, self._handle_league_player_update)]
+
+    async def _prepare_league_player_update(self, data: dict) -> list[WebhookJob]:
+        if not isinstance(data, dict):
+            raise TypeError("League player update must be a JSON object")
+        return [data]
 
-    async def league_player_update_handler(self, request: web.Request):
+    async def _handle_league_player_update(self, job: WebhookJob):
         log.debug("Got league player update event.")
 
     # Commands
@@ -403,6 +416,57 @@ class LeagueMixIn(RSCMixIn):
 
             offset += per_page
 
+    async def player_pages(
+        self,
+        guild: discord.Guild,
+        status: Status | None = None,
+        season: int | None = None,
+        per_page: int = 100,
+        prefetch: int = PLAYER_PAGE_PREFETCH,
+        total: int | None = None,
+    ) -> AsyncIterator[list[LeaguePlayer]]:
+        """League players a page at a time, in order, with `prefetch` pages requested ahead.
+
+        `paged_players` waits for each page before asking for the next. Here the
+        offsets come from the player count up front, so the next pages are already
+        on the wire while the caller works through this one. Pass `total` if the
+        caller has counted already.
+        """
+        if total is None:
+            total = await self.total_players(guild, status=status, season=season)
+        offsets = iter(range(0, total, per_page))
+        in_flight: deque[asyncio.Task[list[LeaguePlayer]]] = deque()
+
+        def request_next() -> bool:
+            offset = next(offsets, None)
+            if offset is None:
+                return False
+            in_flight.append(asyncio.create_task(self.players(guild, status=status, season=season, limit=per_page, offset=offset)))
+            return True
+
+        try:
+            while len(in_flight) < max(prefetch, 1) and request_next():
+                pass
+            page: list[LeaguePlayer] = []
+            while in_flight:
+                page = await in_flight.popleft()
+                request_next()
+                if page:
+                    yield page
+
+            # Players added since the count land past the last offset. A full last
+            # page means there may be more, so finish off one page at a time.
+            offset = total
+            while len(page) == per_page:
+                page = await self.players(guild, status=status, season=season, limit=per_page, offset=offset)
+                if page:
+                    yield page
+                offset += per_page
+        finally:
+            # The caller stopped early or a page failed. Drop the rest.
+            for task in in_flight:
+                task.cancel()
+
     async def update_league_player(
         self,
         guild: discord.Guild,
@@ -422,7 +486,7 @@ class LeagueMixIn(RSCMixIn):
         if current_mmr:
             data.current_mmr = current_mmr
         if tier:
-            log.debug(f"Tier: {type(tier)} {tier}")
+            log.debug("Tier: %s %s", type(tier), tier)
             data.tier = tier
         if team:
             data.team_name = team
@@ -441,14 +505,17 @@ class LeagueMixIn(RSCMixIn):
 
         async with self.api_client(guild) as client:
             api = LeaguePlayersApi(client)
-            log.debug(f"League Player Patch: {data}")
+            log.debug("League Player Patch: %s", data)
             try:
                 result = await api.league_players_partial_update(
                     id=player_id,
                     league=self._league[guild.id],
                     patched_league_player_patch=data,
                 )
-                log.debug(f"Patch Result: {result}")
-                return result
+                log.debug("Patch Result: %s", result)
             except ApiException as exc:
                 raise RscException(response=exc)
+            if status:
+                # The last membership audit read the old status
+                self.membership_audit().invalidate(guild.id)
+            return result
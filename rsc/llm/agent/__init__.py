@@ -3,6 +3,7 @@
 # Importing the tools package registers every tool. It must happen before
 # `tool_schemas()` is called, so it is done here rather than at each call site.
 from rsc.llm.agent import tools as tools
+from rsc.llm.agent.answers import AnswerCache as AnswerCache
 from rsc.llm.agent.budget import CooldownTracker as CooldownTracker
 from rsc.llm.agent.budget import UsageAccumulator as UsageAccumulator
 from rsc.llm.agent.budget import usage_day as usage_day
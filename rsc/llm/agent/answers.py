@@ -0,0 +1,149 @@
+"""Cache of final agent answers, for questions that keep getting asked.
+
+`ToolCache` saves RSC API calls inside one answer; this saves the whole model
+loop when the same question comes round again ("when is the draft", "can a
+sub play in playoffs"). Keys are per guild and carry `PROMPT_VERSION` and the
+rulebook content hash, so a prompt change or a rules update strands every old
+entry rather than serving an answer built on the previous text.
+
+Only answers nobody else could get differently are stored. An answer that
+looked the asker up, looked up their team without the question naming it, or
+used no tools at all (and so may have come from the "Asked by" line) is never
+shared. Nor is one whose text names the asker, their team, franchise or tier
+when the question did not: the model may tailor a rules answer from the
+"Asked by" line without any tool call ("for your tier (Elite) the cap is...").
+A question in the first person ("what is my tier's cap") is never shared
+either, since its answer may rest on who asked without naming them.
+"""
+
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import replace
+
+from rsc.llm.agent.context import AgentContext, UserIdentity
+from rsc.llm.agent.loop import AgentResult
+from rsc.llm.agent.registry import TOOLS
+from rsc.llm.config import ANSWER_CACHE_MAXSIZE, ANSWER_CACHE_TTL, API_CACHE_TTL, PROMPT_VERSION
+from rsc.llm.rulebook import rulebook_hash
+
+AnswerKey = tuple[int, int, str, str]
+
+# Punctuation outside a word. Dots, apostrophes and hyphens inside one are kept
+# so "5.7.3", "can't" and "co-captain" survive.
+_PUNCTUATION = re.compile(r"[^\w\s.'-]|(?<!\w)[.'-]|[.'-](?!\w)")
+# Words that make a question about the asker ("am i" is covered by "i")
+_FIRST_PERSON = frozenset({"i", "me", "my", "mine", "myself", "i'm", "i've", "i'd", "i'll"})
+
+
+def normalize_question(question: str) -> str:
+    """Case, spacing and punctuation folded away, so rephrasings share a key."""
+    text = unicodedata.normalize("NFKC", question).replace("\u2019", "'").casefold()
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def answer_key(guild_id: int, question: str) -> AnswerKey:
+    """Key for a question. Rulebooks must already be loaded."""
+    return (guild_id, PROMPT_VERSION, rulebook_hash(), normalize_question(question))
+
+
+def _own_terms(identity: UserIdentity) -> set[str]:
+    """The asker's name, team, franchise and tier, normalized like a question."""
+    terms = {normalize_question(v) for v in (identity.name, identity.team, identity.franchise, identity.tier) if v}
+    terms.discard("")
+    return terms
+
+
+def _looked_up_asker(ctx: AgentContext, question: str) -> bool:
+    """Whether a tool was pointed at the asker without the question naming them.
+
+    "Who is on my team" becomes `get_team_roster(team="Bulls")` via the
+    identity line, and that answer is wrong for anyone not on the Bulls.
+    """
+    identity = ctx.identity
+    if identity is None:
+        return False
+    asked = f" {normalize_question(question)} "
+    own = _own_terms(identity)
+    for value in ctx.tools_called.values:
+        if identity.discord_id is not None and value == identity.discord_id:
+            return True
+        if isinstance(value, str) and (norm := normalize_question(value)) in own and f" {norm} " not in asked:
+            return True
+    return False
+
+
+def _asks_about_asker(question: str) -> bool:
+    """Whether the question is in the first person, and so about whoever asked it."""
+    return not _FIRST_PERSON.isdisjoint(normalize_question(question).split())
+
+
+def _mentions_asker(ctx: AgentContext, question: str, answer: str) -> bool:
+    """Whether the answer names the asker, their team, franchise or tier and the question does not."""
+    if ctx.identity is None:
+        return False
+    asked = f" {normalize_question(question)} "
+    said = f" {normalize_question(answer)} "
+    return any(f" {term} " in said and f" {term} " not in asked for term in _own_terms(ctx.identity))
+
+
+def answer_ttl(ctx: AgentContext, question: str, answer: str) -> float | None:
+    """How long a finished answer may be shared, or None if it must not be.
+
+    Answers built only on the rulebooks and help docs last `ANSWER_CACHE_TTL`;
+    anything that read league data gets the tool cache's short TTL. An answer
+    that used a tool which is neither is never stored -- schedules and
+    transactions are uncached for a reason.
+    """
+    entries = [TOOLS.get(name) for name in ctx.tools_called.names]
+    if not entries or any(entry is None or entry.personal for entry in entries):
+        return None
+    if any(not (entry.static or entry.cacheable) for entry in entries):
+        return None
+    if _asks_about_asker(question):
+        return None
+    if _looked_up_asker(ctx, question) or _mentions_asker(ctx, question, answer):
+        return None
+    return ANSWER_CACHE_TTL if all(entry.static for entry in entries) else API_CACHE_TTL
+
+
+class AnswerCache:
+    def __init__(self, maxsize: int = ANSWER_CACHE_MAXSIZE, clock: Callable[[], float] = time.monotonic) -> None:
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[AnswerKey, tuple[float, AgentResult]] = OrderedDict()
+
+    def get(self, key: AnswerKey) -> AgentResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires < self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return _copy(result)
+
+    def put(self, key: AnswerKey, result: AgentResult, ttl: float) -> None:
+        self._entries[key] = (self._clock() + ttl, _copy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def store(self, ctx: AgentContext, question: str, result: AgentResult) -> bool:
+        """Keep a finished answer if it is safe to share. Returns whether it was kept."""
+        ttl = answer_ttl(ctx, question, result.answer)
+        if ttl is None:
+            return False
+        self.put(answer_key(ctx.guild.id, question), result, ttl)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _copy(result: AgentResult) -> AgentResult:
+    # Lists copied, so a caller editing its result cannot change the next hit.
+    return replace(result, tools_called=list(result.tools_called), citations=list(result.citations))
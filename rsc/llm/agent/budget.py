@@ -4,13 +4,18 @@ None of this existed under the RAG pipeline -- the mention listener answered
 every mention with no ceiling, no rate limit, and no record of what it cost.
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from openai.types.responses import ResponseUsage
 
+if TYPE_CHECKING:
+    from redbot.core import Config
+
 log = logging.getLogger("red.rsc.llm.budget")
 # Separate logger so spend can be routed to its own sink or grepped on its own.
 usage_log = logging.getLogger("red.rsc.llm.usage")
@@ -105,3 +110,103 @@ class CooldownTracker:
 def usage_day(now: datetime) -> str:
     """Calendar day key in the guild's timezone."""
     return now.strftime("%Y-%m-%d")
+
+
+@dataclass(slots=True)
+class UsageBucket:
+    """One user's, or the guild's (user id 0), usage on `day`."""
+
+    day: str | None = None
+    count: int = 0
+    tokens: int = 0
+
+
+UsageKey = tuple[int, int]
+
+
+class UsageLedger:
+    """Daily question and token counters, held in memory and written to Config in batches.
+
+    Each bucket is read from the `LLMUsage` custom group the first time it is
+    needed. After that, checks and increments never touch Config. `flush()`
+    writes every changed bucket back as a single set. The cog calls it on an
+    interval and on unload. A new day resets a bucket in memory the first time
+    it is counted against. Buckets left on an earlier day are dropped from
+    memory once they have been written.
+    """
+
+    def __init__(self, config: "Config") -> None:
+        self._config = config
+        self._buckets: dict[UsageKey, UsageBucket] = {}
+        self._dirty: set[UsageKey] = set()
+        # guild id -> the latest day seen for it, in the guild's timezone
+        self._today: dict[int, str] = {}
+        self._lock = asyncio.Lock()
+        # Flushes write outside `_lock`. Serialized, so an older snapshot can
+        # never land after a newer one.
+        self._flush_lock = asyncio.Lock()
+
+    def _seen_day(self, guild_id: int, day: str) -> None:
+        # "%Y-%m-%d" sorts by date, and an earlier day asked about late must not
+        # move it back.
+        if day > self._today.get(guild_id, ""):
+            self._today[guild_id] = day
+
+    async def _bucket(self, key: UsageKey) -> UsageBucket:
+        # Caller holds the lock, so a bucket is only ever loaded once.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            record = self._config.custom("LLMUsage", str(key[0]), str(key[1]))
+            bucket = UsageBucket(day=await record.day(), count=int(await record.count()), tokens=int(await record.tokens()))
+            self._buckets[key] = bucket
+        return bucket
+
+    async def usage(self, guild_id: int, user_id: int, now: datetime) -> tuple[int, int]:
+        """Questions asked and tokens spent on `now`'s day."""
+        day = usage_day(now)
+        async with self._lock:
+            self._seen_day(guild_id, day)
+            bucket = await self._bucket((guild_id, user_id))
+            if bucket.day != day:
+                return (0, 0)
+            return (bucket.count, bucket.tokens)
+
+    async def record(self, guild_id: int, user_id: int, *, tokens: int, now: datetime) -> None:
+        """Count one question against the user and the guild-wide bucket."""
+        day = usage_day(now)
+        async with self._lock:
+            self._seen_day(guild_id, day)
+            for key in ((guild_id, user_id), (guild_id, 0)):
+                bucket = await self._bucket(key)
+                if bucket.day != day:
+                    bucket.day, bucket.count, bucket.tokens = day, 0, 0
+                bucket.count += 1
+                bucket.tokens += tokens
+                self._dirty.add(key)
+
+    async def flush(self) -> int:
+        """Write every bucket changed since the last flush. Returns how many were written."""
+        async with self._flush_lock:
+            async with self._lock:
+                pending = {key: (b.day, b.count, b.tokens) for key in self._dirty if (b := self._buckets.get(key))}
+                self._dirty.clear()
+
+            written = 0
+            try:
+                for (guild_id, user_id), (day, count, tokens) in pending.items():
+                    record = self._config.custom("LLMUsage", str(guild_id), str(user_id))
+                    await record.set({"day": day, "count": count, "tokens": tokens})
+                    written += 1
+            finally:
+                # Anything not written goes back in the queue for the next flush.
+                self._dirty.update(list(pending)[written:])
+
+            # Everything is on disk, so a bucket from an earlier day can be
+            # dropped. It would only be reset if asked for again.
+            async with self._lock:
+                stale = [key for key, b in self._buckets.items() if key not in self._dirty and b.day != self._today.get(key[0])]
+                for key in stale:
+                    del self._buckets[key]
+        if written:
+            log.debug("Flushed %s LLM usage bucket(s)", written)
+        return written
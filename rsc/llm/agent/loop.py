@@ -40,6 +40,7 @@ from rsc.llm.config import (
     PROMPT_VERSION,
     TOOL_TIMEOUT,
 )
+from rsc.metrics import AGENT_RUNS, AGENT_SECONDS, AGENT_TOKENS, AGENT_TOOL_SECONDS, METRICS
 
 logger = logging.getLogger("red.rsc.llm.agent")
 log = GuildLogAdapter(logger)
@@ -78,16 +79,17 @@ async def _dispatch(ctx: AgentContext, call: ResponseFunctionToolCall) -> str:
         return "ERROR: arguments must be a JSON object"
     kwargs = entry.clean_arguments(kwargs)
 
-    ctx.tools_called.record(name)
+    ctx.tools_called.record(name, kwargs)
 
     async def run() -> str:
         return await asyncio.wait_for(entry.handler(ctx, **kwargs), TOOL_TIMEOUT)
 
     try:
-        if entry.cacheable and ctx.cache is not None:
-            result = await ctx.cache.get_or_fetch(cache_key(ctx.guild.id, name, kwargs), run)
-        else:
-            result = await run()
+        with METRICS.timer(AGENT_TOOL_SECONDS, tool=name):
+            if entry.cacheable and ctx.cache is not None:
+                result = await ctx.cache.get_or_fetch(cache_key(ctx.guild.id, name, kwargs), run)
+            else:
+                result = await run()
     except RscException as exc:
         reason = exc.reason or exc.message or "request failed"
         log.warning(f"Tool {name} API error: {reason}", guild=ctx.guild)
@@ -208,11 +210,20 @@ async def _final_answer(ctx: AgentContext, system: str, input_items: list[Any])
 async def run_agent(ctx: AgentContext, question: str) -> AgentResult:
     """Answer a question, logging what it cost."""
     started = time.monotonic()
+    outcome = "error"
     try:
         result = await asyncio.wait_for(_run(ctx, question), AGENT_TOTAL_TIMEOUT)
+        outcome = "answered" if result.answer else "empty"
     except TimeoutError as exc:
+        outcome = "timeout"
         raise AgentError("That took too long to answer. Try a narrower question.") from exc
     finally:
+        elapsed = time.monotonic() - started
+        METRICS.histogram(AGENT_SECONDS, surface=ctx.surface).record(elapsed)
+        METRICS.counter(AGENT_RUNS, surface=ctx.surface, outcome=outcome).inc()
+        METRICS.counter(AGENT_TOKENS, kind="input").inc(ctx.usage.input_tokens)
+        METRICS.counter(AGENT_TOKENS, kind="cached").inc(ctx.usage.cached_tokens)
+        METRICS.counter(AGENT_TOKENS, kind="output").inc(ctx.usage.output_tokens)
         log_usage(
             guild_id=ctx.guild.id,
             user_id=ctx.identity.discord_id if ctx.identity and ctx.identity.discord_id else 0,
@@ -221,7 +232,7 @@ async def run_agent(ctx: AgentContext, question: str) -> AgentResult:
             usage=ctx.usage,
             tools=list(ctx.tools_called.names),
             iterations=ctx.iterations,
-            elapsed=time.monotonic() - started,
+            elapsed=elapsed,
         )
 
     if not result.answer:
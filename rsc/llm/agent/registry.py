@@ -35,6 +35,12 @@ class AgentTool:
     # Anything that moves intraday (rosters after a transaction, schedules)
     # must stay uncached -- a stale answer is worse than a slow one.
     cacheable: bool = False
+    # Whether the result can depend on who asked (a `me` lookup). A final
+    # answer that touched one of these is never shared with anyone else.
+    personal: bool = False
+    # Whether the result depends only on the loaded documents (rulebooks, help
+    # docs), so a final answer built on it stays valid until they change.
+    static: bool = False
 
     def schema(self) -> dict[str, Any]:
         """Tool definition in the shape the Responses API expects."""
@@ -80,6 +86,8 @@ def tool(
     required: list[str] | None = None,
     *,
     cacheable: bool = False,
+    personal: bool = False,
+    static: bool = False,
 ) -> Callable[[ToolHandler], ToolHandler]:
     """Register a coroutine as an agent tool.
 
@@ -102,6 +110,8 @@ def tool(
             },
             handler=func,
             cacheable=cacheable,
+            personal=personal,
+            static=static,
         )
         return func
 
@@ -117,10 +127,15 @@ class ToolCallRecord:
     """What the agent consulted, for the sources footer and the usage log."""
 
     names: list[str] = field(default_factory=list)
+    # Every argument value the model passed, so the answer cache can tell when
+    # the asker's own team or name was looked up without being in the question.
+    values: list[object] = field(default_factory=list)
 
-    def record(self, name: str) -> None:
+    def record(self, name: str, arguments: dict[str, Any] | None = None) -> None:
         if name not in self.names:
             self.names.append(name)
+        if arguments:
+            self.values.extend(arguments.values())
 
     def __bool__(self) -> bool:
         return bool(self.names)
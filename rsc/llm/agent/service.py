@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 import discord
 from openai import AsyncOpenAI
 
-from rsc.llm.agent.budget import CooldownTracker, usage_day
+from rsc.llm.agent.budget import CooldownTracker, UsageLedger
 from rsc.llm.agent.cache import ToolCache
 from rsc.llm.agent.context import AgentContext, UserIdentity
 from rsc.llm.agent.format import humanize_status
@@ -109,13 +109,15 @@ async def build_agent_context(
     guild: discord.Guild,
     member: discord.Member | discord.User,
     *,
-    api_key: str,
-    org: str | None,
+    client: AsyncOpenAI,
     surface: str,
     cache: ToolCache,
     now: datetime,
 ) -> AgentContext:
-    """Assemble everything one question needs."""
+    """Assemble everything one question needs.
+
+    `client` is the guild's shared client from `LLMMixIn.llm_client`.
+    """
     # Cheap after the first call; guarded so a cold start still works if the
     # startup warm-up did not run.
     await load_rulebooks()
@@ -124,7 +126,7 @@ async def build_agent_context(
     ctx = AgentContext(
         cog=cog,
         guild=guild,
-        client=AsyncOpenAI(api_key=api_key, organization=org),
+        client=client,
         now=now,
         identity=identity,
         surface=surface,
@@ -145,6 +147,7 @@ async def check_budget(
     member: discord.Member | discord.User,
     *,
     cooldown: CooldownTracker,
+    ledger: UsageLedger,
     user_cap: int,
     guild_cap: int,
     now: datetime,
@@ -163,8 +166,7 @@ async def check_budget(
     if retry_after > 0:
         return BudgetVerdict(allowed=False, reason="cooldown", retry_after=retry_after)
 
-    day = usage_day(now)
-    guild_used = await _usage_count(cog, guild.id, 0, day)
+    guild_used, _ = await ledger.usage(guild.id, 0, now)
     if guild_cap and guild_used >= guild_cap:
         return BudgetVerdict(allowed=False, reason="guild_cap")
 
@@ -176,46 +178,8 @@ async def check_budget(
             log.warning(f"Could not check elevated roles for {member.id}: {exc}", guild=guild)
 
     if not privileged and user_cap:
-        used = await _usage_count(cog, guild.id, member.id, day)
+        used, _ = await ledger.usage(guild.id, member.id, now)
         if used >= user_cap:
             return BudgetVerdict(allowed=False, reason="user_cap")
 
     return BudgetVerdict(allowed=True)
-
-
-async def _usage_count(cog: "RSCMixIn", guild_id: int, user_id: int, day: str) -> int:
-    record = cog.config.custom("LLMUsage", str(guild_id), str(user_id))
-    if await record.day() != day:
-        return 0
-    return int(await record.count())
-
-
-async def record_usage(
-    cog: "RSCMixIn",
-    guild: discord.Guild,
-    user_id: int,
-    *,
-    tokens: int,
-    now: datetime,
-) -> None:
-    """Increment the per-user and per-guild counters for today.
-
-    User id 0 is the guild-wide bucket.
-    """
-    day = usage_day(now)
-    for scope in (user_id, 0):
-        record = cog.config.custom("LLMUsage", str(guild.id), str(scope))
-        if await record.day() != day:
-            await record.day.set(day)
-            await record.count.set(0)
-            await record.tokens.set(0)
-        await record.count.set(int(await record.count()) + 1)
-        await record.tokens.set(int(await record.tokens()) + tokens)
-
-
-async def usage_today(cog: "RSCMixIn", guild: discord.Guild, user_id: int, now: datetime) -> tuple[int, int]:
-    """Questions asked and tokens spent today, for `/llm usage`."""
-    record = cog.config.custom("LLMUsage", str(guild.id), str(user_id))
-    if await record.day() != usage_day(now):
-        return (0, 0)
-    return (int(await record.count()), int(await record.tokens()))
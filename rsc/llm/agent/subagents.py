@@ -20,15 +20,19 @@ from rsc.llm.agent.context import AgentContext
 from rsc.llm.config import (
     OPENAI_REQUEST_TIMEOUT,
     OPENAI_SUBAGENT_MODEL,
+    PROMPT_VERSION,
     RULES_SUBAGENT_MAX_CONTEXT_CHARS,
     RULES_SUBAGENT_MAX_SECTIONS,
     SUBAGENT_MAX_OUTPUT_TOKENS,
 )
 from rsc.llm.rulebook import (
     RULEBOOK_LABELS,
+    RenderedSection,
     RuleBook,
+    estimate_tokens,
+    loaded_rulebooks,
     render_book,
-    render_rule,
+    rendered_section,
     search_rules,
     select_book,
 )
@@ -37,10 +41,14 @@ from rsc.logs import GuildLogAdapter
 logger = logging.getLogger("red.rsc.llm.agent.rules")
 log = GuildLogAdapter(logger)
 
+# Identical for every book and question, so the provider can cache it. The book
+# is named in the message instead; a per-book prefix would split the cache
+# three ways for no gain.
 SUBAGENT_SYSTEM = """\
-You are the RSC rules authority. Answer only from the rule text provided below.
+You are the RSC rules authority. Answer only from the rule text provided in the message.
 
-- Cite every claim as "{book} <number>", for example "{book} 3.1.1".
+- Cite every claim as "<rulebook> <number>" using the rulebook named in the message, for \
+example "RSC Rules 3.1.1" or "Behavioral 3.1.1".
 - Quote or closely paraphrase the rule; do not generalise beyond it.
 - If the provided text does not cover the question, say so plainly and name the closest \
 relevant rule. Do not speculate.
@@ -60,7 +68,7 @@ def _gather_sections(question: str, book: RuleBook) -> tuple[str, list[str]]:
         # Nothing matched lexically. Fall back to the whole book rather than
         # answering from nothing -- this is the expensive path and should be
         # rare.
-        log.debug(f"No lexical hits for {question!r}; loading all of {book.value}.")
+        log.debug("No lexical hits for %r; loading all of %s.", question, book.value)
         return render_book(book)[:RULES_SUBAGENT_MAX_CONTEXT_CHARS], []
 
     sections: list[str] = []
@@ -70,14 +78,39 @@ def _gather_sections(question: str, book: RuleBook) -> tuple[str, list[str]]:
         if len(sections) >= RULES_SUBAGENT_MAX_SECTIONS:
             break
 
-    chunks: list[str] = []
-    for section in sections:
-        rendered = render_rule(book, section, include_children=True)
-        if rendered:
-            chunks.append(rendered)
+    packed = _pack_sections(book, sections)
+    numbers = {rendered.number for rendered in packed}
+    citations = [hit.entry.citation for hit in hits[:RULES_SUBAGENT_MAX_SECTIONS] if hit.entry.section in numbers]
+    context = "\n\n".join(rendered.text for rendered in packed)[:RULES_SUBAGENT_MAX_CONTEXT_CHARS]
+    log.debug("Packed %d of %d section(s), ~%d tokens", len(packed), len(sections), estimate_tokens(context))
+    return context, citations
 
-    citations = [hit.entry.citation for hit in hits[:RULES_SUBAGENT_MAX_SECTIONS]]
-    return "\n\n".join(chunks)[:RULES_SUBAGENT_MAX_CONTEXT_CHARS], citations
+
+def _pack_sections(book: RuleBook, sections: list[str]) -> list[RenderedSection]:
+    """The most relevant sections that fit the context budget, in book order.
+
+    Sizes come from the rendered-section cache, so a section that would
+    overflow is skipped for a smaller one further down rather than rendered
+    and cut off mid-rule. Book order keeps the message prefix identical for
+    questions that land on the same sections, which is what lets the
+    provider's prompt cache reach past the instructions.
+    """
+    packed: list[RenderedSection] = []
+    used = 0
+    for number in sections:
+        rendered = rendered_section(book, number)
+        if rendered is None:
+            continue
+        cost = rendered.chars + (2 if packed else 0)
+        # The best match is always sent, even if it alone overflows and has to
+        # be truncated -- that beats answering from nothing.
+        if packed and used + cost > RULES_SUBAGENT_MAX_CONTEXT_CHARS:
+            continue
+        packed.append(rendered)
+        used += cost
+
+    entries = loaded_rulebooks()[book].entries
+    return sorted(packed, key=lambda rendered: entries[rendered.number].order)
 
 
 async def run_rules_subagent(ctx: AgentContext, question: str, book: RuleBook | None = None) -> str:
@@ -94,15 +127,15 @@ async def run_rules_subagent(ctx: AgentContext, question: str, book: RuleBook |
         ctx.cite(citation)
 
     label = RULEBOOK_LABELS[chosen]
-    instructions = SUBAGENT_SYSTEM.format(book=label)
 
     try:
         response: Any = await ctx.client.responses.create(
             model=OPENAI_SUBAGENT_MODEL,
-            instructions=instructions,
+            instructions=SUBAGENT_SYSTEM,
             input=[{"role": "user", "content": f"Rulebook: {label}\n\n{context}\n\nQuestion: {question}"}],
             max_output_tokens=SUBAGENT_MAX_OUTPUT_TOKENS,
             store=False,
+            prompt_cache_key=f"rsc-rules-v{PROMPT_VERSION}-{chosen.value}",
             timeout=OPENAI_REQUEST_TIMEOUT,
         )
     except APIError as exc:
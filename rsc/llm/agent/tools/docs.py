@@ -45,6 +45,7 @@ DOC_TOPICS: dict[str, Path] = {
     },
     required=["topic"],
     cacheable=True,
+    static=True,
 )
 async def get_help_doc(ctx: AgentContext, topic: str) -> str:
     path = DOC_TOPICS.get(topic)
@@ -121,6 +121,7 @@ async def get_team_roster(ctx: AgentContext, team: str) -> str:
         "discord_id": {"type": "integer", "description": "Player's Discord user id."},
         "me": {"type": "boolean", "description": "Look up the asking user."},
     },
+    personal=True,
 )
 async def find_player(
     ctx: AgentContext,
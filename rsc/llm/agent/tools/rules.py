@@ -39,6 +39,7 @@ def _parse_book(value: str | None) -> RuleBook | None:
         "book": BOOK_PARAM,
     },
     required=["question"],
+    static=True,
 )
 async def ask_rulebook(ctx: AgentContext, question: str, book: str | None = None) -> str:
     return await run_rules_subagent(ctx, question, _parse_book(book))
@@ -54,6 +55,7 @@ async def ask_rulebook(ctx: AgentContext, question: str, book: str | None = None
         "include_children": {"type": "boolean", "description": "Include sub-rules (default true)."},
     },
     required=["number"],
+    static=True,
 )
 async def get_rule(ctx: AgentContext, number: str, book: str | None = None, include_children: bool = True) -> str:
     parsed = _parse_book(book)
@@ -85,6 +87,7 @@ async def get_rule(ctx: AgentContext, number: str, book: str | None = None, incl
         "limit": {"type": "integer", "description": "Max results (default 5, max 8)."},
     },
     required=["query"],
+    static=True,
 )
 async def search_rules_tool(ctx: AgentContext, query: str, book: str | None = None, limit: int = 5) -> str:
     limit = max(1, min(int(limit), 8))
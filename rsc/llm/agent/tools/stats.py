@@ -140,6 +140,7 @@ async def top_teams(ctx: AgentContext, stat: str, tier: str, limit: int = 10) ->
         "me": {"type": "boolean", "description": "Look up the asking user."},
         "postseason": {"type": "boolean", "description": "Postseason instead of regular season."},
     },
+    personal=True,
 )
 async def get_player_stats(
     ctx: AgentContext,
@@ -0,0 +1,79 @@
+"""Long lived OpenAI clients, one per guild.
+
+Every mention and ticket summary used to build its own `AsyncOpenAI`, and with
+it a fresh connection pool, so each question paid a new TCP and TLS handshake
+to the provider. The registry here hands out one client per guild instead, all
+of them on a single shared `httpx.AsyncClient`.
+
+A guild's client is keyed by the (api key, organization) it was built with, so
+`/llm apikey` or `/llm organization` takes effect on the next question. The
+replaced client is simply dropped: the transport belongs to the registry and is
+only closed by `close()`, on cog unload.
+"""
+
+import logging
+
+import httpx
+from openai import AsyncOpenAI
+
+from rsc.llm.config import (
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_REQUEST_TIMEOUT,
+)
+
+log = logging.getLogger("red.rsc.llm.clients")
+
+Credentials = tuple[str, str | None]
+
+
+class OpenAIClients:
+    """Per-guild `AsyncOpenAI` clients sharing one connection pool.
+
+    `transport` replaces the network transport. Tests pass an
+    `httpx.MockTransport`.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._clients: dict[int, tuple[Credentials, AsyncOpenAI]] = {}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Built on first use, so the registry can be created outside a running loop.
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=httpx.Timeout(OPENAI_REQUEST_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._http
+
+    def get(self, guild_id: int, api_key: str, org: str | None) -> AsyncOpenAI:
+        """The guild's client, rebuilt if the key or organization changed."""
+        credentials = (api_key, org)
+        entry = self._clients.get(guild_id)
+        if entry is not None and entry[0] == credentials:
+            return entry[1]
+
+        if entry is not None:
+            log.debug("OpenAI credentials changed for guild %s. Rebuilding client.", guild_id)
+        client = AsyncOpenAI(api_key=api_key, organization=org, http_client=self._http_client())
+        self._clients[guild_id] = (credentials, client)
+        return client
+
+    async def close(self) -> None:
+        """Drop every client and close the shared connection pool."""
+        self._clients.clear()
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.aclose()
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -27,15 +27,41 @@ TOOL_TIMEOUT = 20.0
 AGENT_TOTAL_TIMEOUT = 60.0
 OPENAI_REQUEST_TIMEOUT = 45.0
 
+# Shared connection pool for every guild's OpenAI client. The agent loop makes
+# up to AGENT_MAX_ITERATIONS sequential calls per question, so keeping a warm
+# connection between them saves a TLS handshake on each.
+OPENAI_CONNECT_TIMEOUT = 10.0
+OPENAI_MAX_CONNECTIONS = 20
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 10
+OPENAI_KEEPALIVE_EXPIRY = 60.0
+
 # ~12k tokens. Only reached when lexical search finds no section to scope to.
 RULES_SUBAGENT_MAX_CONTEXT_CHARS = 48_000
 RULES_SUBAGENT_MAX_SECTIONS = 5
 
+# Daily usage counters are kept in memory and written to Config at most this
+# often, instead of on every question. A crash loses at most this much usage.
+USAGE_FLUSH_INTERVAL = 60.0
+
 # Short TTL: rosters move intraday after transactions, so this exists to
 # collapse bursts, not to serve stale data.
 API_CACHE_TTL = 300.0
 API_CACHE_MAXSIZE = 256
 
+# Final answers built only on the rulebooks and help docs. Those change with a
+# deploy or a rules update, both of which change the cache key, so the TTL
+# only bounds memory for questions nobody repeats.
+ANSWER_CACHE_TTL = 6 * 60 * 60.0
+ANSWER_CACHE_MAXSIZE = 512
+
+# Ticket summary images. With "high" detail OpenAI scales to fit 2048px and
+# then to a 768px short side, so a 16:9 screenshot carries no more detail above
+# a 1536px long edge -- only more bytes.
+SUMMARY_IMAGE_MAX_EDGE = 1536
+SUMMARY_IMAGE_JPEG_QUALITY = 80
+SUMMARY_IMAGE_CONCURRENCY = 4
+SUMMARY_IMAGE_CACHE_MAXSIZE = 256
+
 
 # Returns `Any` values because the result is splatted into the OpenAI SDK's
 # TypedDict kwargs, which a concrete `str | float` union cannot satisfy.
@@ -0,0 +1,184 @@
+"""Image preparation for multimodal summaries.
+
+Ticket screenshots arrive at full phone or monitor resolution, often as PNG.
+Sent as-is they dominate both the request payload and the image token bill,
+while the model sees no more than a ~1.5k pixel edge of them anyway. Everything
+here downscales and re-encodes before anything is base64'd.
+
+Attachments are immutable once posted, so results are cached per attachment id
+and a re-run over the same ticket only fetches what is new.
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import discord
+from PIL import Image
+
+from rsc.llm.config import (
+    SUMMARY_IMAGE_CACHE_MAXSIZE,
+    SUMMARY_IMAGE_CONCURRENCY,
+    SUMMARY_IMAGE_JPEG_QUALITY,
+    SUMMARY_IMAGE_MAX_EDGE,
+)
+from rsc.logs import GuildLogAdapter
+from rsc.utils.executor import offload
+
+logger = logging.getLogger("red.rsc.llm.images")
+log = GuildLogAdapter(logger)
+
+# Formats the vision endpoint takes directly. An image already within bounds in
+# one of these is kept as-is when re-encoding would not make it smaller.
+PASSTHROUGH_FORMATS = frozenset({"JPEG", "PNG", "WEBP"})
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedImage:
+    digest: str
+    mime: str
+    data: bytes
+    width: int
+    height: int
+
+    @property
+    def data_url(self) -> str:
+        return f"data:{self.mime};base64,{base64.b64encode(self.data).decode('ascii')}"
+
+
+@dataclass(slots=True)
+class SummaryImages:
+    """Distinct images for one summary, and where each attachment landed.
+
+    `labels` maps an attachment id to its 1-based position in `images`. Reposts
+    of the same screenshot share a position, so transcript markers stay correct
+    after deduplication. Attachments that could not be read have no label.
+    """
+
+    images: list[EncodedImage] = field(default_factory=list)
+    labels: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(len(image.data) for image in self.images)
+
+    @property
+    def data_urls(self) -> list[str]:
+        return [image.data_url for image in self.images]
+
+
+def _flatten(img: Image.Image) -> Image.Image:
+    """An RGB copy of `img`, with any transparency composited onto white.
+
+    JPEG has no alpha channel, and a plain `convert("RGB")` turns transparent
+    regions black, which hides dark text in screenshots.
+    """
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        rgba = img.convert("RGBA")
+        flat = Image.new("RGB", rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat
+    return img.convert("RGB")
+
+
+def encode_image(raw: bytes, *, max_edge: int = SUMMARY_IMAGE_MAX_EDGE, quality: int = SUMMARY_IMAGE_JPEG_QUALITY) -> EncodedImage:
+    """Downscale `raw` to fit `max_edge` and re-encode it as JPEG.
+
+    Synchronous and CPU bound. Call via `offload`. Animated images
+    are reduced to their first frame.
+    """
+    digest = hashlib.sha256(raw).hexdigest()
+    with Image.open(io.BytesIO(raw)) as img:
+        source_format = img.format
+        within_bounds = max(img.size) <= max_edge
+        # JPEG only: decode at a reduced scale rather than decoding the full
+        # image just to throw most of it away. A no-op for other formats.
+        img.draft("RGB", (max_edge, max_edge))
+        flat = _flatten(img)
+
+    flat.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    with io.BytesIO() as buf:
+        flat.save(buf, format="JPEG", quality=quality, optimize=True)
+        data = buf.getvalue()
+
+    if within_bounds and source_format in PASSTHROUGH_FORMATS and len(raw) <= len(data):
+        return EncodedImage(digest=digest, mime=Image.MIME[source_format], data=raw, width=flat.width, height=flat.height)
+    return EncodedImage(digest=digest, mime="image/jpeg", data=data, width=flat.width, height=flat.height)
+
+
+class SummaryImagePipeline:
+    """Fetch, downscale and deduplicate attachments for a summary.
+
+    One pipeline is shared by every summary, so `concurrency` bounds fetches
+    and decodes across all of them. Decodes hold a full resolution bitmap, and
+    the bound is what keeps a burst of summaries from holding dozens at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_edge: int = SUMMARY_IMAGE_MAX_EDGE,
+        quality: int = SUMMARY_IMAGE_JPEG_QUALITY,
+        concurrency: int = SUMMARY_IMAGE_CONCURRENCY,
+        maxsize: int = SUMMARY_IMAGE_CACHE_MAXSIZE,
+    ) -> None:
+        self.max_edge = max_edge
+        self.quality = quality
+        self._maxsize = maxsize
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache: OrderedDict[int, EncodedImage] = OrderedDict()
+
+    def _cached(self, attachment_id: int) -> EncodedImage | None:
+        image = self._cache.get(attachment_id)
+        if image is not None:
+            self._cache.move_to_end(attachment_id)
+        return image
+
+    def _remember(self, attachment_id: int, image: EncodedImage) -> None:
+        self._cache[attachment_id] = image
+        self._cache.move_to_end(attachment_id)
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    async def _prepare(self, attachment: discord.Attachment) -> EncodedImage | None:
+        cached = self._cached(attachment.id)
+        if cached is not None:
+            return cached
+
+        async with self._semaphore:
+            try:
+                raw = await attachment.read(use_cached=True)
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to fetch summary image {attachment.filename}: {exc}")
+                return None
+            try:
+                image = await offload(encode_image, raw, max_edge=self.max_edge, quality=self.quality)
+            except (OSError, ValueError, Image.DecompressionBombError) as exc:
+                log.warning(f"Unable to decode summary image {attachment.filename}: {exc}")
+                return None
+
+        self._remember(attachment.id, image)
+        return image
+
+    async def collect(self, attachments: Sequence[discord.Attachment]) -> SummaryImages:
+        """Prepare `attachments` concurrently, keeping first-seen order."""
+        results = await asyncio.gather(*(self._prepare(attachment) for attachment in attachments))
+
+        prepared = SummaryImages()
+        positions: dict[str, int] = {}
+        for attachment, image in zip(attachments, results, strict=True):
+            if image is None:
+                continue
+            if image.digest not in positions:
+                prepared.images.append(image)
+                positions[image.digest] = len(prepared.images)
+            prepared.labels[attachment.id] = positions[image.digest]
+        return prepared
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -1,30 +1,37 @@
 from __future__ import annotations
 
-import base64
 import logging
 from datetime import datetime, timedelta
 from math import ceil
+from typing import TYPE_CHECKING
 
 import discord
+from discord.ext import tasks
 from redbot.core import app_commands, commands
 
 from rsc.abc import RSCMixIn
 from rsc.embeds import BetterEmbed, BlueEmbed, EmbedLimits, ErrorEmbed, GreenEmbed, SuccessEmbed, YellowEmbed
-from rsc.llm.agent import AgentError, CooldownTracker, ToolCache, run_agent
+from rsc.llm.agent import AgentError, AnswerCache, CooldownTracker, ToolCache, run_agent
+from rsc.llm.agent.answers import answer_key
+from rsc.llm.agent.budget import UsageLedger
 from rsc.llm.agent.service import (
     BudgetError,
     build_agent_context,
     check_budget,
     is_budget_exempt,
-    record_usage,
-    usage_today,
 )
+from rsc.llm.clients import OpenAIClients
+from rsc.llm.config import USAGE_FLUSH_INTERVAL
+from rsc.llm.images import SummaryImagePipeline, SummaryImages
 from rsc.llm.summarize import summarize_ticket_messages
 from rsc.logs import GuildLogAdapter
 from rsc.types import LLMSettings, LLMUsageRecord
 from rsc.utils.pagify import Pagify
 from rsc.utils.utils import rsc_name_from_member
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger("red.rsc.llm")
 log = GuildLogAdapter(logger)
 
@@ -78,9 +85,29 @@ class LLMMixIn(RSCMixIn):
         # Cooldowns live for seconds, so memory is the right store; the daily
         # caps in Config are what must survive a reload.
         self._llm_cooldown = CooldownTracker(seconds=defaults_guild["LLMUserCooldown"])
+        # Daily counters, read from and flushed back to LLMUsage by llm_usage_flush_loop.
+        self._llm_usage = UsageLedger(self.config)
         self._llm_tool_cache = ToolCache()
+        # Finished answers to repeated questions. See rsc.llm.agent.answers.
+        self._llm_answers = AnswerCache()
+        self._summary_images = SummaryImagePipeline()
+        # One client per guild on a shared connection pool. See llm_client().
+        self._llm_clients = OpenAIClients()
         super().__init__()
 
+        if not self.llm_usage_flush_loop.is_running():
+            self.llm_usage_flush_loop.start()
+
+    # Tasks
+
+    @tasks.loop(seconds=USAGE_FLUSH_INTERVAL)
+    async def llm_usage_flush_loop(self):
+        try:
+            await self.llm_usage().flush()
+        except Exception as exc:
+            # Unwritten buckets stay dirty and go out with the next flush.
+            log.exception("Error flushing LLM usage.", exc_info=exc)
+
     # Listener
 
     @commands.Cog.listener("on_message")
@@ -162,7 +189,10 @@ class LLMMixIn(RSCMixIn):
     async def _decline_mention(cls, message: discord.Message, exc: BudgetError) -> None:
         """Mark and explain a mention the spend controls turned away."""
         log.debug(
-            f"Mention declined for {message.author.id}: {exc.reason} (retry_after={exc.retry_after:.1f}s)",
+            "Mention declined for %s: %s (retry_after=%.1fs)",
+            message.author.id,
+            exc.reason,
+            exc.retry_after,
             guild=message.guild,
         )
 
@@ -317,9 +347,9 @@ class LLMMixIn(RSCMixIn):
             return
 
         status = await self._get_llm_status(guild)
-        log.debug(f"Current LLM Status: {status}", guild=guild)
+        log.debug("Current LLM Status: %s", status, guild=guild)
         status ^= True  # Flip boolean with xor
-        log.debug(f"New LLM Status: {status}", guild=guild)
+        log.debug("New LLM Status: %s", status, guild=guild)
         await self._set_llm_status(guild, status)
         result = "**enabled**" if status else "**disabled**"
         await interaction.response.send_message(
@@ -424,7 +454,7 @@ class LLMMixIn(RSCMixIn):
         now = datetime.now(tz)
         # User id 0 is the guild-wide bucket.
         scope_id = member.id if member else 0
-        count, tokens = await usage_today(self, guild, scope_id, now)
+        count, tokens = await self.llm_usage().usage(guild.id, scope_id, now)
         cap = await self._get_llm_user_daily_cap(guild) if member else await self._get_llm_guild_daily_cap(guild)
 
         embed = BlueEmbed(title="RSC AI Usage")
@@ -522,27 +552,33 @@ class LLMMixIn(RSCMixIn):
         #     )
 
         summary_messages = list(reversed(history[:message_limit]))
-        transcript = self._build_summary_transcript(summary_messages, max_chars=LLM_SUMMARY_MAX_TRANSCRIPT_CHARS)
-        if not transcript:
+
+        # Images first: deduplication decides which [image-N] marker each
+        # attachment gets in the transcript.
+        images, image_error = await self._collect_summary_images(summary_messages)
+        if image_error:
             return await interaction.followup.send(
-                embed=ErrorEmbed(description="Could not build transcript data from the selected messages."),
+                embed=ErrorEmbed(description=image_error),
                 ephemeral=True,
             )
 
-        image_data_urls, image_error = await self._collect_summary_images(summary_messages)
-        if image_error:
+        transcript = self._build_summary_transcript(
+            summary_messages,
+            max_chars=LLM_SUMMARY_MAX_TRANSCRIPT_CHARS,
+            image_labels=images.labels,
+        )
+        if not transcript:
             return await interaction.followup.send(
-                embed=ErrorEmbed(description=image_error),
+                embed=ErrorEmbed(description="Could not build transcript data from the selected messages."),
                 ephemeral=True,
             )
 
         try:
             summary = await summarize_ticket_messages(
                 guild=guild,
-                org_name=org,
-                api_key=key,
+                llm=self.llm_client(guild, key, org),
                 transcript=transcript,
-                image_data_urls=image_data_urls,
+                image_data_urls=images.data_urls,
             )
         except RuntimeError as exc:
             return await interaction.followup.send(content=str(exc), ephemeral=True)
@@ -624,7 +660,7 @@ class LLMMixIn(RSCMixIn):
         if not message.guild:
             return message.clean_content
 
-        log.debug(f"Original Question: {message.clean_content}")
+        log.debug("Original Question: %s", message.clean_content)
 
         # Remove bot mention
         cleaned_msg = message.clean_content.replace(f"@{message.guild.me.display_name}", "").strip()
@@ -638,7 +674,7 @@ class LLMMixIn(RSCMixIn):
                 continue
             cleaned_msg = cleaned_msg.replace(f"@{mentioned.display_name}", rsc_name_from_member(mentioned))
 
-        log.debug(f"Question sent to the agent: {cleaned_msg}")
+        log.debug("Question sent to the agent: %s", cleaned_msg)
 
         return cleaned_msg.strip()
 
@@ -722,8 +758,17 @@ class LLMMixIn(RSCMixIn):
                 return True
         return False
 
-    def _build_summary_transcript(self, messages: list[discord.Message], max_chars: int = 20000) -> str:
-        """Build a compact transcript for LLM summarization."""
+    def _build_summary_transcript(
+        self,
+        messages: list[discord.Message],
+        max_chars: int = 20000,
+        image_labels: dict[int, int] | None = None,
+    ) -> str:
+        """Build a compact transcript for LLM summarization.
+
+        `image_labels` maps attachment ids to the image number they were sent
+        as. Without it, images are numbered in order of appearance.
+        """
         rows: list[str] = []
         total = 0
         image_index = 0
@@ -731,9 +776,13 @@ class LLMMixIn(RSCMixIn):
             content = msg.clean_content.strip()
             image_markers: list[str] = []
             for attachment in msg.attachments:
-                if self._is_image_attachment(attachment):
+                if not self._is_image_attachment(attachment):
+                    continue
+                if image_labels is None:
                     image_index += 1
                     image_markers.append(f"image-{image_index}")
+                elif attachment.id in image_labels:
+                    image_markers.append(f"image-{image_labels[attachment.id]}")
 
             if image_markers:
                 marker_text = " ".join(f"[{marker}]" for marker in image_markers)
@@ -756,36 +805,23 @@ class LLMMixIn(RSCMixIn):
 
         return "\n".join(rows)
 
-    async def _collect_summary_images(self, messages: list[discord.Message]) -> tuple[list[str], str | None]:
-        """Collect full image attachments as data URLs for multimodal moderation summary."""
-        data_urls: list[str] = []
-        total_bytes = 0
-
-        for msg in messages:
-            for attachment in msg.attachments:
-                if not self._is_image_attachment(attachment):
-                    continue
-
-                if len(data_urls) >= LLM_SUMMARY_MAX_IMAGES:
-                    return (
-                        [],
-                        f"Too many images to summarize safely. Limit is {LLM_SUMMARY_MAX_IMAGES} images; reduce message_limit.",
-                    )
-
-                raw = await attachment.read(use_cached=True)
-                total_bytes += len(raw)
-                if total_bytes > LLM_SUMMARY_MAX_IMAGE_BYTES:
-                    max_mb = LLM_SUMMARY_MAX_IMAGE_BYTES // (1024 * 1024)
-                    return (
-                        [],
-                        f"Image payload is too large to summarize safely (>{max_mb}MB total). Reduce message_limit.",
-                    )
-
-                mime = self._attachment_mime(attachment)
-                b64 = base64.b64encode(raw).decode("ascii")
-                data_urls.append(f"data:{mime};base64,{b64}")
+    async def _collect_summary_images(self, messages: list[discord.Message]) -> tuple[SummaryImages, str | None]:
+        """Collect downscaled, deduplicated image attachments for a multimodal summary."""
+        attachments = [attachment for msg in messages for attachment in msg.attachments if self._is_image_attachment(attachment)]
+        if len(attachments) > LLM_SUMMARY_MAX_IMAGES:
+            return (
+                SummaryImages(),
+                f"Too many images to summarize safely. Limit is {LLM_SUMMARY_MAX_IMAGES} images; reduce message_limit.",
+            )
 
-        return (data_urls, None)
+        images = await self._summary_images.collect(attachments)
+        if images.total_bytes > LLM_SUMMARY_MAX_IMAGE_BYTES:
+            max_mb = LLM_SUMMARY_MAX_IMAGE_BYTES // (1024 * 1024)
+            return (
+                SummaryImages(),
+                f"Image payload is too large to summarize safely (>{max_mb}MB total). Reduce message_limit.",
+            )
+        return (images, None)
 
     def _is_image_attachment(self, attachment: discord.Attachment) -> bool:
         content_type = (attachment.content_type or "").lower()
@@ -795,29 +831,46 @@ class LLMMixIn(RSCMixIn):
         filename = (attachment.filename or "").lower()
         return filename.endswith((".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp"))
 
-    def _attachment_mime(self, attachment: discord.Attachment) -> str:
-        content_type = (attachment.content_type or "").lower()
-        if content_type.startswith("image/"):
-            return content_type
-
-        filename = (attachment.filename or "").lower()
-        if filename.endswith(".png"):
-            return "image/png"
-        if filename.endswith((".jpg", ".jpeg")):
-            return "image/jpeg"
-        if filename.endswith(".webp"):
-            return "image/webp"
-        if filename.endswith(".gif"):
-            return "image/gif"
-        if filename.endswith(".bmp"):
-            return "image/bmp"
-        return "application/octet-stream"
-
     async def get_llm_credentials(self, guild: discord.Guild) -> tuple[str | None, str | None]:
         org = await self._get_openai_org(guild)
         key = await self._get_openai_key(guild)
         return (org, key)
 
+    def llm_client(self, guild: discord.Guild, api_key: str, org: str | None) -> AsyncOpenAI:
+        """The guild's long lived OpenAI client, rebuilt when the key or organization changes."""
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        clients = getattr(self, "_llm_clients", None)
+        if clients is None:
+            clients = self._llm_clients = OpenAIClients()
+        return clients.get(guild.id, api_key, org)
+
+    def llm_usage(self) -> UsageLedger:
+        """Today's question and token counters for every guild."""
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        ledger = getattr(self, "_llm_usage", None)
+        if ledger is None:
+            ledger = self._llm_usage = UsageLedger(self.config)
+        return ledger
+
+    def llm_answers(self) -> AnswerCache:
+        """Shared answers to repeated questions, for every guild."""
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        answers = getattr(self, "_llm_answers", None)
+        if answers is None:
+            answers = self._llm_answers = AnswerCache()
+        return answers
+
+    async def flush_llm_usage(self):
+        """Stop the flush loop and write out any usage not yet in Config."""
+        self.llm_usage_flush_loop.cancel()
+        await self.llm_usage().flush()
+
+    async def close_llm_clients(self):
+        """Close the shared OpenAI connection pool."""
+        clients = getattr(self, "_llm_clients", None)
+        if clients is not None:
+            await clients.close()
+
     # Agent
 
     async def answer_with_agent(
@@ -845,6 +898,7 @@ class LLMMixIn(RSCMixIn):
             guild,
             member,
             cooldown=self._llm_cooldown,
+            ledger=self.llm_usage(),
             user_cap=await self._get_llm_user_daily_cap(guild),
             guild_cap=await self._get_llm_guild_daily_cap(guild),
             now=now,
@@ -864,13 +918,18 @@ class LLMMixIn(RSCMixIn):
             self,
             guild,
             member,
-            api_key=key,
-            org=org,
+            client=self.llm_client(guild, key, org),
             surface=surface,
             cache=self._llm_tool_cache,
             now=now,
         )
 
+        # A hit costs no tokens, so it is not counted against the daily caps.
+        # The cooldown above still applies: it is there to pace the channel.
+        if cached := self.llm_answers().get(answer_key(guild.id, question)):
+            log.debug("Answered from the answer cache (%d citation(s))", len(cached.citations), guild=guild)
+            return cached.answer
+
         try:
             result = await run_agent(ctx, question)
         except AgentError:
@@ -880,7 +939,8 @@ class LLMMixIn(RSCMixIn):
                 self._llm_cooldown.clear(guild.id, member.id)
             raise
 
-        await record_usage(self, guild, member.id, tokens=ctx.usage.total, now=now)
+        await self.llm_usage().record(guild.id, member.id, tokens=ctx.usage.total, now=now)
+        self.llm_answers().store(ctx, question, result)
         return result.answer
 
     # Config
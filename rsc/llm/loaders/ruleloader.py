@@ -113,6 +113,14 @@ class RuleDocumentLoader:
         """
         return self._parse_rule_nodes(data)
 
+    def parse_glossary_entries(self, data: str) -> list[GlossaryEntry]:
+        """Parse glossary entries from already-read rule text.
+
+        The glossary counterpart of `parse_rule_nodes`, so an index can parse
+        both from a single read of the file.
+        """
+        return self._parse_glossary_entries(data)
+
     def _parse_rule_nodes(self, data: str) -> list[RuleNode]:
         nodes: dict[str, RuleNode] = {}
         current_number = ""
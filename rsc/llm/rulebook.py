@@ -13,23 +13,35 @@ Two things this module is careful about:
 * It scopes to sections. A whole book is ~6k-19k tokens, but the enclosing
   section of any given rule is usually a few hundred, so section-scoped answers
   cost an order of magnitude less than book-scoped ones.
+
+The built index is compiled to a versioned JSON artifact keyed by a hash of the
+rule documents, so a restart reads one file instead of re-parsing the markdown.
+Bump `COMPILED_VERSION` whenever parsing, tokenizing or the artifact layout
+changes; the hash only covers the inputs, not the code that reads them.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import math
 import re
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from enum import StrEnum
 from pathlib import Path
 
-from rsc.llm.loaders.ruleloader import RuleDocumentLoader, RuleNode
+from rsc.llm.loaders.ruleloader import RULE_LINE_RE, RuleDocumentLoader, RuleNode
 
 log = logging.getLogger("red.rsc.llm.rulebook")
 
 RULES_PATH = Path(__file__).parent.parent / "resources" / "rules"
 
+# Layout version of the compiled artifact. Part of the file name, so an old
+# artifact is never read by newer code; it is simply rebuilt and pruned.
+COMPILED_VERSION = 1
+COMPILED_GLOB = "rulebooks-v*.json"
+
 # BM25 tuning. Standard defaults; the corpus is small and homogeneous enough
 # that these have never needed tuning.
 BM25_K1 = 1.5
@@ -41,6 +53,10 @@ TITLE_BONUS = 0.5
 # text lives in their children. Nudge them below leaf rules of equal relevance.
 PARENT_PENALTY = 0.75
 
+# Rough chars-per-token for English rule text, for sizing prompts without a
+# tokenizer. Only used to pack and log context; nothing is billed on it.
+CHARS_PER_TOKEN = 4
+
 RULE_NUMBER_QUERY_RE = re.compile(r"\b(\d+(?:\.\d+)+)\b")
 TOKEN_RE = re.compile(r"[a-z0-9']+")
 
@@ -111,6 +127,10 @@ class RuleEntry:
     is_heading: bool
     has_children: bool
     order: int
+    # Lowercased once at build time. Search compares against these on every
+    # hit, and lowering 1,200 rule texts per query added up.
+    title_lower: str
+    text_lower: str
 
     @property
     def citation(self) -> str:
@@ -127,6 +147,20 @@ class RuleHit:
         return text if len(text) <= limit else text[:limit].rstrip() + "..."
 
 
+@dataclass(frozen=True, slots=True)
+class RenderedSection:
+    """A section's full text as sent to the rules sub-agent, rendered once."""
+
+    book: RuleBook
+    number: str
+    text: str
+    tokens: int
+
+    @property
+    def chars(self) -> int:
+        return len(self.text)
+
+
 @dataclass(slots=True)
 class RuleBookIndex:
     book: RuleBook
@@ -134,10 +168,21 @@ class RuleBookIndex:
     order: tuple[str, ...]
     toc: str
     glossary: dict[str, str]
+    # Depth-first rule order in which every subtree is contiguous, and each
+    # rule's `[start, end)` range within it. Usually identical to `order`, but
+    # a rule quoted before its own heading gets parsed out of place, and
+    # document order then splits its subtree.
+    tree_order: tuple[str, ...]
+    spans: dict[str, tuple[int, int]]
 
     def get(self, number: str) -> RuleEntry | None:
         return self.entries.get(number.strip().rstrip("."))
 
+    def descendants(self, number: str) -> tuple[str, ...]:
+        """Every rule below `number`, parents before children."""
+        start, end = self.spans[number]
+        return self.tree_order[start + 1 : end]
+
 
 @dataclass(slots=True)
 class SearchIndex:
@@ -163,6 +208,10 @@ def _key(book: RuleBook, number: str) -> str:
 
 _INDEXES: dict[RuleBook, RuleBookIndex] = {}
 _SEARCH: SearchIndex | None = None
+_HASH: str | None = None
+# Keyed by (book, section, rulebook hash), so a reload with new rules can never
+# serve the old text. Filled for every section on load; see `rendered_section`.
+_RENDERED: dict[tuple[RuleBook, str, str], RenderedSection] = {}
 _LOAD_LOCK = asyncio.Lock()
 
 
@@ -209,6 +258,37 @@ def _apply_synthetic_headings(nodes: list[RuleNode], synthetic: dict[str, str])
     return sorted(patched, key=lambda node: node.order)
 
 
+def _subtree_spans(entries: dict[str, RuleEntry]) -> tuple[tuple[str, ...], dict[str, tuple[int, int]]]:
+    """Lay rules out depth first so each subtree is one contiguous range.
+
+    A rule hangs off its nearest ancestor that exists, so a subtree still holds
+    every rule sharing its number prefix when an intermediate number is missing.
+    Siblings keep document order.
+    """
+    children: dict[str, list[str]] = defaultdict(list)
+    roots: list[str] = []
+    for entry in sorted(entries.values(), key=lambda e: e.order):
+        parent = next((a for a in reversed(entry.ancestors) if a in entries), None)
+        if parent is None:
+            roots.append(entry.number)
+        else:
+            children[parent].append(entry.number)
+
+    tree_order: list[str] = []
+    spans: dict[str, tuple[int, int]] = {}
+
+    def visit(number: str) -> None:
+        start = len(tree_order)
+        tree_order.append(number)
+        for child in children.get(number, ()):
+            visit(child)
+        spans[number] = (start, len(tree_order))
+
+    for root in roots:
+        visit(root)
+    return tuple(tree_order), spans
+
+
 def _build_index(book: RuleBook, nodes: list[RuleNode], glossary: dict[str, str]) -> RuleBookIndex:
     synthetic = SYNTHETIC_HEADINGS.get(book, {})
     nodes = _apply_synthetic_headings(nodes, synthetic)
@@ -230,11 +310,12 @@ def _build_index(book: RuleBook, nodes: list[RuleNode], glossary: dict[str, str]
             anc_node = by_number.get(ancestor)
             anc_title = (anc_node.title if anc_node else "") or synthetic.get(ancestor, "")
             path_parts.append(f"{ancestor} {anc_title}".strip())
+        text = "\n".join(node.lines)
         entries[node.number] = RuleEntry(
             book=book,
             number=node.number,
             title=title,
-            text="\n".join(node.lines),
+            text=text,
             parent=ancestors[-1] if ancestors else "",
             ancestors=ancestors,
             depth=len(parts),
@@ -243,14 +324,19 @@ def _build_index(book: RuleBook, nodes: list[RuleNode], glossary: dict[str, str]
             is_heading=bool(node.heading_level) or node.number in synthetic,
             has_children=node.number in parents_with_children,
             order=node.order,
+            title_lower=title.lower(),
+            text_lower=text.lower(),
         )
 
+    tree_order, spans = _subtree_spans(entries)
     return RuleBookIndex(
         book=book,
         entries=entries,
         order=tuple(entry.number for entry in sorted(entries.values(), key=lambda e: e.order)),
         toc=_render_toc(book, entries),
         glossary=glossary,
+        tree_order=tree_order,
+        spans=spans,
     )
 
 
@@ -300,34 +386,180 @@ def _render_toc(book: RuleBook, entries: dict[str, RuleEntry]) -> str:
     return "\n".join([f"## {RULEBOOK_LABELS[book]} ({book.value})", *lines])
 
 
-def _load_book(book: RuleBook) -> RuleBookIndex:
-    path = RULES_PATH / RULEBOOK_FILES[book]
-    loader = RuleDocumentLoader(str(path))
-    data = path.read_text(encoding="utf-8")
+def _read_sources() -> dict[RuleBook, str]:
+    return {book: (RULES_PATH / RULEBOOK_FILES[book]).read_text(encoding="utf-8") for book in RuleBook}
+
+
+def _content_hash(sources: dict[RuleBook, str]) -> str:
+    """Hash of everything the compiled index is derived from, short of the code.
+
+    Covers the rule text plus the tunables that shape it. Parser logic changes
+    are not visible here, which is what `COMPILED_VERSION` is for.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        str(COMPILED_VERSION),
+        RULE_LINE_RE.pattern,
+        TOKEN_RE.pattern,
+        " ".join(sorted(STOPWORDS)),
+        json.dumps(SYNTHETIC_HEADINGS, sort_keys=True),
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for book in RuleBook:
+        digest.update(book.value.encode())
+        digest.update(b"\0")
+        digest.update(sources[book].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_book(book: RuleBook, data: str) -> RuleBookIndex:
+    loader = RuleDocumentLoader(str(RULES_PATH / RULEBOOK_FILES[book]))
     nodes = loader.parse_rule_nodes(data)
-    glossary = {
-        str(doc.metadata["term"]): doc.page_content.split("Definition:", maxsplit=1)[-1].strip() for doc in loader.lazy_load_glossary()
-    }
-    log.debug(f"Indexed {book.value}: {len(nodes)} rules, {len(glossary)} glossary terms.")
+    glossary = {entry.terms[0]: " ".join(entry.definition_parts) for entry in loader.parse_glossary_entries(data)}
+    log.debug("Indexed %s: %s rules, %s glossary terms.", book.value, len(nodes), len(glossary))
     return _build_index(book, nodes, glossary)
 
 
-async def load_rulebooks(*, force: bool = False) -> dict[RuleBook, RuleBookIndex]:
-    """Build (once) and return the index for every rulebook."""
-    global _INDEXES, _SEARCH
+def _compile(indexes: dict[RuleBook, RuleBookIndex], search: SearchIndex, content_hash: str) -> dict:
+    """Flatten the built indexes into plain JSON types.
+
+    Entries are stored as field tuples rather than dicts, which keeps the file
+    about half the size. Postings, idf and lengths reference rules by search
+    key and are stored once, not per book.
+    """
+    return {
+        "version": COMPILED_VERSION,
+        "hash": content_hash,
+        "books": {
+            book.value: {
+                "entries": [list(astuple(entry)) for entry in index.entries.values()],
+                "order": list(index.order),
+                "toc": index.toc,
+                "glossary": index.glossary,
+                "tree_order": list(index.tree_order),
+                "spans": index.spans,
+            }
+            for book, index in indexes.items()
+        },
+        "postings": search.postings,
+        "idf": search.idf,
+        "lengths": search.lengths,
+        "avg_length": search.avg_length,
+    }
+
+
+def _decompile(payload: dict) -> tuple[dict[RuleBook, RuleBookIndex], SearchIndex]:
+    indexes: dict[RuleBook, RuleBookIndex] = {}
+    search_entries: dict[str, RuleEntry] = {}
+    for value, data in payload["books"].items():
+        book = RuleBook(value)
+        entries: dict[str, RuleEntry] = {}
+        for fields in data["entries"]:
+            fields[0] = book
+            fields[5] = tuple(fields[5])
+            entry = RuleEntry(*fields)
+            entries[entry.number] = entry
+            search_entries[_key(book, entry.number)] = entry
+        indexes[book] = RuleBookIndex(
+            book=book,
+            entries=entries,
+            order=tuple(data["order"]),
+            toc=data["toc"],
+            glossary=data["glossary"],
+            tree_order=tuple(data["tree_order"]),
+            spans={number: (span[0], span[1]) for number, span in data["spans"].items()},
+        )
+
+    search = SearchIndex(
+        entries=search_entries,
+        postings={token: tuple((key, freq) for key, freq in plist) for token, plist in payload["postings"].items()},
+        idf=payload["idf"],
+        lengths=payload["lengths"],
+        avg_length=payload["avg_length"],
+    )
+    return indexes, search
+
+
+def _artifact_path(cache_dir: Path, content_hash: str) -> Path:
+    return cache_dir / f"rulebooks-v{COMPILED_VERSION}-{content_hash[:16]}.json"
+
+
+def _read_artifact(path: Path, content_hash: str) -> tuple[dict[RuleBook, RuleBookIndex], SearchIndex] | None:
+    """The compiled index at `path`, or `None` if it is missing or unusable."""
+    try:
+        payload = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        log.warning(f"Unreadable compiled rulebook {path.name}. Rebuilding: {exc}")
+        return None
+
+    # The file name only carries a hash prefix. Trust the full one inside.
+    if not isinstance(payload, dict) or payload.get("version") != COMPILED_VERSION or payload.get("hash") != content_hash:
+        log.warning(f"Compiled rulebook {path.name} does not match the rule documents. Rebuilding.")
+        return None
+
+    try:
+        return _decompile(payload)
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        log.warning(f"Malformed compiled rulebook {path.name}. Rebuilding: {exc}")
+        return None
+
+
+def _write_artifact(cache_dir: Path, content_hash: str, payload: dict) -> None:
+    """Write atomically and prune every other compiled rulebook in `cache_dir`."""
+    path = _artifact_path(cache_dir, content_hash)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+        for stale in cache_dir.glob(COMPILED_GLOB):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        # Not fatal. The in-memory index is already built; the next start just
+        # pays the parse again.
+        log.warning(f"Unable to write compiled rulebook to {cache_dir}: {exc}")
+
+
+def _build_rulebooks(cache_dir: Path | None) -> tuple[dict[RuleBook, RuleBookIndex], SearchIndex, str]:
+    sources = _read_sources()
+    content_hash = _content_hash(sources)
+
+    if cache_dir is not None:
+        loaded = _read_artifact(_artifact_path(cache_dir, content_hash), content_hash)
+        if loaded is not None:
+            log.debug("Loaded compiled rulebooks %s", content_hash[:16])
+            return *loaded, content_hash
+
+    indexes = {book: _load_book(book, sources[book]) for book in RuleBook}
+    search = _build_search_index(indexes)
+    if cache_dir is not None:
+        _write_artifact(cache_dir, content_hash, _compile(indexes, search, content_hash))
+    return indexes, search, content_hash
+
+
+async def load_rulebooks(*, force: bool = False, cache_dir: Path | None = None) -> dict[RuleBook, RuleBookIndex]:
+    """Build (once) and return the index for every rulebook.
+
+    With `cache_dir`, a compiled artifact matching the current rule documents
+    is loaded from there in one read, or written there after a fresh parse.
+    """
+    global _INDEXES, _SEARCH, _HASH, _RENDERED
     if _INDEXES and not force:
         return _INDEXES
     async with _LOAD_LOCK:
         if _INDEXES and not force:
             return _INDEXES
 
-        def build() -> tuple[dict[RuleBook, RuleBookIndex], SearchIndex]:
-            indexes = {book: _load_book(book) for book in RuleBook}
-            return indexes, _build_search_index(indexes)
-
-        # Pure regex over ~164KB. Threaded so a cold first question does not
-        # stall the event loop behind it.
-        _INDEXES, _SEARCH = await asyncio.to_thread(build)
+        # Pure regex over ~164KB, or a JSON decode of the compiled form.
+        # Threaded so a cold first question does not stall the event loop.
+        indexes, search, content_hash = await asyncio.to_thread(_build_rulebooks, cache_dir)
+        rendered = await asyncio.to_thread(_render_sections, indexes, content_hash)
+        _INDEXES, _SEARCH, _HASH, _RENDERED = indexes, search, content_hash, rendered
     return _INDEXES
 
 
@@ -344,6 +576,17 @@ def _loaded_search() -> SearchIndex:
     return _SEARCH
 
 
+def rulebook_hash() -> str:
+    """Content hash of the loaded rule documents.
+
+    Changes whenever any rulebook does, so anything derived from rule text can
+    key on it to go stale with the rules.
+    """
+    if _HASH is None:
+        raise RuntimeError("Rulebooks have not been loaded. Call load_rulebooks() first.")
+    return _HASH
+
+
 def rulebook_toc() -> str:
     """Compact map of all three books, for the cached system prompt."""
     return "\n\n".join(index.toc for index in loaded_rulebooks().values())
@@ -377,9 +620,10 @@ def search_rules(query: str, book: RuleBook | None = None, limit: int = 8) -> li
         return []
     phrase = " ".join(query.lower().split())
     wanted_books = set(books)
+    token_set = set(tokens)
 
     scores: dict[str, float] = defaultdict(float)
-    for token in set(tokens):
+    for token in token_set:
         postings = search.postings.get(token)
         if not postings:
             continue
@@ -393,9 +637,9 @@ def search_rules(query: str, book: RuleBook | None = None, limit: int = 8) -> li
     hits: list[RuleHit] = []
     for key, score in scores.items():
         entry = search.entries[key]
-        if phrase and phrase in entry.text.lower():
+        if phrase and phrase in entry.text_lower:
             score += PHRASE_BONUS
-        if entry.title and any(token in entry.title.lower() for token in tokens):
+        if entry.title_lower and any(token in entry.title_lower for token in token_set):
             score += TITLE_BONUS
         if entry.has_children:
             score -= PARENT_PENALTY
@@ -417,11 +661,44 @@ def render_rule(book: RuleBook, number: str, *, include_children: bool = True, i
         parts.extend(index.entries[ancestor].text for ancestor in entry.ancestors if ancestor in index.entries)
     parts.append(entry.text)
     if include_children:
-        prefix = f"{entry.number}."
-        parts.extend(index.entries[num].text for num in index.order if num.startswith(prefix))
+        parts.extend(index.entries[num].text for num in index.descendants(entry.number))
     return "\n".join(parts)
 
 
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _render_sections(indexes: dict[RuleBook, RuleBookIndex], content_hash: str) -> dict[tuple[RuleBook, str, str], RenderedSection]:
+    """Every section of every book, pre-rendered for the rules sub-agent."""
+    rendered: dict[tuple[RuleBook, str, str], RenderedSection] = {}
+    for book, index in indexes.items():
+        for number in dict.fromkeys(entry.section for entry in index.entries.values()):
+            if number not in index.entries:
+                continue
+            text = "\n".join([index.entries[number].text, *(index.entries[n].text for n in index.descendants(number))])
+            rendered[book, number, content_hash] = RenderedSection(book, number, text, estimate_tokens(text))
+    return rendered
+
+
+def rendered_section(book: RuleBook, number: str) -> RenderedSection | None:
+    """A rule and its subtree, from the rendered-section cache.
+
+    The same text as `render_rule(book, number)`, but sections are rendered
+    once per rulebook load rather than on every rules question, and carry a
+    token estimate so callers can pack them into a budget without rendering
+    and truncating.
+    """
+    key = (book, number, rulebook_hash())
+    cached = _RENDERED.get(key)
+    if cached is None:
+        text = render_rule(book, number, include_children=True)
+        if text is None:
+            return None
+        cached = _RENDERED[key] = RenderedSection(book, number, text, estimate_tokens(text))
+    return cached
+
+
 def render_section(book: RuleBook, number: str) -> str | None:
     """Raw text of the whole section enclosing a rule."""
     index = loaded_rulebooks()[book]
@@ -1,21 +1,99 @@
+"""Logging for the cog.
+
+`GuildLogAdapter` prefixes records with the guild and match they concern.
+Arguments are %-style and only rendered for records that will be emitted, and
+`Deferred` extends that to arguments that are expensive to build, such as a
+`pformat` of a whole payload.
+
+`QueuedLogging` moves the handlers of rsc's loggers onto a background thread.
+Red's file handlers write to disk synchronously, which is harmless at INFO and
+stalls the event loop once `/rsc dev loglevel` turns on DEBUG during an
+incident. With it started, the caller only renders the message and puts the
+record on a queue. A `BurstFilter` in front of the queue drops repeats of the
+same message from a noisy loop.
+"""
+
+import copy
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 
 import discord
 
 from rscapi.models.match import Match
 
+# Loggers routed through the queue. `/rsc dev loglevel` sets the same two.
+QUEUED_LOGGERS = ("red.rsc", "ballchasing")
+# Identical records let through per window. The rest are counted and dropped.
+BURST_LIMIT = 5
+BURST_WINDOW = 10.0
+# Distinct messages tracked at once, least recently seen evicted first.
+BURST_KEYS = 1024
+
+
+class Deferred:
+    """A log argument computed only if the record is emitted.
+
+    Usage:
+        log.debug("Schema: %s", Deferred(pformat, schema), guild=guild)
+    """
+
+    __slots__ = ("_args", "_func", "_kwargs", "_value")
+
+    def __init__(self, func: Callable[..., object], /, *args: object, **kwargs: object) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = str(self._func(*self._args, **self._kwargs))
+        return self._value
+
+    __repr__ = __str__
+
+
+def _resolve(value: object) -> object:
+    # Context may be handed over as a callable, so it is only looked up when used
+    if callable(value) and not isinstance(value, (discord.Guild, Match)):
+        return value()
+    return value
+
 
 class GuildLogAdapter(logging.LoggerAdapter):
-    def process(self, msg, kwargs):  # noqa: ANN001
-        guild = kwargs.pop("guild", None)
+    def log(self, level, msg, *args, **kwargs):  # noqa: ANN001
+        # LoggerAdapter.debug()/info()/... all land here. Overridden only so the
+        # prefix can be escaped when `msg` is a %-format string: logging then
+        # interpolates the whole message, guild name included, and a guild named
+        # "100% Gaming" would break it.
+        if self.isEnabledFor(level):
+            msg, kwargs = self.process(msg, kwargs, escape=bool(args))
+            self.logger.log(level, msg, *args, **kwargs)
+
+    def process(self, msg, kwargs, *, escape: bool = False):  # noqa: ANN001
+        """Prefix `msg` with its context.
+
+        `guild` and `match` may also be callables returning one, which are only
+        called for a record that is emitted.
+        """
+        guild = _resolve(kwargs.pop("guild", None))
         parts = []
         if guild and isinstance(guild, discord.Guild):
             parts.append(f"[{guild.name}]")
 
-        match = kwargs.pop("match", None)
+        match = _resolve(kwargs.pop("match", None))
         if match and isinstance(match, Match):
             parts.append(f"[Match {match.id}]")
 
+        if escape:
+            parts = [part.replace("%", "%%") for part in parts]
+
         if isinstance(msg, str) or hasattr(msg, "__str__"):
             parts.append(msg)
             msg = " ".join(parts)
@@ -23,3 +101,155 @@ class GuildLogAdapter(logging.LoggerAdapter):
             msg = f"Log message is not a string or does not have __str__ method. Type: {type(msg)}"
 
         return msg, kwargs
+
+
+@dataclass(slots=True)
+class _Burst:
+    start: float
+    count: int = 1
+    suppressed: int = 0
+
+
+class BurstFilter(logging.Filter):
+    """Lets `limit` identical records through per `window` seconds and drops the rest.
+
+    Identical means the same logger, level, call site and rendered message. The
+    first record of the next window says how many were dropped. ERROR and above
+    always pass.
+    """
+
+    def __init__(
+        self,
+        limit: int = BURST_LIMIT,
+        window: float = BURST_WINDOW,
+        maxkeys: int = BURST_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.maxkeys = maxkeys
+        self.suppressed = 0
+        self._clock = clock
+        self._bursts: OrderedDict[tuple, _Burst] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+
+        # Kept on the record, so `_QueueHandler.prepare` need not render it again.
+        # Rendered outside the lock, since it may run a `Deferred`.
+        message = record.message = record.getMessage()
+        key = (record.name, record.levelno, record.pathname, record.lineno, message)
+        # One filter is shared by every queued logger, and records are logged
+        # from executor threads as well as the event loop
+        with self._lock:
+            now = self._clock()
+            burst = self._bursts.get(key)
+            if burst is None or now - burst.start >= self.window:
+                if burst is not None and burst.suppressed:
+                    record.message = f"{message} (repeated {burst.suppressed} more times)"
+                self._bursts[key] = _Burst(start=now)
+                self._bursts.move_to_end(key)
+                if len(self._bursts) > self.maxkeys:
+                    self._bursts.popitem(last=False)
+                return True
+
+            self._bursts.move_to_end(key)
+            burst.count += 1
+            if burst.count <= self.limit:
+                return True
+            burst.suppressed += 1
+            self.suppressed += 1
+            return False
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message is rendered here, on the calling thread, so the arguments
+        # are read before the caller can change them. Timestamps, tracebacks and
+        # the handlers' own formatting happen on the listener thread. Unlike the
+        # stdlib version, `exc_info` is kept: the queue never leaves the process,
+        # and Red's console handler renders tracebacks from it.
+        message = record.__dict__.get("message")
+        if message is None:
+            message = record.getMessage()
+        record = copy.copy(record)
+        record.message = record.msg = message
+        record.args = None
+        return record
+
+
+@dataclass(slots=True)
+class _Route:
+    logger: logging.Logger
+    handler: QueueHandler
+    listener: QueueListener
+    handlers: list[logging.Handler]
+    propagate: bool
+
+
+def _effective_handlers(logger: logging.Logger) -> list[logging.Handler]:
+    """Every handler a record from `logger` reaches, in the order logging calls them."""
+    handlers: list[logging.Handler] = []
+    current: logging.Logger | None = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
+
+
+class QueuedLogging:
+    """Routes rsc's loggers through a queue to their handlers on a background thread.
+
+    Each logger keeps its level. Its records go to one `QueueHandler`, and a
+    `QueueListener` thread hands them to the handlers they reached before
+    `start`, its own and its ancestors'. `stop` drains the queue and puts
+    everything back.
+
+    Usage:
+        queued = QueuedLogging()
+        queued.start()
+        # ... later ...
+        queued.stop()
+    """
+
+    def __init__(self, names: Iterable[str] = QUEUED_LOGGERS, burst: BurstFilter | None = None) -> None:
+        self.names = tuple(names)
+        self.burst = burst or BurstFilter()
+        self._routes: list[_Route] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._routes)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        for name in self.names:
+            logger = logging.getLogger(name)
+            targets = _effective_handlers(logger)
+            q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            handler = _QueueHandler(q)
+            handler.addFilter(self.burst)
+            listener = QueueListener(q, *targets, respect_handler_level=True)
+            route = _Route(logger=logger, handler=handler, listener=listener, handlers=list(logger.handlers), propagate=logger.propagate)
+            for h in route.handlers:
+                logger.removeHandler(h)
+            logger.addHandler(handler)
+            logger.propagate = False
+            listener.start()
+            self._routes.append(route)
+
+    def stop(self) -> None:
+        """Restore the original handlers, then write out whatever is still queued."""
+        for route in reversed(self._routes):
+            route.logger.removeHandler(route.handler)
+            for h in route.handlers:
+                route.logger.addHandler(h)
+            route.logger.propagate = route.propagate
+            route.listener.stop()
+        self._routes.clear()
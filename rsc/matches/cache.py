@@ -0,0 +1,148 @@
+"""Per-guild cache of season schedules and standings.
+
+Match nights bring hundreds of identical `/schedule`, `/match` and `/standings`
+lookups, and between two match results none of them change. Entries hold the
+API response, or the embed field text already rendered from it, so a hit costs
+no request and no formatting.
+
+A guild's entries are dropped together when a match is reported through the bot
+and on object events from the league feed. The TTL covers results reported
+anywhere else.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from rscapi.models.franchise_standings import FranchiseStandings
+from rscapi.models.high_level_match import HighLevelMatch
+from rscapi.models.team_standings import TeamStandings
+
+from rsc.enums import MatchType
+
+T = TypeVar("T")
+
+SEASON_CACHE_TTL = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleFields:
+    """`/schedule` embed columns for one team, one match per line."""
+
+    tier: str | None
+    date: str
+    home: str
+    away: str
+
+    @classmethod
+    def from_matches(cls, schedule: Sequence[HighLevelMatch], preseason: bool) -> "ScheduleFields | None":
+        """`None` when there is nothing to show. Raises `ValueError` on a match with no team name."""
+        if not schedule:
+            return None
+
+        if preseason:
+            matches = [s for s in schedule if s.match_type == MatchType.PRESEASON]
+        else:
+            matches = [s for s in schedule if s.match_type == MatchType.REGULAR]
+            matches.extend([s for s in schedule if s.match_type == MatchType.POSTSEASON])
+            matches.extend([s for s in schedule if s.match_type == MatchType.FINALS])
+
+        if not (all(m.home_team.name for m in matches) and all(m.away_team.name for m in matches)):
+            raise ValueError("Schedule data has a missing home or away team name.")
+
+        return cls(
+            tier=schedule[0].home_team.tier,
+            date="\n".join([f"{m.var_date.strftime('%-m/%-d')}" for m in matches if m.var_date]),
+            home="\n".join([str(m.home_team.name) for m in matches]),
+            away="\n".join([str(m.away_team.name) for m in matches]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StandingsFields:
+    """`/standings` embed columns, one team or franchise per line."""
+
+    rank: str
+    name: str
+    record: str
+
+    @classmethod
+    def from_franchises(cls, standings: Sequence[FranchiseStandings]) -> "StandingsFields | None":
+        if not standings:
+            return None
+        ordered = sorted(standings, key=lambda x: x.franchise_standings_rank)
+        return cls(
+            rank="\n".join([str(x.franchise_standings_rank) for x in ordered]),
+            name="\n".join([x.franchise for x in ordered]),
+            record="\n".join([f"{x.wins} - {x.losses}" for x in ordered]),
+        )
+
+    @classmethod
+    def from_teams(cls, standings: Sequence[TeamStandings]) -> "StandingsFields | None":
+        if not standings:
+            return None
+        return cls(
+            rank="\n".join([str(x.rank) for x in standings]),
+            name="\n".join([x.team for x in standings]),
+            record="\n".join([f"{x.games_won} - {x.games_lost}" for x in standings]),
+        )
+
+
+class SeasonCache:
+    """TTL cache keyed by guild, with single-flight fetches.
+
+    `None` is a valid cached value (no next match, no standings yet). A fetch
+    that raises caches nothing.
+    """
+
+    def __init__(self, ttl: float = SEASON_CACHE_TTL, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[int, dict[Hashable, tuple[float, Any]]] = {}
+        self._locks: dict[tuple[int, Hashable], asyncio.Lock] = {}
+        # Bumped by invalidate(), so a fetch that started before a match result
+        # does not store what it read after the guild was cleared.
+        self._generation: dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, guild_id: int, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(guild_id, {}).get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires < self._clock():
+            del self._entries[guild_id][key]
+            return False, None
+        return True, value
+
+    async def get_or_fetch(self, guild_id: int, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        found, value = self._get(guild_id, key)
+        if found:
+            self.hits += 1
+            return value
+
+        lock = self._locks.setdefault((guild_id, key), asyncio.Lock())
+        async with lock:
+            # A concurrent caller may have populated it while we waited.
+            found, value = self._get(guild_id, key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            generation = self._generation.get(guild_id, 0)
+            value = await fetch()
+            if self._generation.get(guild_id, 0) == generation:
+                self._entries.setdefault(guild_id, {})[key] = (self._clock() + self.ttl, value)
+        if not lock.locked():
+            self._locks.pop((guild_id, key), None)
+        return value
+
+    def invalidate(self, guild_id: int) -> None:
+        self._entries.pop(guild_id, None)
+        self._generation[guild_id] = self._generation.get(guild_id, 0) + 1
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
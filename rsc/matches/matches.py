@@ -26,6 +26,7 @@ from rsc.enums import (
 )
 from rsc.exceptions import RscException
 from rsc.logs import GuildLogAdapter
+from rsc.matches.cache import ScheduleFields, SeasonCache
 from rsc.teams import TeamMixIn
 from rsc.utils.utils import tier_color_by_name
 
@@ -42,6 +43,8 @@ log = GuildLogAdapter(logger)
 class MatchMixIn(RSCMixIn):
     def __init__(self) -> None:
         log.debug("Initializing MatchMixIn")
+        # Schedules, upcoming matches and standings. See season_cache().
+        self._season_cache = SeasonCache()
         super().__init__()
 
     # App Commands
@@ -71,13 +74,13 @@ class MatchMixIn(RSCMixIn):
         tier = None
         if team:
             # If team name was supplied, find the ID of that team
-            log.debug(f"Searching for team: {team}")
+            log.debug("Searching for team: %s", team)
             try:
                 team_id = await self.team_id_by_name(guild, name=team)
             except ValueError as exc:
                 return await interaction.followup.send(embed=ExceptionErrorEmbed(exc_message=str(exc)), ephemeral=True)
         else:
-            log.debug(f"Finding team for {interaction.user.display_name}")
+            log.debug("Finding team for %s", interaction.user.display_name)
             # Find the team ID of interaction user
             player = await self.players(guild, discord_id=interaction.user.id, limit=1)
             if not player:
@@ -113,10 +116,15 @@ class MatchMixIn(RSCMixIn):
             return
 
         # Fetch team schedule
-        log.debug(f"Fetching matches for team id: {team_id}")
-        schedule = await self.season_matches(guild, team_id, preseason=preseason)
+        log.debug("Fetching matches for team id: %s", team_id)
+        try:
+            fields = await self.team_schedule(guild, team_id, preseason=preseason)
+        except ValueError:
+            return await interaction.followup.send(
+                embed=ErrorEmbed(description="Schedule data has a missing home or away team name. Please open a modmail ticket.")
+            )
 
-        if not schedule:
+        if not fields:
             return await interaction.followup.send(
                 embed=YellowEmbed(
                     title=f"{team} Schedule",
@@ -128,23 +136,10 @@ class MatchMixIn(RSCMixIn):
         tier_color = discord.Color.default()
         if tier:
             tier_color = await tier_color_by_name(guild, tier)
-        elif schedule[0].home_team.tier:
-            tier_color = await tier_color_by_name(guild, schedule[0].home_team.tier)
-
-        # Sorting
-        if preseason:
-            title = f"{team} Preseason Schedule"
-            matches = [s for s in schedule if s.match_type == MatchType.PRESEASON]
-        else:
-            title = f"{team} Schedule"
-            matches = [s for s in schedule if s.match_type == MatchType.REGULAR]
-            matches.extend([s for s in schedule if s.match_type == MatchType.POSTSEASON])
-            matches.extend([s for s in schedule if s.match_type == MatchType.FINALS])
+        elif fields.tier:
+            tier_color = await tier_color_by_name(guild, fields.tier)
 
-        if not (all(m.home_team.name for m in matches) and all(m.away_team.name for m in matches)):
-            return await interaction.followup.send(
-                embed=ErrorEmbed(description="Schedule data has a missing home or away team name. Please open a modmail ticket.")
-            )
+        title = f"{team} Preseason Schedule" if preseason else f"{team} Schedule"
 
         embed = discord.Embed(
             title=title,
@@ -152,21 +147,9 @@ class MatchMixIn(RSCMixIn):
             color=tier_color or discord.Color.blue(),
         )
 
-        embed.add_field(
-            name="Date",
-            value="\n".join([f"{m.var_date.strftime('%-m/%-d')}" for m in matches if m.var_date]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Home",
-            value="\n".join([str(m.home_team.name) for m in matches]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Away",
-            value="\n".join([str(m.away_team.name) for m in matches]),
-            inline=True,
-        )
+        embed.add_field(name="Date", value=fields.date, inline=True)
+        embed.add_field(name="Home", value=fields.home, inline=True)
+        embed.add_field(name="Away", value=fields.away, inline=True)
 
         await interaction.followup.send(embed=embed)
 
@@ -227,14 +210,14 @@ class MatchMixIn(RSCMixIn):
         # Get teams next match
         try:
             if day:
-                log.debug(f"Getting match for team: {team_id} on day: {day}", guild=guild)
+                log.debug("Getting match for team: %s on day: %s", team_id, day, guild=guild)
                 # Does not support preseason matches currently
-                match = await self.match_by_day(guild, team_id, day, preseason=False)
+                match = await self.upcoming_match(guild, team_id, day=day)
             else:
-                log.debug(f"Getting match for team: {team_id}", guild=guild)
-                match = await self.next_match(guild, team_id)
+                log.debug("Getting match for team: %s", team_id, guild=guild)
+                match = await self.upcoming_match(guild, team_id)
         except RscException as exc:
-            log.debug(f"Match Return Status: {exc.status}")
+            log.debug("Match Return Status: %s", exc.status)
             await interaction.followup.send(
                 embed=ApiExceptionErrorEmbed(
                     exc,
@@ -283,6 +266,37 @@ class MatchMixIn(RSCMixIn):
             return await interaction.followup.send(embed=ExceptionErrorEmbed(str(exc)))
         await interaction.followup.send(embed=embed, ephemeral=True)
 
+    # Cache
+
+    def season_cache(self) -> SeasonCache:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        cache = getattr(self, "_season_cache", None)
+        if cache is None:
+            cache = self._season_cache = SeasonCache()
+        return cache
+
+    def invalidate_season_cache(self, guild: discord.Guild | int) -> None:
+        """Drop the guild's cached schedules, matches and standings after a match result."""
+        guild_id = guild if isinstance(guild, int) else guild.id
+        self.season_cache().invalidate(guild_id)
+        log.debug("Season cache invalidated for guild %s", guild_id)
+
+    async def team_schedule(self, guild: discord.Guild, team_id: int, preseason: bool = False) -> ScheduleFields | None:
+        """Rendered `/schedule` columns for a team's current season."""
+
+        async def fetch() -> ScheduleFields | None:
+            return ScheduleFields.from_matches(await self.season_matches(guild, team_id, preseason=preseason), preseason)
+
+        return await self.season_cache().get_or_fetch(guild.id, ("schedule", team_id, preseason), fetch)
+
+    async def upcoming_match(self, guild: discord.Guild, team_id: int, day: int | None = None) -> Match | None:
+        """The team's next match, or its regular season match on `day`."""
+        if day:
+            return await self.season_cache().get_or_fetch(
+                guild.id, ("match_day", team_id, day), lambda: self.match_by_day(guild, team_id, day, preseason=False)
+            )
+        return await self.season_cache().get_or_fetch(guild.id, ("next_match", team_id), lambda: self.next_match(guild, team_id))
+
     # Functions
 
     async def discord_member_in_match(self, member: discord.Member, match: Match) -> bool:
@@ -305,7 +319,7 @@ class MatchMixIn(RSCMixIn):
             if not (m.home_team.name and m.away_team.name):
                 continue
 
-            log.debug(f"Match List Data: {m.home_team.name} v {m.away_team.name}")
+            log.debug("Match List Data: %s v %s", m.home_team.name, m.away_team.name)
             if home.lower() in (
                 m.home_team.name.lower(),
                 m.away_team.name.lower(),
@@ -582,7 +596,7 @@ class MatchMixIn(RSCMixIn):
             return None
 
         fname = franchise.name.casefold()
-        log.debug(f"AGM of {franchise.name}. Home: {match.home_team.franchise} Away: {match.away_team.franchise}", guild=guild)
+        log.debug("AGM of %s. Home: %s Away: %s", franchise.name, match.home_team.franchise, match.away_team.franchise, guild=guild)
 
         if match.home_team.franchise and match.home_team.franchise.casefold() == fname:
             return MatchTeamEnum.HOME
@@ -699,7 +713,7 @@ class MatchMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TeamsApi(client)
             try:
-                log.debug(f"Fetching match for team ID: {team_id} on day: {day} (preseason={preseason})", guild=guild)
+                log.debug("Fetching match for team ID: %s on day: %s (preseason=%s)", team_id, day, preseason, guild=guild)
                 match: Match = await api.teams_match_retrieve(
                     id=team_id,
                     day=day,
@@ -767,10 +781,12 @@ class MatchMixIn(RSCMixIn):
                     executor=executor.id,
                     override=override,
                 )
-                log.debug(f"Match Score Report ({match_id}): {data}")
-                return await api.matches_score_report_create(match_id, data)
+                log.debug("Match Score Report (%s): %s", match_id, data)
+                result = await api.matches_score_report_create(match_id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
+        self.invalidate_season_cache(guild)
+        return result
 
     async def create_match(
         self,
@@ -791,7 +807,7 @@ class MatchMixIn(RSCMixIn):
                     match_type=MatchTypeEnum(match_type.value),
                     day=day,
                 )
-                log.debug(f"Match Create: {data}")
+                log.debug("Match Create: %s", data)
                 return await api.matches_create(data)
             except ApiException as exc:
                 raise RscException(response=exc)
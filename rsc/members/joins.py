@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+import discord
+
+from rsc.logs import GuildLogAdapter
+
+logger = logging.getLogger("red.rsc.members.joins")
+log = GuildLogAdapter(logger)
+
+# Seconds a join waits for others to batch with. Short enough that a lone join
+# still feels instant, long enough that a raid or season start collapses into
+# a handful of batches.
+JOIN_BATCH_WINDOW = 2.0
+# A batch is flushed early once this many joins are pending.
+JOIN_BATCH_MAX = 100
+# RSC API lookups and creates in flight at once for a single batch.
+JOIN_LOOKUP_CONCURRENCY = 8
+# Discord's message content limit.
+WELCOME_MESSAGE_MAX = 2000
+
+
+@dataclass
+class WelcomePlan:
+    """Welcome settings for a guild, read once per join batch."""
+
+    roles: list[discord.Role] = field(default_factory=list)
+    channel: discord.TextChannel | None = None
+    message: str | None = None
+
+
+@dataclass
+class _GuildJoins:
+    guild: discord.Guild
+    pending: dict[int, discord.Member] = field(default_factory=dict)
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task | None = None
+
+
+class JoinQueue:
+    """Collect member joins per guild and hand them to `flush` in batches.
+
+    The first join in a guild starts a short window. Joins arriving inside it
+    are batched together and flushed when it closes, or as soon as `max_size`
+    are pending. A member who joins twice inside one window is only flushed
+    once, with their latest `discord.Member`.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[discord.Guild, list[discord.Member]], Awaitable[None]],
+        *,
+        window: float = JOIN_BATCH_WINDOW,
+        max_size: int = JOIN_BATCH_MAX,
+    ) -> None:
+        self._flush = flush
+        self.window = window
+        self.max_size = max_size
+        self._guilds: dict[int, _GuildJoins] = {}
+
+    @property
+    def pending(self) -> int:
+        return sum(len(state.pending) for state in self._guilds.values())
+
+    def put(self, member: discord.Member) -> None:
+        """Queue a join. Never blocks."""
+        guild = member.guild
+        state = self._guilds.get(guild.id)
+        if state is None:
+            state = self._guilds[guild.id] = _GuildJoins(guild=guild)
+        state.guild = guild
+        state.pending.pop(member.id, None)
+        state.pending[member.id] = member
+        if len(state.pending) >= self.max_size:
+            state.full.set()
+        if state.task is None:
+            state.task = asyncio.create_task(self._run(state))
+
+    async def _run(self, state: _GuildJoins) -> None:
+        try:
+            while state.pending:
+                if not state.full.is_set():
+                    try:
+                        await asyncio.wait_for(state.full.wait(), self.window)
+                    except TimeoutError:
+                        pass
+                state.full.clear()
+
+                batch = [state.pending.pop(mid) for mid in list(state.pending)[: self.max_size]]
+                if len(state.pending) >= self.max_size:
+                    state.full.set()
+                log.debug("Flushing %d queued joins", len(batch), guild=state.guild)
+                try:
+                    await self._flush(state.guild, batch)
+                except Exception as exc:
+                    log.exception(f"Error processing {len(batch)} joined members: {exc}", guild=state.guild)
+        finally:
+            state.task = None
+
+    async def join(self) -> None:
+        """Wait until every queued join has been flushed."""
+        while tasks := [s.task for s in self._guilds.values() if s.task is not None]:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel pending batches. Queued joins are dropped, not flushed."""
+        tasks = [s.task for s in self._guilds.values() if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._guilds.clear()
+
+
+def welcome_messages(template: str, members: Iterable[discord.Member]) -> list[str]:
+    """Render `template` for each member, packed into as few messages as fit.
+
+    One rendered welcome per line. A single welcome longer than Discord's limit
+    is truncated rather than dropped.
+    """
+    messages: list[str] = []
+    lines: list[str] = []
+    size = 0
+    for member in members:
+        line = template.format(member=member)[:WELCOME_MESSAGE_MAX]
+        added = len(line) + (1 if lines else 0)
+        if lines and size + added > WELCOME_MESSAGE_MAX:
+            messages.append("\n".join(lines))
+            lines, size, added = [], 0, len(line)
+        lines.append(line)
+        size += added
+    if lines:
+        messages.append("\n".join(lines))
+    return messages
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import cast
@@ -45,6 +46,7 @@ from rsc.enums import Platform, PlayerType, Referrer, RegionPreference, StaffPos
 from rsc.exceptions import DiscordNameTooLong, LeagueNotConfigured, RscException
 from rsc.franchises import FranchiseMixIn
 from rsc.logs import GuildLogAdapter
+from rsc.members.joins import JOIN_LOOKUP_CONCURRENCY, JoinQueue, WelcomePlan, welcome_messages
 from rsc.members.views.intent import IntentState, IntentToPlayView
 from rsc.members.views.player_info import PlayerInfoView
 from rsc.members.views.signup import SignupState, SignupView
@@ -72,43 +74,132 @@ class MemberMixIn(RSCMixIn):
     def __init__(self):
         log.debug("Initializing MemberMixIn")
         self._elevated_role_cache: dict[int, dict[int, tuple[float, frozenset[str]]]] = {}
+        # Per guild join batches, see process_joins()
+        self._joins = JoinQueue(self.process_joins)
         super().__init__()
 
     # Listeners
 
     @commands.Cog.listener("on_member_join")
     async def on_join_member_processing(self, member: discord.Member):
-        guild = member.guild
-        log.debug(f"Processing new member on_join: {member}", guild=guild)
-
-        if not self._api_conf.get(guild.id):
-            log.warning(f"Unable to process {member} ({member.id}) on join. Guild has not configured API settings.", guild=guild)
+        log.debug("Queueing new member on_join: %s", member, guild=member.guild)
+        self._join_queue().put(member)
+
+    def _join_queue(self) -> JoinQueue:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        queue = getattr(self, "_joins", None)
+        if queue is None:
+            queue = self._joins = JoinQueue(self.process_joins)
+        return queue
+
+    async def process_joins(self, guild: discord.Guild, members: list[discord.Member]):
+        """Welcome a batch of newly joined members and set their RSC names.
+
+        Each member gets at most one PATCH carrying both their welcome roles and
+        RSC nickname, and the welcomes are packed into as few channel messages
+        as fit. The welcomes go out alongside the edits rather than after them.
+        """
+        # Raids and mistaken invites leave again before the batch flushes.
+        members = [m for m in members if guild.get_member(m.id) is not None]
+        if not members:
             return
 
-        try:
-            ml = await self.members(guild, discord_id=member.id, limit=1)
-        except RscException as exc:
-            log.warning(f"Unable to look up {member} ({member.id}) on join. {exc}", guild=guild)
-            return
+        plan = await self.welcome_plan(guild)
+        await asyncio.gather(self._send_welcomes(guild, plan, members), self._set_up_joins(guild, plan, members))
 
-        if not ml:
-            # Member does not exist, create one
-            log.debug(f"{member} does not exist. Creating member in API", guild=guild)
+    async def _send_welcomes(self, guild: discord.Guild, plan: WelcomePlan, members: list[discord.Member]):
+        if not (plan.channel and plan.message):
+            return
+        for content in welcome_messages(plan.message, members):
             try:
-                await self.create_member(guild, member=member)
-            except RscException as exc:
-                log.warning(f"Unable to create member {member} ({member.id}) on join. {exc}", guild=guild)
+                await plan.channel.send(content=content, allowed_mentions=discord.AllowedMentions(users=True))
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to send welcome message to {plan.channel.name}. {exc}", guild=guild)
+
+    async def _set_up_joins(self, guild: discord.Guild, plan: WelcomePlan, members: list[discord.Member]):
+        names = await self._resolve_join_names(guild, members)
+        for member in members:
+            await self._apply_join(member, plan.roles, names.get(member.id))
+
+    async def _resolve_join_names(self, guild: discord.Guild, members: list[discord.Member]) -> dict[int, str]:
+        """RSC name of each joined member who is already known to the API.
+
+        Unknown members are created in the API and left out of the result. The
+        API has no multi ID lookup, so lookups run concurrently over the shared
+        client instead, bounded by `JOIN_LOOKUP_CONCURRENCY`.
+        """
+        if not self._api_conf.get(guild.id):
+            log.warning(f"Unable to process {len(members)} joined members. Guild has not configured API settings.", guild=guild)
+            return {}
+
+        names: dict[int, str] = {}
+        sem = asyncio.Semaphore(JOIN_LOOKUP_CONCURRENCY)
+
+        async def resolve(member: discord.Member):
+            async with sem:
+                try:
+                    ml = await self.members(guild, discord_id=member.id, limit=1)
+                except RscException as exc:
+                    log.warning(f"Unable to look up {member} ({member.id}) on join. {exc}", guild=guild)
+                    return
+
+                if ml:
+                    names[member.id] = ml[0].rsc_name
+                    return
+
+                # Member does not exist, create one
+                log.debug("%s does not exist. Creating member in API", member, guild=guild)
+                try:
+                    await self.create_member(guild, member=member)
+                except RscException as exc:
+                    log.warning(f"Unable to create member {member} ({member.id}) on join. {exc}", guild=guild)
+
+        await asyncio.gather(*(resolve(m) for m in members))
+        return names
+
+    async def _apply_join(self, member: discord.Member, roles: list[discord.Role], nick: str | None):
+        """Add welcome `roles` and set `nick` in a single member edit.
+
+        If that edit is rejected, the roles and nickname are retried on their
+        own so one failing change does not take the other with it.
+        """
+        guild = member.guild
+        # The edit replaces the whole role list, so build it from the latest
+        # cached roles rather than those seen when the member was queued.
+        member = guild.get_member(member.id) or member
+        kwargs = {}
+        if nick and member.nick != nick:
+            log.debug("%s already exists. Changing nickname to %s", member, nick, guild=guild)
+            kwargs["nick"] = nick
+        missing = [r for r in roles if r not in member.roles]
+        if missing:
+            kwargs["roles"] = [*(r for r in member.roles if not r.is_default()), *missing]
+        if not kwargs:
             return
 
-        # Change nickname to RSC name
-        m = ml.pop()
-        log.debug(f"{member} already exists. Changing nickname to {m.rsc_name}", guild=guild)
         try:
-            await member.edit(nick=m.rsc_name)
+            await member.edit(**kwargs)
+            return
         except discord.Forbidden:
-            log.warning(f"Missing permissions to change nickname of {member} ({member.id}) on join.", guild=guild)
+            log.warning(f"Missing permissions to set up {member} ({member.id}) on join.", guild=guild)
         except discord.HTTPException as exc:
-            log.warning(f"Error changing nickname of {member} ({member.id}) on join. {exc}", guild=guild)
+            log.warning(f"Error setting up {member} ({member.id}) on join. {exc}", guild=guild)
+
+        # add_roles adds each role without replacing the member's role list
+        if missing:
+            try:
+                await member.add_roles(*missing)
+                log.debug("Added welcome roles to %s on retry", member, guild=guild)
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to add welcome roles to {member} ({member.id}) on join. {exc}", guild=guild)
+
+        # A nickname alone was exactly the request that just failed
+        if "nick" in kwargs and missing:
+            try:
+                await member.edit(nick=nick)
+                log.debug("Changed nickname of %s to %s on retry", member, nick, guild=guild)
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to change nickname of {member} ({member.id}) to {nick} on join. {exc}", guild=guild)
 
     # App Groups
 
@@ -163,7 +254,7 @@ class MemberMixIn(RSCMixIn):
                 embed=ErrorEmbed(description="API returned a Season without an ID. Please open a modmail ticket.")
             )
 
-        log.debug(f"Player: {player.display_name} Discord ID: {player.id}")
+        log.debug("Player: %s Discord ID: %s", player.display_name, player.id)
         lp_list = await self.players(guild=guild, season=next_season.id, discord_id=player.id, limit=1)
         if not lp_list:
             return await interaction.followup.send(
@@ -175,7 +266,7 @@ class MemberMixIn(RSCMixIn):
 
         lp = lp_list.pop(0)
 
-        log.debug(f"Player Status: {lp.status}")
+        log.debug("Player Status: %s", lp.status)
 
         if lp.status in (
             Status.PERM_FA,
@@ -344,7 +435,7 @@ class MemberMixIn(RSCMixIn):
             else:
                 return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc))
 
-        log.debug(f"Next Season: {next_season}")
+        log.debug("Next Season: %s", next_season)
 
         if not next_season:
             return await interaction.followup.send(
@@ -371,7 +462,7 @@ class MemberMixIn(RSCMixIn):
             returning=returning,
             missing=missing,
         )
-        log.debug(f"Intent Length: {len(intent_list)}")
+        log.debug("Intent Length: %s", len(intent_list))
 
         if not intent_list:
             return await interaction.followup.send(
@@ -386,22 +477,22 @@ class MemberMixIn(RSCMixIn):
 
         # Filter by franchise
         if franchise:
-            log.debug(f"Filtering intents by franchise: {franchise}")
+            log.debug("Filtering intents by franchise: %s", franchise)
             intents = [i for i in intents if i.player and i.player.franchise and i.player.franchise.lower() == franchise.lower()]
 
         # Filter by team
         if team:
-            log.debug(f"Filtering intents by team: {franchise}")
+            log.debug("Filtering intents by team: %s", franchise)
             intents = [i for i in intents if i.player and i.player.team and i.player.team.lower() == team.lower()]
 
         # Filter by returning value
         if returning is True or returning is False:
-            log.debug(f"Filtering intents by returning: {returning}")
+            log.debug("Filtering intents by returning: %s", returning)
             intents = [i for i in intents if i.returning == returning]
 
         # Filter by missing value
         if missing is True or missing is False:
-            log.debug(f"Filtering intents by missing: {missing}")
+            log.debug("Filtering intents by missing: %s", missing)
             intents = [i for i in intents if i.missing == missing]
 
         if not intents:
@@ -415,7 +506,7 @@ class MemberMixIn(RSCMixIn):
         # Limit to max of 50
         total_results = len(intents)
         intents = intents[:50]
-        log.debug(f"Filtered Intent Length: {len(intents)}")
+        log.debug("Filtered Intent Length: %s", len(intents))
 
         intent_dict = {}
         for i in intents:
@@ -425,7 +516,7 @@ class MemberMixIn(RSCMixIn):
                 continue
             m = guild.get_member(i.player.player.discord_id)
             if not m:
-                log.debug(f"Couldn't find member in guild: {i.player.player.rsc_name} ({i.player.player.discord_id})")
+                log.debug("Couldn't find member in guild: %s (%s)", i.player.player.rsc_name, i.player.player.discord_id)
                 continue
 
             if i.returning:
@@ -504,7 +595,7 @@ class MemberMixIn(RSCMixIn):
             )
 
         # A current player must declare intent, use that instead
-        log.debug(f"Checking if user is already signed up for season {signup_season.number}")
+        log.debug("Checking if user is already signed up for season %s", signup_season.number)
         plist = await self.players(guild, season=signup_season.id, discord_id=interaction.user.id, limit=1)
         if plist:
             log.debug("User is already signed up for the league. Using intent declaration instead.")
@@ -512,14 +603,14 @@ class MemberMixIn(RSCMixIn):
 
         # A returning player declaring intent for the first time has no league player
         # for the signup season yet. Route on last season instead (dropped players must re-signup).
-        log.debug(f"Checking if user played season {signup_season.number - 1}")
+        log.debug("Checking if user played season %s", signup_season.number - 1)
         prev_list = await self.players(guild, season_number=signup_season.number - 1, discord_id=interaction.user.id, limit=1)
         prev_lp = prev_list[0] if prev_list else None
         if prev_lp and prev_lp.status != Status.DROPPED:
             log.debug("User played last season. Using intent declaration instead.")
             return await self._intent_to_play_flow(interaction, guild, interaction.user)
 
-        log.debug(f"{interaction.user} is signing up for the league")
+        log.debug("%s is signing up for the league", interaction.user)
 
         # User prompts
         signup_view = SignupView(interaction)
@@ -567,7 +658,7 @@ class MemberMixIn(RSCMixIn):
                 accepted_rules=True,
                 accepted_match_nights=True,
             )
-            log.debug(f"Signup result: {result}")
+            log.debug("Signup result: %s", result)
         except RscException as exc:
             match exc.status:
                 case 409:
@@ -600,7 +691,7 @@ class MemberMixIn(RSCMixIn):
 
         # Check should get devleague role (only add to users one time in their career)
         add_devleague_role = await self.should_get_devleague_role(interaction.user)
-        log.debug(f"Add Dev League Role: {add_devleague_role}")
+        log.debug("Add Dev League Role: %s", add_devleague_role)
 
         # Sync roles and name in discord.
         #
@@ -640,7 +731,7 @@ class MemberMixIn(RSCMixIn):
         if not guild or not isinstance(interaction.user, discord.Member):
             return
 
-        log.debug(f"{interaction.user} is signing up as PermFA")
+        log.debug("%s is signing up as PermFA", interaction.user)
 
         # User prompts
         signup_view = SignupView(interaction)
@@ -689,7 +780,7 @@ class MemberMixIn(RSCMixIn):
                 accepted_rules=True,
                 accepted_match_nights=True,
             )
-            log.debug(f"Signup result: {result}")
+            log.debug("Signup result: %s", result)
         except RscException as exc:
             match exc.status:
                 case 409:
@@ -719,7 +810,7 @@ class MemberMixIn(RSCMixIn):
 
         # Check should get devleague role (only add to users one time in their career)
         add_devleague_role = await self.should_get_devleague_role(interaction.user)
-        log.debug(f"Add Dev League Role: {add_devleague_role}")
+        log.debug("Add Dev League Role: %s", add_devleague_role)
 
         # Sync roles and name in discord.
         #
@@ -873,7 +964,7 @@ class MemberMixIn(RSCMixIn):
     # Helper Functions
 
     async def _intent_to_play_flow(self, interaction: discord.Interaction, guild: discord.Guild, user: discord.Member):
-        log.debug(f"{interaction.user} is declaring intent", guild=guild)
+        log.debug("%s is declaring intent", interaction.user, guild=guild)
 
         # User prompts
         intent_view = IntentToPlayView(interaction)
@@ -912,7 +1003,7 @@ class MemberMixIn(RSCMixIn):
                 member=user,
                 returning=intent_view.result,
             )
-            log.debug(f"Intent Result: {result}")
+            log.debug("Intent Result: %s", result)
         except RscException as exc:
             if exc.status == 409:
                 await interaction.edit_original_response(
@@ -974,7 +1065,7 @@ class MemberMixIn(RSCMixIn):
 
         cached = gcache.get(discord_id)
         if cached and cached[0] > time.monotonic():
-            log.debug(f"Elevated role cache hit for {discord_id}: {sorted(cached[1])}", guild=guild)
+            log.debug("Elevated role cache hit for %s: %s", discord_id, sorted(cached[1]), guild=guild)
             return cached[1]
 
         roles = await self.member_elevated_roles(guild, discord_id)
@@ -992,7 +1083,7 @@ class MemberMixIn(RSCMixIn):
             found.add(parsed.value)
         positions = frozenset(found)
 
-        log.debug(f"Fetched elevated roles for {discord_id}: {sorted(positions)}", guild=guild)
+        log.debug("Fetched elevated roles for %s: %s", discord_id, sorted(positions), guild=guild)
         gcache[discord_id] = (time.monotonic() + ELEVATED_ROLE_TTL, positions)
         return positions
 
@@ -1129,7 +1220,7 @@ class MemberMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = MembersApi(client)
             try:
-                log.debug(f"Creating elevated role for {discord_id}: {data}", guild=guild)
+                log.debug("Creating elevated role for %s: %s", discord_id, data, guild=guild)
                 result = await api.members_elevated_roles_create(member_id=discord_id, elevated_role_input=data)
             except ApiException as exc:
                 raise RscException(exc)
@@ -1146,7 +1237,7 @@ class MemberMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = MembersApi(client)
             try:
-                log.debug(f"Deleting elevated role {role_id} for {discord_id}", guild=guild)
+                log.debug("Deleting elevated role %s for %s", role_id, discord_id, guild=guild)
                 await api.members_elevated_roles_destroy(member_id=discord_id, id=role_id)
             except ApiException as exc:
                 raise RscException(exc)
@@ -1210,7 +1301,7 @@ class MemberMixIn(RSCMixIn):
                 admin_override=override,
             )
             try:
-                log.debug(f"Signup Data: {data}")
+                log.debug("Signup Data: %s", data)
                 return await api.members_signup_create(member.id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1228,7 +1319,7 @@ class MemberMixIn(RSCMixIn):
                 discord_id=member.id,
                 rsc_name=rsc_name or member.display_name,
             )
-            log.debug(f"Member Creation Data: {data}")
+            log.debug("Member Creation Data: %s", data)
             try:
                 return await api.members_create(data)
             except ApiException as exc:
@@ -1266,7 +1357,7 @@ class MemberMixIn(RSCMixIn):
                     admin_override=override,
                     **({"executor": executor} if executor is not None else {}),
                 )
-                log.debug(f"NameChange Data. Name: {data.name} Override: {data.admin_override} Executor: {executor}")
+                log.debug("NameChange Data. Name: %s Override: %s Executor: %s", data.name, data.admin_override, executor)
                 return await api.members_name_change_partial_update(id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1311,7 +1402,7 @@ class MemberMixIn(RSCMixIn):
             )
             try:
                 member_id = member.id if isinstance(member, discord.Member) else member
-                log.debug(f"Intent Data ({member_id}): {data}")
+                log.debug("Intent Data (%s): %s", member_id, data)
                 return await api.members_intent_to_play_create(member_id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1347,7 +1438,7 @@ class MemberMixIn(RSCMixIn):
                 admin_override=override,
             )
             try:
-                log.debug(f"PermFA Signup Data: {data}")
+                log.debug("PermFA Signup Data: %s", data)
                 return await api.members_permfa_signup_create(member.id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1379,7 +1470,7 @@ class MemberMixIn(RSCMixIn):
                 admin_override=override,
             )
             try:
-                log.debug(f"[{player_id}] Activity Check: {data}")
+                log.debug("[%s] Activity Check: %s", player_id, data)
                 return await api.members_activity_check_create(player_id, data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1389,7 +1480,7 @@ class MemberMixIn(RSCMixIn):
             api = MembersApi(client)
             data = MemberTransferRequest(new_account=new.id)
             try:
-                log.debug(f"Transferring {old} membership to {new.id}", guild=guild)
+                log.debug("Transferring %s membership to %s", old, new.id, guild=guild)
                 return await api.members_transfer_account_create(id=old, member_transfer_request=data)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -1398,7 +1489,7 @@ class MemberMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = MembersApi(client)
             try:
-                log.debug(f"Fetching name history for {member.id}", guild=guild)
+                log.debug("Fetching name history for %s", member.id, guild=guild)
                 history = await api.members_name_changes_list(member.id, offset=offset, limit=limit)
                 return history.results
             except ApiException as exc:
@@ -1428,7 +1519,9 @@ class MemberMixIn(RSCMixIn):
             )
             try:
                 log.debug(
-                    f"Converting {member.display_name} ({member.id}) to league player.",
+                    "Converting %s (%s) to league player.",
+                    member.display_name,
+                    member.id,
                     guild=guild,
                 )
                 return await api.members_make_player_create(id=member.id, league_player_signup=data)
@@ -1447,7 +1540,10 @@ class MemberMixIn(RSCMixIn):
             )
             try:
                 log.debug(
-                    f"Droppping {member.display_name} ({member.id}) from league {data}",
+                    "Droppping %s (%s) from league %s",
+                    member.display_name,
+                    member.id,
+                    data,
                     guild=guild,
                 )
                 return await api.members_member_league_drop_create(id=member.id, league_player_signup=cast("LeaguePlayerSignup", data))
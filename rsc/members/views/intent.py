@@ -91,7 +91,7 @@ class IntentToPlayView(AuthorOnlyLayoutView):
                 content="Please select returning or not returning in the drop down.",
                 ephemeral=True,
             )
-        log.debug(f"[INTENT] User confirmed: returning={self.result}")
+        log.debug("[INTENT] User confirmed: returning=%s", self.result)
         self._select.disabled = True
         self._confirm_btn.disabled = True
         self._cancel_btn.disabled = True
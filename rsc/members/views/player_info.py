@@ -47,7 +47,7 @@ class PlayerInfoView(discord.ui.View):
         if not guild:
             return
 
-        log.debug(f"Fetching teams for {self.franchise}")
+        log.debug("Fetching teams for %s", self.franchise)
         try:
             teams = await self.mixin.teams(guild, franchise=self.franchise)
         except RscException as exc:
@@ -396,7 +396,7 @@ class SignupLayoutView(AuthorOnlyLayoutView):
 
     async def complete_step(self, interaction: discord.Interaction, step: SignupState):
         """Delegate step completion to the active phase and transition when needed."""
-        log.debug(f"[SIGNUP] Completed step: {step.name}")
+        log.debug("[SIGNUP] Completed step: %s", step.name)
 
         # Phase 1 steps
         if step in (SignupState.TIMES, SignupState.RULES):
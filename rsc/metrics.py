@@ -0,0 +1,351 @@
+"""In-process performance metrics.
+
+Counters, gauges and latency histograms held in one process-wide registry,
+read back by `/rsc perf` and optionally scraped as Prometheus text from the
+localhost web app.
+
+Everything here runs on the event loop and is deliberately lock free. Recording
+is a dict lookup and an integer add, cheap enough to leave on permanently.
+
+Histograms are log-linear in the style of HdrHistogram: each power of two is
+split into `SUB_BUCKETS` equal buckets, so any quantile is within ~1.6% of the
+true value whether the sample is 200us or 20 minutes, in a few hundred ints.
+"""
+
+import functools
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import discord
+
+if TYPE_CHECKING:
+    from rscapi import ApiClient
+
+# Metric names. Units follow the Prometheus convention of being in the name.
+API_REQUEST_SECONDS = "rsc_api_request_seconds"
+API_REQUESTS = "rsc_api_requests_total"
+DISCORD_REQUEST_SECONDS = "rsc_discord_request_seconds"
+DISCORD_REQUESTS = "rsc_discord_requests_total"
+LOOP_SECONDS = "rsc_loop_seconds"
+LOOP_ERRORS = "rsc_loop_errors_total"
+LOOP_LAST_RUN = "rsc_loop_last_run_timestamp_seconds"
+AGENT_SECONDS = "rsc_agent_seconds"
+AGENT_RUNS = "rsc_agent_runs_total"
+AGENT_TOKENS = "rsc_agent_tokens_total"
+AGENT_TOOL_SECONDS = "rsc_agent_tool_seconds"
+EVENT_LOOP_LAG_SECONDS = "rsc_event_loop_lag_seconds"
+EVENT_LOOP_STALLS = "rsc_event_loop_stalls_total"
+
+DESCRIPTIONS: dict[str, str] = {
+    API_REQUEST_SECONDS: "RSC API request latency, including client retries.",
+    API_REQUESTS: "RSC API requests by response status.",
+    DISCORD_REQUEST_SECONDS: "Discord REST request latency, including rate limit waits.",
+    DISCORD_REQUESTS: "Discord REST requests by outcome.",
+    LOOP_SECONDS: "Duration of one background task loop iteration.",
+    LOOP_ERRORS: "Background task loop failures.",
+    LOOP_LAST_RUN: "Unix time a background task loop last finished.",
+    AGENT_SECONDS: "End to end LLM agent answer latency.",
+    AGENT_RUNS: "LLM agent runs by outcome.",
+    AGENT_TOKENS: "LLM agent tokens by kind.",
+    AGENT_TOOL_SECONDS: "LLM agent tool call latency.",
+    EVENT_LOOP_LAG_SECONDS: "How late the event loop watchdog's heartbeat woke up.",
+    EVENT_LOOP_STALLS: "Event loop stalls longer than the watchdog threshold.",
+}
+
+# 2**7 buckets per power of two: 1/64 worst case relative error.
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = SUB_BUCKETS >> 1
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Path segments that are ids rather than part of the route. Keeps the label
+# set bounded: `/players/123/` and `/players/456/` are the same endpoint.
+_ID_SEGMENT_RE = re.compile(r"^\d+$")
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF + (micros >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    """Largest microsecond value that lands in bucket `index`."""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // _HALF - 1
+    top = index - shift * _HALF
+    return ((top + 1) << shift) - 1
+
+
+class Histogram:
+    """Latency distribution, recorded in seconds and held in microseconds."""
+
+    __slots__ = ("buckets", "count", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        index = _bucket_index(int(seconds * 1_000_000))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        self.max = max(self.max, seconds)
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile `q` in seconds, never above the largest sample."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper(index) / 1_000_000, self.max)
+        return self.max
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    name: str
+    labels: dict[str, str]
+    metric: Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._counters: dict[tuple[str, Labels], Counter] = {}
+        self._gauges: dict[tuple[str, Labels], Gauge] = {}
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict[str, str | int]) -> tuple[str, Labels]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def counter(self, name: str, **labels: str | int) -> Counter:
+        key = self._key(name, labels)
+        metric = self._counters.get(key)
+        if metric is None:
+            metric = self._counters[key] = Counter()
+        return metric
+
+    def gauge(self, name: str, **labels: str | int) -> Gauge:
+        key = self._key(name, labels)
+        metric = self._gauges.get(key)
+        if metric is None:
+            metric = self._gauges[key] = Gauge()
+        return metric
+
+    def histogram(self, name: str, **labels: str | int) -> Histogram:
+        key = self._key(name, labels)
+        metric = self._histograms.get(key)
+        if metric is None:
+            metric = self._histograms[key] = Histogram()
+        return metric
+
+    @contextmanager
+    def timer(self, name: str, **labels: str | int) -> Iterator[None]:
+        """Record the duration of the `with` body, including when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name, **labels).record(time.perf_counter() - start)
+
+    def samples(self, name: str) -> list[Sample]:
+        """Every labelled series recorded under `name`."""
+        found: list[Sample] = []
+        for store in (self._counters, self._gauges, self._histograms):
+            found.extend(Sample(name=n, labels=dict(labels), metric=m) for (n, labels), m in store.items() if n == name)
+        return found
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """The registry in the Prometheus text exposition format.
+
+        Histograms are exported as summaries. Their buckets are far finer than
+        anything worth scraping, and the quantiles are what `/rsc perf` shows.
+        """
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in DESCRIPTIONS:
+                lines.append(f"# HELP {name} {DESCRIPTIONS[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for kind, store in (("counter", self._counters), ("gauge", self._gauges)):
+            last = None
+            for (name, labels), metric in sorted(store.items(), key=lambda item: item[0]):
+                if name != last:
+                    header(name, kind)
+                    last = name
+                lines.append(f"{name}{_render_labels(labels)} {_render_value(metric.value)}")
+
+        last = None
+        for (name, labels), hist in sorted(self._histograms.items(), key=lambda item: item[0]):
+            if name != last:
+                header(name, "summary")
+                last = name
+            lines.extend(f"{name}{_render_labels((*labels, ('quantile', str(q))))} {_render_value(hist.quantile(q))}" for q in QUANTILES)
+            lines.append(f"{name}_sum{_render_labels(labels)} {_render_value(hist.total)}")
+            lines.append(f"{name}_count{_render_labels(labels)} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+def _render_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+METRICS = MetricsRegistry()
+
+
+def timed_loop(loop: str, registry: MetricsRegistry = METRICS) -> Callable:
+    """Time every iteration of a `tasks.loop` body.
+
+    Goes between `@tasks.loop` and the method. The wrapper is itself a
+    coroutine function, which is all `tasks.loop` checks for.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                registry.counter(LOOP_ERRORS, loop=loop).inc()
+                raise
+            finally:
+                registry.histogram(LOOP_SECONDS, loop=loop).record(time.perf_counter() - start)
+                registry.gauge(LOOP_LAST_RUN, loop=loop).set(time.time())
+
+        return wrapper
+
+    return decorator
+
+
+def endpoint_label(url: str) -> str:
+    """Route template for a request URL, with numeric ids collapsed to `{id}`."""
+    path = urlsplit(url).path or "/"
+    return "/".join("{id}" if _ID_SEGMENT_RE.match(segment) else segment for segment in path.split("/"))
+
+
+def instrument_api_client(client: "ApiClient", registry: MetricsRegistry = METRICS) -> None:
+    """Time every request `client` makes, per endpoint.
+
+    Wraps `call_api` on the instance, the one method every generated API
+    method funnels through. Instance level rather than a subclass so code
+    patching `ApiClient` itself keeps working.
+    """
+    original = client.call_api
+
+    async def call_api(method: str, url: str, *args, **kwargs):
+        endpoint = endpoint_label(url)
+        status = "error"
+        start = time.perf_counter()
+        try:
+            response = await original(method, url, *args, **kwargs)
+            status = str(getattr(response, "status", "ok"))
+            return response
+        finally:
+            registry.histogram(API_REQUEST_SECONDS, method=method, endpoint=endpoint).record(time.perf_counter() - start)
+            registry.counter(API_REQUESTS, method=method, endpoint=endpoint, status=status).inc()
+
+    client.call_api = call_api
+
+
+def instrument_discord_http(http: discord.http.HTTPClient, registry: MetricsRegistry = METRICS) -> None:
+    """Time every Discord REST request the bot makes, per route.
+
+    Every send, edit and role change goes through `HTTPClient.request`, and its
+    `Route` carries the unformatted path, which makes a bounded label. This is
+    bot wide, so requests from other cogs are counted too. Idempotent.
+    """
+    if "request" in vars(http):
+        return
+    original = http.request
+
+    @functools.wraps(original)
+    async def request(route: discord.http.Route, *args, **kwargs):
+        status = "ok"
+        start = time.perf_counter()
+        try:
+            return await original(route, *args, **kwargs)
+        except discord.HTTPException as exc:
+            status = str(exc.status)
+            raise
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            registry.histogram(DISCORD_REQUEST_SECONDS, method=route.method, route=route.path).record(time.perf_counter() - start)
+            registry.counter(DISCORD_REQUESTS, method=route.method, route=route.path, status=status).inc()
+
+    http.request = request
+
+
+def uninstrument_discord_http(http: discord.http.HTTPClient) -> None:
+    """Undo `instrument_discord_http`, so a reload does not stack wrappers."""
+    vars(http).pop("request", None)
@@ -31,7 +31,7 @@ class ThreadMixIn(RSCMixIn):
         group_list = await self._get_groups(interaction.guild)
         groups = list(group_list.keys())
 
-        log.debug(f"Autocomplete Groups: {groups}")
+        log.debug("Autocomplete Groups: %s", groups)
         # Return nothing if no groups exist
         if not groups:
             return []
@@ -308,7 +308,7 @@ class ThreadMixIn(RSCMixIn):
         groups = await self._get_groups(guild)
         for k, v in groups.items():
             if k == group:
-                log.debug(f"Found thread group: {k}")
+                log.debug("Found thread group: %s", k)
                 return v
         return None
 
@@ -319,7 +319,7 @@ class ThreadMixIn(RSCMixIn):
         groups = await self._get_groups(channel.guild)
         for v in groups.values():
             if v["category"] == channel.category_id:
-                log.debug(f"Valid modmail thread: {channel}")
+                log.debug("Valid modmail thread: %s", channel)
                 return True
         return False
 
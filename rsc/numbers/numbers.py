@@ -115,7 +115,7 @@ class NumberMixIn(RSCMixIn):
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
-        log.debug(f"Total MMR pulls: {len(pulls)}")
+        log.debug("Total MMR pulls: %s", len(pulls))
 
         peaks = await self.calculate_mmr_peaks(pulls)
 
@@ -169,10 +169,10 @@ class NumberMixIn(RSCMixIn):
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
 
-        log.debug(f"Total MMR pulls: {len(pulls)}")
+        log.debug("Total MMR pulls: %s", len(pulls))
 
         pulls_fmt = await self.filter_no_games_played_mmr_pulls(pulls)
-        log.debug(f"Total Filtered MMR pulls: {len(pulls)}")
+        log.debug("Total Filtered MMR pulls: %s", len(pulls))
         pulls_fmt.sort(key=lambda x: cast("int", x.threes_games_played), reverse=True)
 
         embed = YellowEmbed(
@@ -200,7 +200,7 @@ class NumberMixIn(RSCMixIn):
     # Functions
 
     async def filter_no_games_played_mmr_pulls(self, pulls: list[PlayerMMR]) -> list[PlayerMMR]:
-        log.debug(f"Filter pulls len: {len(pulls)}")
+        log.debug("Filter pulls len: %s", len(pulls))
         pulls_filtered: list[PlayerMMR] = []
         for p in pulls:
             log.debug(p)
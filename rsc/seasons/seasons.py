@@ -32,12 +32,12 @@ class SeasonsMixIn(RSCMixIn):
             return None
 
         league_seasons = list(filter(lambda league: league.league.id == league_id, seasons))
-        log.debug(f"league_seasons: {league_seasons}")
+        log.debug("league_seasons: %s", league_seasons)
         if not league_seasons:
             return None
 
         next_season = max(league_seasons, key=attrgetter("number"))
-        log.debug(f"Newest Season. ID: {next_season.id} Season Number: {next_season.number}")
+        log.debug("Newest Season. ID: %s Season Number: %s", next_season.id, next_season.number)
 
         return next_season
 
@@ -85,7 +85,7 @@ class SeasonsMixIn(RSCMixIn):
             api = SeasonsApi(client)
             try:
                 discord_id = player.id if player else None
-                log.debug(f"Season Intent Data. Season: {season_id} Discord: {discord_id} Returning: {returning} Missing: {missing}")
+                log.debug("Season Intent Data. Season: %s Discord: %s Returning: %s Missing: %s", season_id, discord_id, returning, missing)
                 return await api.seasons_player_intents_list(
                     season_id,
                     discord_id=discord_id,
@@ -8,6 +8,7 @@ from rscapi.models.team_season_stats import TeamSeasonStats
 from rsc.abc import RSCMixIn
 from rsc.embeds import ApiExceptionErrorEmbed, BlueEmbed, ErrorEmbed, YellowEmbed
 from rsc.exceptions import RscException
+from rsc.matches.cache import StandingsFields
 from rsc.teams import TeamMixIn
 from rsc.tiers import TierMixIn
 
@@ -37,16 +38,17 @@ class StatsMixIn(RSCMixIn):
         await interaction.response.defer(ephemeral=False)
 
         # fetch season data
+        cache = self.season_cache()
         if not season:
             log.debug("No season specified, fetching current season.")
-            sdata = await self.current_season(guild)
+            sdata = await cache.get_or_fetch(guild.id, ("current_season",), lambda: self.current_season(guild))
         else:
-            log.debug(f"Getting season information for S{season}")
-            slist = await self.seasons(guild, number=season)
+            log.debug("Getting season information for S%s", season)
+            slist = await cache.get_or_fetch(guild.id, ("seasons", season), lambda: self.seasons(guild, number=season))
             if not slist:
                 await interaction.followup.send(embed=ErrorEmbed(description=f"No season data found for S{season}"))
                 return
-            sdata = slist.pop(0)
+            sdata = slist[0]
 
         log.debug(sdata)
         if not sdata:
@@ -60,35 +62,23 @@ class StatsMixIn(RSCMixIn):
         season = sdata.number
         season_id = sdata.id
 
-        standings = await self.franchise_standings(guild, season_id=season_id)
-        # standings = await self.franchise_standings(guild, season_id=1)  # REMOVE ME
+        async def fetch_standings() -> StandingsFields | None:
+            return StandingsFields.from_franchises(await self.franchise_standings(guild, season_id=season_id))
 
-        if not standings:
+        fields = await cache.get_or_fetch(guild.id, ("franchise_standings", season_id), fetch_standings)
+
+        if not fields:
             await interaction.followup.send(embed=ErrorEmbed(description=f"No franchise standings returned for `S{season}`"))
             return
 
-        standings.sort(key=lambda x: x.franchise_standings_rank)
-
         embed = BlueEmbed(
             title=f"S{season} Franchise Standings",
             description="Displaying overall franchise standings.",
         )
 
-        embed.add_field(
-            name="Rank",
-            value="\n".join([str(x.franchise_standings_rank) for x in standings]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Franchise",
-            value="\n".join([x.franchise for x in standings]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Record",
-            value="\n".join([f"{x.wins} - {x.losses}" for x in standings]),
-            inline=True,
-        )
+        embed.add_field(name="Rank", value=fields.rank, inline=True)
+        embed.add_field(name="Franchise", value=fields.name, inline=True)
+        embed.add_field(name="Record", value=fields.record, inline=True)
 
         await interaction.followup.send(embed=embed, ephemeral=False)
 
@@ -100,7 +90,8 @@ class StatsMixIn(RSCMixIn):
             return
         await interaction.response.defer(ephemeral=False)
 
-        tier_data = await self.tiers(guild, name=tier)
+        cache = self.season_cache()
+        tier_data = await cache.get_or_fetch(guild.id, ("tiers", tier.casefold()), lambda: self.tiers(guild, name=tier))
         if not tier_data:
             await interaction.followup.send(embed=ErrorEmbed(description=f"No tier found with the name: `{tier}`"))
             return
@@ -109,14 +100,14 @@ class StatsMixIn(RSCMixIn):
             await interaction.followup.send(embed=ErrorEmbed(description=f"Found multiple tiers matching: `{tier}`"))
             return
 
-        tier_info = tier_data.pop(0)
+        tier_info = tier_data[0]
 
         if not tier_info.id:
             await interaction.followup.send(embed=ErrorEmbed(description="API returned a tier with no ID. Please submit a modmail."))
             return
 
         if not season:
-            current_season = await self.current_season(guild)
+            current_season = await cache.get_or_fetch(guild.id, ("current_season",), lambda: self.current_season(guild))
             if not (current_season and current_season.number):
                 await interaction.followup.send(
                     embed=ErrorEmbed(description="Could not determine current season. Please specify a season number.")
@@ -125,10 +116,14 @@ class StatsMixIn(RSCMixIn):
             season = current_season.number
 
         tier_id = tier_info.id
+        season_number = season
 
-        standings = await self.tier_standings(guild, tier_id=tier_id, season=season)
+        async def fetch_standings() -> StandingsFields | None:
+            return StandingsFields.from_teams(await self.tier_standings(guild, tier_id=tier_id, season=season_number))
 
-        if not standings:
+        fields = await cache.get_or_fetch(guild.id, ("tier_standings", tier_id, season), fetch_standings)
+
+        if not fields:
             await interaction.followup.send(embed=ErrorEmbed(description=f"No tier standings returned for `{tier}` in S{season}"))
             return
 
@@ -137,21 +132,9 @@ class StatsMixIn(RSCMixIn):
             description=f"Displaying standings for {tier} tier.",
         )
 
-        embed.add_field(
-            name="Rank",
-            value="\n".join([str(x.rank) for x in standings]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Team",
-            value="\n".join([x.team for x in standings]),
-            inline=True,
-        )
-        embed.add_field(
-            name="Record",
-            value="\n".join([f"{x.games_won} - {x.games_lost}" for x in standings]),
-            inline=True,
-        )
+        embed.add_field(name="Rank", value=fields.rank, inline=True)
+        embed.add_field(name="Team", value=fields.name, inline=True)
+        embed.add_field(name="Record", value=fields.record, inline=True)
 
         await interaction.followup.send(embed=embed, ephemeral=False)
 
@@ -82,7 +82,7 @@ class TeamMixIn(RSCMixIn):
             return
 
         await interaction.response.defer()
-        log.debug(f"Fetching teams for {franchise}")
+        log.debug("Fetching teams for %s", franchise)
         try:
             teams = await self.teams(guild, franchise=franchise)
         except RscException as exc:
@@ -115,7 +115,7 @@ class TeamMixIn(RSCMixIn):
             return
 
         await interaction.response.defer()
-        log.debug(f"Fetching teams for {tier}")
+        log.debug("Fetching teams for %s", tier)
         teams = await self.teams(guild, tier=tier)
 
         if not teams:
@@ -177,9 +177,9 @@ class TeamMixIn(RSCMixIn):
 
         await interaction.response.defer()
         plist = await self.players(guild, team_name=team)
-        log.debug(f"Total Rostered Players: {len(plist)}")
+        log.debug("Total Rostered Players: %s", len(plist))
         plist = [p for p in plist if p.team and p.team.name and p.team.name.lower() == team.lower()]
-        log.debug(f"Total filtered Players: {len(plist)}")
+        log.debug("Total filtered Players: %s", len(plist))
 
         # Verify team exists and get data
         if not plist:
@@ -388,10 +388,10 @@ class TeamMixIn(RSCMixIn):
 
             if idx == 0:
                 base = tier
-                log.debug(f"Base Comparison Tier: {base}")
+                log.debug("Base Comparison Tier: %s", base)
                 continue
 
-            log.debug(f"Team Tier: {tier}")
+            log.debug("Team Tier: %s", tier)
             if tier != base:
                 return False
         return True
@@ -414,9 +414,9 @@ class TeamMixIn(RSCMixIn):
     async def team_captain(self, guild: discord.Guild, team_name: str) -> LeaguePlayer | None:
         """Return captain of a team by name"""
         players = await self.players(guild, team_name=team_name)
-        log.debug(f"Total Rostered Players: {len(players)}")
+        log.debug("Total Rostered Players: %s", len(players))
         players = [p for p in players if p.team and p.team.name == team_name]
-        log.debug(f"Filtered Rostered Players: {len(players)}")
+        log.debug("Filtered Rostered Players: %s", len(players))
         if not players:
             return None
         return next((x for x in players if x.captain), None)
@@ -475,12 +475,15 @@ class TeamMixIn(RSCMixIn):
 
         gm_id = teams[0].franchise.gm.discord_id if teams[0].franchise.gm else None
 
-        # `TeamList` only carries the GM, so the franchise has to be fetched for
-        # the AGM list. A failure here should not cost the user the whole embed.
+        # `TeamList` only carries the GM. The AGMs come from the franchise index,
+        # or a fetch for a franchise it does not know yet. A failure here should
+        # not cost the user the whole embed.
         agm_ids: list[int] = []
         try:
-            franchise = await self.fetch_franchise(guild, teams[0].franchise.name)
-            if franchise:
+            entry = (await self.franchise_index(guild)).by_id(teams[0].franchise.id) if teams[0].franchise.id else None
+            if entry is not None:
+                agm_ids = list(entry.agm_ids)
+            elif franchise := await self.fetch_franchise(guild, teams[0].franchise.name):
                 agm_ids = [a.discord_id for a in (franchise.agms or []) if a.discord_id]
         except (RscException, ValueError) as exc:
             log.warning(f"Unable to fetch AGMs for {teams[0].franchise.name}: {exc}", guild=guild)
@@ -644,7 +647,7 @@ class TeamMixIn(RSCMixIn):
                     merged = merge_name_cache(cached, (t.name for t in teams if t.name), full_refresh=full_refresh)
                     merged.sort()
                     if merged != cached:
-                        log.debug(f"[{guild.name}] Team cache now holds {len(merged)} teams")
+                        log.debug("[%s] Team cache now holds %s teams", guild.name, len(merged))
                     self._team_cache[guild.id] = merged
                 return teams
             except ApiException as exc:
@@ -742,7 +745,7 @@ class TeamMixIn(RSCMixIn):
                 result = await api.teams_create(data)
                 return result
         except (ApiException, BadRequestException) as exc:
-            log.debug(f"Exception during team creation: {type(exc)}")
+            log.debug("Exception during team creation: %s", type(exc))
             raise RscException(exc)
 
     async def delete_team(self, guild: discord.Guild, team_id: int):
@@ -200,7 +200,7 @@ class TierMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TiersApi(client)
             data = cast("Tier", {"name": name, "color": color, "position": position})
-            log.debug(f"Create Tier Data: {data}")
+            log.debug("Create Tier Data: %s", data)
             try:
                 return await api.tiers_create(data)
             except ApiException as exc:
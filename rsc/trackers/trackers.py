@@ -1,5 +1,6 @@
+import heapq
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import cast
 
 import discord
@@ -34,6 +35,9 @@ TRACKER_POSITIONS = (
     StaffPositions.NUMBERS_HEAD,
 )
 
+# Sort key for links that have never been pulled
+NEVER_UPDATED = datetime.min.replace(tzinfo=UTC)
+
 
 class TrackerMixIn(RSCMixIn):
     def __init__(self):
@@ -213,7 +217,9 @@ class TrackerMixIn(RSCMixIn):
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=False)
 
-        trackers.sort(key=lambda x: cast("datetime", x.last_updated), reverse=True)
+        # Only 25 are shown, so select them rather than sort every link. Never
+        # updated sorts as oldest.
+        trackers = heapq.nlargest(25, trackers, key=lambda x: x.last_updated or NEVER_UPDATED)
 
         dates = []
         for x in trackers:
@@ -226,17 +232,17 @@ class TrackerMixIn(RSCMixIn):
         )
         embed.add_field(
             name="RSC ID",
-            value="\n".join([str(x.rscid) for x in trackers[:25]]),
+            value="\n".join([str(x.rscid) for x in trackers]),
             inline=True,
         )
         embed.add_field(
             name="Name",
-            value="\n".join([str(x.member_name) for x in trackers[:25]]),
+            value="\n".join([str(x.member_name) for x in trackers]),
             inline=True,
         )
         embed.add_field(
             name="Date",
-            value="\n".join(dates[:25]),
+            value="\n".join(dates),
             inline=True,
         )
         await interaction.followup.send(embed=embed, ephemeral=False)
@@ -293,28 +299,23 @@ class TrackerMixIn(RSCMixIn):
         tz = await self.timezone(guild)
         date_cutoff = datetime.now(tz) - timedelta(days=days)
 
-        log.debug(f"Getting tracker data older than {date_cutoff.date()}")
+        log.debug("Getting tracker data older than %s", date_cutoff.date())
         try:
-            trackers = await self.trackers(guild, status)
+            if status == TrackerLinksStatus.NEW:
+                # New links have never been pulled, so every one is outdated
+                # and the count alone answers.
+                total = old_trackers = await self.tracker_count(guild, status)
+            else:
+                trackers = await self.trackers(guild, status)
+                total = len(trackers)
+                cutoff = date_cutoff.date()
+                old_trackers = sum(1 for t in trackers if not t.last_updated or t.last_updated.date() < cutoff)
         except RscException as exc:
             return await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=False)
 
-        log.debug("Removing recently updated trackers")
-        old_trackers = []
-        for t in trackers:
-            if not t.last_updated:
-                old_trackers.append(t)
-                continue
-
-            if t.last_updated.date() < date_cutoff.date():
-                old_trackers.append(t)
-        log.debug("Finished iterating tracker list")
-
         embed = YellowEmbed(
             title="Outdated RSC Trackers",
-            description=(
-                f"Found **{len(old_trackers)}/{len(trackers)} {status.name}** trackers have not been updated since **{date_cutoff.date()}**"
-            ),
+            description=(f"Found **{old_trackers}/{total} {status.name}** trackers have not been updated since **{date_cutoff.date()}**"),
         )
         await interaction.followup.send(embed=embed)
 
@@ -463,6 +464,20 @@ class TrackerMixIn(RSCMixIn):
             except ApiException as exc:
                 raise RscException(response=exc)
 
+    async def tracker_count(
+        self,
+        guild: discord.Guild,
+        status: TrackerLinksStatus | None = None,
+    ) -> int:
+        """Number of tracker links, read from a one row page"""
+        async with self.api_client(guild) as client:
+            api = TrackerLinksApi(client)
+            try:
+                trackers = await api.tracker_links_list(status=str(status) if status else None, limit=1, offset=0)
+                return trackers.count
+            except ApiException as exc:
+                raise RscException(response=exc)
+
     async def tracker_stats(
         self,
         guild: discord.Guild,
@@ -524,7 +539,7 @@ class TrackerMixIn(RSCMixIn):
         """Delete a tracker"""
         async with self.api_client(guild) as client:
             api = TrackerLinksApi(client)
-            log.debug(f"Tracker Delete: {tracker_id}")
+            log.debug("Tracker Delete: %s", tracker_id)
             try:
                 return await api.tracker_links_destroy(str(tracker_id))
             except ApiException as exc:
@@ -541,7 +556,7 @@ class TrackerMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TrackerLinksApi(client)
             data = TrackerLinkLinking(member=player.id, executor=executor.id)
-            log.debug(f"Tracker Unlink: {tracker_id} (Member: {player})")
+            log.debug("Tracker Unlink: %s (Member: %s)", tracker_id, player)
             try:
                 return await api.tracker_links_unlink_create(tracker_id, data)
             except ApiException as exc:
@@ -558,7 +573,7 @@ class TrackerMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TrackerLinksApi(client)
             data = TrackerLinkLinking(member=player.id, executor=executor.id)
-            log.debug(f"Tracker Link: {tracker_id} (Member: {player})")
+            log.debug("Tracker Link: %s (Member: %s)", tracker_id, player)
             try:
                 return await api.tracker_links_link_create(tracker_id, data)
             except ApiException as exc:
@@ -572,7 +587,7 @@ class TrackerMixIn(RSCMixIn):
         """Fetch a Tracker Link by API ID"""
         async with self.api_client(guild) as client:
             api = TrackerLinksApi(client)
-            log.debug(f"Fetch Tracker ID: {tracker_id}")
+            log.debug("Fetch Tracker ID: %s", tracker_id)
             try:
                 return await api.tracker_links_retrieve(str(tracker_id))
             except ApiException as exc:
@@ -587,7 +602,7 @@ class TrackerMixIn(RSCMixIn):
         """Fetch a Tracker Link by API ID"""
         async with self.api_client(guild) as client:
             api = TrackerLinksApi(client)
-            log.debug(f"Merging {source} pulls into {dest}")
+            log.debug("Merging %s pulls into %s", source, dest)
             try:
                 data = TrackerIDInput(tracker_id=source)
                 return await api.tracker_links_migrate_pulls_create(id=dest, tracker_id_input=data)
@@ -0,0 +1,93 @@
+import bisect
+from collections.abc import Iterable
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+import discord
+
+from rsc.types import Substitute
+
+CONTRACT_EXPIRED_IMG = ("transactions", "ContractExpired.png")
+
+# Seconds between contract expired announcements. Each one is a send and an
+# edit in the same channel, whose bucket is roughly 5 requests / 5 seconds.
+SUB_SEND_PACING_DELAY = 1.0
+# Subbed out role removals in flight at once. Each member is its own route, so
+# these do not share the transaction channel's bucket.
+SUB_ROLE_CONCURRENCY = 4
+
+
+def sub_started_at(sub: Substitute, tz: ZoneInfo) -> datetime:
+    """When `sub` was signed. A date stored without an offset is read as `tz` local time."""
+    started = datetime.fromisoformat(sub["date"])
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=tz)
+    return started
+
+
+def expiry_cutoff(now: datetime, tz: ZoneInfo) -> datetime:
+    """Start of the guild's local day at `now`.
+
+    A contract signed before this was signed yesterday or earlier in the guild's
+    timezone and is due. Comparing instants rather than stored dates keeps this
+    right for contracts signed under a different timezone setting.
+    """
+    return datetime.combine(now.astimezone(tz).date(), time(), tzinfo=tz)
+
+
+class SubstituteIndex:
+    """A guild's substitute contracts ordered by when they were signed.
+
+    Due contracts are always a prefix, so finding them is a bisect rather than a
+    scan over every stored substitute.
+    """
+
+    def __init__(self, subs: Iterable[Substitute], tz: ZoneInfo) -> None:
+        self.tz = tz
+        self._started: list[datetime] = []
+        self._subs: list[Substitute] = []
+        for sub in subs:
+            self.add(sub)
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def add(self, sub: Substitute) -> None:
+        started = sub_started_at(sub, self.tz)
+        idx = bisect.bisect_right(self._started, started)
+        self._started.insert(idx, started)
+        self._subs.insert(idx, sub)
+
+    def remove(self, sub: Substitute) -> bool:
+        try:
+            idx = self._subs.index(sub)
+        except ValueError:
+            return False
+        del self._started[idx]
+        del self._subs[idx]
+        return True
+
+    def due(self, now: datetime) -> list[Substitute]:
+        """Contracts signed before the guild's local day at `now` began."""
+        return self._subs[: bisect.bisect_left(self._started, expiry_cutoff(now, self.tz))]
+
+
+def contract_expired_embed(
+    sub: Substitute,
+    player_in: str,
+    player_out: str,
+    color: discord.Color,
+    image_url: str,
+    icon_url: str | None,
+) -> discord.Embed:
+    embed = discord.Embed(color=color)
+    embed.set_image(url=image_url)
+    embed.set_author(
+        name=f"{player_in} has finished temporary contract for {sub['team']}",
+        icon_url=icon_url,
+    )
+    # The sub is the one leaving now, so the fields read the other way around.
+    embed.add_field(name="Player In", value=player_out, inline=True)
+    embed.add_field(name="Player Out", value=player_in, inline=True)
+    embed.add_field(name="Franchise", value=sub["franchise"], inline=True)
+    return embed
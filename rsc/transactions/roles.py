@@ -104,15 +104,15 @@ async def update_signed_player_discord(
 
     # Update roles at same time to reduce API calls
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     # Update player prefix
     try:
-        log.debug(f"Changing {player.id} signed player nick", guild=guild)
+        log.debug("Changing %s signed player nick", player.id, guild=guild)
         await utils.update_discord_name(member=player, name=ptu.player.player.name, prefix=ptu.player.team.franchise.prefix)
     except discord.Forbidden as exc:
         log.warning(f"Unable to update nickname {player.display_name} ({player.id}): {exc}")
@@ -155,9 +155,9 @@ async def update_cut_player_discord(
     roles_to_remove.append(captain_role)
 
     # Update tier role, handle promotion case
-    log.debug(f"Old Tier: {ptu.old_team.tier}", guild=guild)
+    log.debug("Old Tier: %s", ptu.old_team.tier, guild=guild)
     old_tier_role = await utils.get_tier_role(guild, ptu.old_team.tier)
-    log.debug(f"New Tier: {ptu.player.tier.name}", guild=guild)
+    log.debug("New Tier: %s", ptu.player.tier.name, guild=guild)
     tier_role = await utils.get_tier_role(guild, ptu.player.tier.name)
     if old_tier_role != tier_role:
         roles_to_remove.append(old_tier_role)
@@ -199,10 +199,10 @@ async def update_cut_player_discord(
         roles_to_add.remove(tier_fa_role)
 
     if roles_to_remove:
-        log.debug(f"Removing cut player roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing cut player roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding cut player roles: {roles_to_add}", guild=guild)
+        log.debug("Adding cut player roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     log.debug("Updating cut player nickname", guild=guild)
@@ -228,10 +228,10 @@ async def update_team_captain_discord(
             continue
 
         if p.captain and cpt_role not in m.roles:
-            log.debug(f"Adding captain role: {m.display_name} ({m.id})", guild=guild)
+            log.debug("Adding captain role: %s (%s)", m.display_name, m.id, guild=guild)
             await m.add_roles(cpt_role)
         elif cpt_role in m.roles:
-            log.debug(f"Removing captain role: {m.display_name} ({m.id})", guild=guild)
+            log.debug("Removing captain role: %s (%s)", m.display_name, m.id, guild=guild)
             await m.remove_roles(cpt_role)
 
 
@@ -410,7 +410,7 @@ async def update_nonplaying_discord(
 
     # Remove Roles
     if roles_to_remove:
-        log.debug(f"Removing roles ({member.id}): {roles_to_remove}", guild=guild)
+        log.debug("Removing roles (%s): %s", member.id, roles_to_remove, guild=guild)
         await member.remove_roles(*roles_to_remove)
 
     # Determine Former Player by prefix. An AGM keeps a franchise prefix as
@@ -430,7 +430,7 @@ async def update_nonplaying_discord(
         # letting a 32 character nickname raise would report the whole retire as
         # failed after the API mutation had gone through.
         try:
-            log.debug(f"Restoring AGM prefix ({member.id}): {agm_franchise.prefix}", guild=guild)
+            log.debug("Restoring AGM prefix (%s): %s", member.id, agm_franchise.prefix, guild=guild)
             await utils.update_discord_name(
                 member=member,
                 name=agm_rsc_name(member, agm_franchise),
@@ -443,7 +443,7 @@ async def update_nonplaying_discord(
 
         if new_nick != member.display_name:
             try:
-                log.debug(f"Updating nickname ({member.id}): {new_nick}", guild=guild)
+                log.debug("Updating nickname (%s): %s", member.id, new_nick, guild=guild)
 
                 if len(new_nick) > 32:
                     raise ValueError(f"Discord name is too long: {len(new_nick)} characters")
@@ -456,7 +456,7 @@ async def update_nonplaying_discord(
 
     # Add Roles
     if roles_to_add:
-        log.debug(f"Adding Roles ({member.id}): {roles_to_add}", guild=guild)
+        log.debug("Adding Roles (%s): %s", member.id, roles_to_add, guild=guild)
         await member.add_roles(*roles_to_add)
 
 
@@ -543,15 +543,15 @@ async def update_nonplaying_gm_discord(
 
     # Update roles at same time to reduce API calls
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     # Update player prefix
     try:
-        log.debug(f"Changing {player.id} non-playing GM nick", guild=guild)
+        log.debug("Changing %s non-playing GM nick", player.id, guild=guild)
         if not franchise.gm.rsc_name:
             raise ValueError("Franchise GM has no name in API...")
         await utils.update_discord_name(member=player, name=franchise.gm.rsc_name, prefix=franchise.prefix)
@@ -652,10 +652,10 @@ async def update_unsigned_gm_discord(
 
     # Update roles at same time to reduce API calls
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     # Update player prefix
@@ -792,10 +792,10 @@ async def update_rostered_discord(
 
     # Update roles at same time to reduce API calls
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     # Update player prefix
@@ -892,10 +892,10 @@ async def update_free_agent_discord(
         roles_to_remove.append(permfa_waiting_role)
 
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     try:
@@ -994,10 +994,10 @@ async def update_draft_eligible_discord(
             roles_to_add.append(dev_league_role)
 
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     try:
@@ -1079,10 +1079,10 @@ async def update_permfa_waiting_discord(
         roles_to_add.append(permfa_waiting_role)
 
     if roles_to_remove:
-        log.debug(f"Removing roles: {roles_to_remove}", guild=guild)
+        log.debug("Removing roles: %s", roles_to_remove, guild=guild)
         await player.remove_roles(*roles_to_remove)
     if roles_to_add:
-        log.debug(f"Adding roles: {roles_to_add}", guild=guild)
+        log.debug("Adding roles: %s", roles_to_add, guild=guild)
         await player.add_roles(*roles_to_add)
 
     try:
@@ -3,8 +3,7 @@ import itertools
 import logging
 import re
 from collections.abc import AsyncIterator
-from datetime import datetime, time, timedelta
-from pathlib import Path
+from datetime import UTC, datetime, time
 from pprint import pformat
 
 import discord
@@ -31,6 +30,7 @@ from rscapi.models.transaction_franchise import TransactionFranchise
 from rscapi.models.transaction_response import TransactionResponse
 
 from rsc.abc import RSCMixIn
+from rsc.assets import fa_asset, resource_asset, transaction_asset
 from rsc.embeds import (
     ApiExceptionErrorEmbed,
     BlueEmbed,
@@ -51,8 +51,17 @@ from rsc.exceptions import (
     translate_api_error,
 )
 from rsc.franchises import FranchiseMixIn
-from rsc.logs import GuildLogAdapter
+from rsc.franchises.index import FranchiseIndex, FranchiseIndexEntry
+from rsc.logs import Deferred, GuildLogAdapter
+from rsc.metrics import timed_loop
 from rsc.teams import TeamMixIn
+from rsc.transactions.expiry import (
+    CONTRACT_EXPIRED_IMG,
+    SUB_ROLE_CONCURRENCY,
+    SUB_SEND_PACING_DELAY,
+    SubstituteIndex,
+    contract_expired_embed,
+)
 from rsc.transactions.modals import CutMsgModal, TransactionAnnouncementModal
 from rsc.transactions.trade_announce import announce_trade, apply_trade_role_updates
 from rsc.transactions.roles import (
@@ -131,6 +140,8 @@ class TransactionMixIn(RSCMixIn):
         # Prepare configuration group
         self.config.init_custom("Transactions", 1)
         self.config.register_custom("Transactions", **defaults)
+        # guild.id -> substitutes ordered by signing date, see _substitute_index()
+        self._sub_index: dict[int, SubstituteIndex] = {}
         super().__init__()
 
         # Start sub expire loop
@@ -139,93 +150,116 @@ class TransactionMixIn(RSCMixIn):
 
     # Tasks
     @tasks.loop(time=SUB_LOOP_TIME)
+    @timed_loop("expire_sub_contract_loop")
     async def expire_sub_contract_loop(self):
         """Send contract expiration message to Transaction Channel"""
         log.info("Expire sub contracts loop started")
+        now = datetime.now(UTC)
         guilds: list[discord.Guild] = list(self.bot.guilds)
-        for guild in guilds:
-            log.info("Expire sub contract loop is running", guild=guild)
-            subs: list[Substitute] = await self._get_substitutes(guild)
-            if not subs:
-                log.debug("No substitutes to expire", guild=guild)
-                continue
+        # Guilds announce in their own channels, so they do not share a bucket.
+        results = await asyncio.gather(*(self.expire_substitutes(g, now=now) for g in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results, strict=True):
+            if isinstance(result, Exception):
+                log.error("Error expiring substitute contracts", exc_info=result, guild=guild)
+        log.info("Finished expire substitute daily loop.")
 
-            tchan = await self._trans_channel(guild)
-            if not tchan or not hasattr(tchan, "send"):
-                # Still need to remove player from sub list after.
-                log.warning("Substitutes found but transaction channel not set", guild=guild)
+    async def expire_substitutes(
+        self,
+        guild: discord.Guild,
+        now: datetime | None = None,
+    ) -> list[Substitute]:
+        """Expire every substitute contract due at `now` and return them.
+
+        Due contracts are announced in the transaction channel while the subbed
+        out role is taken back, then all of them are removed from config in a
+        single write. A failed announcement does not keep a contract alive.
+        """
+        now = now or datetime.now(UTC)
+        index = await self._substitute_index(guild)
+        due = index.due(now)
+        log.debug("Substitutes due: %d of %d", len(due), len(index), guild=guild)
+        if not due:
+            return []
+
+        tchan = await self._trans_channel(guild)
+        if not tchan or not hasattr(tchan, "send"):
+            # Still need to remove player from sub list after.
+            log.warning("Substitutes found but transaction channel not set", guild=guild)
+            tchan = None
 
+        try:
             subbed_out_role = await utils.get_subbed_out_role(guild)
+        except ValueError:
+            subbed_out_role = None
 
-            guild_tz = await self.timezone(guild)
-            yesterday = datetime.now(tz=guild_tz) - timedelta(1)
-
-            # Get ContractExpired image
-            img_path = Path(__file__).parent.parent / "resources/transactions/ContractExpired.png"
-
-            # Loop through checkins.
-            log.debug(f"Total substitute count: {len(subs)}", guild=guild)
-            for s in subs:
-                sub_date = datetime.fromisoformat(s["date"])
-                dFiles = [discord.File(img_path)]
-                if sub_date.date() <= yesterday.date():
-                    # Get FA img resource
-                    fa_icon = await utils.fa_img_from_tier(s["tier"], tiny=True)
-
-                    # Tier color
-                    tier_color = await utils.tier_color_by_name(guild, s["tier"])
-
-                    # Get Member
-                    m_in = guild.get_member(s["player_in"])
-                    m_out = guild.get_member(s["player_out"])
-
-                    m_in_fmt = m_in.display_name if m_in else f"<@!{s['player_in']}>"
-                    m_out_fmt = m_out.display_name if m_out else f"<@!{s['player_out']}>"
-
-                    log.debug(f"Expiring Sub Contract: {s['player_in']}", guild=guild)
-                    embed = discord.Embed(color=tier_color)
-                    embed.set_image(url=f"attachment://{img_path.name}")
-                    if fa_icon:
-                        dFiles.append(fa_icon)
-                        embed.set_author(
-                            name=f"{m_in_fmt} has finished temporary contract for {s['team']}",
-                            icon_url=f"attachment://{fa_icon.filename}",
-                        )
-                    else:
-                        embed.set_author(name=f"{m_in_fmt} has finished temporary contract for {s['team']}")
+        tiers = {s["tier"] for s in due}
+        colors = {tier: await utils.tier_color_by_name(guild, tier) for tier in tiers}
 
-                    embed.add_field(
-                        name="Player In",
-                        value=m_out_fmt,
-                        inline=True,
-                    )
-                    embed.add_field(
-                        name="Player Out",
-                        value=m_in_fmt,
-                        inline=True,
-                    )
-                    embed.add_field(name="Franchise", value=s["franchise"], inline=True)
-
-                    # Send ping for player/GM then quickly remove it
-                    if tchan and hasattr(tchan, "send"):
-                        pingstr = f"<@!{s['player_in']}> <@!{s['gm']}>"
-                        tmsg = await tchan.send(
-                            content=pingstr,
-                            embed=embed,
-                            files=dFiles,
-                            allowed_mentions=discord.AllowedMentions(users=True),
-                        )
-                        await tmsg.edit(content=None, embed=embed)
+        sem = asyncio.Semaphore(SUB_ROLE_CONCURRENCY)
 
-                    await self._rm_substitute(guild, s)
-                    if subbed_out_role and m_out:
-                        await m_out.remove_roles(subbed_out_role)
-                else:
-                    log.debug(
-                        f"{s['player_in']} is not ready to be expired. Sub Date: {s['date']}",
-                        guild=guild,
-                    )
-        log.info("Finished expire substitute daily loop.")
+        async def release(member: discord.Member):
+            async with sem:
+                try:
+                    await member.remove_roles(subbed_out_role)
+                except discord.HTTPException as exc:
+                    log.warning(f"Unable to remove subbed out role from {member} ({member.id}). {exc}", guild=guild)
+
+        released = []
+        if subbed_out_role:
+            released = [m for s in due if (m := guild.get_member(s["player_out"])) and subbed_out_role in m.roles]
+
+        await asyncio.gather(
+            self._announce_expired_subs(guild, tchan, due, colors),
+            *(release(m) for m in released),
+        )
+        await self._remove_substitutes(guild, due)
+        return due
+
+    async def _announce_expired_subs(
+        self,
+        guild: discord.Guild,
+        tchan: discord.TextChannel | None,
+        subs: list[Substitute],
+        colors: dict[str, discord.Color],
+    ):
+        if not tchan:
+            return
+
+        for idx, s in enumerate(subs):
+            m_in = guild.get_member(s["player_in"])
+            m_out = guild.get_member(s["player_out"])
+            m_in_fmt = m_in.display_name if m_in else f"<@!{s['player_in']}>"
+            m_out_fmt = m_out.display_name if m_out else f"<@!{s['player_out']}>"
+
+            log.debug("Expiring Sub Contract: %s", s["player_in"], guild=guild)
+            files, image_url, icon_url = await self._contract_expired_images(guild, s["tier"])
+            embed = contract_expired_embed(s, m_in_fmt, m_out_fmt, colors[s["tier"]], image_url, icon_url)
+
+            # Send ping for player/GM then quickly remove it
+            try:
+                tmsg = await tchan.send(
+                    content=f"<@!{s['player_in']}> <@!{s['gm']}>",
+                    embed=embed,
+                    files=files,
+                    allowed_mentions=discord.AllowedMentions(users=True),
+                )
+                await tmsg.edit(content=None, embed=embed)
+            except (discord.Forbidden, discord.NotFound) as exc:
+                log.error(f"Unable to post in transaction channel. Skipping remaining announcements. {exc}", guild=guild)
+                return
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to announce expired contract for {s['player_in']}. {exc}", guild=guild)
+
+            if idx < len(subs) - 1:
+                await asyncio.sleep(SUB_SEND_PACING_DELAY)
+
+    async def _contract_expired_images(self, guild: discord.Guild, tier: str) -> tuple[list[discord.File], str, str | None]:
+        """Banner and FA icon URLs for a contract expired embed, and any files that must go out with it."""
+        files: list[discord.File] = []
+        image_url = await self.attach_asset(guild, resource_asset(*CONTRACT_EXPIRED_IMG), files)
+        fa_icon = fa_asset(tier, tiny=True)
+        icon_url = await self.attach_asset(guild, fa_icon, files) if fa_icon else None
+        return files, image_url, icon_url
 
     @expire_sub_contract_loop.before_loop
     async def before_expire_sub_contract_loop(self):
@@ -354,7 +388,8 @@ class TransactionMixIn(RSCMixIn):
             case _:
                 # We only notify for specific statuses
                 log.debug(
-                    f"Not sending transaction notification. Player Status: {player_before_retire.status}",
+                    "Not sending transaction notification. Player Status: %s",
+                    player_before_retire.status,
                     guild=guild,
                 )
                 return
@@ -499,9 +534,9 @@ class TransactionMixIn(RSCMixIn):
         if not guild:
             return
         status = await self._notifications_enabled(guild)
-        log.debug(f"Current Notifications: {status}", guild=guild)
+        log.debug("Current Notifications: %s", status, guild=guild)
         status ^= True  # Flip boolean with xor
-        log.debug(f"Transaction Notifications: {status}", guild=guild)
+        log.debug("Transaction Notifications: %s", status, guild=guild)
         await self._set_notifications(guild, status)
         result = "**enabled**" if status else "**disabled**"
         await interaction.response.send_message(
@@ -620,9 +655,9 @@ class TransactionMixIn(RSCMixIn):
         if not guild:
             return
         status = await self._gm_notifications_enabled(guild)
-        log.debug(f"Current GM Notifications: {status}", guild=guild)
+        log.debug("Current GM Notifications: %s", status, guild=guild)
         status ^= True  # Flip boolean with xor
-        log.debug(f"GM Notifications: {status}", guild=guild)
+        log.debug("GM Notifications: %s", status, guild=guild)
         await self._set_gm_notifications(guild, status)
         result = "**enabled**" if status else "**disabled**"
         await interaction.response.send_message(
@@ -643,9 +678,9 @@ class TransactionMixIn(RSCMixIn):
             return
 
         status = await self._trans_dms_enabled(guild)
-        log.debug(f"Current DM Status: {status}", guild=guild)
+        log.debug("Current DM Status: %s", status, guild=guild)
         status ^= True  # Flip boolean with xor
-        log.debug(f"New Transaction DMs Status: {status}", guild=guild)
+        log.debug("New Transaction DMs Status: %s", status, guild=guild)
         await self._set_trans_dm(guild, status)
 
         result = "**enabled**" if status else "**disabled**"
@@ -767,7 +802,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 override=override,
             )
-            log.debug(f"Cut Result: {result}", guild=guild)
+            log.debug("Cut Result: %s", result, guild=guild)
         except RscException as exc:
             log.warning(f"Transaction Exception: {exc.reason}", guild=guild)
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
@@ -788,7 +823,7 @@ class TransactionMixIn(RSCMixIn):
         try:
             # Check should get devleague role (only add to users one time in their career)
             add_devleague_role = await self.should_get_devleague_role(interaction.user)
-            log.debug(f"Add Dev League Role: {add_devleague_role}")
+            log.debug("Add Dev League Role: %s", add_devleague_role)
             await update_cut_player_discord(guild=guild, player=player, response=result, ptu=ptu, devleague=add_devleague_role)
 
         except discord.Forbidden as exc:
@@ -878,7 +913,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 override=override,
             )
-            log.debug(f"Sign Result: {result}]", guild=guild)
+            log.debug("Sign Result: %s]", result, guild=guild)
             tiers = await self.tiers(guild=guild)
         except RscException as exc:
             log.warning(f"Transaction Exception: {exc.reason}", guild=guild)
@@ -985,7 +1020,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 override=override,
             )
-            log.debug(f"Re-sign Result: {result}]", guild=guild)
+            log.debug("Re-sign Result: %s]", result, guild=guild)
             tiers = await self.tiers(guild=guild)
         except RscException as exc:
             log.warning(f"Transaction Exception: {exc.reason}", guild=guild)
@@ -1073,7 +1108,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 override=override,
             )
-            log.debug(f"Sub Result: {result}", guild=guild)
+            log.debug("Sub Result: %s", result, guild=guild)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
             return
@@ -1228,7 +1263,7 @@ class TransactionMixIn(RSCMixIn):
             await interaction.followup.send(content="No trade information provided... Try again.", ephemeral=True)
             return
 
-        log.debug(f"Trade Announcement: {trade_modal.trade.value}", guild=guild)
+        log.debug("Trade Announcement: %s", trade_modal.trade.value, guild=guild)
         trade_msg = await trans_channel.send(
             content=trade_modal.trade.value,
             allowed_mentions=discord.AllowedMentions(users=True),
@@ -1282,7 +1317,7 @@ class TransactionMixIn(RSCMixIn):
         # Parse trade
         try:
             trade_items = await self.parse_trade_text(guild=guild, data=trade_modal.trade.value)
-            log.debug(pformat(trade_items))
+            log.debug("Trade: %s", Deferred(pformat, trade_items), guild=guild)
         except TradeParserException as exc:
             await interaction.followup.send(
                 embed=ExceptionErrorEmbed(title="Trade Parsing Error", exc_message=exc.message),
@@ -1298,7 +1333,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes or trade_modal.trade.value,
                 override=override,
             )
-            log.debug(f"Transaction History Result: {result}", guild=guild)
+            log.debug("Transaction History Result: %s", result, guild=guild)
             tiers = await self.tiers(guild=guild)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
@@ -1380,11 +1415,11 @@ class TransactionMixIn(RSCMixIn):
         captains: list[discord.Member] = []
 
         # Aggregate captains into list
-        log.debug(f"Locals: {argv}", guild=guild)
+        log.debug("Locals: %s", argv, guild=guild)
         for k, v in argv.items():
             if v and k.startswith("player"):
                 captains.append(v)
-        log.debug(f"Captain Count: {len(captains)}", guild=guild)
+        log.debug("Captain Count: %s", len(captains), guild=guild)
 
         results: list[discord.Member] = []
         for captain in captains:
@@ -1474,7 +1509,7 @@ class TransactionMixIn(RSCMixIn):
                 player=player,
                 executor=interaction.user,
             )
-            log.debug(f"Expire Sub Result: {result}", guild=guild)
+            log.debug("Expire Sub Result: %s", result, guild=guild)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
             return
@@ -1495,25 +1530,18 @@ class TransactionMixIn(RSCMixIn):
             if subbed_out_role and m_out:
                 await m_out.remove_roles(subbed_out_role)
 
-            # Get FA img resource
-            fa_icon = await utils.fa_img_from_tier(stier, tiny=True)
-            img_path = Path(__file__).parent.parent / "resources/transactions/ContractExpired.png"
-
-            dFiles = [discord.File(img_path)]
-            if fa_icon:
-                dFiles.append(fa_icon)
-
             # Tier color
             tier_color = await utils.tier_color_by_name(guild, stier)
 
             # Post to transactions
             tchan = await self._trans_channel(guild)
             if tchan:
+                dFiles, image_url, icon_url = await self._contract_expired_images(guild, stier)
                 embed = discord.Embed(color=tier_color)
-                embed.set_image(url="attachment://ContractExpired.png")
+                embed.set_image(url=image_url)
                 embed.set_author(
                     name=f"{player.display_name} has finished temporary contract for {steam}",
-                    icon_url=f"attachment://{fa_icon.filename}" if fa_icon else None,
+                    icon_url=icon_url,
                 )
                 embed.add_field(name="Player In", value=f"<@!{p_out}>", inline=True)
                 embed.add_field(name="Player Out", value=f"<@!{p_in}>", inline=True)
@@ -1580,7 +1608,7 @@ class TransactionMixIn(RSCMixIn):
         #     )
         #     return
 
-        log.debug(f"Moving AGM to Redshirt: {player.display_name} ({player.id})", guild=guild)
+        log.debug("Moving AGM to Redshirt: %s (%s)", player.display_name, player.id, guild=guild)
         await interaction.response.defer(ephemeral=True)
         try:
             result = await self.inactive_reserve(
@@ -1591,7 +1619,7 @@ class TransactionMixIn(RSCMixIn):
                 override=override,
                 redshirt=True,
             )
-            log.debug(f"Redshirt Result: {result}", guild=guild)
+            log.debug("Redshirt Result: %s", result, guild=guild)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
             return
@@ -1599,7 +1627,7 @@ class TransactionMixIn(RSCMixIn):
         # Remove tier roles since redshirt is not a player.
         tiers = await self.tiers(guild)
         if tiers:
-            log.debug(f"Removing tier roles from AGM Redshirt: {player.id}", guild=guild)
+            log.debug("Removing tier roles from AGM Redshirt: %s", player.id, guild=guild)
             roles_to_remove: list[discord.Role] = []
             for r in player.roles:
                 for tier in tiers:
@@ -1651,7 +1679,7 @@ class TransactionMixIn(RSCMixIn):
         await interaction.response.defer(ephemeral=True)
 
         remove = bool(action.value)
-        log.debug(f"Remove from IR: {remove}", guild=guild)
+        log.debug("Remove from IR: %s", remove, guild=guild)
 
         try:
             result = await self.inactive_reserve(
@@ -1663,7 +1691,7 @@ class TransactionMixIn(RSCMixIn):
                 redshirt=False,
                 remove=remove,
             )
-            log.debug(f"Expire Sub Result: {result}", guild=guild)
+            log.debug("Expire Sub Result: %s", result, guild=guild)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
             return
@@ -1741,7 +1769,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 override=override,
             )
-            log.debug(f"Retire Result: {result}", guild=guild)
+            log.debug("Retire Result: %s", result, guild=guild)
             tiers = await self.tiers(guild=guild)
             # A retiring AGM keeps their staff role and franchise prefix: they
             # stopped playing, not staffing. `/admin agm remove` is what ends it.
@@ -1837,7 +1865,7 @@ class TransactionMixIn(RSCMixIn):
                 trans_type=type,
                 limit=limit,
             )
-            log.debug(f"Transaction History Result: {result}")
+            log.debug("Transaction History Result: %s", result)
         except RscException as exc:
             await interaction.followup.send(embed=ApiExceptionErrorEmbed(exc), ephemeral=True)
             return
@@ -2278,7 +2306,7 @@ class TransactionMixIn(RSCMixIn):
         except ValueError as exc:
             raise MalformedTransactionResponse(f"Unknown transaction response type from API: {response.type}") from exc
 
-        log.debug(f"Building transactions embed for type {action.name}", guild=guild)
+        log.debug("Building transactions embed for type %s", action.name, guild=guild)
 
         # LeaguePlayer Objects
         ptu_in = await self.league_player_from_transaction(response, player_in)
@@ -2296,21 +2324,18 @@ class TransactionMixIn(RSCMixIn):
         franchise = None
         gm_id = None
         icon_url = None
-        img = None
         tier = None
 
         # Image resource
-        img = await utils.transaction_image_from_type(action)
-        embed.set_image(url=f"attachment://{img.filename}")
-        files.append(img)
+        embed.set_image(url=await self.attach_asset(guild, transaction_asset(action), files))
 
         match action:
             case TransactionType.CUT | TransactionType.IR_CUT:
                 if not (ptu_in.old_team and ptu_in.old_team.tier and response.first_franchise):
                     raise MalformedTransactionResponse("Old team, tier, or first_franchise was not returned by API.")
-                author_icon = await utils.fa_img_from_tier(ptu_in.old_team.tier, tiny=True)
-                if author_icon:
-                    files.append(author_icon)
+                fa_icon = fa_asset(ptu_in.old_team.tier, tiny=True)
+                if fa_icon:
+                    author_icon = await self.attach_asset(guild, fa_icon, files)
 
                 tier = ptu_in.old_team.tier
 
@@ -2634,7 +2659,7 @@ class TransactionMixIn(RSCMixIn):
         if not trole:
             return None
 
-        log.debug(f"Announcing to {channel.name}")
+        log.debug("Announcing to %s", channel.name)
         content = kwargs.pop("content", trole.mention)
         return await channel.send(
             content=content,
@@ -2664,61 +2689,55 @@ class TransactionMixIn(RSCMixIn):
         if isinstance(gm, int):
             content = f"<@!{gm}>"
 
-        log.debug(f"Announcing to {channel.name}", guild=guild)
+        log.debug("Announcing to %s", channel.name, guild=guild)
         return await channel.send(
             content=content,
             allowed_mentions=discord.AllowedMentions(users=True, roles=True),
             **kwargs,
         )
 
+    def _trade_gm_franchise(self, guild: discord.Guild, index: FranchiseIndex, gm_str: str, line: str) -> FranchiseIndexEntry:
+        """Resolve the GM named in a trade line to their franchise."""
+        matches = index.match_gm(gm_str, guild=guild)
+        if not matches:
+            raise TradeParserException(message=f"Unable to parse GM name from: `{line}`")
+        if len(matches) > 1:
+            names = ", ".join(f"{m.gm_name} ({m.name})" for m in matches)
+            raise TradeParserException(message=f"GM name `{gm_str}` is ambiguous. Matches: {names}")
+        return matches[0]
+
     async def parse_trade_text(self, guild: discord.Guild, data: str) -> list[TradeObject]:
         if not data:
             raise TradeParserException(message="No trade data provided...")
 
         try:
             league_role = await utils.get_league_role(guild=guild)
-            gm_role = await utils.get_gm_role(guild=guild)
         except ValueError as exc:
             raise TradeParserException(message=str(exc))
 
+        # Every GM and franchise lookup below is served from memory. The index
+        # costs one franchise list request if it is cold and nothing otherwise,
+        # where the old role scan asked the API once per GM in the trade.
+        index = await self.franchise_index(guild)
+
         # Iterate once to get all franchises involved
         log.debug("Finding all franchises in trade.", guild=guild)
         franchises: list[TradeFranchise] = []
         for line in data.splitlines():
             line = line.strip()
-            log.debug(f"Line: {line}", guild=guild)
+            log.debug("Line: %s", line, guild=guild)
 
             if match := GM_TRADE_REGEX.search(line):
                 if not match.group("gm"):
                     raise TradeParserException(message=f"Unable to parse GM name from: `{line}`")
 
                 gm_str = match.group("gm").strip()
-                log.debug(f"GM str: {gm_str}", guild=guild)
-
-                # Find name in GM role members
-                log.debug("Finding GM in role.")
-                gm: discord.Member | None = None
-                for m in gm_role.members:
-                    tmp = await utils.remove_prefix(m)
-                    if tmp.lower().startswith(gm_str.lower()):
-                        gm = m
-                        break
+                entry = self._trade_gm_franchise(guild, index, gm_str, line)
+                if not entry.gm_id:
+                    raise TradeParserException(message=f"Franchise has no GM: `{entry.name}`")
 
-                if not gm:
-                    raise TradeParserException(message=f"Unable to parse GM name from: `{line}`")
-                log.debug(f"Trade GM: {gm.display_name}", guild=guild)
-
-                # Get franchise from API
-                fdata = await self.franchises(guild=guild, gm_discord_id=gm.id)
-                if not fdata or len(fdata) > 1:
-                    raise TradeParserException(message=f"Error finding franchise for GM: `{gm.display_name} ({gm.id})`")
-
-                log.debug("Getting fname and fid")
-                fname = fdata[0].name
-                fid = fdata[0].id
-                log.debug(f"Franchise ID: {fid} Name: {fname} GM: {gm.id}", guild=guild)
-                f_object = TradeFranchise(gm=gm.id, name=fname, id=fid)
-                franchises.append(f_object)
+                log.debug("Franchise ID: %s Name: %s GM: %s", entry.id, entry.name, entry.gm_id, guild=guild)
+                franchises.append(TradeFranchise(gm=entry.gm_id, name=entry.name, id=entry.id))
 
         # Initial validation on franchises
         if len(franchises) < 2:
@@ -2729,7 +2748,7 @@ class TransactionMixIn(RSCMixIn):
         log.debug("Parsing trades...", guild=guild)
         for line in data.splitlines():
             line = line.strip()
-            log.debug(f"Line: {line}")
+            log.debug("Line: %s", line)
 
             # Skip line breaks
             if len(line) == 0:
@@ -2747,27 +2766,12 @@ class TransactionMixIn(RSCMixIn):
                     raise TradeParserException(message=f"Unable to parse GM name from: `{line}`")
 
                 gm_str = match.group("gm").strip()
-                log.debug(f"GM str: {gm_str}", guild=guild)
-
-                # Find name in GM role members
-                gm = None
-                for m in gm_role.members:
-                    tmp = await utils.remove_prefix(m)
-                    log.debug(f"GM tmp: {tmp}", guild=guild)
-                    if tmp.lower().startswith(gm_str.lower()):
-                        gm = m
-                        break
-
-                if not gm:
-                    raise TradeParserException(message=f"Unable to parse GM name from: `{line}`")
-                log.debug(f"Trade GM: {gm.display_name}", guild=guild)
+                entry = self._trade_gm_franchise(guild, index, gm_str, line)
+                dest_franchise = next((x for x in franchises if x.id == entry.id), None)
 
-                # Get franchise from API
-                dest_franchise = next((x for x in franchises if x.gm == gm.id), None)
-
-                log.debug(f"Destination Franchise: {dest_franchise}")
+                log.debug("Destination Franchise: %s", dest_franchise, guild=guild)
                 if not dest_franchise:
-                    raise TradeParserException(message=f"Error finding franchise for GM: `{gm.display_name} ({gm.id})`")
+                    raise TradeParserException(message=f"Error finding franchise for GM: `{entry.gm_name} ({entry.gm_id})`")
                 continue
 
             # Player trade
@@ -2780,12 +2784,12 @@ class TransactionMixIn(RSCMixIn):
                     raise TradeParserException(message=f"Unable to parse player trade from: `{line}`")
 
                 m_str = match.group("player").strip()
-                log.debug(f"Player str: {m_str}", guild=guild)
+                log.debug("Player str: %s", m_str, guild=guild)
                 player = discord.utils.get(league_role.members, display_name=m_str)
 
                 if not player:
                     raise TradeParserException(message=f"Unable to parse player from: `{m_str}`")
-                log.debug(f"Trade Player: {player.display_name}", guild=guild)
+                log.debug("Trade Player: %s", player.display_name, guild=guild)
 
                 # Get source franchise
                 plist = await self.players(guild=guild, discord_id=player.id)
@@ -2803,7 +2807,7 @@ class TransactionMixIn(RSCMixIn):
 
                 sf_id = pdata.team.franchise.id
                 sf_name = pdata.team.franchise.name
-                log.debug(f"Source. ID={sf_id} NAME={sf_name}", guild=guild)
+                log.debug("Source. ID=%s NAME=%s", sf_id, sf_name, guild=guild)
                 sfranchise = TradeFranchise(id=sf_id, name=sf_name, gm=None)
 
                 # Get destination team name (find by current tier)
@@ -2823,11 +2827,15 @@ class TransactionMixIn(RSCMixIn):
 
                     dest_team = team_list[0].name
 
-                log.debug(f"Destination Team Name: {dest_team}", guild=guild)
+                log.debug("Destination Team Name: %s", dest_team, guild=guild)
 
                 tvalue = TradeItem(player=TradePlayer(id=player.id, team=dest_team))
                 log.debug(
-                    f"Player Trade. Src Franchise: {sfranchise.name} Dest Franchise: {dest_franchise.name} Player: {player.id}", guild=guild
+                    "Player Trade. Src Franchise: %s Dest Franchise: %s Player: %s",
+                    sfranchise.name,
+                    dest_franchise.name,
+                    player.id,
+                    guild=guild,
                 )
 
                 item = TradeObject(source=sfranchise, destination=dest_franchise, value=tvalue)
@@ -2842,28 +2850,26 @@ class TransactionMixIn(RSCMixIn):
                 tier = match.group("tier")
                 round = int(match.group("round"))
 
-                # Find name in GM role members
-                source_gm = None
-                for m in gm_role.members:
-                    tmp = await utils.remove_prefix(m)
-                    if tmp.lower().startswith(gm_str.lower()):
-                        source_gm = m
-                        break
-
-                if not source_gm:
-                    raise TradeParserException(message=f"Error finding discord member for future source GM: `{gm_str}`")
+                source = self._trade_gm_franchise(guild, index, gm_str, line)
+                if not source.gm_id:
+                    raise TradeParserException(message=f"Error finding future source GM: `{gm_str}`")
 
-                sfranchise = TradeFranchise(id=None, name=None, gm=source_gm.id)
+                sfranchise = TradeFranchise(id=None, name=None, gm=source.gm_id)
 
                 tvalue = TradeItem(pick=DraftPickTrade(tier=tier.capitalize(), round=round, number=0, future=True))
                 log.debug(
-                    f"Future Trade. Src Franchise: {sfranchise.name} Dest Franchise: {dest_franchise.name}",
+                    "Future Trade. Src Franchise: %s Dest Franchise: %s",
+                    sfranchise.name,
+                    dest_franchise.name,
                     guild=guild,
                 )
                 if tvalue.pick:
                     log.debug(
-                        f"Trade Value: Tier={tvalue.pick.tier} Round={tvalue.pick.round} "
-                        f"Number={tvalue.pick.number} Future={tvalue.pick.future}",
+                        "Trade Value: Tier=%s Round=%s Number=%s Future=%s",
+                        tvalue.pick.tier,
+                        tvalue.pick.round,
+                        tvalue.pick.number,
+                        tvalue.pick.future,
                         guild=guild,
                     )
                 else:
@@ -2884,21 +2890,14 @@ class TransactionMixIn(RSCMixIn):
 
                 # Check if GM was provided (3+ way trade)
                 gm_str = None
-                source_gm = None
+                source_gm: int | None = None
                 sfranchise = None
                 if match.group("gm"):
                     gm_str = match.group("gm").strip()
-
-                    # Find name in GM role members
-                    source_gm = None
-                    for m in gm_role.members:
-                        tmp = await utils.remove_prefix(m)
-                        if tmp.lower().startswith(gm_str.lower()):
-                            source_gm = m
-                            break
+                    source_gm = self._trade_gm_franchise(guild, index, gm_str, line).gm_id
 
                     if not source_gm:
-                        raise TradeParserException(message=f"Error finding discord member for future source GM: `{gm_str}`")
+                        raise TradeParserException(message=f"Error finding pick source GM: `{gm_str}`")
                 else:
                     # 2 way trade. Validate against franchise list
                     if len(franchises) > 2:
@@ -2908,15 +2907,17 @@ class TransactionMixIn(RSCMixIn):
 
                     # Grab franchise that isn't the destination franchise
                     for f in franchises:
-                        if f.gm != dest_franchise.gm:
+                        if f.id != dest_franchise.id:
                             sfranchise = f
 
                 log.debug(
-                    f"Pick Trade. Source GM: {source_gm} Source Franchise: {sfranchise}",
+                    "Pick Trade. Source GM: %s Source Franchise: %s",
+                    source_gm,
+                    sfranchise,
                     guild=guild,
                 )
                 if not sfranchise and source_gm:
-                    sfranchise = TradeFranchise(id=None, name=None, gm=source_gm.id)
+                    sfranchise = TradeFranchise(id=None, name=None, gm=source_gm)
 
                 tvalue = TradeItem(pick=DraftPickTrade(tier=tier.capitalize(), round=round, number=pick, future=False))
 
@@ -2925,13 +2926,18 @@ class TransactionMixIn(RSCMixIn):
                 item = TradeObject(source=sfranchise, destination=dest_franchise, value=tvalue)
 
                 log.debug(
-                    f"Future Trade. Src Franchise: {sfranchise.name} Dest Franchise: {dest_franchise.name}",
+                    "Future Trade. Src Franchise: %s Dest Franchise: %s",
+                    sfranchise.name,
+                    dest_franchise.name,
                     guild=guild,
                 )
                 if tvalue.pick:
                     log.debug(
-                        f"Trade Value: Tier={tvalue.pick.tier} Round={tvalue.pick.round} "
-                        f"Number={tvalue.pick.number} Future={tvalue.pick.future}",
+                        "Trade Value: Tier=%s Round=%s Number=%s Future=%s",
+                        tvalue.pick.tier,
+                        tvalue.pick.round,
+                        tvalue.pick.number,
+                        tvalue.pick.future,
                         guild=guild,
                     )
                 else:
@@ -2965,7 +2971,7 @@ class TransactionMixIn(RSCMixIn):
                         if m:
                             gm_name = await utils.remove_prefix(m)
                             gm_name = await utils.strip_discord_accolades(gm_name)
-                            log.debug(f"Embed GM Name: {gm_name}", guild=guild)
+                            log.debug("Embed GM Name: %s", gm_name, guild=guild)
                             dest = f"{trade.destination.name} ({gm_name.strip()})"
                         else:
                             dest = trade.destination.name
@@ -3025,7 +3031,7 @@ class TransactionMixIn(RSCMixIn):
     async def get_franchise_transaction_channel(self, guild: discord.Guild, franchise_name: str) -> discord.TextChannel | None:
         """Find franchise transaction channel"""
         tchannel_name = await self.get_franchise_transaction_channel_name(franchise_name)
-        log.debug(f"Searching for transaction channel: {tchannel_name}", guild=guild)
+        log.debug("Searching for transaction channel: %s", tchannel_name, guild=guild)
 
         tchannel = discord.utils.get(guild.channels, name=tchannel_name)
         if not tchannel:
@@ -3063,11 +3069,13 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 admin_override=override,
             )
-            log.debug(f"Sign Parameters: {data}", guild=guild)
+            log.debug("Sign Parameters: %s", data, guild=guild)
             try:
-                return await api.transactions_sign_create(data)
+                result = await api.transactions_sign_create(data)
             except ApiException as exc:
                 raise await translate_api_error(exc)
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     async def cut(
         self,
@@ -3087,11 +3095,13 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 admin_override=override,
             )
-            log.debug(f"Cut Parameters: {data}", guild=guild)
+            log.debug("Cut Parameters: %s", data, guild=guild)
             try:
-                return await api.transactions_cut_create(data)
+                result = await api.transactions_cut_create(data)
             except ApiException as exc:
                 raise await translate_api_error(exc)
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     async def resign(
         self,
@@ -3113,11 +3123,13 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 admin_override=override,
             )
-            log.debug(f"Resign Parameters: {data}", guild=guild)
+            log.debug("Resign Parameters: %s", data, guild=guild)
             try:
-                return await api.transactions_resign_create(data)
+                result = await api.transactions_resign_create(data)
             except ApiException as exc:
                 raise await translate_api_error(exc)
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     async def set_captain(self, guild: discord.Guild, id: int) -> LeaguePlayer:
         """Set a player as captain using their discord ID"""
@@ -3145,7 +3157,7 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 admin_override=override,
             )
-            log.debug(f"Sub Data: {data}", guild=guild)
+            log.debug("Sub Data: %s", data, guild=guild)
             try:
                 return await api.transactions_substitution_create(data)
             except ApiException as exc:
@@ -3161,7 +3173,7 @@ class TransactionMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TransactionsApi(client)
             data = PlayerInput(league=self._league[guild.id], player=player.id, executor=executor.id)
-            log.debug(f"Expire Sub Data: {data}", guild=guild)
+            log.debug("Expire Sub Data: %s", data, guild=guild)
             try:
                 return await api.transactions_expire_create(data)
             except ApiException as exc:
@@ -3185,11 +3197,14 @@ class TransactionMixIn(RSCMixIn):
                 notes=notes,
                 admin_override=override,
             )
-            log.debug(f"Retire Data: {data}", guild=guild)
+            log.debug("Retire Data: %s", data, guild=guild)
             try:
-                return await api.transactions_retire_create(data)
+                result = await api.transactions_retire_create(data)
             except ApiException as exc:
                 raise RscException(response=exc)
+            # The player's status changed, so the last membership audit no longer holds
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     async def inactive_reserve(
         self,
@@ -3213,11 +3228,13 @@ class TransactionMixIn(RSCMixIn):
                 redshirt=redshirt,
                 remove_from_ir=remove,
             )
-            log.debug(f"IR Data: {data}", guild=guild)
+            log.debug("IR Data: %s", data, guild=guild)
             try:
-                return await api.transactions_inactive_reserve_create(data)
+                result = await api.transactions_inactive_reserve_create(data)
             except ApiException as exc:
                 raise RscException(response=exc)
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     async def transaction_history(
         self,
@@ -3236,7 +3253,11 @@ class TransactionMixIn(RSCMixIn):
             executor_id = executor.id if executor else None
             t_type = str(trans_type) if trans_type else None
             log.debug(
-                f"Transaction History Query. Player: {player_id} Executor: {executor_id} Season: {season} Type: {trans_type}",
+                "Transaction History Query. Player: %s Executor: %s Season: %s Type: %s",
+                player_id,
+                executor_id,
+                season,
+                trans_type,
                 guild=guild,
             )
             try:
@@ -3268,7 +3289,11 @@ class TransactionMixIn(RSCMixIn):
         executor_id = executor.id if executor else None
         t_type = str(trans_type) if trans_type else None
         log.debug(
-            f"Paged Transaction History Query. Player: {player_id} Executor: {executor_id} Season: {season} Type: {trans_type}",
+            "Paged Transaction History Query. Player: %s Executor: %s Season: %s Type: %s",
+            player_id,
+            executor_id,
+            season,
+            trans_type,
             guild=guild,
         )
 
@@ -3276,7 +3301,7 @@ class TransactionMixIn(RSCMixIn):
         async with self.api_client(guild) as client:
             api = TransactionsApi(client)
             while True:
-                log.debug(f"Offset: {offset}")
+                log.debug("Offset: %s", offset)
                 try:
                     league_id = self._league[guild.id]
                     trans_list = await api.transactions_history_list(
@@ -3332,7 +3357,7 @@ class TransactionMixIn(RSCMixIn):
                     notes=notes or "",
                     admin_override=override,
                 )
-                log.debug(f"Schema: {pformat(schema)}", guild=guild)
+                log.debug("Schema: %s", Deferred(pformat, schema), guild=guild)
                 return await api.transactions_trade_create(schema)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -3350,7 +3375,7 @@ class TransactionMixIn(RSCMixIn):
                     league=self._league[guild.id],
                     franchise_name=franchise_name,
                 )
-                log.debug(f"Futures validation schema: {schema}", guild=guild)
+                log.debug("Futures validation schema: %s", schema, guild=guild)
                 return await api.transactions_trade_validate_futures_create(schema)
             except ApiException as exc:
                 raise RscException(response=exc)
@@ -3378,10 +3403,12 @@ class TransactionMixIn(RSCMixIn):
                     number=pick,
                     admin_override=override,
                 )
-                log.debug(f"Draft Schema: {pformat(draft_pick)}", guild=guild)
-                return await api.transactions_draft_create(draft_pick)
+                log.debug("Draft Schema: %s", Deferred(pformat, draft_pick), guild=guild)
+                result = await api.transactions_draft_create(draft_pick)
             except ApiException as exc:
                 raise RscException(response=exc)
+            self.membership_audit().invalidate(guild.id)
+            return result
 
     # Config
 
@@ -3457,6 +3484,9 @@ class TransactionMixIn(RSCMixIn):
 
     async def _set_substitutes(self, guild: discord.Guild, subs: list[Substitute]):
         await self.config.custom("Transactions", str(guild.id)).Substitutes.set(subs)
+        index = self._sub_indexes().get(guild.id)
+        if index is not None:
+            self._sub_indexes()[guild.id] = SubstituteIndex(subs, index.tz)
 
     async def _add_substitute(self, guild: discord.Guild, sub: Substitute):
         s = await self.config.custom("Transactions", str(guild.id)).Substitutes()
@@ -3464,9 +3494,27 @@ class TransactionMixIn(RSCMixIn):
         await self._set_substitutes(guild, s)
 
     async def _rm_substitute(self, guild: discord.Guild, sub: Substitute):
+        await self._remove_substitutes(guild, [sub])
+
+    async def _remove_substitutes(self, guild: discord.Guild, subs: list[Substitute]):
+        """Remove `subs` from the saved list in one write. Unknown entries are ignored."""
         s = await self.config.custom("Transactions", str(guild.id)).Substitutes()
-        try:
-            s.remove(sub)
-        except ValueError:
+        remaining = [x for x in s if x not in subs]
+        if len(remaining) == len(s):
             return
-        await self._set_substitutes(guild, s)
+        await self._set_substitutes(guild, remaining)
+
+    def _sub_indexes(self) -> dict[int, SubstituteIndex]:
+        # Lazily initialized: a mixin used standalone has not run __init__.
+        indexes = getattr(self, "_sub_index", None)
+        if indexes is None:
+            indexes = self._sub_index = {}
+        return indexes
+
+    async def _substitute_index(self, guild: discord.Guild) -> SubstituteIndex:
+        """The guild's substitutes by signing date. Built from config once, then kept in step with writes."""
+        tz = await self.timezone(guild)
+        index = self._sub_indexes().get(guild.id)
+        if index is None or index.tz != tz:
+            index = self._sub_indexes()[guild.id] = SubstituteIndex(await self._get_substitutes(guild), tz)
+        return index
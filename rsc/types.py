@@ -127,6 +127,8 @@ class AdminSettings(TypedDict):
     IntentDmLastSeason: int | None
     IntentDmLastRun: int | None  # unix timestamp, rendered with discord <t:> markup
     IntentDmLastExecutor: int | None
+    # Match key -> `rsc.admin.match_import.LedgerEntry.to_config()`
+    MatchImports: dict[str, dict]
     PermFAChannel: int | None
     PermFAMsgIds: list[int] | None
     RetireAuditEnabled: bool
@@ -136,6 +138,8 @@ class CombineSettings(TypedDict):
     Active: bool
     CombinesApi: str | None
     CombinesCategory: discord.CategoryChannel | None
+    # Lobby id -> `rsc.combines.lobbies.LobbyRecord.to_config()`
+    Lobbies: dict[str, dict]
 
 
 class LLMSettings(TypedDict):
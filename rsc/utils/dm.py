@@ -205,7 +205,7 @@ class DMHelper:
         if send_at and send_at > datetime.now(UTC):
             async with self._scheduled_lock:
                 self._scheduled.append(task)
-            logger.debug(f"Scheduled DM to {member} ({member.id}) at {send_at.isoformat()}")
+            logger.debug("Scheduled DM to %s (%s) at %s", member, member.id, send_at.isoformat())
         else:
             await self._queue.put(task)
 
@@ -226,7 +226,7 @@ class DMHelper:
             await self._send(item)
             # Rate limit after each message
             await asyncio.sleep(self._jittered_rate())
-        logger.debug(f"DM consumer finished. Sent: {self._success}, Failed: {self._failed}")
+        logger.debug("DM consumer finished. Sent: %s, Failed: %s", self._success, self._failed)
 
     async def _schedule_loop(self) -> None:
         """Periodically move scheduled tasks that are due into the send queue."""
@@ -244,7 +244,7 @@ class DMHelper:
                 self._scheduled = remaining
 
             for task in ready:
-                logger.debug(f"Releasing scheduled DM to {task.member} ({task.member.id})")
+                logger.debug("Releasing scheduled DM to %s (%s)", task.member, task.member.id)
                 await self._queue.put(task)
 
             await asyncio.sleep(SCHEDULE_POLL_INTERVAL)
@@ -275,11 +275,11 @@ class DMHelper:
                 await asyncio.sleep(backoff)
             except discord.Forbidden:
                 self._record_failure(task.member)
-                logger.debug(f"Cannot DM {task.member} ({task.member.id}): DMs disabled")
+                logger.debug("Cannot DM %s (%s): DMs disabled", task.member, task.member.id)
                 return
             except discord.HTTPException as exc:
                 self._record_failure(task.member)
-                logger.debug(f"Failed to DM {task.member} ({task.member.id}): {exc}")
+                logger.debug("Failed to DM %s (%s): %s", task.member, task.member.id, exc)
                 return
 
         # Exhausted all retries
@@ -303,7 +303,7 @@ class DMHelper:
             return True
 
         self._skipped += 1
-        logger.debug(f"Skipping DM to {task.member} ({task.member.id}): no longer required")
+        logger.debug("Skipping DM to %s (%s): no longer required", task.member, task.member.id)
         return False
 
     def _record_failure(self, member: discord.Member | discord.User) -> None:
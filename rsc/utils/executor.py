@@ -0,0 +1,62 @@
+"""A dedicated thread pool for blocking CPU work such as PIL and replay parsing.
+
+A coroutine that decodes or resizes an image on the event loop freezes gateway
+heartbeats and every other command until it returns. `asyncio.to_thread` moves
+the work off the loop, but onto the default executor, which it shares with
+DNS lookups and file reads, and it queues without limit.
+
+`offload()` runs the work on a small pool of its own. At most
+`CPU_QUEUE_LIMIT` jobs are handed to the pool at once. Further callers wait on
+the loop holding only their input bytes, so a burst of logo uploads cannot
+fill memory with decoded images.
+"""
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+CPU_WORKERS = min(4, os.cpu_count() or 1)
+CPU_QUEUE_LIMIT = CPU_WORKERS * 4
+
+
+class _CpuPool:
+    def __init__(self) -> None:
+        self.executor: ThreadPoolExecutor | None = None
+        # asyncio primitives belong to one loop, so the limit is rebuilt if a
+        # new loop (a test, a restarted bot) asks for it.
+        self.limit: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+_state = _CpuPool()
+
+
+def cpu_executor() -> ThreadPoolExecutor:
+    if _state.executor is None:
+        _state.executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="rsc-cpu")
+    return _state.executor
+
+
+def _slots(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    if _state.limit is None or _state.limit[0] is not loop:
+        _state.limit = (loop, asyncio.Semaphore(CPU_QUEUE_LIMIT))
+    return _state.limit[1]
+
+
+async def offload(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run `func(*args, **kwargs)` on the CPU pool and return its result."""
+    loop = asyncio.get_running_loop()
+    async with _slots(loop):
+        return await loop.run_in_executor(cpu_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_cpu_executor() -> None:
+    """Stop the pool's threads. A later `offload()` starts a fresh pool."""
+    if _state.executor is not None:
+        _state.executor.shutdown(wait=False, cancel_futures=True)
+    _state.executor = None
+    _state.limit = None
@@ -5,6 +5,8 @@ from pathlib import Path
 import discord
 from PIL import Image, ImageDraw, ImageFont
 
+from rsc.utils.executor import offload
+
 log = logging.getLogger("red.rsc.utils.images")
 
 ROOT_PATH = Path(__file__).parent.parent
@@ -54,7 +56,7 @@ def drawProgressBar(  # noqa: N802
     return d
 
 
-def getProgressBar(  # noqa: N802
+async def progress_bar(
     x: int,
     y: int,
     w: int,
@@ -64,6 +66,31 @@ def getProgressBar(  # noqa: N802
     bg: tuple[int, int, int] = (17, 17, 17),
     fg: tuple[int, int, int] = (0, 102, 153),
 ) -> discord.File:
+    """Progress bar image, rendered on the CPU pool rather than the event loop."""
+    data = await offload(
+        render_progress_bar,
+        x=x,
+        y=y,
+        w=w,
+        h=h,
+        progress=progress,
+        progress_bounds=progress_bounds,
+        bg=bg,
+        fg=fg,
+    )
+    return discord.File(filename="progress.jpeg", fp=io.BytesIO(data))
+
+
+def render_progress_bar(
+    x: int,
+    y: int,
+    w: int,
+    h: int,
+    progress: float = 0.0,
+    progress_bounds: tuple[int, int] | None = None,
+    bg: tuple[int, int, int] = (17, 17, 17),
+    fg: tuple[int, int, int] = (0, 102, 153),
+) -> bytes:
     progress_bar = Image.new("RGBA", (275, 50), (255, 255, 255))
     progress_bar.putalpha(1)
     base_image = ImageDraw.Draw(progress_bar)
@@ -82,8 +109,4 @@ def getProgressBar(  # noqa: N802
 
     with io.BytesIO() as buf:
         progress_bar.save(buf, format="PNG")
-        # byte_arr = buf.getvalue()
-        buf.seek(0)
-        dFile = discord.File(filename="progress.jpeg", fp=buf)
-
-    return dFile
+        return buf.getvalue()
@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+import discord
+
+from rsc import const
+from rsc.embeds import ErrorEmbed
+from rsc.logs import GuildLogAdapter
+from rsc.types import Accolades
+
+logger = logging.getLogger("red.rsc.utils.nicknames")
+log = GuildLogAdapter(logger)
+
+# Nickname edits in flight at once. Every member edit in a guild shares one
+# route bucket, so like role syncs this bounds what is parked on it.
+NICKNAME_CONCURRENCY = 4
+
+FORBIDDEN_REASON = "Missing permission to change nickname (role hierarchy or server owner)"
+OWNER_REASON = "Server owner's nickname cannot be changed by a bot"
+
+# Display names remembered by `NICKNAMES`. Comfortably more than the members a
+# role sync or rebrand walks, so a bulk pass never evicts its own entries.
+NICKNAME_CACHE_SIZE = 16_384
+PREFIX_SEPARATOR = " | "
+# Every accolade emoji is a single code point, so one class matches them all.
+ACCOLADE_PATTERN = re.compile(
+    f"[{const.TROPHY_EMOJI}{const.STAR_EMOJI}{const.DEV_LEAGUE_EMOJI}{const.COOKIE_EMOJI}{const.COMBINE_CUP_EMOJI}]"
+)
+
+
+@dataclass(slots=True)
+class ParsedNickname:
+    """A display name split into the parts the bot writes as `"{prefix} | {name} {accolades}"`.
+
+    Shared by everyone who parses the same name, so treat it as read only. Not
+    frozen only because a frozen dataclass is several times slower to build.
+    """
+
+    # First segment before " | ", or None without one. Not checked against
+    # the franchise prefixes, same as `remove_prefix`.
+    prefix: str | None
+    # Everything after the prefix, accolades included.
+    unprefixed: str
+    # `unprefixed` without accolade emoji.
+    name: str
+    # The whole display name without accolade emoji.
+    bare: str
+    trophy: int = 0
+    star: int = 0
+    devleague: int = 0
+    combine_cup: int = 0
+    # The accolades as `Accolades.__str__` renders them, cookies folded in.
+    badges: str = ""
+
+    @property
+    def accolades(self) -> Accolades:
+        # A new instance every time. Callers add to it.
+        return Accolades(trophy=self.trophy, star=self.star, devleague=self.devleague, combine_cup=self.combine_cup)
+
+
+class NicknameCodec:
+    """Parses display names once and renders nicknames back in one step.
+
+    Parsed names are memoized in an LRU keyed by display name, so a bulk pass
+    that asks for a member's prefix, name and accolades in turn reads the name
+    once. Synchronous and safe to call from anywhere on the event loop.
+    """
+
+    def __init__(self, maxsize: int = NICKNAME_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, ParsedNickname] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def parse(self, display_name: str) -> ParsedNickname:
+        parsed = self._cache.get(display_name)
+        if parsed is not None:
+            self.hits += 1
+            self._cache.move_to_end(display_name)
+            return parsed
+
+        self.misses += 1
+        parsed = self._cache[display_name] = _parse(display_name)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def render(name: str, accolades: Accolades | str = "", prefix: str | None = None) -> str:
+        if prefix:
+            return f"{prefix}{PREFIX_SEPARATOR}{name} {accolades}".strip()
+        return f"{name} {accolades}".strip()
+
+    def reprefix(self, display_name: str, prefix: str | None) -> str:
+        """`display_name` under a new franchise prefix, accolades kept."""
+        parsed = self.parse(display_name)
+        return self.render(parsed.name, parsed.badges, prefix)
+
+
+def _parse(display_name: str) -> ParsedNickname:
+    head, separator, tail = display_name.partition(PREFIX_SEPARATOR)
+    prefix = head.strip() if separator else None
+    unprefixed = tail.strip() if separator else display_name.strip()
+
+    found = ACCOLADE_PATTERN.findall(display_name)
+    if not found:
+        return ParsedNickname(prefix=prefix, unprefixed=unprefixed, name=unprefixed, bare=display_name.strip())
+
+    parsed = ParsedNickname(
+        prefix=prefix,
+        unprefixed=unprefixed,
+        name=ACCOLADE_PATTERN.sub("", unprefixed).strip(),
+        bare=ACCOLADE_PATTERN.sub("", display_name).strip(),
+        trophy=found.count(const.TROPHY_EMOJI),
+        star=found.count(const.STAR_EMOJI),
+        devleague=found.count(const.DEV_LEAGUE_EMOJI) + found.count(const.COOKIE_EMOJI) * 4,
+        combine_cup=found.count(const.COMBINE_CUP_EMOJI),
+    )
+    parsed.badges = str(parsed.accolades)
+    return parsed
+
+
+NICKNAMES = NicknameCodec()
+
+
+@dataclass
+class NicknameRewrite:
+    """Target nicknames for a batch of members and the outcome of applying them.
+
+    Built by `plan_nicknames` and filled in by `apply_nicknames`. Applying the
+    same plan again resumes it: members already renamed are skipped and the
+    edits that failed are retried.
+    """
+
+    targets: dict[discord.Member, str] = field(default_factory=dict)
+    # Members the rewrite could not produce a nickname for, and why.
+    invalid: dict[discord.Member, str] = field(default_factory=dict)
+    # Members whose nickname already matched the target at planning time.
+    unchanged: int = 0
+    renamed: list[discord.Member] = field(default_factory=list)
+    failed: dict[discord.Member, str] = field(default_factory=dict)
+    # Already renamed by the time a worker reached them.
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.targets)
+
+    @property
+    def done(self) -> int:
+        return len(self.renamed) + len(self.failed) + self.skipped
+
+    def pending(self) -> dict[discord.Member, str]:
+        """Targets not applied yet, including the ones that failed."""
+        renamed = set(self.renamed)
+        return {m: nick for m, nick in self.targets.items() if m not in renamed}
+
+    def errors(self) -> list[str]:
+        """One line per member that was not renamed, for a final report."""
+        lines = [f"{m.mention}: {reason}" for m, reason in self.invalid.items()]
+        lines.extend(f"{m.mention}: {reason}" for m, reason in self.failed.items())
+        return lines
+
+    def describe(self) -> str:
+        desc = f"Updating nicknames: **{self.done}/{self.total}**\nRenamed: {len(self.renamed)}"
+        if self.failed:
+            desc += f"\nFailed: {len(self.failed)}"
+        return desc
+
+
+ProgressCallback = Callable[[NicknameRewrite], Awaitable[None]]
+
+
+async def plan_nicknames(
+    members: Iterable[discord.Member],
+    rewrite: Callable[[discord.Member], Awaitable[str]],
+) -> NicknameRewrite:
+    """Work out every member's new nickname before any edit is made.
+
+    A `ValueError` from `rewrite` marks that member invalid rather than
+    stopping the plan. Members already carrying their target are left out.
+    """
+    plan = NicknameRewrite()
+    for member in members:
+        try:
+            nick = await rewrite(member)
+        except ValueError as exc:
+            plan.invalid[member] = str(exc)
+            continue
+        if nick == member.display_name:
+            plan.unchanged += 1
+            continue
+        plan.targets[member] = nick
+    return plan
+
+
+async def apply_nicknames(
+    guild: discord.Guild,
+    plan: NicknameRewrite,
+    *,
+    reason: str | None = None,
+    progress: ProgressCallback | None = None,
+    every: int = 10,
+    concurrency: int = NICKNAME_CONCURRENCY,
+) -> NicknameRewrite:
+    """Apply a plan through `concurrency` workers, reporting every `every` edits.
+
+    A failed edit is recorded against its member in `plan.failed` rather than
+    raised, so one member the bot cannot rename does not strand the rest with
+    half the batch updated.
+    """
+    queue: asyncio.Queue[tuple[discord.Member, str]] = asyncio.Queue()
+    for member, nick in plan.pending().items():
+        queue.put_nowait((member, nick))
+    plan.failed.clear()
+    plan.skipped = 0
+    log.debug("Rewriting %d nickname(s), %d already done", queue.qsize(), plan.done, guild=guild)
+
+    async def worker():
+        while not queue.empty():
+            member, nick = queue.get_nowait()
+            # A rerun, or someone else, may have renamed them already.
+            if member.display_name == nick:
+                plan.skipped += 1
+            elif member.id == guild.owner_id:
+                plan.failed[member] = OWNER_REASON
+            else:
+                try:
+                    await member.edit(nick=nick, reason=reason)
+                    plan.renamed.append(member)
+                except discord.Forbidden:
+                    plan.failed[member] = FORBIDDEN_REASON
+                except discord.HTTPException as exc:
+                    log.warning(f"Error updating nickname for {member.id}: {exc}", guild=guild)
+                    plan.failed[member] = f"Discord API error ({exc.text or exc.status})"
+
+            if progress and every and plan.done % every == 0 and plan.done != plan.total:
+                await _report(progress, plan, guild)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, queue.qsize()))))
+    log.debug(
+        "Rewrote nicknames in %.1fs: %d renamed, %d failed, %d skipped",
+        time.perf_counter() - started,
+        len(plan.renamed),
+        len(plan.failed),
+        plan.skipped,
+        guild=guild,
+    )
+    return plan
+
+
+def errors_embed(plan: NicknameRewrite, title: str) -> ErrorEmbed:
+    """Final report of the members a rewrite could not rename."""
+    errors = plan.errors()
+    error_text = "\n".join(errors)
+    embed = ErrorEmbed(
+        title=title,
+        description=f"Renamed **{len(plan.renamed)}/{plan.total + len(plan.invalid)}** member(s). The rest must be updated manually.",
+    )
+    if embed.add_long_field(name=f"Errors ({len(errors)})", value=error_text):
+        log.warning(f"Nickname rewrite finished with {len(errors)} error(s):\n{error_text}")
+        embed.set_footer(text="Some errors were too long to display. See the bot logs for the full list.")
+    return embed
+
+
+async def _report(progress: ProgressCallback, plan: NicknameRewrite, guild: discord.Guild):
+    # Progress is cosmetic. An expired interaction must not stop the rewrite.
+    try:
+        await progress(plan)
+    except discord.HTTPException as exc:
+        log.debug("Unable to report nickname progress: %s", exc, guild=guild)
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+import discord
+
+from rsc.embeds import YellowEmbed
+from rsc.logs import GuildLogAdapter
+
+logger = logging.getLogger("red.rsc.utils.roles")
+log = GuildLogAdapter(logger)
+
+# Role edits in flight at once. Adds and removes are separate member routes but
+# share the guild's member role bucket. discord.py parks requests on a bucket
+# that is exhausted, so this bounds how many are parked rather than the rate.
+ROLE_SYNC_CONCURRENCY = 4
+# Minimum seconds between progress updates. Each one is an interaction edit.
+ROLE_SYNC_PROGRESS_INTERVAL = 3.0
+
+
+@dataclass
+class RoleSyncProgress:
+    """Running totals for one `sync_role` call. The final value is its result."""
+
+    role: discord.Role
+    to_add: int = 0
+    to_remove: int = 0
+    added: list[discord.Member] = field(default_factory=list)
+    removed: list[discord.Member] = field(default_factory=list)
+    failed: list[discord.Member] = field(default_factory=list)
+    # Already in the wanted state by the time a worker reached them.
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.to_add + self.to_remove
+
+    @property
+    def done(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.failed) + self.skipped
+
+    def describe(self) -> str:
+        desc = f"Updating {self.role.mention}: **{self.done}/{self.total}**\nAdded: {len(self.added)}\nRemoved: {len(self.removed)}"
+        if self.failed:
+            desc += f"\nFailed: {len(self.failed)}"
+        return desc
+
+
+ProgressCallback = Callable[[RoleSyncProgress], Awaitable[None]]
+
+
+class Describable(Protocol):
+    def describe(self) -> str: ...
+
+
+def interaction_progress(interaction: discord.Interaction, title: str) -> Callable[[Describable], Awaitable[None]]:
+    """Report `sync_role` (or any bulk edit's) progress by editing the interaction's original response."""
+
+    async def report(progress: Describable):
+        await interaction.edit_original_response(embed=YellowEmbed(title=title, description=progress.describe()))
+
+    return report
+
+
+async def sync_role(
+    guild: discord.Guild,
+    role: discord.Role,
+    should_have: Iterable[int],
+    *,
+    add_reason: str | None = None,
+    remove_reason: str | None = None,
+    progress: ProgressCallback | None = None,
+    concurrency: int = ROLE_SYNC_CONCURRENCY,
+    interval: float = ROLE_SYNC_PROGRESS_INTERVAL,
+) -> RoleSyncProgress:
+    """Make `role` held by exactly the members of `guild` whose IDs are in `should_have`.
+
+    Only the difference against the role's current members is applied, through
+    `concurrency` workers. Every member is checked again right before their
+    edit, so a run that was interrupted is resumed by running it again: members
+    already done are part of the role's membership and drop out of the diff.
+
+    A failed edit is recorded in the result rather than raised.
+    """
+    wanted = set(should_have)
+    current = {m.id for m in role.members}
+    remove = [m for mid in current - wanted if (m := guild.get_member(mid))]
+    add = [m for mid in wanted - current if (m := guild.get_member(mid))]
+
+    state = RoleSyncProgress(role=role, to_add=len(add), to_remove=len(remove))
+    log.debug("Syncing role %s: +%d -%d", role.name, len(add), len(remove), guild=guild)
+    if not state.total:
+        return state
+
+    queue: asyncio.Queue[tuple[discord.Member, bool]] = asyncio.Queue()
+    for m in remove:
+        queue.put_nowait((m, False))
+    for m in add:
+        queue.put_nowait((m, True))
+
+    async def worker():
+        while not queue.empty():
+            member, adding = queue.get_nowait()
+            # Someone else may have changed the role since the diff was taken.
+            if (role in member.roles) == adding:
+                state.skipped += 1
+                continue
+            try:
+                if adding:
+                    await member.add_roles(role, reason=add_reason)
+                    state.added.append(member)
+                else:
+                    await member.remove_roles(role, reason=remove_reason)
+                    state.removed.append(member)
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to {'add' if adding else 'remove'} {role.name} for {member} ({member.id}): {exc}", guild=guild)
+                state.failed.append(member)
+
+    async def report():
+        reported = -1
+        while True:
+            await asyncio.sleep(interval)
+            if state.done == reported:
+                continue
+            reported = state.done
+            await _report(progress, state, guild)
+
+    reporter = asyncio.create_task(report()) if progress else None
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, state.total))))
+    finally:
+        if reporter:
+            reporter.cancel()
+
+    log.debug(
+        "Synced role %s in %.1fs: +%d -%d, %d failed, %d skipped",
+        role.name,
+        time.perf_counter() - started,
+        len(state.added),
+        len(state.removed),
+        len(state.failed),
+        state.skipped,
+        guild=guild,
+    )
+    return state
+
+
+async def _report(progress: ProgressCallback, state: RoleSyncProgress, guild: discord.Guild):
+    # The interaction token lasts 15 minutes. A large sync outlives it, and a
+    # stale progress message must not stop the sync itself.
+    try:
+        await progress(state)
+    except discord.HTTPException as exc:
+        log.debug("Unable to report role sync progress: %s", exc, guild=guild)
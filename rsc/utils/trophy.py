@@ -8,6 +8,7 @@ from rsc.embeds import BetterEmbed, ErrorEmbed, ExceptionErrorEmbed, SuccessEmbe
 from rsc.types import Accolades
 from rsc.logs import GuildLogAdapter
 from rsc.utils import utils
+from rsc.utils.nicknames import NicknameRewrite, apply_nicknames, plan_nicknames
 from rsc.utils.views.mass_trophy import MassTrophyModal
 
 logger = logging.getLogger("red.rsc.trophy")
@@ -147,8 +148,7 @@ class TrophyMixIn(RSCMixIn):
         else:
             await interaction.followup.send(embed=status, ephemeral=True)
 
-        applied = 0
-        for idx, member in enumerate(members, start=1):
+        async def add_trophy(member: discord.Member) -> str:
             accolades = await utils.member_accolades(member)
 
             match trophy:
@@ -161,26 +161,26 @@ class TrophyMixIn(RSCMixIn):
                 case const.COMBINE_CUP_EMOJI:
                     accolades.combine_cup += 1
 
-            # A failure on one member must not abandon the rest of the batch.
-            try:
-                new_nick = await self.format_nickname(member, accolades)
-                await member.edit(nick=new_nick)
-                applied += 1
-            except ValueError as exc:
-                errors.append(f"{member.mention}: {exc}")
-            except discord.Forbidden:
-                errors.append(f"{member.mention}: Missing permission to change nickname (role hierarchy or server owner)")
-            except discord.HTTPException as exc:
-                log.warning(f"Error updating nickname for {member.id}: {exc}", guild=guild)
-                errors.append(f"{member.mention}: Discord API error ({exc.text or exc.status})")
-
-            if modal_interaction and idx % PROGRESS_INTERVAL == 0 and idx != total:
-                await modal_interaction.edit_original_response(
-                    embed=YellowEmbed(
-                        title="Processing",
-                        description=f"Applying {trophy!s}... {idx}/{total} processed ({len(errors)} error(s))",
-                    )
+            return await self.format_nickname(member, accolades)
+
+        async def report(plan: NicknameRewrite):
+            if not modal_interaction:
+                return
+            processed = plan.done + len(plan.invalid)
+            failed = len(errors) + len(plan.invalid) + len(plan.failed)
+            await modal_interaction.edit_original_response(
+                embed=YellowEmbed(
+                    title="Processing",
+                    description=f"Applying {trophy!s}... {processed}/{total} processed ({failed} error(s))",
                 )
+            )
+
+        # Every nickname is worked out before the first edit. A member that
+        # fails either step is reported without abandoning the rest of the batch.
+        plan = await plan_nicknames(members, add_trophy)
+        await apply_nicknames(guild, plan, progress=report, every=PROGRESS_INTERVAL)
+        errors.extend(plan.errors())
+        applied = len(plan.renamed) + plan.skipped
 
         summary = f"Added {trophy!s} for **{applied}/{total}** member(s)."
         result: BetterEmbed = (
@@ -7,13 +7,14 @@ from pathlib import Path
 import discord
 from discord.app_commands import Transform
 from PIL import Image
-from redbot.core import app_commands
+from redbot.core import app_commands, commands
 from rscapi.models.franchise import Franchise
 from rscapi.models.franchise_list import FranchiseList
 from rscapi.models.league_player import LeaguePlayer
 
 from rsc import const
 from rsc.abc import RSCMixIn
+from rsc.assets import fa_asset_path
 from rsc.embeds import (
     ErrorEmbed,
     BetterEmbed,
@@ -22,12 +23,14 @@ from rsc.embeds import (
     OrangeEmbed,
     SuccessEmbed,
 )
-from rsc.enums import BulkRoleAction, DiscordPermType, DiscordPermValue, TransactionType
+from rsc.enums import BulkRoleAction, DiscordPermType, DiscordPermValue
 from rsc.exceptions import DiscordNameTooLong
 from rsc.logs import GuildLogAdapter
 from rsc.transformers import GreedyMemberTransformer
 from rsc.types import Accolades
 from rsc.utils import filters
+from rsc.utils.executor import offload
+from rsc.utils.nicknames import NICKNAMES
 from rsc.utils.pagify import Pagify
 from rsc.utils.views.bulk_role import BulkRoleConfirmView
 
@@ -80,9 +83,7 @@ async def valid_emoji_name(name: str) -> bool:
 
 async def update_discord_name(member: discord.Member, name: str, prefix: str | None = None) -> None:
     accolades = await member_accolades(member)
-    final = f"{name} {accolades}".strip()
-    if prefix:
-        final = f"{prefix} | {name} {accolades}".strip()
+    final = NICKNAMES.render(name, accolades, prefix)
 
     if len(final) > NICKNAME_MAX_LENGTH:
         raise DiscordNameTooLong(member_id=member.id, nickname=final)
@@ -91,19 +92,23 @@ async def update_discord_name(member: discord.Member, name: str, prefix: str | N
         raise ValueError(f"Error changing name. Empty or <1 characters: {member.mention}")
 
     if final == member.display_name:
-        log.debug(f"Name is unchanged for {member.id}: {final}", guild=member.guild)
+        log.debug("Name is unchanged for %s: %s", member.id, final, guild=member.guild)
         return
 
-    log.debug(f"Updating {member.id} nickname to {final}", guild=member.guild)
+    log.debug("Updating %s nickname to %s", member.id, final, guild=member.guild)
     await member.edit(nick=final)
 
 
-async def resize_image(img_data: bytes, height: int, width: int, imgtype: str):
+async def resize_image(img_data: bytes, height: int, width: int, imgtype: str) -> bytes:
+    return await offload(_resize_image, img_data, height, width, imgtype)
+
+
+def _resize_image(img_data: bytes, height: int, width: int, imgtype: str) -> bytes:
     img = Image.open(io.BytesIO(img_data))
     # Image.resize() returns a new image, it does not resize in place.
     img = img.resize((width, height))
 
-    log.debug(f"Image Mode: {img.mode}")
+    log.debug("Image Mode: %s", img.mode)
     if img.mode == "RGBA" and imgtype == "JPEG":
         log.debug("Converting RGBA to RGB for JPEG.")
         img = img.convert("RGB")
@@ -113,7 +118,11 @@ async def resize_image(img_data: bytes, height: int, width: int, imgtype: str):
         return buf.getvalue()
 
 
-async def img_to_thumbnail(img_data: bytes, height: int, width: int, imgtype: str):
+async def img_to_thumbnail(img_data: bytes, height: int, width: int, imgtype: str) -> bytes:
+    return await offload(_img_to_thumbnail, img_data, height, width, imgtype)
+
+
+def _img_to_thumbnail(img_data: bytes, height: int, width: int, imgtype: str) -> bytes:
     img = Image.open(io.BytesIO(img_data))
     # Unlike resize(), thumbnail() is in place. It preserves aspect ratio and
     # only ever shrinks, so the result fits within the box but may not fill it.
@@ -383,24 +392,12 @@ def rsc_name_from_member(member: discord.Member | discord.User) -> str:
 
 async def remove_prefix(member: discord.Member) -> str:
     """Remove team prefix from guild members display name"""
-    result = member.display_name.split(" | ", maxsplit=1)
-    if not result:
-        raise ValueError(f"Unable to remove prefix from {member.display_name}")
-    elif len(result) == 1:
-        return result[0].strip()  # No prefix found
-    else:
-        return result[1].strip()
+    return NICKNAMES.parse(member.display_name).unprefixed
 
 
 async def get_prefix(member: discord.Member) -> str | None:
     """Get team prefix from guild members display name"""
-    result = member.display_name.split(" | ", maxsplit=1)
-    if not result:
-        raise ValueError(f"Error parsing prefix from {member.display_name}")
-    elif len(result) == 1:
-        return None  # No prefix found
-    else:
-        return result[0].strip()
+    return NICKNAMES.parse(member.display_name).prefix
 
 
 async def give_fa_prefix(member: discord.Member):
@@ -449,56 +446,8 @@ async def franchise_role_from_name(guild: discord.Guild, franchise_name: str) ->
     return None
 
 
-async def fa_img_from_tier(tier: str, tiny: bool = False) -> discord.File | None:
-    root = Path(__file__).parent.parent
-    if tiny:  # noqa: SIM108
-        img_path = root / f"resources/FA/64x64/{tier}FA_64x64.png"
-    else:
-        img_path = root / f"resources/FA/{tier}FA.png"
-
-    if img_path.is_file():
-        return discord.File(img_path)
-
-    return None
-
-
 async def fa_img_path_from_tier(tier: str, tiny: bool = False) -> Path | None:
-    root = Path(__file__).parent.parent
-    if tiny:  # noqa: SIM108
-        img_path = root / f"resources/FA/64x64/{tier}FA_64x64.png"
-    else:
-        img_path = root / f"resources/FA/{tier}FA.png"
-
-    if img_path.is_file():
-        return img_path
-
-    return None
-
-
-async def transaction_image_from_type(action: TransactionType) -> discord.File:
-    root = Path(__file__).parent.parent
-    match action:
-        # A cut off Inactive Reserve is still a release.
-        case TransactionType.CUT | TransactionType.IR_CUT:
-            return discord.File(root / "resources/transactions/Released.png")
-        case TransactionType.PICKUP:
-            return discord.File(root / "resources/transactions/Signed.png")
-        case TransactionType.RESIGN:
-            return discord.File(root / "resources/transactions/Resigned.png")
-        case TransactionType.SUBSTITUTION:
-            return discord.File(root / "resources/transactions/Subbed.png")
-        case TransactionType.TEMP_FA:
-            return discord.File(root / "resources/transactions/Subbed.png")
-        case TransactionType.TRADE:
-            return discord.File(root / "resources/transactions/Traded.png")
-        case TransactionType.RETIRE:
-            return discord.File(root / "resources/transactions/Retired.png")
-        case TransactionType.INACTIVE_RESERVE:
-            return discord.File(root / "resources/transactions/InactiveReserve.png")
-        case TransactionType.IR_RETURN:
-            return discord.File(root / "resources/transactions/InactiveReserve.png")
-        case _:
-            raise NotImplementedError
+    return fa_asset_path(tier, tiny=tiny)
 
 
 async def franchise_role_from_league_player(guild: discord.Guild, player: LeaguePlayer) -> discord.Role:
@@ -587,50 +536,31 @@ async def emoji_from_prefix(guild: discord.Guild, prefix: str) -> discord.Emoji
 
 
 async def trophy_count(member: discord.Member) -> int:
-    return member.display_name.count(const.TROPHY_EMOJI)
+    return NICKNAMES.parse(member.display_name).trophy
 
 
 async def star_count(member: discord.Member) -> int:
-    return member.display_name.count(const.STAR_EMOJI)
+    return NICKNAMES.parse(member.display_name).star
 
 
 async def devleague_count(member: discord.Member) -> int:
-    count = member.display_name.count(const.DEV_LEAGUE_EMOJI)
-    cookies = member.display_name.count(const.COOKIE_EMOJI) * 4
-    return count + cookies
+    return NICKNAMES.parse(member.display_name).devleague
 
 
 async def combine_cup_count(member: discord.Member) -> int:
-    return member.display_name.count(const.COMBINE_CUP_EMOJI)
+    return NICKNAMES.parse(member.display_name).combine_cup
 
 
 async def format_discord_prefix(member: discord.Member, prefix: str) -> str:
-    accolades = await member_accolades(member)
-    no_pfx = await remove_prefix(member)
-    name = await strip_discord_accolades(no_pfx)
-    if prefix:  # noqa: SIM108
-        new_nick = f"{prefix} | {name} {accolades}".strip()
-    else:
-        new_nick = f"{name} {accolades}".strip()
-    return new_nick
+    return NICKNAMES.reprefix(member.display_name, prefix)
 
 
 async def strip_discord_accolades(value: str) -> str:
-    final = value.replace(const.TROPHY_EMOJI, "")
-    final = final.replace(const.STAR_EMOJI, "")
-    final = final.replace(const.DEV_LEAGUE_EMOJI, "")
-    final = final.replace(const.COOKIE_EMOJI, "")
-    final = final.replace(const.COMBINE_CUP_EMOJI, "")
-    return final.strip()
+    return NICKNAMES.parse(value).bare
 
 
 async def member_accolades(member: discord.Member) -> Accolades:
-    return Accolades(
-        trophy=await trophy_count(member),
-        star=await star_count(member),
-        devleague=await devleague_count(member),
-        combine_cup=await combine_cup_count(member),
-    )
+    return NICKNAMES.parse(member.display_name).accolades
 
 
 async def remove_emoji(member: discord.Member | str) -> str:
@@ -657,6 +587,17 @@ class UtilsMixIn(RSCMixIn):
 
         super().__init__()
 
+    # Listeners
+
+    @commands.Cog.listener("on_raw_message_delete")
+    async def forget_deleted_asset(self, payload: discord.RawMessageDeleteEvent):
+        """Re-upload an asset next time it is used if its upload was deleted"""
+        self.asset_host().forget_messages([payload.message_id])
+
+    @commands.Cog.listener("on_raw_bulk_message_delete")
+    async def forget_bulk_deleted_assets(self, payload: discord.RawBulkMessageDeleteEvent):
+        self.asset_host().forget_messages(payload.message_ids)
+
     @app_commands.command(
         name="getreactlist",
         description="Get a list of users who reacted to a message",
@@ -687,9 +628,9 @@ class UtilsMixIn(RSCMixIn):
         fmt_msg: dict[discord.Reaction, str] = {}
         for r in msg.reactions:
             if filter and r.emoji != filter.strip():
-                log.debug(f"Skipping reaction {r.emoji}. (Filter: {filter})")
+                log.debug("Skipping reaction %s. (Filter: %s)", r.emoji, filter)
                 continue
-            log.debug(f"Reaction: {r}")
+            log.debug("Reaction: %s", r)
             fmt_msg[r] = ""
             async for user in r.users():
                 fmt_msg[r] += f"{user.id}:{user.display_name}\n"
@@ -1097,7 +1038,7 @@ class UtilsMixIn(RSCMixIn):
             msg = "\n".join([f"{p.display_name}:{p.name}:{p.id}" for p in results])
             if len(msg) > 2000:
                 paged_msg = Pagify(text=msg)
-                log.debug(f"Paged Msg: {paged_msg}")
+                log.debug("Paged Msg: %s", paged_msg)
                 for page in paged_msg:
                     await interaction.followup.send(
                         content=f"```\n{page}\n```",
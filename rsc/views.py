@@ -215,7 +215,7 @@ class LeagueSelectView(AuthorOnlyView):
         await self.interaction.response.send_message(embed=embed, view=self, ephemeral=True)
 
     async def save_selection(self, interaction: discord.Interaction, league_id: list[str]):
-        log.debug(f"League Selection: {league_id}")
+        log.debug("League Selection: %s", league_id)
         self.result = int(league_id[0])
         league = next(x for x in self.leagues if x.id == self.result)
         embed = discord.Embed(
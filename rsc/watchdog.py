@@ -0,0 +1,161 @@
+"""Event loop stall detection.
+
+Anything that blocks the event loop (a PIL call, a large JSON parse, a sync
+HTTP request) delays gateway heartbeats and every other command for as long
+as it runs. Once the loop is free again the culprit has returned, and nothing
+says where the time went.
+
+`LoopWatchdog` runs two halves:
+
+* A heartbeat task on the loop sleeps for `interval` and records how late it
+  woke up as `rsc_event_loop_lag_seconds`.
+* A daemon thread watches the heartbeat. When it goes quiet for longer than
+  `threshold`, the thread captures the loop thread's stack and the task that
+  was running, while the block is still in progress.
+
+When the heartbeat resumes it pairs its lag with the captured stack. It logs
+the result as a `Stall`, keeps it for `/rsc stalls` and counts it in
+`rsc_event_loop_stalls_total`.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from rsc.metrics import EVENT_LOOP_LAG_SECONDS, EVENT_LOOP_STALLS, METRICS, MetricsRegistry
+
+log = logging.getLogger("red.rsc.watchdog")
+
+# Seconds between heartbeats.
+WATCHDOG_INTERVAL = 0.1
+# A heartbeat this late is a stall. Discord closes the gateway after missing
+# heartbeats for tens of seconds, but commands feel stuck long before that.
+WATCHDOG_THRESHOLD = 0.5
+# Stalls kept for `/rsc stalls`, newest last.
+WATCHDOG_HISTORY = 20
+# Innermost frames kept from a stalled stack.
+STACK_DEPTH = 12
+
+
+@dataclass(slots=True)
+class Stall:
+    at: datetime
+    seconds: float
+    task: str | None = None
+    stack: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        where = self.stack[-1].strip().splitlines()[0] if self.stack else "unknown"
+        return f"{self.seconds * 1000:.0f}ms in {self.task or 'loop callback'} at {where}"
+
+
+class LoopWatchdog:
+    """Samples event loop lag and records stalls with the stack that caused them.
+
+    Usage:
+        watchdog = LoopWatchdog()
+        watchdog.start()
+        # ... later ...
+        await watchdog.stop()
+    """
+
+    def __init__(
+        self,
+        interval: float = WATCHDOG_INTERVAL,
+        threshold: float = WATCHDOG_THRESHOLD,
+        history: int = WATCHDOG_HISTORY,
+        registry: MetricsRegistry = METRICS,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls: deque[Stall] = deque(maxlen=history)
+        self._registry = registry
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._beat = time.monotonic()
+        # (beat, task, stack). Written by the monitor thread, taken by the
+        # heartbeat. A tuple swap is atomic under the GIL, so no lock.
+        self._captured: tuple[float, str | None, list[str]] | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-watchdog")
+        self._thread = threading.Thread(target=self._monitor, name="rsc-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        lag_hist = self._registry.histogram(EVENT_LOOP_LAG_SECONDS)
+        while True:
+            start = time.monotonic()
+            self._beat = start
+            await asyncio.sleep(self.interval)
+            lag = max(time.monotonic() - start - self.interval, 0.0)
+            lag_hist.record(lag)
+            if lag >= self.threshold:
+                self._record(start, lag)
+            self._captured = None
+
+    def _record(self, beat: float, lag: float) -> None:
+        task, stack = None, []
+        captured = self._captured
+        # Only a capture taken during this beat describes this stall
+        if captured is not None and captured[0] == beat:
+            _, task, stack = captured
+        stall = Stall(at=datetime.now(UTC), seconds=lag, task=task, stack=stack)
+        self.stalls.append(stall)
+        self._registry.counter(EVENT_LOOP_STALLS).inc()
+        log.warning(f"Event loop blocked for {stall.summary()}\n{''.join(stack)}")
+
+    def _monitor(self) -> None:
+        """Monitor thread. Captures the loop's stack while it is blocked."""
+        captured_for = None
+        while not self._stopping.wait(self.interval / 2):
+            beat = self._beat
+            if beat == captured_for or time.monotonic() - beat < self.threshold:
+                continue
+            captured_for = beat
+            self._captured = (beat, *self._capture())
+
+    def _capture(self) -> tuple[str | None, list[str]]:
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = traceback.format_stack(frame)[-STACK_DEPTH:] if frame is not None else []
+        task = None
+        try:
+            current = asyncio.current_task(self._loop)
+        except Exception:
+            # Read from outside the loop's thread; best effort only
+            current = None
+        if current is not None:
+            task = current.get_name()
+            coro = current.get_coro()
+            if coro is not None:
+                task = f"{task} ({getattr(coro, '__qualname__', coro)})"
+        return task, stack
@@ -0,0 +1,283 @@
+"""Journaled ingestion for the local web app's webhooks.
+
+Upstream services post to the bot and give up if it answers slowly, then
+retry. A combines match with 60 lobbies used to hold its request open for
+minutes while every lobby's channels were created, so the retry arrived
+mid-way and created the work a second time.
+
+Requests are now validated, appended to an on-disk journal under an
+idempotency key and answered `202 Accepted` straight away. A small worker pool
+drains the journal:
+
+* A key already in the journal is acknowledged but not queued again, so an
+  upstream retry is harmless.
+* A job is marked finished only after its handler returns. Anything accepted
+  but unfinished when the bot stops (a reload, a crash) is replayed by the next
+  `start()`, so handlers must tolerate running twice -- lobby creation already
+  checks for existing channels.
+* A handler that raises is logged and marked failed rather than retried. Half
+  created Discord state is not something a blind retry improves.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+log = logging.getLogger("red.rsc.webhooks")
+
+# Jobs handled at once. Lobby creation is a handful of Discord calls per job,
+# all against one guild's rate limits, so more workers only queue on those.
+WEBHOOK_WORKERS = 4
+# Finished keys remembered for dedup, newest kept. Upstream retries arrive
+# within minutes, so this only needs to outlast a burst.
+WEBHOOK_DEDUP_WINDOW = 10_000
+# Rewrite the journal after this many jobs finish, so it stays small.
+WEBHOOK_COMPACT_AFTER = 1_000
+
+WebhookJob = dict[str, Any]
+
+
+class WebhookRejectedError(Exception):
+    """A request the ingest layer must refuse with `status` instead of accepting."""
+
+    def __init__(self, status: int, reason: str = ""):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookRoute:
+    name: str
+    # Validates a request body and splits it into independently handled jobs.
+    # Raises `WebhookRejectedError`, or `ValueError`/`TypeError` (pydantic errors
+    # included) for a malformed body.
+    prepare: Callable[[Any], Awaitable[list[WebhookJob]]]
+    handle: Callable[[WebhookJob], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    key: str
+    route: str
+    job: WebhookJob
+
+
+def idempotency_key(route: str, job: WebhookJob) -> str:
+    """Key for a job sent without an `Idempotency-Key` header: a hash of its content."""
+    body = json.dumps(job, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{route}:{hashlib.sha256(body.encode()).hexdigest()}"
+
+
+class WebhookJournal:
+    """Append-only JSON lines file of accepted and finished jobs."""
+
+    def __init__(self, path: Path, dedup_window: int = WEBHOOK_DEDUP_WINDOW, compact_after: int = WEBHOOK_COMPACT_AFTER):
+        self.path = path
+        self._dedup_window = dedup_window
+        self._compact_after = compact_after
+        self._pending: dict[str, JournalEntry] = {}
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self._since_compact = 0
+        self._lock = asyncio.Lock()
+
+    def load(self) -> list[JournalEntry]:
+        """Read the journal back. Returns jobs accepted but never finished, oldest first.
+
+        A torn last line, from a crash mid-append, is skipped: its request was
+        never acknowledged, so upstream will send it again.
+        """
+        self._pending.clear()
+        self._finished.clear()
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning(f"Skipping unreadable webhook journal line: {line[:80]!r}")
+                    continue
+                if record["op"] == "accept":
+                    self._pending[record["key"]] = JournalEntry(record["key"], record["route"], record["job"])
+                else:
+                    self._pending.pop(record["key"], None)
+                    self._remember(record["key"])
+        return list(self._pending.values())
+
+    def seen(self, key: str) -> bool:
+        return key in self._pending or key in self._finished
+
+    def pending(self, key: str) -> JournalEntry | None:
+        return self._pending.get(key)
+
+    async def accept(self, entries: Iterable[JournalEntry]) -> list[JournalEntry]:
+        """Journal the entries not seen before, durably. Returns the ones written."""
+        async with self._lock:
+            fresh: dict[str, JournalEntry] = {}
+            for entry in entries:
+                if not self.seen(entry.key) and entry.key not in fresh:
+                    fresh[entry.key] = entry
+            if fresh:
+                lines = [{"op": "accept", "key": e.key, "route": e.route, "job": e.job} for e in fresh.values()]
+                await asyncio.to_thread(self._append, lines)
+                self._pending.update(fresh)
+            return list(fresh.values())
+
+    async def finish(self, key: str, *, failed: bool = False) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._append, [{"op": "done", "key": key, "failed": failed}])
+            self._pending.pop(key, None)
+            self._remember(key)
+            self._since_compact += 1
+            if self._since_compact >= self._compact_after:
+                await asyncio.to_thread(self._compact)
+                self._since_compact = 0
+
+    def _remember(self, key: str) -> None:
+        self._finished[key] = None
+        self._finished.move_to_end(key)
+        while len(self._finished) > self._dedup_window:
+            self._finished.popitem(last=False)
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fp:
+            fp.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+            fp.flush()
+            # Acknowledged means on disk. A 202 for a job lost in a crash
+            # would never be sent again.
+            os.fsync(fp.fileno())
+
+    def _compact(self) -> None:
+        """Rewrite the journal as the dedup window plus the unfinished jobs."""
+        records = [{"op": "done", "key": key} for key in self._finished]
+        records.extend({"op": "accept", "key": e.key, "route": e.route, "job": e.job} for e in self._pending.values())
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as fp:
+            fp.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+            fp.flush()
+            os.fsync(fp.fileno())
+        tmp.replace(self.path)
+
+
+class WebhookIngest:
+    """Accepts webhook requests into a `WebhookJournal` and drains it with a worker pool.
+
+    Usage:
+        ingest = WebhookIngest(WebhookJournal(path), routes)
+        app.router.add_post("/combines_match", ingest.handler("combines_match"))
+        await ingest.start()
+        # ... later ...
+        await ingest.stop()
+    """
+
+    def __init__(self, journal: WebhookJournal, routes: Iterable[WebhookRoute], workers: int = WEBHOOK_WORKERS):
+        self.journal = journal
+        self._routes = {route.name: route for route in routes}
+        self._workers = workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def handler(self, name: str) -> Callable[[web.Request], Awaitable[web.Response]]:
+        route = self._routes[name]
+
+        async def handle(request: web.Request) -> web.Response:
+            return await self._ingest(route, request)
+
+        return handle
+
+    async def start(self) -> None:
+        """Replay unfinished jobs from the journal and start the workers."""
+        if self.running:
+            return
+        replay = await asyncio.to_thread(self.journal.load)
+        if replay:
+            log.info(f"Replaying {len(replay)} unfinished webhook job(s).")
+        for entry in replay:
+            self._queue.put_nowait(entry.key)
+        self._tasks = [asyncio.create_task(self._worker(), name=f"webhook-worker-{i}") for i in range(self._workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers. Unfinished jobs stay in the journal for the next `start()`."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = asyncio.Queue()
+
+    async def join(self) -> None:
+        """Wait until every queued job has been handled."""
+        await self._queue.join()
+
+    async def _ingest(self, route: WebhookRoute, request: web.Request) -> web.Response:
+        try:
+            data = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            log.warning(f"Received {route.name} webhook with no JSON data")
+            return web.Response(status=400)
+
+        try:
+            jobs = await route.prepare(data)
+        except WebhookRejectedError as exc:
+            log.warning(f"Rejected {route.name} webhook ({exc.status}): {exc.reason}")
+            return web.Response(status=exc.status)
+        except (ValueError, TypeError, AttributeError) as exc:
+            # pydantic.ValidationError is a ValueError.
+            log.warning(f"Invalid {route.name} webhook: {exc}")
+            return web.Response(status=400)
+
+        if not jobs:
+            log.warning(f"Received {route.name} webhook with no data")
+            return web.Response(status=400)
+
+        header = request.headers.get("Idempotency-Key")
+        entries = [
+            JournalEntry(f"{route.name}:{header}:{i}" if header else idempotency_key(route.name, job), route.name, job)
+            for i, job in enumerate(jobs)
+        ]
+        accepted = await self.journal.accept(entries)
+        for entry in accepted:
+            self._queue.put_nowait(entry.key)
+
+        log.debug("Accepted %d %s job(s), %d duplicate(s)", len(accepted), route.name, len(entries) - len(accepted))
+        return web.json_response({"accepted": len(accepted), "duplicates": len(entries) - len(accepted)}, status=202)
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                await self._run(key)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, key: str) -> None:
+        entry = self.journal.pending(key)
+        if entry is None:
+            return
+        route = self._routes.get(entry.route)
+        if route is None:
+            log.error(f"Dropping webhook job for unknown route: {entry.route}")
+            await self.journal.finish(key, failed=True)
+            return
+
+        try:
+            await route.handle(entry.job)
+        except Exception as exc:
+            log.exception(f"Webhook {entry.route} job failed: {exc}", exc_info=exc)
+            await self.journal.finish(key, failed=True)
+            return
+        await self.journal.finish(key)
@@ -1,10 +1,11 @@
 import logging
 
 import discord
-from redbot.core import app_commands, commands
+from redbot.core import app_commands
 
 from rsc.abc import RSCMixIn
 from rsc.embeds import BlueEmbed, SuccessEmbed
+from rsc.members.joins import WelcomePlan
 from rsc.types import WelcomeSettings
 
 log = logging.getLogger("red.rsc.welcome")
@@ -20,28 +21,6 @@ class WelcomeMixIn(RSCMixIn):
         self.config.register_custom("Welcome", **defaults_guild)
         super().__init__()
 
-    # Listeners
-
-    @commands.Cog.listener("on_member_join")
-    async def on_join_welcome(self, member: discord.Member):
-        # Assign role(s) to user
-        wroles = await self._get_welcome_roles(member.guild)
-        if wroles:
-            await member.add_roles(*wroles)
-
-        # Check if welcome channel is set
-        wchan = await self._get_welcome_channel(member.guild)
-        if not wchan:
-            return
-
-        # Check if welcome msg is set, and send it to channel
-        wmsg = await self._get_welcome_msg(member.guild)
-        if wmsg:
-            await wchan.send(
-                content=wmsg.format(member=member),
-                allowed_mentions=discord.AllowedMentions(users=True),
-            )
-
     # Group
 
     _rsc_welcome = app_commands.Group(
@@ -87,7 +66,7 @@ class WelcomeMixIn(RSCMixIn):
 
         status = await self._get_welcome_status(interaction.guild)
         status ^= True  # Flip boolean with xor
-        log.debug(f"Welcome Status: {status}")
+        log.debug("Welcome Status: %s", status)
         await self._set_welcome_status(interaction.guild, status)
         result = "**enabled**" if status else "**disabled**"
         await interaction.response.send_message(
@@ -156,6 +135,25 @@ class WelcomeMixIn(RSCMixIn):
 
     # Settings
 
+    async def welcome_plan(self, guild: discord.Guild) -> WelcomePlan:
+        """Roles, channel and message for new members, in one config read."""
+        settings = await self.config.custom("Welcome", str(guild.id)).all()
+
+        roles = []
+        for rid in settings["WelcomeRoles"]:
+            r = guild.get_role(rid)
+            if r:
+                roles.append(r)
+        # Update saved roles if one or more don't exist
+        if len(roles) != len(settings["WelcomeRoles"]):
+            await self._set_welcome_roles(guild, roles)
+
+        channel = guild.get_channel(settings["WelcomeChannel"])
+        if not isinstance(channel, discord.TextChannel):
+            channel = None
+
+        return WelcomePlan(roles=roles, channel=channel, message=settings["WelcomeMsg"])
+
     async def _get_welcome_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
         cid = await self.config.custom("Welcome", str(guild.id)).WelcomeChannel()
         channel = guild.get_channel(cid)
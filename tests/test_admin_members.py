@@ -223,13 +223,13 @@ def _league_player(name, discord_id, status, *, lp_id=1, tier="Elite", franchise
     return lp
 
 
-def _paged_players(players):
-    """Stub for `paged_players`, which is an async generator rather than a coroutine."""
+def _player_pages(players):
+    """Stub for `player_pages`, which is an async generator rather than a coroutine."""
 
     def _stub(*args, **kwargs):
         async def _gen():
-            for p in players:
-                yield p
+            if players:
+                yield list(players)
 
         return _gen()
 
@@ -244,7 +244,7 @@ def _notinserver_mixin(players, **attrs):
         "current_season": AsyncMock(return_value=season),
         "_ensure_chunked": AsyncMock(return_value=True),
         "total_players": AsyncMock(return_value=len(players)),
-        "paged_players": _paged_players(players),
+        "player_pages": _player_pages(players),
     }
     return _create_mixin(**{**defaults, **attrs})
 
@@ -321,7 +321,8 @@ class TestAdminNotInServerCommand:
     async def test_player_in_server_is_not_reported(self, mock_guild, mock_member):
         mixin = _notinserver_mixin([_league_player("Present", 111, Status.ROSTERED)])
         interaction = _notinserver_interaction(mock_guild)
-        mock_guild.get_member = MagicMock(return_value=mock_member)
+        mock_member.id = 111
+        mock_guild.members = [mock_member]
         mock_guild.fetch_member = AsyncMock()
 
         await NOTINSERVER_CMD(mixin, interaction)
@@ -415,13 +416,13 @@ class TestAdminNotInServerCommand:
     async def test_scopes_query_to_current_season_id(self, mock_guild):
         """`season` takes an id. Passing a season *number* silently returns nothing."""
         mixin = _notinserver_mixin([])
-        mixin.paged_players = MagicMock(side_effect=_paged_players([]))
+        mixin.player_pages = MagicMock(side_effect=_player_pages([]))
         interaction = _notinserver_interaction(mock_guild)
 
         await NOTINSERVER_CMD(mixin, interaction)
 
-        assert mixin.paged_players.call_args.kwargs["season"] == 42
-        assert "season_number" not in mixin.paged_players.call_args.kwargs
+        assert mixin.player_pages.call_args.kwargs["season"] == 42
+        assert "season_number" not in mixin.player_pages.call_args.kwargs
         mixin.total_players.assert_awaited_once_with(mock_guild, season=42)
 
     async def test_no_guild_is_noop(self):
@@ -431,6 +432,39 @@ class TestAdminNotInServerCommand:
         assert await NOTINSERVER_CMD(mixin, interaction) is None
         mixin.current_season.assert_not_awaited()
 
+    async def test_a_repeat_run_reuses_the_sweep_and_confirmed_departures(self, mock_guild):
+        players = [_league_player("Gone", 222, Status.ROSTERED)]
+        mixin = _notinserver_mixin(players, player_pages=MagicMock(side_effect=_player_pages(players)))
+        mock_guild.fetch_member = AsyncMock(side_effect=discord.NotFound(MagicMock(status=404), "Unknown Member"))
+
+        await NOTINSERVER_CMD(mixin, _notinserver_interaction(mock_guild))
+        interaction = _notinserver_interaction(mock_guild)
+        await NOTINSERVER_CMD(mixin, interaction)
+
+        assert mixin.player_pages.call_count == 1
+        mock_guild.fetch_member.assert_awaited_once_with(222)
+        assert _reported_ids(interaction) == ["222"]
+
+    async def test_progress_lists_misses_as_they_are_found(self, mock_guild):
+        players = [_league_player(f"Gone{i}", 1000 + i, Status.ROSTERED) for i in range(4)]
+
+        def two_pages(*args, **kwargs):
+            async def _gen():
+                yield players[:2]
+                yield players[2:]
+
+            return _gen()
+
+        mixin = _notinserver_mixin(players, player_pages=two_pages)
+        interaction = _notinserver_interaction(mock_guild)
+        mock_guild.fetch_member = AsyncMock(side_effect=discord.NotFound(MagicMock(status=404), "Unknown Member"))
+
+        await NOTINSERVER_CMD(mixin, interaction)
+
+        embed = interaction.edit_original_response.await_args.kwargs["embed"]
+        assert "Checked 4/4 players. 4 not in server so far" in embed.description
+        assert "Gone3 (1003)" in embed.fields[0].value
+
 
 class TestStaffPositionsFullName:
     @pytest.mark.parametrize(
@@ -50,9 +50,11 @@ def _make_league_player(discord_id: int, status: Status = Status.ROSTERED, team:
 
 
 def _paged(players):
+    """Stub for `player_pages`, with every player on one page."""
+
     async def _iter(*args, **kwargs):
-        for p in players:
-            yield p
+        if players:
+            yield list(players)
 
     return _iter
 
@@ -80,7 +82,8 @@ def mixin(guild):
     m._league = {guild.id: 1}
     m._ensure_chunked = AsyncMock(return_value=True)
     m._resolve_members_by_id = AsyncMock(return_value=([], [], []))
-    m.paged_players = _paged([])
+    m.total_players = AsyncMock(return_value=0)
+    m.player_pages = _paged([])
     m._get_event_channel = AsyncMock(return_value=MagicMock(spec=discord.TextChannel))
     m._try_post_embeds = AsyncMock()
     m._get_retire_audit_enabled = AsyncMock(return_value=True)
@@ -92,7 +95,7 @@ def mixin(guild):
 class TestFindDepartedPlayers:
     async def test_reports_players_discord_confirmed_as_gone(self, mixin, guild):
         players = [_make_league_player(i) for i in range(100, 200)]
-        mixin.paged_players = _paged(players)
+        mixin.player_pages = _paged(players)
         mixin._resolve_members_by_id.return_value = ([], [100, 101], [])
 
         report = await mixin.find_departed_players(guild)
@@ -105,7 +108,7 @@ class TestFindDepartedPlayers:
 
     async def test_lookup_failures_are_never_actionable(self, mixin, guild):
         """'Could not tell' is not 'they left'."""
-        mixin.paged_players = _paged([_make_league_player(i) for i in range(100, 200)])
+        mixin.player_pages = _paged([_make_league_player(i) for i in range(100, 200)])
         mixin._resolve_members_by_id.return_value = ([], [], [100, 101, 102])
 
         report = await mixin.find_departed_players(guild)
@@ -116,7 +119,7 @@ class TestFindDepartedPlayers:
     async def test_cache_miss_that_resolves_is_not_departed(self, mixin, guild):
         """A `get_member` miss whose `fetch_member` succeeds lands in `found`, not `left_guild`."""
         resolved = MagicMock(spec=discord.Member)
-        mixin.paged_players = _paged([_make_league_player(100)])
+        mixin.player_pages = _paged([_make_league_player(100)])
         mixin._resolve_members_by_id.return_value = ([resolved], [], [])
 
         report = await mixin.find_departed_players(guild)
@@ -124,7 +127,7 @@ class TestFindDepartedPlayers:
         assert report.departed == []
 
     async def test_only_active_statuses_are_checked(self, mixin, guild):
-        mixin.paged_players = _paged(
+        mixin.player_pages = _paged(
             [
                 _make_league_player(100, status=Status.ROSTERED),
                 _make_league_player(101, status=Status.FORMER),
@@ -139,8 +142,19 @@ class TestFindDepartedPlayers:
         assert report.total_active == 2
         assert sorted(mixin._resolve_members_by_id.await_args.args[1]) == [100, 104]
 
+    async def test_confirmed_departures_are_not_fetched_again(self, mixin, guild):
+        mixin.player_pages = _paged([_make_league_player(i) for i in range(100, 200)])
+        mixin._resolve_members_by_id.return_value = ([], [100], [])
+        await mixin.find_departed_players(guild)
+        mixin._resolve_members_by_id.return_value = ([], [], [])
+
+        report = await mixin.find_departed_players(guild)
+
+        assert report.departed == [100]
+        assert 100 not in mixin._resolve_members_by_id.await_args.args[1]
+
     async def test_players_without_a_discord_id_are_skipped(self, mixin, guild):
-        mixin.paged_players = _paged([_make_league_player(100), _make_league_player(None)])
+        mixin.player_pages = _paged([_make_league_player(100), _make_league_player(None)])
 
         report = await mixin.find_departed_players(guild)
 
@@ -150,7 +164,7 @@ class TestFindDepartedPlayers:
 class TestGuardrails:
     async def test_aborts_when_bot_is_disconnected(self, mixin, guild):
         mixin.bot.is_closed.return_value = True
-        mixin.paged_players = MagicMock(side_effect=AssertionError("must not page the API"))
+        mixin.player_pages = MagicMock(side_effect=AssertionError("must not page the API"))
 
         report = await mixin.find_departed_players(guild)
 
@@ -160,7 +174,7 @@ class TestGuardrails:
 
     async def test_aborts_when_guild_is_unavailable(self, mixin, guild):
         guild.unavailable = True
-        mixin.paged_players = MagicMock(side_effect=AssertionError("must not page the API"))
+        mixin.player_pages = MagicMock(side_effect=AssertionError("must not page the API"))
 
         report = await mixin.find_departed_players(guild)
 
@@ -170,7 +184,7 @@ class TestGuardrails:
     async def test_aborts_when_chunking_fails(self, mixin, guild):
         """A cold cache makes every player look like they left."""
         mixin._ensure_chunked.return_value = False
-        mixin.paged_players = MagicMock(side_effect=AssertionError("must not page the API"))
+        mixin.player_pages = MagicMock(side_effect=AssertionError("must not page the API"))
 
         report = await mixin.find_departed_players(guild)
 
@@ -180,7 +194,7 @@ class TestGuardrails:
 
     async def test_aborts_on_a_thin_member_cache(self, mixin, guild):
         guild.members = [MagicMock()] * 500  # 50% of member_count
-        mixin.paged_players = MagicMock(side_effect=AssertionError("must not page the API"))
+        mixin.player_pages = MagicMock(side_effect=AssertionError("must not page the API"))
 
         report = await mixin.find_departed_players(guild)
 
@@ -189,7 +203,7 @@ class TestGuardrails:
         assert report.departed == []
 
     async def test_aborts_when_too_much_of_the_league_looks_gone(self, mixin, guild):
-        mixin.paged_players = _paged([_make_league_player(i) for i in range(100, 200)])
+        mixin.player_pages = _paged([_make_league_player(i) for i in range(100, 200)])
         mixin._resolve_members_by_id.return_value = ([], list(range(100, 140)), [])
 
         report = await mixin.find_departed_players(guild)
@@ -201,7 +215,7 @@ class TestGuardrails:
     async def test_small_absolute_counts_are_not_blocked_by_the_ratio(self, mixin, guild):
         """A tiny league with two leavers crosses the ratio without being suspicious."""
         departed = list(range(100, 100 + AUDIT_ABORT_FLOOR - 1))
-        mixin.paged_players = _paged([_make_league_player(i) for i in range(100, 120)])
+        mixin.player_pages = _paged([_make_league_player(i) for i in range(100, 120)])
         mixin._resolve_members_by_id.return_value = ([], departed, [])
 
         report = await mixin.find_departed_players(guild)
@@ -212,7 +226,7 @@ class TestGuardrails:
 
 class TestAuditLoop:
     async def test_posts_a_report_and_retires_nobody(self, mixin, guild):
-        mixin.paged_players = _paged([_make_league_player(i) for i in range(100, 200)])
+        mixin.player_pages = _paged([_make_league_player(i) for i in range(100, 200)])
         mixin._resolve_members_by_id.return_value = ([], [100], [])
 
         report = await mixin.run_retire_audit(guild)
@@ -0,0 +1,224 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from rsc.abc import RSCMixIn
+from rsc.assets import RESOURCES_ROOT, Asset, AssetHost, attachment_expiry, fa_asset, load_asset, resource_asset, transaction_asset
+from rsc.enums import TransactionType
+
+EXPIRES_AT = 0x67A0F000
+
+
+def _create_mixin(**attrs):
+    saved = RSCMixIn.__abstractmethods__
+    RSCMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(RSCMixIn)
+    finally:
+        RSCMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+class FakeMessage:
+    def __init__(self, id, url):
+        self.id = id
+        self.attachments = [MagicMock(url=url)]
+
+
+class FakeChannel:
+    """Asset channel that hands out signed CDN links and counts uploads."""
+
+    def __init__(self, id=1000, expires_at=EXPIRES_AT, delay=0.0):
+        self.id = id
+        self.expires_at = expires_at
+        self.delay = delay
+        self.uploads: list[str] = []
+        self.fail = False
+
+    async def send(self, *, file: discord.File):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise discord.HTTPException(MagicMock(status=500), "Internal Server Error")
+        self.uploads.append(file.filename)
+        msg_id = len(self.uploads)
+        url = f"https://cdn.discordapp.com/attachments/{self.id}/{msg_id}/{file.filename}?ex={self.expires_at:x}&is=0&hm=abc"
+        return FakeMessage(msg_id, url)
+
+
+@pytest.fixture
+def asset():
+    return transaction_asset(TransactionType.PICKUP)
+
+
+@pytest.fixture
+def clock():
+    now = [EXPIRES_AT - 86400]
+    clock = MagicMock(side_effect=lambda: now[0])
+    clock.now = now
+    return clock
+
+
+# --- loading ---
+
+
+class TestLoadAsset:
+    def test_read_once(self):
+        assert transaction_asset(TransactionType.PICKUP) is transaction_asset(TransactionType.PICKUP)
+
+    def test_same_bytes_share_digest(self):
+        # Temporary FA contracts and substitutions use the same image
+        assert transaction_asset(TransactionType.TEMP_FA).digest == transaction_asset(TransactionType.SUBSTITUTION).digest
+        assert transaction_asset(TransactionType.TEMP_FA).digest != transaction_asset(TransactionType.PICKUP).digest
+
+    def test_fresh_file_per_call(self, asset):
+        first, second = asset.file(), asset.file()
+        assert first is not second
+        assert first.filename == second.filename == "Signed.png"
+        assert first.fp.read() == asset.data
+
+    def test_fa_asset(self):
+        assert fa_asset("Elite", tiny=True).name == "EliteFA_64x64.png"
+        assert fa_asset("NotATier") is None
+
+    def test_unhandled_transaction_type(self):
+        with pytest.raises(NotImplementedError):
+            transaction_asset(TransactionType.NONE)
+
+    def test_resource_asset(self):
+        asset = resource_asset("combines", "combines_login.png")
+        assert asset.name == "combines_login.png"
+        assert asset is load_asset(RESOURCES_ROOT / "combines" / "combines_login.png")
+
+
+class TestAttachmentExpiry:
+    def test_parses_hex_timestamp(self):
+        assert attachment_expiry(f"https://cdn.discordapp.com/a.png?ex={EXPIRES_AT:x}&is=0") == EXPIRES_AT
+
+    @pytest.mark.parametrize("url", ["https://cdn.discordapp.com/a.png", "https://cdn.discordapp.com/a.png?ex=zz"])
+    def test_unsigned(self, url):
+        assert attachment_expiry(url) is None
+
+
+# --- AssetHost ---
+
+
+class TestAssetHost:
+    async def test_uploads_once(self, asset, clock):
+        host = AssetHost(clock=clock)
+        channel = FakeChannel()
+
+        urls = {await host.url(channel, asset) for _ in range(10)}
+
+        assert len(urls) == 1
+        assert channel.uploads == ["Signed.png"]
+        assert host.uploads == 1
+
+    async def test_concurrent_callers_share_one_upload(self, asset, clock):
+        host = AssetHost(clock=clock)
+        channel = FakeChannel(delay=0.01)
+
+        urls = await asyncio.gather(*(host.url(channel, asset) for _ in range(20)))
+
+        assert len(set(urls)) == 1
+        assert len(channel.uploads) == 1
+
+    async def test_reuploads_before_expiry(self, asset, clock):
+        host = AssetHost(margin=3600, clock=clock)
+        channel = FakeChannel()
+
+        await host.url(channel, asset)
+        clock.now[0] = EXPIRES_AT - 3601
+        await host.url(channel, asset)
+        assert len(channel.uploads) == 1
+
+        # Inside the refresh margin
+        clock.now[0] = EXPIRES_AT - 60
+        await host.url(channel, asset)
+        assert len(channel.uploads) == 2
+
+    async def test_reuploads_after_delete(self, asset, clock):
+        host = AssetHost(clock=clock)
+        channel = FakeChannel()
+        other = fa_asset("Elite", tiny=True)
+
+        await host.url(channel, asset)
+        await host.url(channel, other)
+        host.forget_messages([1])
+        await host.url(channel, asset)
+        await host.url(channel, other)
+
+        assert channel.uploads == ["Signed.png", "EliteFA_64x64.png", "Signed.png"]
+
+    async def test_per_channel(self, asset, clock):
+        host = AssetHost(clock=clock)
+        first, second = FakeChannel(id=1), FakeChannel(id=2)
+
+        await host.url(first, asset)
+        await host.url(second, asset)
+        host.forget_channel(1)
+        await host.url(first, asset)
+        await host.url(second, asset)
+
+        assert len(first.uploads) == 2
+        assert len(second.uploads) == 1
+
+    async def test_failed_upload_is_retried(self, asset, clock):
+        host = AssetHost(clock=clock)
+        channel = FakeChannel()
+        channel.fail = True
+
+        assert await host.url(channel, asset) is None
+
+        channel.fail = False
+        assert await host.url(channel, asset)
+        assert len(channel.uploads) == 1
+
+
+# --- attach_asset ---
+
+
+class TestAttachAsset:
+    async def test_hosted(self, asset, clock):
+        channel = FakeChannel()
+        mixin = _create_mixin(_get_asset_channel=AsyncMock(return_value=channel), _asset_host=AssetHost(clock=clock))
+        files: list[discord.File] = []
+
+        url = await mixin.attach_asset(MagicMock(), asset, files)
+
+        assert url.startswith("https://cdn.discordapp.com/attachments/")
+        assert files == []
+
+    async def test_attached_without_asset_channel(self, asset):
+        mixin = _create_mixin(_get_asset_channel=AsyncMock(return_value=None))
+        files: list[discord.File] = []
+
+        assert await mixin.attach_asset(MagicMock(), asset, files) == "attachment://Signed.png"
+        assert [f.filename for f in files] == ["Signed.png"]
+
+    async def test_attached_when_upload_fails(self, asset, clock):
+        channel = FakeChannel()
+        channel.fail = True
+        mixin = _create_mixin(_get_asset_channel=AsyncMock(return_value=channel), _asset_host=AssetHost(clock=clock))
+        files: list[discord.File] = []
+
+        assert await mixin.attach_asset(MagicMock(), asset, files) == "attachment://Signed.png"
+        assert len(files) == 1
+
+    async def test_announcements_upload_once(self, clock):
+        channel = FakeChannel()
+        mixin = _create_mixin(_get_asset_channel=AsyncMock(return_value=channel), _asset_host=AssetHost(clock=clock))
+
+        for action in [TransactionType.CUT, TransactionType.PICKUP] * 50:
+            await mixin.attach_asset(MagicMock(), transaction_asset(action), [])
+
+        assert sorted(channel.uploads) == ["Released.png", "Signed.png"]
+
+
+def test_asset_repr_omits_data(asset):
+    assert "data" not in repr(asset)
+    assert isinstance(asset, Asset)
@@ -904,15 +904,15 @@ class TestBuildCandidates:
         assert candidates[0].data == b"bytes"
         assert candidates[0].label == "a.replay"
 
-    async def test_parsing_is_offloaded_to_a_thread(self):
+    async def test_parsing_is_offloaded_to_the_cpu_pool(self):
         attachment = MagicMock(spec=discord.Attachment)
         attachment.filename ="a.replay"
         attachment.read = AsyncMock(return_value=b"bytes")
 
-        with patch.object(process.asyncio, "to_thread", AsyncMock(return_value=_parsed("GUID-A"))) as to_thread:
+        with patch.object(process, "offload", AsyncMock(return_value=_parsed("GUID-A"))) as offload:
             await process.build_candidates([attachment])
 
-        to_thread.assert_awaited_once()
+        offload.assert_awaited_once_with(process._parse_bytes, b"bytes")
 
     async def test_unparseable_file_names_itself(self):
         attachment = MagicMock(spec=discord.Attachment)
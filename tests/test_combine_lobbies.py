@@ -0,0 +1,264 @@
+"""Tests for the combine lobby registry and paced teardown.
+
+Config is a dict-backed stand-in for the "Combines" group, shared between
+registries so a fresh registry reading it back is a restart. Guilds are fakes
+that serve channels by id and count deletes in flight.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from rsc.combines import lobbies as lobbies_module
+from rsc.combines.lobbies import CombineLobbyRegistry, LobbyRecord, LobbyTeardownScheduler, delete_channels
+from rsc.combines.runner import CombineRunnerMixIn
+
+GUILD_ID = 395806681994493964
+
+
+class FakeLobbies:
+    """The `Lobbies` value of one guild's "Combines" group."""
+
+    def __init__(self):
+        self.store: dict[str, dict] = {}
+        self.reads = 0
+        self.writes = 0
+
+    async def __call__(self):
+        self.reads += 1
+        return {k: dict(v) for k, v in self.store.items()}
+
+    async def set(self, value):
+        self.writes += 1
+        self.store = {k: dict(v) for k, v in value.items()}
+
+    async def set_raw(self, key, *, value):
+        self.writes += 1
+        self.store[key] = dict(value)
+
+
+class FakeConfig:
+    def __init__(self):
+        self.guilds: dict[str, FakeLobbies] = {}
+
+    def custom(self, group, guild_id):
+        assert group == "Combines"
+        return MagicMock(Lobbies=self.guilds.setdefault(guild_id, FakeLobbies()))
+
+
+class FakeGuild:
+    def __init__(self, id: int = GUILD_ID):
+        self.id = id
+        self.name = "RSC Combines"
+        self.live: dict[int, MagicMock] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.scans = 0
+        self.category = MagicMock()
+        self.category.name = "Combines"
+
+    def add_lobby(self, lobby_id: int) -> list[int]:
+        ids = []
+        for side in ("home", "away"):
+            cid = lobby_id * 10 + (1 if side == "home" else 2)
+            channel = MagicMock(spec=discord.VoiceChannel)
+            channel.id = cid
+            channel.name = f"Elite-{lobby_id}-{side}"
+            channel.category = self.category
+            channel.delete = AsyncMock(side_effect=self._deleter(cid))
+            self.live[cid] = channel
+            ids.append(cid)
+        return ids
+
+    def _deleter(self, cid: int):
+        async def delete(reason=None):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            if self.live.pop(cid, None) is None:
+                raise discord.NotFound(MagicMock(status=404), "Unknown Channel")
+
+        return delete
+
+    def get_channel(self, cid: int):
+        return self.live.get(cid)
+
+    @property
+    def channels(self):
+        self.scans += 1
+        return list(self.live.values())
+
+
+@pytest.fixture(autouse=True)
+def _no_pacing(monkeypatch):
+    monkeypatch.setattr(lobbies_module, "LOBBY_DELETE_PACING_DELAY", 0)
+
+
+@pytest.fixture
+def config():
+    return FakeConfig()
+
+
+@pytest.fixture
+def guild():
+    return FakeGuild()
+
+
+def _create_runner(**attrs):
+    saved = CombineRunnerMixIn.__abstractmethods__
+    CombineRunnerMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(CombineRunnerMixIn)
+    finally:
+        CombineRunnerMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+@pytest.fixture
+async def runner(config, guild):
+    bot = MagicMock()
+    bot.get_guild = MagicMock(side_effect=lambda id: guild if id == guild.id else None)
+    m = _create_runner(bot=bot, config=config)
+    yield m
+    await m.close_combine_teardown()
+
+
+async def _register(registry: CombineLobbyRegistry, guild: FakeGuild, lobby_ids) -> None:
+    for lobby_id in lobby_ids:
+        await registry.add(LobbyRecord(guild_id=guild.id, lobby_id=lobby_id, channel_ids=guild.add_lobby(lobby_id)))
+
+
+class TestRegistry:
+    async def test_survives_restart(self, config, guild):
+        registry = CombineLobbyRegistry(config)
+        await registry.add(LobbyRecord(guild_id=guild.id, lobby_id=7, channel_ids=[71, 72], announce_channel_id=5, announce_message_id=99))
+        await registry.mark_teardown(guild.id, 7, 1000.0)
+
+        restarted = CombineLobbyRegistry(config)
+
+        assert await restarted.get(guild.id, 7) == LobbyRecord(guild.id, 7, [71, 72], 5, 99, teardown_at=1000.0)
+        assert restarted.pending_teardowns(guild.id) == [await restarted.get(guild.id, 7)]
+
+    async def test_reads_config_once(self, config, guild):
+        registry = CombineLobbyRegistry(config)
+        await _register(registry, guild, range(3))
+
+        for lobby_id in range(3):
+            assert await registry.get(guild.id, lobby_id)
+
+        assert config.guilds[str(guild.id)].reads == 1
+
+    async def test_remove_is_one_write(self, config, guild):
+        registry = CombineLobbyRegistry(config)
+        await _register(registry, guild, range(100))
+        lobbies = config.guilds[str(guild.id)]
+        writes = lobbies.writes
+
+        removed = await registry.remove(guild.id, range(50))
+
+        assert len(removed) == 50
+        assert lobbies.writes == writes + 1
+        assert sorted(int(k) for k in lobbies.store) == list(range(50, 100))
+
+    async def test_unreadable_record_is_skipped(self, config, guild):
+        config.custom("Combines", str(guild.id)).Lobbies.store = {"bad": {}, "3": {"channel_ids": [31]}}
+
+        assert list(await CombineLobbyRegistry(config).load(guild.id)) == [3]
+
+
+class TestTeardown:
+    async def test_hundred_lobbies(self, runner, guild, config):
+        await _register(runner.combine_lobbies(), guild, range(100))
+
+        for lobby_id in range(100):
+            await runner.teardown_combine_lobby(guild, lobby_id, delay=0)
+        await runner._combine_teardown().run_due(time.time() + 1)
+
+        assert guild.live == {}
+        # Every lobby was found by id, never by walking the guild's channels
+        assert guild.scans == 0
+        assert guild.max_in_flight <= lobbies_module.LOBBY_DELETE_BATCH
+        assert await runner.combine_lobbies().load(guild.id) == {}
+        assert config.guilds[str(guild.id)].store == {}
+
+    async def test_waits_for_the_delay(self, runner, guild):
+        await _register(runner.combine_lobbies(), guild, [1, 2])
+
+        await runner.teardown_combine_lobby(guild, 1, delay=60)
+        await runner.teardown_combine_lobby(guild, 2, delay=0)
+        await asyncio.sleep(0.05)
+
+        assert sorted(guild.live) == [11, 12]
+        assert len(runner._combine_teardown()) == 1
+
+    async def test_resumes_after_restart(self, config, guild):
+        registry = CombineLobbyRegistry(config)
+        await _register(registry, guild, [1, 2, 3])
+        await registry.mark_teardown(guild.id, 1, time.time() - 5)
+        await registry.mark_teardown(guild.id, 2, time.time() + 60)
+
+        # The cog reloads before anything is deleted
+        bot = MagicMock()
+        bot.get_guild = MagicMock(return_value=guild)
+        restarted = _create_runner(bot=bot, config=config)
+        try:
+            await restarted.recover_combine_lobbies(guild)
+            await asyncio.sleep(0.05)
+        finally:
+            await restarted.close_combine_teardown()
+
+        assert sorted(guild.live) == [21, 22, 31, 32]
+        assert sorted(int(k) for k in config.guilds[str(guild.id)].store) == [2, 3]
+
+    async def test_stop_keeps_stamped_lobbies(self, runner, guild, config):
+        await _register(runner.combine_lobbies(), guild, [1])
+        await runner.teardown_combine_lobby(guild, 1, delay=60)
+
+        await runner.close_combine_teardown()
+
+        assert config.guilds[str(guild.id)].store["1"]["teardown_at"] is not None
+        assert sorted(guild.live) == [11, 12]
+
+    async def test_cleared_lobby_is_skipped(self, runner, guild):
+        await _register(runner.combine_lobbies(), guild, [1])
+        await runner.teardown_combine_lobby(guild, 1, delay=0)
+        # Combines stopped, and the rooms deleted with the category
+        await runner.combine_lobbies().clear(guild.id)
+
+        assert await runner._combine_teardown().run_due(time.time() + 1) == 0
+
+    async def test_lobby_from_before_the_registry(self, runner, guild):
+        guild.add_lobby(5)
+        guild.add_lobby(55)
+
+        await runner.teardown_combine_lobby(guild, 5, delay=0)
+        await runner._combine_teardown().run_due(time.time() + 1)
+
+        assert sorted(guild.live) == [551, 552]
+
+    async def test_unknown_guild_keeps_records(self, config, guild):
+        registry = CombineLobbyRegistry(config)
+        await _register(registry, guild, [1])
+        await registry.mark_teardown(guild.id, 1, 0.0)
+        scheduler = LobbyTeardownScheduler(registry, lambda id: None)
+        scheduler._heap.append((0.0, guild.id, 1))
+
+        assert await scheduler.run_due(1.0) == 0
+        assert await registry.get(guild.id, 1) is not None
+
+
+async def test_delete_channels_tolerates_missing(guild):
+    ids = guild.add_lobby(1)
+    channels = [guild.get_channel(c) for c in ids]
+    guild.live.pop(ids[0])
+    broken = MagicMock(spec=discord.VoiceChannel, id=9, delete=AsyncMock(side_effect=discord.Forbidden(MagicMock(status=403), "no")))
+    broken.name = "Elite-9-home"
+
+    assert await delete_channels([*channels, broken], reason="done") == 1
+    assert guild.live == {}
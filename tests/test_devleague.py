@@ -0,0 +1,170 @@
+"""Tests for the Dev League opt in/out registry.
+
+Config is a dict-backed stand-in for the "DevLeague" group whose writes yield
+to the event loop, so concurrent opt-ins interleave the way they would against
+a real Config driver.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from rsc.devleague import devleague as devleague_module
+from rsc.devleague.devleague import DevLeagueMixIn
+from rsc.devleague.registry import DevLeagueRegistry
+
+GUILD_ID = 395806681994493964
+
+
+class FakeMembers:
+    def __init__(self):
+        self.store: dict[str, bool] = {}
+        self.reads = 0
+        self.writes = 0
+
+    async def __call__(self):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return dict(self.store)
+
+    async def set(self, value):
+        self.writes += 1
+        await asyncio.sleep(0)
+        self.store = dict(value)
+
+    async def set_raw(self, key, *, value):
+        self.writes += 1
+        await asyncio.sleep(0)
+        self.store[key] = value
+
+
+class FakeLegacy:
+    def __init__(self, value=None):
+        self.value = value
+
+    async def __call__(self):
+        return list(self.value) if self.value is not None else None
+
+    async def clear(self):
+        self.value = None
+
+
+class FakeConfig:
+    def __init__(self):
+        self.groups: dict[str, MagicMock] = {}
+
+    def custom(self, group, guild_id):
+        assert group == "DevLeague"
+        if guild_id not in self.groups:
+            self.groups[guild_id] = MagicMock(DevLeagueMembers=FakeMembers(), DevLeagueRoleUsers=FakeLegacy())
+        return self.groups[guild_id]
+
+
+async def _edit_roles(*roles, reason=None):
+    pass
+
+
+def _member(member_id: int, guild_id: int = GUILD_ID):
+    # Plain objects, so building ten thousand of them stays cheap
+    return SimpleNamespace(id=member_id, guild=SimpleNamespace(id=guild_id), roles=[], add_roles=_edit_roles, remove_roles=_edit_roles)
+
+
+def _create_mixin(**attrs):
+    saved = DevLeagueMixIn.__abstractmethods__
+    DevLeagueMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(DevLeagueMixIn)
+    finally:
+        DevLeagueMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+@pytest.fixture
+def config():
+    return FakeConfig()
+
+
+@pytest.fixture
+def mixin(config, monkeypatch):
+    monkeypatch.setattr(devleague_module.utils, "get_devleague_role", AsyncMock(return_value=MagicMock(spec=discord.Role)))
+    return _create_mixin(config=config)
+
+
+class TestMigration:
+    async def test_legacy_list_is_moved_once(self, config):
+        group = config.custom("DevLeague", str(GUILD_ID))
+        group.DevLeagueRoleUsers.value = [1, 2, 3, 2]
+
+        assert await DevLeagueRegistry(config).load(GUILD_ID) == {1, 2, 3}
+        assert group.DevLeagueMembers.store == {"1": True, "2": True, "3": True}
+        assert group.DevLeagueRoleUsers.value is None
+
+        # A restart reads the new format only
+        writes = group.DevLeagueMembers.writes
+        assert await DevLeagueRegistry(config).load(GUILD_ID) == {1, 2, 3}
+        assert group.DevLeagueMembers.writes == writes
+
+    async def test_concurrent_first_use_migrates_once(self, config):
+        group = config.custom("DevLeague", str(GUILD_ID))
+        group.DevLeagueRoleUsers.value = [1, 2]
+        registry = DevLeagueRegistry(config)
+
+        results = await asyncio.gather(*(registry.load(GUILD_ID) for _ in range(20)))
+
+        assert all(r is results[0] for r in results)
+        assert group.DevLeagueMembers.reads == 1
+        assert group.DevLeagueMembers.writes == 1
+
+
+class TestRegistry:
+    async def test_should_get_role_reads_config_once(self, mixin, config):
+        config.custom("DevLeague", str(GUILD_ID)).DevLeagueMembers.store = {"5": True}
+
+        results = [await mixin.should_get_devleague_role(_member(i)) for i in range(1000)]
+
+        assert results.count(False) == 1
+        assert not results[5]
+        assert config.groups[str(GUILD_ID)].DevLeagueMembers.reads == 1
+
+    async def test_concurrent_opt_ins_and_outs(self, mixin, config):
+        members = [_member(i) for i in range(200)]
+        # Every member clicks twice, half opting in and half out, all at once
+        calls = [(mixin.add_devleague_role if m.id % 2 else mixin.remove_devleague_role)(m) for m in members for _ in range(2)]
+
+        await asyncio.gather(*calls)
+
+        stored = config.groups[str(GUILD_ID)].DevLeagueMembers
+        assert set(stored.store) == {str(m.id) for m in members}
+        # One write per member, not per click and not a whole list rewrite
+        assert stored.writes == 200
+        assert stored.reads == 1
+        assert await mixin.devleague_registry().filter_eligible(members) == []
+
+    async def test_add_reports_new_members(self, config):
+        registry = DevLeagueRegistry(config)
+
+        assert await registry.add(GUILD_ID, 1)
+        assert not await registry.add(GUILD_ID, 1)
+
+    async def test_filter_eligible_ten_thousand(self, config):
+        group = config.custom("DevLeague", str(GUILD_ID))
+        group.DevLeagueMembers.store = {str(i): True for i in range(0, 10_000, 3)}
+        members = [_member(i) for i in range(10_000)]
+
+        eligible = await DevLeagueRegistry(config).filter_eligible(members)
+
+        assert [m.id for m in eligible] == [i for i in range(10_000) if i % 3]
+        assert group.DevLeagueMembers.reads == 1
+
+    async def test_filter_eligible_per_guild(self, config):
+        config.custom("DevLeague", "1").DevLeagueMembers.store = {"7": True}
+        members = [_member(7, guild_id=1), _member(7, guild_id=2), _member(8, guild_id=1)]
+
+        eligible = await DevLeagueRegistry(config).filter_eligible(members)
+
+        assert [(m.guild.id, m.id) for m in eligible] == [(2, 7), (1, 8)]
@@ -0,0 +1,212 @@
+"""Tests for the in-memory franchise lookup index.
+
+Built from `data/franchises.json`, a real 32 franchise `FranchiseList` response
+from staging, so the GM names exercise the same punctuation and casing the
+trade parser sees in production.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+from rscapi.models.franchise_list import FranchiseList
+
+from rsc.enums import EventAction, EventCategory
+from rsc.events.handlers import EVENT_HANDLERS, handle_object_changed
+from rsc.events.models import LeagueEventData
+from rsc.franchises.franchises import FranchiseMixIn
+from rsc.franchises.index import FranchiseIndex, FranchiseIndexEntry, normalize_name
+
+DATA = Path(__file__).parent.parent / "data" / "franchises.json"
+
+
+def _load_franchises() -> list[FranchiseList]:
+    return [FranchiseList.from_dict(f) for f in json.loads(DATA.read_text())]
+
+
+def _create_mixin(**attrs):
+    """Create a FranchiseMixIn instance bypassing ABC restrictions."""
+    saved = FranchiseMixIn.__abstractmethods__
+    FranchiseMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(FranchiseMixIn)
+    finally:
+        FranchiseMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+def _entry(fid: int, name: str, gm_name: str, gm_id: int, prefix: str = "XX") -> FranchiseIndexEntry:
+    return FranchiseIndexEntry(id=fid, name=name, prefix=prefix, gm_id=gm_id, gm_name=gm_name)
+
+
+def _member(discord_id: int, display_name: str) -> MagicMock:
+    m = MagicMock(spec=discord.Member)
+    m.id = discord_id
+    m.display_name = display_name
+    return m
+
+
+class TestNormalizeName:
+    def test_strips_prefix_and_accolades(self):
+        assert normalize_name("TQD | Wheelchair {LFLegs} 🏆🏆") == "wheelchair {lflegs}"
+
+    def test_keeps_pipe_inside_long_name(self):
+        assert normalize_name("Santiago | Kreiker") == "santiago | kreiker"
+
+
+class TestFranchiseIndex:
+    def test_builds_from_fixture(self):
+        index = FranchiseIndex.from_franchises(_load_franchises())
+
+        assert len(index) == 32
+        assert index.by_gm(226558249204187140).name == "The Shadows"
+        assert index.by_name("the shadows").id == 13
+        assert index.by_prefix("<0>").name == "The Shadows"
+        assert "Despair" in index.by_id(13).teams
+        assert index.by_id(13).logo == "https://staging-api.rscna.com/media/franchises/13/The_Shadows.png"
+
+    def test_skips_franchise_without_id(self):
+        f = MagicMock(spec=FranchiseList)
+        f.id = None
+        f.name = "Ghost"
+        assert len(FranchiseIndex.from_franchises([f])) == 0
+
+    def test_updated_replaces_one_entry(self):
+        index = FranchiseIndex([_entry(1, "A", "nick", 10), _entry(2, "B", "nickm", 20)])
+
+        updated = index.updated(1, logo="https://cdn.example.com/a.png")
+
+        assert updated.by_gm(10).logo == "https://cdn.example.com/a.png"
+        assert updated.by_id(2) is index.by_id(2)
+        assert index.by_id(1).logo is None
+        assert index.updated(3, logo="x") is index
+
+    def test_match_gm_by_rsc_name(self):
+        index = FranchiseIndex.from_franchises(_load_franchises())
+        assert [e.name for e in index.match_gm("Nehtaro")] == ["The Shadows"]
+
+    def test_match_gm_by_prefix_of_name(self):
+        index = FranchiseIndex.from_franchises(_load_franchises())
+        assert [e.name for e in index.match_gm("tuxedo")] == ["Cheese Guild"]
+
+    def test_match_gm_by_franchise_name_and_prefix(self):
+        index = FranchiseIndex.from_franchises(_load_franchises())
+        assert [e.id for e in index.match_gm("Minty Fresh")] == [10]
+        assert [e.id for e in index.match_gm("CHZ")] == [1]
+
+    def test_exact_match_beats_prefix_match(self):
+        index = FranchiseIndex([_entry(1, "A", "nick", 10), _entry(2, "B", "nickm", 20)])
+        assert [e.id for e in index.match_gm("nick")] == [1]
+
+    def test_ambiguous_prefix_returns_every_candidate(self):
+        index = FranchiseIndex([_entry(1, "A", "nickm", 10), _entry(2, "B", "nicky", 20)])
+        assert {e.id for e in index.match_gm("nick")} == {1, 2}
+
+    def test_match_gm_uses_live_nickname(self, mock_guild):
+        index = FranchiseIndex([_entry(1, "A", "OldName", 10)])
+        mock_guild.get_member = MagicMock(return_value=_member(10, "AAA | NewName"))
+
+        assert [e.id for e in index.match_gm("newname", guild=mock_guild)] == [1]
+        assert index.match_gm("newname") == []
+
+    def test_no_match(self):
+        index = FranchiseIndex.from_franchises(_load_franchises())
+        assert index.match_gm("nobody at all") == []
+
+
+class TestFranchiseIndexCache:
+    def _mixin(self, guild):
+        return _create_mixin(
+            _api_conf={guild.id: MagicMock()},
+            _league={guild.id: 1},
+            _franchise_cache={},
+        )
+
+    async def _call_franchises(self, mixin, guild, flist, **kwargs):
+        with patch("rsc.abc.ApiClient"):
+            mock_api = AsyncMock()
+            mock_api.franchises_list.return_value = flist
+            with patch("rsc.franchises.franchises.FranchisesApi", return_value=mock_api):
+                await mixin.franchises(guild, **kwargs)
+
+    async def test_full_refresh_builds_index(self, mock_guild):
+        mixin = self._mixin(mock_guild)
+        await self._call_franchises(mixin, mock_guild, _load_franchises())
+
+        assert len(mixin._franchise_index[mock_guild.id]) == 32
+
+    async def test_filtered_query_leaves_index_alone(self, mock_guild):
+        mixin = self._mixin(mock_guild)
+        await self._call_franchises(mixin, mock_guild, _load_franchises()[:1], name="The Shadows")
+
+        assert mock_guild.id not in getattr(mixin, "_franchise_index", {})
+
+    async def test_index_is_built_once(self, mock_guild):
+        mixin = self._mixin(mock_guild)
+        flist = _load_franchises()
+
+        async def fake_franchises(guild, **kwargs):
+            mixin._franchise_index[guild.id] = FranchiseIndex.from_franchises(flist)
+            return flist
+
+        mixin._franchise_index = {}
+        mixin.franchises = AsyncMock(side_effect=fake_franchises)
+
+        first = await mixin.franchise_index(mock_guild)
+        second = await mixin.franchise_index(mock_guild)
+
+        assert first is second
+        mixin.franchises.assert_awaited_once()
+
+    async def test_invalidate_forces_rebuild(self, mock_guild):
+        mixin = self._mixin(mock_guild)
+        flist = _load_franchises()
+
+        async def fake_franchises(guild, **kwargs):
+            mixin._franchise_index[guild.id] = FranchiseIndex.from_franchises(flist)
+            return flist
+
+        mixin._franchise_index = {}
+        mixin.franchises = AsyncMock(side_effect=fake_franchises)
+
+        await mixin.franchise_index(mock_guild)
+        mixin.invalidate_franchise_index(mock_guild)
+        await mixin.franchise_index(mock_guild)
+
+        assert mixin.franchises.await_count == 2
+
+    async def test_rebrand_invalidates_index(self, mock_guild):
+        mixin = self._mixin(mock_guild)
+        mixin._franchise_index = {mock_guild.id: FranchiseIndex(())}
+
+        with patch("rsc.abc.ApiClient"):
+            mock_api = AsyncMock()
+            with patch("rsc.franchises.franchises.FranchisesApi", return_value=mock_api):
+                await mixin.rebrand_franchise(mock_guild, 1, MagicMock())
+
+        assert mock_guild.id not in mixin._franchise_index
+
+
+class TestObjectEventInvalidation:
+    def test_registered_for_object_actions(self):
+        for action in (EventAction.NAME_CHANGE, EventAction.TRANSFER, EventAction.UPDATE):
+            assert EVENT_HANDLERS[action] is handle_object_changed
+
+    async def test_object_event_invalidates(self, mock_guild):
+        cog = MagicMock()
+        event = LeagueEventData(id=1, category=EventCategory.OBJECT.value, action=EventAction.TRANSFER.value)
+
+        await handle_object_changed(cog, mock_guild, event)
+
+        cog.invalidate_franchise_index.assert_called_once_with(mock_guild)
+
+    async def test_other_category_is_ignored(self, mock_guild):
+        cog = MagicMock()
+        event = LeagueEventData(id=1, category=EventCategory.TRANSACTION.value, action=EventAction.UPDATE.value)
+
+        await handle_object_changed(cog, mock_guild, event)
+
+        cog.invalidate_franchise_index.assert_not_called()
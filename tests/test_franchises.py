@@ -11,6 +11,7 @@ from rscapi.models.rebrand_a_franchise import RebrandAFranchise
 from rsc.const import API_TIMEOUT
 from rsc.exceptions import RscException
 from rsc.franchises.franchises import FranchiseMixIn
+from rsc.franchises.index import FranchiseIndex, FranchiseIndexEntry
 
 GUILD_ID = 395806681994493964
 
@@ -503,6 +504,26 @@ class TestUploadFranchiseLogoApi:
 
         assert result is f
 
+    async def test_upload_patches_index(self, mock_guild):
+        f = MagicMock(spec=Franchise)
+        f.logo = "https://cdn.example.com/new.png"
+        old = FranchiseIndexEntry(id=1, name="Eagles", prefix="EGL", gm_id=999, gm_name="GM", logo="https://cdn.example.com/old.png")
+        other = FranchiseIndexEntry(id=2, name="Tigers", prefix="TGR", gm_id=998, gm_name="GM2")
+        mixin = _create_mixin(_api_conf={mock_guild.id: MagicMock()}, _franchise_index={mock_guild.id: FranchiseIndex([old, other])})
+
+        with patch("rsc.abc.ApiClient") as mock_client:
+            mock_api = AsyncMock()
+            mock_api.franchises_upload_logo_update.return_value = f
+            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
+            with patch("rsc.franchises.franchises.FranchisesApi", return_value=mock_api):
+                await mixin.upload_franchise_logo(mock_guild, id=1, logo=b"fake data")
+
+        index = mixin._franchise_index[mock_guild.id]
+        assert index.by_id(1).logo == "https://cdn.example.com/new.png"
+        assert index.by_name("eagles").logo == "https://cdn.example.com/new.png"
+        assert index.by_id(2) == other
+
     async def test_raises_rsc_exception_on_api_error(self, mock_guild):
         mixin = _create_mixin(_api_conf={mock_guild.id: MagicMock()})
 
@@ -612,6 +633,7 @@ class TestFranchiseLogoApi:
     async def test_returns_full_logo_url(self, mock_guild):
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
+            _franchise_index={mock_guild.id: FranchiseIndex(())},
             _get_api_url=AsyncMock(return_value="https://api.example.com/api/v1/"),
         )
         logo_mock = MagicMock()
@@ -630,6 +652,7 @@ class TestFranchiseLogoApi:
     async def test_returns_none_when_no_host(self, mock_guild):
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
+            _franchise_index={mock_guild.id: FranchiseIndex(())},
             _get_api_url=AsyncMock(return_value=None),
         )
         result = await mixin.franchise_logo(mock_guild, 1)
@@ -638,6 +661,7 @@ class TestFranchiseLogoApi:
     async def test_returns_none_when_no_logo(self, mock_guild):
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
+            _franchise_index={mock_guild.id: FranchiseIndex(())},
             _get_api_url=AsyncMock(return_value="https://api.example.com/"),
         )
         logo_mock = MagicMock()
@@ -656,6 +680,7 @@ class TestFranchiseLogoApi:
     async def test_returns_none_on_not_found(self, mock_guild):
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
+            _franchise_index={mock_guild.id: FranchiseIndex(())},
             _get_api_url=AsyncMock(return_value="https://api.example.com/"),
         )
 
@@ -672,6 +697,7 @@ class TestFranchiseLogoApi:
     async def test_raises_rsc_exception_on_api_error(self, mock_guild):
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
+            _franchise_index={mock_guild.id: FranchiseIndex(())},
             _get_api_url=AsyncMock(return_value="https://api.example.com/"),
         )
 
@@ -684,6 +710,33 @@ class TestFranchiseLogoApi:
                 with pytest.raises(RscException):
                     await mixin.franchise_logo(mock_guild, 1)
 
+    async def test_served_from_index(self, mock_guild):
+        entry = FranchiseIndexEntry(id=1, name="Eagles", prefix="EGL", gm_id=999, gm_name="GM", logo="https://cdn.example.com/eagles.png")
+        mixin = _create_mixin(
+            _franchise_index={mock_guild.id: FranchiseIndex([entry])},
+            _get_api_url=AsyncMock(return_value="https://api.example.com/"),
+            api_client=MagicMock(),
+        )
+
+        assert await mixin.franchise_logo(mock_guild, 1) == "https://cdn.example.com/eagles.png"
+        mixin.api_client.assert_not_called()
+        mixin._get_api_url.assert_not_awaited()
+
+    async def test_indexed_relative_logo_joins_host(self, mock_guild):
+        entries = [
+            FranchiseIndexEntry(id=1, name="Eagles", prefix="EGL", gm_id=999, gm_name="GM", logo="/media/logos/eagles.png"),
+            FranchiseIndexEntry(id=2, name="Tigers", prefix="TGR", gm_id=998, gm_name="GM2"),
+        ]
+        mixin = _create_mixin(
+            _franchise_index={mock_guild.id: FranchiseIndex(entries)},
+            _get_api_url=AsyncMock(return_value="https://api.example.com/api/v1/"),
+            api_client=MagicMock(),
+        )
+
+        assert await mixin.franchise_logo(mock_guild, 1) == "https://api.example.com/media/logos/eagles.png"
+        assert await mixin.franchise_logo(mock_guild, 2) is None
+        mixin.api_client.assert_not_called()
+
 
 # --- AGM management ---
 
@@ -750,6 +803,27 @@ class TestAddAgmApi:
                     await mixin.add_agm(mock_guild, 7, agm=mock_member, executor=222)
 
 
+    async def test_writes_the_new_agms_through_to_the_index(self, mock_guild):
+        """`/admin agm add` builds the index before the change, and the franchise
+        teams embed reads AGMs from it."""
+        f = MagicMock(spec=Franchise)
+        f.agms = [_agm_member(333), _agm_member(111)]
+        entry = FranchiseIndexEntry(id=7, name="The Ocean", prefix="OCN", gm_id=999, gm_name="GM", agm_ids=(333,))
+        mixin = _create_mixin(
+            _api_conf={mock_guild.id: MagicMock()}, _league={mock_guild.id: 1}, _franchise_index={mock_guild.id: FranchiseIndex([entry])}
+        )
+
+        with patch("rsc.abc.ApiClient") as mock_client:
+            mock_api = AsyncMock()
+            mock_api.franchises_add_agm_update.return_value = f
+            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
+            with patch("rsc.franchises.franchises.FranchisesApi", return_value=mock_api):
+                await mixin.add_agm(mock_guild, 7, agm=111, executor=222)
+
+        assert mixin._franchise_index[mock_guild.id].by_id(7).agm_ids == (333, 111)
+
+
 class TestRemoveAgmApi:
     async def test_posts_discord_ids_for_both_members(self, mock_guild, mock_member):
         f = MagicMock(spec=Franchise)
@@ -768,6 +842,24 @@ class TestRemoveAgmApi:
         assert kwargs["id"] == 7
         assert kwargs["franchise_agm_request"].to_dict() == {"agm": mock_member.id, "executor": 222}
 
+    async def test_writes_the_new_agms_through_to_the_index(self, mock_guild):
+        f = MagicMock(spec=Franchise)
+        f.agms = [_agm_member(333)]
+        entry = FranchiseIndexEntry(id=7, name="The Ocean", prefix="OCN", gm_id=999, gm_name="GM", agm_ids=(333, 111))
+        mixin = _create_mixin(
+            _api_conf={mock_guild.id: MagicMock()}, _league={mock_guild.id: 1}, _franchise_index={mock_guild.id: FranchiseIndex([entry])}
+        )
+
+        with patch("rsc.abc.ApiClient") as mock_client:
+            mock_api = AsyncMock()
+            mock_api.franchises_remove_agm_update.return_value = f
+            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
+            with patch("rsc.franchises.franchises.FranchisesApi", return_value=mock_api):
+                await mixin.remove_agm(mock_guild, 7, agm=111, executor=222)
+
+        assert mixin._franchise_index[mock_guild.id].by_id(7).agm_ids == (333,)
+
     async def test_raises_rsc_exception_with_status_on_404(self, mock_guild, mock_member):
         """`/admin agm remove` keys "already gone" off the 404 status, so it has
         to survive the wrapper."""
@@ -85,38 +85,42 @@ class TestDrawProgressBar:
         assert render((0, 102, 153)) != render((153, 102, 0))
 
 
-class TestGetProgressBar:
-    def test_returns_a_readable_discord_file(self):
-        # getProgressBar builds the buffer inside a `with io.BytesIO()` block and
-        # returns a File wrapping it. That only survives because discord.File
-        # stubs out fp.close(). If that ever changes the buffer arrives closed.
-        f = images.getProgressBar(x=10, y=10, w=225, h=30, progress=0.5)
+class TestProgressBar:
+    async def test_returns_a_readable_discord_file(self):
+        # discord.File stubs out fp.close(), so the buffer stays readable after
+        # it is handed over. If that ever changes the buffer arrives closed.
+        f = await images.progress_bar(x=10, y=10, w=225, h=30, progress=0.5)
 
         assert isinstance(f, discord.File)
         assert not f.fp.closed
         assert _file_bytes(f)
 
-    def test_output_is_a_valid_png(self):
-        f = images.getProgressBar(x=10, y=10, w=225, h=30, progress=0.5)
+    async def test_output_is_a_valid_png(self):
+        f = await images.progress_bar(x=10, y=10, w=225, h=30, progress=0.5)
 
         img = _open(_file_bytes(f))
         assert img.format == "PNG"
         assert img.size == (275, 50)
         assert img.mode == "RGBA"
 
-    def test_filename_matches_the_embed_attachment_url(self):
+    async def test_filename_matches_the_embed_attachment_url(self):
         # rsc/admin/sync.py points its embed at `attachment://progress.jpeg`, so
         # the name is load bearing even though the payload is really a PNG.
-        assert images.getProgressBar(x=10, y=10, w=225, h=30).filename == "progress.jpeg"
+        assert (await images.progress_bar(x=10, y=10, w=225, h=30)).filename == "progress.jpeg"
 
-    def test_renders_across_the_whole_progress_range(self):
-        rendered = [
-            _open(_file_bytes(images.getProgressBar(x=10, y=10, w=225, h=30, progress=p, progress_bounds=(int(p * 100), 100)))).tobytes()
-            for p in (0.0, 0.5, 1.0)
-        ]
+    async def test_renders_across_the_whole_progress_range(self):
+        rendered = []
+        for p in (0.0, 0.5, 1.0):
+            f = await images.progress_bar(x=10, y=10, w=225, h=30, progress=p, progress_bounds=(int(p * 100), 100))
+            rendered.append(_open(_file_bytes(f)).tobytes())
 
         assert len(set(rendered)) == 3
 
+    async def test_matches_rendering_on_the_calling_thread(self):
+        f = await images.progress_bar(x=10, y=10, w=225, h=30, progress=0.5)
+
+        assert _file_bytes(f) == images.render_progress_bar(x=10, y=10, w=225, h=30, progress=0.5)
+
 
 class TestResizeImage:
     async def test_resizes_to_the_requested_dimensions(self):
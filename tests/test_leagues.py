@@ -284,6 +284,7 @@ class TestUpdateLeaguePlayer:
         mixin = _create_mixin(
             _api_conf={mock_guild.id: MagicMock()},
             _league={mock_guild.id: 1},
+            membership_audit=MagicMock(),
         )
 
         with patch("rsc.abc.ApiClient") as mock_client:
@@ -300,3 +301,4 @@ class TestUpdateLeaguePlayer:
                 )
 
         assert result is updated
+        mixin.membership_audit().invalidate.assert_called_once_with(mock_guild.id)
@@ -0,0 +1,315 @@
+"""Tests for the shared answer cache for repeated agent questions.
+
+Questions go through `LLMMixIn.answer_with_agent` with a fake OpenAI client
+scripted per question, so a hit is visible as a question that never reached
+the model.
+"""
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rsc.llm import rulebook
+from rsc.llm.agent.answers import AnswerCache, answer_key, normalize_question
+from rsc.llm.agent.context import AgentContext, UserIdentity
+from rsc.llm.agent.loop import AgentResult
+from rsc.llm.agent.registry import TOOLS, AgentTool
+from rsc.llm.config import ANSWER_CACHE_TTL, API_CACHE_TTL
+from rsc.llm.llm import LLMMixIn
+from rsc.llm.rulebook import load_rulebooks
+
+NOW = datetime(2026, 8, 10, 12, 0, tzinfo=UTC)
+ASKER = UserIdentity(name="nickm", discord_id=100, team="Bulls", franchise="Chicago", tier="Elite")
+
+
+def fn_call(name: str, args: dict) -> SimpleNamespace:
+    return SimpleNamespace(type="function_call", name=name, arguments=json.dumps(args), call_id=f"call_{name}")
+
+
+def fake_response(output: list, text: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        output=output,
+        output_text=text,
+        usage=SimpleNamespace(
+            input_tokens=100,
+            output_tokens=20,
+            total_tokens=120,
+            input_tokens_details=SimpleNamespace(cached_tokens=0),
+            output_tokens_details=SimpleNamespace(reasoning_tokens=0),
+        ),
+    )
+
+
+class FakeModel:
+    """Answers every question by calling `tool` with `args`, then replying `answer`."""
+
+    def __init__(self):
+        self.calls = 0
+        self.tool = "rules_tool"
+        self.args: dict = {}
+        self.answer = "Rule 5.7.3 says no."
+        self.responses = SimpleNamespace(create=self.create)
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if kwargs["input"][-1].get("type") == "function_call_output":
+            return fake_response([], self.answer)
+        return fake_response([fn_call(self.tool, self.args)])
+
+
+@pytest.fixture(autouse=True)
+async def _rulebooks():
+    await load_rulebooks()
+
+
+@pytest.fixture(autouse=True)
+def tools():
+    async def rules_tool(ctx, **kwargs):
+        ctx.cite("Rulebook 5.7.3")
+        return "5.7.3 No substitutes in playoffs."
+
+    async def roster_tool(ctx, **kwargs):
+        return "Bulls: a, b, c"
+
+    async def schedule_tool(ctx, **kwargs):
+        return "Next match Tuesday."
+
+    async def me_tool(ctx, **kwargs):
+        return "nickm plays for the Bulls."
+
+    flags = {
+        "rules_tool": (rules_tool, {"static": True}),
+        "roster_tool": (roster_tool, {"cacheable": True}),
+        "schedule_tool": (schedule_tool, {}),
+        "me_tool": (me_tool, {"personal": True}),
+    }
+    for name, (handler, kwargs) in flags.items():
+        TOOLS[name] = AgentTool(
+            name=name,
+            description="test tool",
+            parameters={"type": "object", "properties": {}, "required": []},
+            handler=handler,
+            **kwargs,
+        )
+    yield
+    for name in flags:
+        TOOLS.pop(name, None)
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+@pytest.fixture
+def cog(model, monkeypatch, mock_guild):
+    async def context(cog, guild, member, *, client, surface, cache, now):
+        return AgentContext(cog=cog, guild=guild, client=client, now=now, identity=ASKER, surface=surface, cache=cache)
+
+    monkeypatch.setattr("rsc.llm.llm.check_budget", AsyncMock(return_value=SimpleNamespace(allowed=True)))
+    monkeypatch.setattr("rsc.llm.llm.is_budget_exempt", MagicMock(return_value=True))
+    monkeypatch.setattr("rsc.llm.llm.build_agent_context", context)
+
+    saved = LLMMixIn.__abstractmethods__
+    LLMMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(LLMMixIn)
+    finally:
+        LLMMixIn.__abstractmethods__ = saved
+    m.get_llm_credentials = AsyncMock(return_value=(None, "sk-test"))
+    m.timezone = AsyncMock(return_value=UTC)
+    m._get_llm_user_daily_cap = AsyncMock(return_value=0)
+    m._get_llm_guild_daily_cap = AsyncMock(return_value=0)
+    m._llm_cooldown = MagicMock()
+    m._llm_tool_cache = None
+    m._llm_usage = MagicMock(record=AsyncMock())
+    m.llm_client = MagicMock(return_value=model)
+    return m
+
+
+async def ask(cog, guild, question: str) -> str:
+    return await cog.answer_with_agent(guild, MagicMock(id=100), question, surface="slash")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_normalize_question():
+    assert normalize_question("  Can a SUB play in playoffs?? ") == "can a sub play in playoffs"
+    assert normalize_question("What does rule 5.7.3 say?") == "what does rule 5.7.3 say"
+    assert normalize_question("Who’s the co-captain… of the Bulls!") == "who's the co-captain of the bulls"
+
+
+class TestAnswerCache:
+    async def test_repeat_is_served_without_the_model(self, cog, model, mock_guild):
+        first = await ask(cog, mock_guild, "Can a sub play in playoffs?")
+        second = await ask(cog, mock_guild, "can a sub play in PLAYOFFS")
+
+        assert first == second == "Rule 5.7.3 says no."
+        assert model.calls == 2
+        # A hit is not counted as a question against the daily caps
+        assert cog._llm_usage.record.await_count == 1
+
+    async def test_hit_keeps_citations(self, cog, mock_guild):
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+
+        cached = cog.llm_answers().get(answer_key(mock_guild.id, "can a sub play in playoffs"))
+
+        assert cached.citations == ["Rulebook 5.7.3"]
+        assert cached.tools_called == ["rules_tool"]
+
+    async def test_different_question_misses(self, cog, model, mock_guild):
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+        await ask(cog, mock_guild, "Can a sub play in the regular season?")
+
+        assert model.calls == 4
+
+    async def test_scoped_per_guild(self, cog, model, mock_guild):
+        other = MagicMock()
+        other.id = mock_guild.id + 1
+
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+        await ask(cog, other, "Can a sub play in playoffs?")
+
+        assert model.calls == 4
+
+    async def test_prompt_version_invalidates(self, cog, model, mock_guild, monkeypatch):
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+        monkeypatch.setattr("rsc.llm.agent.answers.PROMPT_VERSION", 2)
+
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+
+        assert model.calls == 4
+
+    async def test_rulebook_change_invalidates(self, cog, model, mock_guild, monkeypatch):
+        await ask(cog, mock_guild, "Can a sub play in playoffs?")
+        monkeypatch.setattr(rulebook, "_HASH", "rules-updated")
+        model.answer = "Rule 5.7.3 now says yes."
+
+        assert await ask(cog, mock_guild, "Can a sub play in playoffs?") == "Rule 5.7.3 now says yes."
+        assert model.calls == 4
+
+    @pytest.mark.parametrize(
+        ("tool", "args"),
+        [
+            # Looked the asker up directly
+            ("me_tool", {"me": True}),
+            # Read intraday data that is never cached
+            ("schedule_tool", {}),
+            # "my team" resolved to the asker's team from the identity line
+            ("roster_tool", {"team": "Bulls"}),
+            ("roster_tool", {"discord_id": 100}),
+        ],
+    )
+    async def test_identity_dependent_answers_are_not_shared(self, cog, model, mock_guild, tool, args):
+        model.tool, model.args = tool, args
+
+        await ask(cog, mock_guild, "Who is on my team?")
+        await ask(cog, mock_guild, "Who is on my team?")
+
+        assert model.calls == 4
+        assert len(cog.llm_answers()) == 0
+
+    async def test_first_person_question_is_not_shared(self, cog, model, mock_guild):
+        # The answer leans on the asker's tier without naming it
+        model.answer = "Your tier's salary cap is 620."
+
+        await ask(cog, mock_guild, "What is the cap for my tier?")
+        await ask(cog, mock_guild, "What is the cap for my tier?")
+
+        assert model.calls == 4
+        assert len(cog.llm_answers()) == 0
+
+    async def test_named_team_is_shared(self, cog, model, mock_guild):
+        model.tool, model.args = "roster_tool", {"team": "Bulls"}
+
+        await ask(cog, mock_guild, "Who plays for the Bulls?")
+        await ask(cog, mock_guild, "who plays for the bulls")
+
+        assert model.calls == 2
+
+    async def test_agent_error_is_not_cached(self, cog, model, mock_guild):
+        model.answer = ""
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="could not come up with an answer"):
+                await ask(cog, mock_guild, "Can a sub play in playoffs?")
+
+        assert model.calls == 4
+        assert len(cog.llm_answers()) == 0
+
+
+class TestAnswerTTL:
+    def _ctx(self, mock_guild, *names):
+        ctx = AgentContext(cog=MagicMock(), guild=mock_guild, client=MagicMock(), now=NOW, identity=ASKER)
+        for name in names:
+            ctx.tools_called.record(name)
+        return ctx
+
+    def test_rules_only_answers_last_longer(self, mock_guild):
+        cache = AnswerCache()
+        result = AgentResult(answer="x", tools_called=["rules_tool"])
+
+        assert cache.store(self._ctx(mock_guild, "rules_tool"), "q", result)
+        assert cache.store(self._ctx(mock_guild, "rules_tool", "roster_tool"), "q2", result)
+
+        expiries = sorted(expires for expires, _ in cache._entries.values())
+        assert expiries[1] - expiries[0] == pytest.approx(ANSWER_CACHE_TTL - API_CACHE_TTL, abs=1)
+
+    def test_answer_without_tools_is_not_shared(self, mock_guild):
+        # It may have come from the "Asked by" line alone
+        assert not AnswerCache().store(self._ctx(mock_guild), "what team am i on", AgentResult(answer="Bulls"))
+
+    def test_answer_tailored_to_the_asker_is_not_shared(self, mock_guild):
+        ctx = self._ctx(mock_guild, "rules_tool")
+        result = AgentResult(answer="For your tier (Elite) the cap is 620.")
+
+        assert not AnswerCache().store(ctx, "what's the salary cap", result)
+
+    @pytest.mark.parametrize("question", ["what's my cap", "can i sub", "am I eligible", "I'm on waivers, now what", "is this mine"])
+    def test_first_person_question_is_not_shared(self, mock_guild, question):
+        ctx = self._ctx(mock_guild, "rules_tool")
+
+        assert not AnswerCache().store(ctx, question, AgentResult(answer="The cap is 620."))
+
+    def test_answer_may_repeat_what_the_question_named(self, mock_guild):
+        ctx = self._ctx(mock_guild, "rules_tool")
+        result = AgentResult(answer="The Elite cap is 620.")
+
+        assert AnswerCache().store(ctx, "what's the elite salary cap", result)
+
+    def test_expires(self, mock_guild):
+        clock = Clock()
+        cache = AnswerCache(clock=clock)
+        cache.store(self._ctx(mock_guild, "roster_tool"), "who plays for the bulls", AgentResult(answer="a, b, c"))
+        key = answer_key(mock_guild.id, "who plays for the bulls")
+
+        clock.now = API_CACHE_TTL - 1
+        assert cache.get(key).answer == "a, b, c"
+        clock.now = API_CACHE_TTL + 1
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_evicts_beyond_maxsize(self, mock_guild):
+        cache = AnswerCache(maxsize=2)
+        for q in ("a", "b", "c"):
+            cache.store(self._ctx(mock_guild, "rules_tool"), q, AgentResult(answer=q))
+
+        assert cache.get(answer_key(mock_guild.id, "a")) is None
+        assert cache.get(answer_key(mock_guild.id, "c")).answer == "c"
+
+    def test_hit_is_a_copy(self, mock_guild):
+        cache = AnswerCache()
+        cache.put((1, 1, "h", "q"), AgentResult(answer="x", citations=["Rulebook 1.1"]), 60)
+
+        cache.get((1, 1, "h", "q")).citations.append("tampered")
+
+        assert cache.get((1, 1, "h", "q")).citations == ["Rulebook 1.1"]
@@ -4,6 +4,8 @@ None of this existed under the RAG pipeline: the mention listener answered every
 mention with no rate limit, no cap, and no record of what it cost.
 """
 
+import asyncio
+import random
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
@@ -11,40 +13,54 @@ from unittest.mock import AsyncMock, MagicMock
 import discord
 import pytest
 
-from rsc.llm.agent.budget import CooldownTracker, UsageAccumulator, usage_day
+from rsc.llm.agent.budget import CooldownTracker, UsageAccumulator, UsageLedger, usage_day
 from rsc.llm.agent.cache import ToolCache, cache_key
 from rsc.llm.agent.service import check_budget, is_budget_exempt
 
 NOW = datetime(2026, 8, 10, 12, 0, tzinfo=UTC)
+# Registered defaults of the LLMUsage custom group.
+USAGE_DEFAULTS = {"day": None, "count": 0, "tokens": 0}
 
 
 class FakeRecord:
     """Stands in for a Red Config custom group."""
 
-    def __init__(self, store: dict, key: tuple):
-        self._store = store
+    def __init__(self, config: "FakeConfig", key: tuple):
+        self._config = config
+        self._store = config.store
         self._key = key
 
     def _get(self, field: str):
-        return self._store.get(self._key, {}).get(field)
+        return self._store.get(self._key, {}).get(field, USAGE_DEFAULTS.get(field))
 
     def __getattr__(self, field: str):
         async def getter():
+            self._config.reads += 1
+            await asyncio.sleep(0)
             return self._get(field)
 
         async def setter(value):
+            self._config.writes += 1
+            await asyncio.sleep(0)
             self._store.setdefault(self._key, {})[field] = value
 
         getter.set = setter  # type: ignore[attr-defined]
         return getter
 
+    async def set(self, value: dict):
+        self._config.writes += 1
+        await asyncio.sleep(0)
+        self._store[self._key] = dict(value)
+
 
 class FakeConfig:
     def __init__(self):
         self.store: dict = {}
+        self.reads = 0
+        self.writes = 0
 
     def custom(self, _scope: str, *identifiers: str) -> FakeRecord:
-        return FakeRecord(self.store, tuple(identifiers))
+        return FakeRecord(self, tuple(identifiers))
 
 
 @pytest.fixture
@@ -119,7 +135,7 @@ async def test_check_budget_reports_cooldown(cog, guild, member, monkeypatch):
     tracker = CooldownTracker(seconds=20)
     tracker.start(guild.id, member.id)
 
-    verdict = await check_budget(cog, guild, member, cooldown=tracker, user_cap=15, guild_cap=400, now=NOW)
+    verdict = await check_budget(cog, guild, member, cooldown=tracker, ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW)
 
     assert not verdict.allowed
     assert verdict.reason == "cooldown"
@@ -133,7 +149,7 @@ async def test_user_cap_blocks_at_the_limit(cog, guild, member):
     seed_usage(cog, guild.id, member.id, day=usage_day(NOW), count=15)
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert not verdict.allowed
@@ -146,7 +162,7 @@ async def test_usage_resets_on_a_new_day(cog, guild, member):
     seed_usage(cog, guild.id, member.id, day=yesterday, count=15)
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert verdict.allowed
@@ -156,7 +172,7 @@ async def test_guild_cap_blocks_everyone(cog, guild, member):
     seed_usage(cog, guild.id, 0, day=usage_day(NOW), count=400)
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert not verdict.allowed
@@ -168,7 +184,7 @@ async def test_elevated_members_bypass_the_user_cap(cog, guild, member):
     cog.elevated_positions.return_value = frozenset({"ADM"})
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert verdict.allowed
@@ -180,7 +196,7 @@ async def test_elevated_members_do_not_bypass_the_guild_cap(cog, guild, member):
     cog.elevated_positions.return_value = frozenset({"ADM"})
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert not verdict.allowed
@@ -195,7 +211,7 @@ async def test_manage_guild_bypasses_every_limit(cog, guild, member, monkeypatch
     tracker = CooldownTracker(seconds=20)
     tracker.start(guild.id, member.id)
 
-    verdict = await check_budget(cog, guild, member, cooldown=tracker, user_cap=15, guild_cap=400, now=NOW)
+    verdict = await check_budget(cog, guild, member, cooldown=tracker, ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW)
 
     assert verdict.allowed
 
@@ -209,7 +225,7 @@ async def test_zero_cap_disables_the_limit(cog, guild, member):
     seed_usage(cog, guild.id, member.id, day=usage_day(NOW), count=9999)
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=0, guild_cap=0, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=0, guild_cap=0, now=NOW
     )
 
     assert verdict.allowed
@@ -220,7 +236,7 @@ async def test_role_lookup_failure_does_not_block_the_question(cog, guild, membe
     cog.elevated_positions.side_effect = RuntimeError("api down")
 
     verdict = await check_budget(
-        cog, guild, member, cooldown=CooldownTracker(seconds=0), user_cap=15, guild_cap=400, now=NOW
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=UsageLedger(cog.config), user_cap=15, guild_cap=400, now=NOW
     )
 
     assert verdict.allowed
@@ -264,6 +280,149 @@ def test_usage_accumulator_tolerates_missing_usage():
     assert usage.calls == 0
 
 
+# Usage ledger
+
+
+async def config_record_usage(config: FakeConfig, guild_id: int, user_id: int, *, tokens: int, now: datetime) -> None:
+    """The per-question Config accounting the ledger replaced, kept as the reference."""
+    day = usage_day(now)
+    for scope in (user_id, 0):
+        record = config.custom("LLMUsage", str(guild_id), str(scope))
+        if await record.day() != day:
+            await record.day.set(day)
+            await record.count.set(0)
+            await record.tokens.set(0)
+        await record.count.set(int(await record.count()) + 1)
+        await record.tokens.set(int(await record.tokens()) + tokens)
+
+
+async def test_ledger_matches_config_accounting():
+    reference, config = FakeConfig(), FakeConfig()
+    ledger = UsageLedger(config)
+    rng = random.Random(7)
+    for store in (reference.store, config.store):
+        store[("1", "100")] = {"day": usage_day(NOW - timedelta(days=1)), "count": 9, "tokens": 900}
+
+    for i in range(300):
+        now = NOW + timedelta(hours=i // 10)
+        user_id = rng.choice([100, 200, 300])
+        tokens = rng.randint(0, 500)
+        await config_record_usage(reference, 1, user_id, tokens=tokens, now=now)
+        await ledger.record(1, user_id, tokens=tokens, now=now)
+        if i % 7 == 0:
+            await ledger.flush()
+        for scope in (user_id, 0):
+            expected = reference.store[("1", str(scope))]
+            assert await ledger.usage(1, scope, now) == (expected["count"], expected["tokens"])
+
+    await ledger.flush()
+    assert config.store == reference.store
+
+
+async def test_ledger_loses_no_increments_under_concurrent_asks():
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+    users = range(100, 150)
+
+    async def ask(user_id: int, n: int):
+        await ledger.record(1, user_id, tokens=10, now=NOW)
+        if n % 5 == 0:
+            await ledger.flush()
+
+    await asyncio.gather(*(ask(u, n) for n in range(4) for u in users))
+    await ledger.flush()
+
+    assert config.store[("1", "0")] == {"day": usage_day(NOW), "count": 200, "tokens": 2000}
+    assert all(config.store[("1", str(u))]["count"] == 4 for u in users)
+
+
+async def test_ledger_reads_each_bucket_once_and_batches_writes():
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+
+    for _ in range(20):
+        await ledger.usage(1, 100, NOW)
+        await ledger.record(1, 100, tokens=5, now=NOW)
+    assert config.writes == 0
+    # day, count and tokens, for the user and the guild-wide bucket
+    assert config.reads == 6
+
+    assert await ledger.flush() == 2
+    assert config.writes == 2
+    assert await ledger.flush() == 0
+
+
+async def test_ledger_rolls_over_in_memory():
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+    tomorrow = NOW + timedelta(days=1)
+
+    await ledger.record(1, 100, tokens=5, now=NOW)
+    await ledger.record(1, 100, tokens=7, now=tomorrow)
+
+    assert await ledger.usage(1, 100, tomorrow) == (1, 7)
+    assert await ledger.usage(1, 100, NOW) == (0, 0)
+    assert config.writes == 0
+
+
+async def test_ledger_failed_flush_is_retried(monkeypatch):
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+    await ledger.record(1, 100, tokens=5, now=NOW)
+    monkeypatch.setattr(FakeRecord, "set", AsyncMock(side_effect=OSError("disk full")))
+
+    with pytest.raises(OSError):
+        await ledger.flush()
+    monkeypatch.undo()
+    await ledger.record(1, 200, tokens=5, now=NOW)
+
+    assert await ledger.flush() == 3
+    assert config.store[("1", "0")]["count"] == 2
+
+
+async def test_ledger_drops_past_days_once_written():
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+    tomorrow = NOW + timedelta(days=1)
+    for user_id in range(100, 110):
+        await ledger.record(1, user_id, tokens=5, now=NOW)
+    await ledger.record(2, 100, tokens=5, now=NOW)
+    await ledger.record(1, 200, tokens=5, now=tomorrow)
+
+    await ledger.flush()
+
+    # Guild 1 moved on to tomorrow; guild 2 has not seen it yet
+    assert set(ledger._buckets) == {(1, 200), (1, 0), (2, 100), (2, 0)}
+    assert config.store[("1", "105")] == {"day": usage_day(NOW), "count": 1, "tokens": 5}
+    assert await ledger.usage(1, 105, tomorrow) == (0, 0)
+
+
+async def test_ledger_keeps_unwritten_buckets(monkeypatch):
+    config = FakeConfig()
+    ledger = UsageLedger(config)
+    await ledger.record(1, 100, tokens=5, now=NOW)
+    await ledger.record(1, 200, tokens=5, now=NOW + timedelta(days=1))
+    monkeypatch.setattr(FakeRecord, "set", AsyncMock(side_effect=OSError("disk full")))
+
+    with pytest.raises(OSError):
+        await ledger.flush()
+
+    assert (1, 100) in ledger._buckets
+
+
+async def test_check_budget_reads_the_ledger(cog, guild, member):
+    ledger = UsageLedger(cog.config)
+    for _ in range(15):
+        await ledger.record(guild.id, member.id, tokens=1, now=NOW)
+
+    verdict = await check_budget(
+        cog, guild, member, cooldown=CooldownTracker(seconds=0), ledger=ledger, user_cap=15, guild_cap=400, now=NOW
+    )
+
+    assert verdict.reason == "user_cap"
+    assert cog.config.writes == 0
+
+
 # Tool cache
 
 
@@ -0,0 +1,153 @@
+"""Tests for the shared per-guild OpenAI client registry.
+
+Requests go through an `httpx.MockTransport`, so these exercise the real
+`AsyncOpenAI` client against a local handler instead of the provider.
+"""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from rsc.llm.agent.cache import ToolCache
+from rsc.llm.agent.context import UserIdentity
+from rsc.llm.agent.service import build_agent_context
+from rsc.llm.clients import OpenAIClients
+from rsc.llm.llm import LLMMixIn
+from rsc.llm.summarize import summarize_ticket_messages
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-5.4-mini",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+class Provider:
+    """Local stand-in for the OpenAI API, recording who asked."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.transport = httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=_completion("Summary of the ticket."))
+
+    @property
+    def keys(self) -> list[str]:
+        return [r.headers["authorization"] for r in self.requests]
+
+
+@pytest.fixture
+def provider():
+    return Provider()
+
+
+@pytest.fixture
+async def clients(provider):
+    registry = OpenAIClients(transport=provider.transport)
+    yield registry
+    await registry.close()
+
+
+def _create_mixin(**attrs):
+    saved = LLMMixIn.__abstractmethods__
+    LLMMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(LLMMixIn)
+    finally:
+        LLMMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+class TestOpenAIClients:
+    def test_one_client_per_guild(self, clients):
+        first = clients.get(1, "sk-a", "org-a")
+
+        assert clients.get(1, "sk-a", "org-a") is first
+        assert clients.get(2, "sk-a", "org-a") is not first
+        assert len(clients) == 2
+
+    def test_guilds_share_one_pool(self, clients):
+        assert clients.get(1, "sk-a", None)._client is clients.get(2, "sk-b", None)._client
+
+    @pytest.mark.parametrize(("key", "org"), [("sk-new", "org-a"), ("sk-a", "org-new"), ("sk-a", None)])
+    def test_rebuilt_when_credentials_change(self, clients, key, org):
+        old = clients.get(1, "sk-a", "org-a")
+
+        new = clients.get(1, key, org)
+
+        assert new is not old
+        assert new.api_key == key
+        assert new.organization == org
+        assert new._client is old._client
+
+    async def test_close_closes_pool(self, clients):
+        pool = clients.get(1, "sk-a", None)._client
+
+        await clients.close()
+
+        assert pool.is_closed
+        assert len(clients) == 0
+        # Usable again afterwards, on a fresh pool
+        assert not clients.get(1, "sk-a", None)._client.is_closed
+
+
+class TestConnectionReuse:
+    async def test_agent_and_summary_share_pool(self, clients, provider, mock_guild, monkeypatch):
+        monkeypatch.setattr("rsc.llm.agent.service.load_rulebooks", AsyncMock())
+        monkeypatch.setattr("rsc.llm.agent.service.resolve_agent_identity", AsyncMock(return_value=UserIdentity(name="nickm")))
+        cog = MagicMock()
+        cog.current_season = AsyncMock(return_value=None)
+
+        for _ in range(3):
+            llm = clients.get(mock_guild.id, "sk-a", "org-a")
+            ctx = await build_agent_context(
+                cog, mock_guild, MagicMock(), client=llm, surface="mention", cache=ToolCache(), now=datetime.now(UTC)
+            )
+            await ctx.client.chat.completions.create(model="gpt-5.4-mini", messages=[{"role": "user", "content": "hi"}])
+            summary = await summarize_ticket_messages(mock_guild, clients.get(mock_guild.id, "sk-a", "org-a"), "transcript")
+            assert summary == "Summary of the ticket."
+            assert ctx.client is llm
+
+        assert len(provider.requests) == 6
+        assert set(provider.keys) == {"Bearer sk-a"}
+        # The summary used to close its own pool after every call
+        assert not llm._client.is_closed
+        assert len(clients) == 1
+
+    async def test_summary_request_body(self, clients, provider, mock_guild):
+        await summarize_ticket_messages(mock_guild, clients.get(mock_guild.id, "sk-a", None), "transcript", ["data:image/png;base64,AA"])
+
+        body = json.loads(provider.requests[0].content)
+        assert body["messages"][1]["content"][1]["image_url"]["url"] == "data:image/png;base64,AA"
+
+    async def test_key_change_takes_effect(self, clients, provider, mock_guild):
+        await summarize_ticket_messages(mock_guild, clients.get(mock_guild.id, "sk-a", None), "transcript")
+        await summarize_ticket_messages(mock_guild, clients.get(mock_guild.id, "sk-b", None), "transcript")
+
+        assert provider.keys == ["Bearer sk-a", "Bearer sk-b"]
+
+
+class TestLLMMixInClients:
+    async def test_llm_client_lazily_built_and_closed(self, mock_guild):
+        mixin = _create_mixin()
+
+        llm = mixin.llm_client(mock_guild, "sk-a", None)
+        assert mixin.llm_client(mock_guild, "sk-a", None) is llm
+
+        await mixin.close_llm_clients()
+        assert llm._client.is_closed
+
+    async def test_close_without_clients(self):
+        await _create_mixin().close_llm_clients()
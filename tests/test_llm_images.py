@@ -0,0 +1,256 @@
+"""Tests for the ticket summary image pipeline.
+
+Images are generated with Pillow or read from the bundled transaction
+graphics, so nothing here touches the network.
+"""
+
+import asyncio
+import io
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from PIL import Image
+
+from rsc.llm.images import SummaryImagePipeline, encode_image
+from rsc.llm.llm import LLM_SUMMARY_MAX_IMAGES, LLMMixIn
+
+RESOURCES = Path(__file__).parent.parent / "rsc" / "resources"
+
+
+def _image_bytes(size: tuple[int, int], fmt: str = "PNG", mode: str = "RGB", color=(200, 30, 30)) -> bytes:
+    fill = color if mode == "RGB" else (*color, 0)
+    with io.BytesIO() as buf:
+        Image.new(mode, size, fill).save(buf, format=fmt)
+        return buf.getvalue()
+
+
+def _noisy_png(size: tuple[int, int]) -> bytes:
+    """A PNG that compresses about as badly as a real screenshot."""
+    img = Image.effect_noise(size, 64).convert("RGB")
+    with io.BytesIO() as buf:
+        img.save(buf, format="PNG")
+        return buf.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+def _attachment(attachment_id: int, data: bytes, filename: str = "shot.png", delay: float = 0.0) -> MagicMock:
+    async def read(**kwargs):
+        if delay:
+            await asyncio.sleep(delay)
+        return data
+
+    a = MagicMock(spec=discord.Attachment)
+    a.id = attachment_id
+    a.filename = filename
+    a.content_type = "image/png"
+    a.read = AsyncMock(side_effect=read)
+    return a
+
+
+def _message(*attachments, content: str = "") -> MagicMock:
+    msg = MagicMock(spec=discord.Message)
+    msg.clean_content = content
+    msg.attachments = list(attachments)
+    msg.author.display_name = "Player"
+    msg.created_at.isoformat.return_value = "2026-01-01T00:00:00"
+    return msg
+
+
+def _create_mixin(**attrs):
+    saved = LLMMixIn.__abstractmethods__
+    LLMMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(LLMMixIn)
+    finally:
+        LLMMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+class TestEncodeImage:
+    def test_downscales_to_max_edge(self):
+        image = encode_image(_image_bytes((3000, 1500)), max_edge=1000)
+
+        assert (image.width, image.height) == (1000, 500)
+        assert image.mime == "image/jpeg"
+        assert _open(image.data).size == (1000, 500)
+
+    def test_portrait_is_bounded_by_height(self):
+        image = encode_image(_image_bytes((800, 2400)), max_edge=1200)
+        assert (image.width, image.height) == (400, 1200)
+
+    def test_reencode_shrinks_large_screenshot(self):
+        raw = _noisy_png((960, 540))
+        image = encode_image(raw, max_edge=768)
+
+        assert max(image.width, image.height) == 768
+        assert len(image.data) < len(raw) // 2
+
+    def test_small_compact_source_passes_through(self):
+        raw = _image_bytes((64, 64))
+        image = encode_image(raw, max_edge=1536)
+
+        assert image.data == raw
+        assert image.mime == "image/png"
+
+    def test_large_jpeg_decodes_within_bounds(self):
+        image = encode_image(_image_bytes((4000, 3000), fmt="JPEG"), max_edge=800)
+        assert max(image.width, image.height) == 800
+
+    def test_transparency_is_flattened_to_white(self):
+        image = encode_image(_image_bytes((2000, 2000), mode="RGBA"), max_edge=100)
+
+        assert image.mime == "image/jpeg"
+        r, g, b = _open(image.data).convert("RGB").getpixel((50, 50))
+        assert min(r, g, b) > 240
+
+    def test_bundled_graphic(self):
+        raw = (RESOURCES / "transactions" / "Traded.png").read_bytes()
+        image = encode_image(raw, max_edge=256)
+
+        assert max(image.width, image.height) <= 256
+        assert len(image.data) <= len(raw)
+
+    def test_digest_is_of_source_bytes(self):
+        raw = _image_bytes((10, 10))
+        assert encode_image(raw).digest == encode_image(raw, max_edge=5).digest
+
+    def test_garbage_raises(self):
+        with pytest.raises(OSError):
+            encode_image(b"not an image")
+
+
+class TestSummaryImagePipeline:
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+        raw = _image_bytes((50, 50))
+
+        async def read(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return raw
+
+        attachments = [_attachment(i, raw) for i in range(12)]
+        for a in attachments:
+            a.read = AsyncMock(side_effect=read)
+
+        await SummaryImagePipeline(concurrency=3).collect(attachments)
+
+        assert peak == 3
+
+    async def test_bound_is_shared_across_summaries(self):
+        in_flight = 0
+        peak = 0
+        raw = _image_bytes((50, 50))
+
+        async def read(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return raw
+
+        pipeline = SummaryImagePipeline(concurrency=2)
+        batches = [[_attachment(b * 10 + i, raw) for i in range(4)] for b in range(3)]
+        for batch in batches:
+            for a in batch:
+                a.read = AsyncMock(side_effect=read)
+
+        await asyncio.gather(*(pipeline.collect(batch) for batch in batches))
+
+        assert peak == 2
+
+    async def test_results_keep_attachment_order(self):
+        sizes = [(30, 10), (10, 30), (20, 20)]
+        # Reverse delays so completion order is the opposite of input order.
+        attachments = [_attachment(i, _image_bytes(size), delay=0.03 - i * 0.01) for i, size in enumerate(sizes)]
+
+        prepared = await SummaryImagePipeline().collect(attachments)
+
+        assert [(img.width, img.height) for img in prepared.images] == sizes
+        assert prepared.labels == {0: 1, 1: 2, 2: 3}
+
+    async def test_duplicates_share_one_image(self):
+        shot = _image_bytes((40, 40))
+        other = _image_bytes((40, 40), color=(0, 0, 255))
+        attachments = [_attachment(1, shot), _attachment(2, other), _attachment(3, shot)]
+
+        prepared = await SummaryImagePipeline().collect(attachments)
+
+        assert len(prepared.images) == 2
+        assert prepared.labels == {1: 1, 2: 2, 3: 1}
+
+    async def test_cached_per_attachment(self):
+        pipeline = SummaryImagePipeline()
+        a = _attachment(1, _image_bytes((40, 40)))
+
+        first = await pipeline.collect([a])
+        second = await pipeline.collect([a])
+
+        a.read.assert_awaited_once()
+        assert first.images == second.images
+
+    async def test_cache_is_bounded(self):
+        pipeline = SummaryImagePipeline(maxsize=2)
+        attachments = [_attachment(i, _image_bytes((10 + i, 10))) for i in range(3)]
+
+        await pipeline.collect(attachments)
+        await pipeline.collect(attachments[:1])
+
+        assert attachments[0].read.await_count == 2
+
+    async def test_unreadable_attachments_are_skipped(self):
+        broken = _attachment(1, b"")
+        broken.read = AsyncMock(side_effect=discord.HTTPException(MagicMock(status=404), "gone"))
+        attachments = [broken, _attachment(2, b"not an image"), _attachment(3, _image_bytes((20, 20)))]
+
+        prepared = await SummaryImagePipeline().collect(attachments)
+
+        assert len(prepared.images) == 1
+        assert prepared.labels == {3: 1}
+
+    async def test_data_urls(self):
+        prepared = await SummaryImagePipeline().collect([_attachment(1, _image_bytes((20, 20)))])
+        assert prepared.data_urls[0].startswith("data:image/png;base64,")
+
+
+class TestCollectSummaryImages:
+    async def test_too_many_images(self):
+        mixin = _create_mixin(_summary_images=SummaryImagePipeline())
+        messages = [_message(_attachment(i, b"")) for i in range(LLM_SUMMARY_MAX_IMAGES + 1)]
+
+        images, error = await mixin._collect_summary_images(messages)
+
+        assert error is not None
+        assert images.images == []
+        messages[0].attachments[0].read.assert_not_awaited()
+
+    async def test_transcript_markers_follow_deduplication(self):
+        mixin = _create_mixin(_summary_images=SummaryImagePipeline())
+        shot = _image_bytes((40, 40))
+        messages = [
+            _message(_attachment(1, shot), content="first"),
+            _message(_attachment(2, b"broken"), content="second"),
+            _message(_attachment(3, _image_bytes((40, 40), color=(0, 255, 0))), _attachment(4, shot), content="third"),
+        ]
+
+        images, error = await mixin._collect_summary_images(messages)
+        transcript = mixin._build_summary_transcript(messages, image_labels=images.labels)
+
+        assert error is None
+        assert len(images.images) == 2
+        lines = transcript.splitlines()
+        assert lines[0].endswith("first [image-1]")
+        assert lines[1].endswith("second")
+        assert lines[2].endswith("third [image-2] [image-1]")
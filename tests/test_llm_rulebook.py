@@ -7,9 +7,13 @@ synthetic fixtures. Bounds are deliberately loose so an ordinary rulebook
 revision does not turn the suite red.
 """
 
+from pathlib import Path
+
 import pytest
 
+from rsc.llm import rulebook
 from rsc.llm.rulebook import (
+    COMPILED_VERSION,
     RULEBOOK_FILES,
     RULES_PATH,
     RuleBook,
@@ -18,6 +22,8 @@ from rsc.llm.rulebook import (
     render_book,
     render_rule,
     render_section,
+    rendered_section,
+    rulebook_hash,
     rulebook_toc,
     search_rules,
     select_book,
@@ -125,6 +131,28 @@ async def test_section_render_is_far_cheaper_than_whole_book() -> None:
     assert len(section) < len(render_book(RuleBook.COMPETITIVE)) / 5
 
 
+async def test_rendered_sections_match_render_rule() -> None:
+    """Every section is pre-rendered on load, to the same text `render_rule` gives."""
+    for book, index in (await load_rulebooks()).items():
+        for number in {entry.section for entry in index.entries.values()}:
+            assert (book, number, rulebook_hash()) in rulebook._RENDERED
+            rendered = rendered_section(book, number)
+            assert rendered.text == render_rule(book, number, include_children=True)
+            assert rendered.tokens == pytest.approx(rendered.chars / 4, abs=1)
+
+
+async def test_rendered_section_follows_the_rulebook_hash(monkeypatch) -> None:
+    section = (await load_rulebooks())[RuleBook.COMPETITIVE].entries["5.7.3"].section
+    before = rendered_section(RuleBook.COMPETITIVE, section)
+    monkeypatch.setattr(rulebook, "_HASH", "rules-updated")
+
+    after = rendered_section(RuleBook.COMPETITIVE, section)
+
+    assert after is not before
+    assert after.text == before.text
+    assert rendered_section(RuleBook.COMPETITIVE, "99.99") is None
+
+
 async def test_substitution_question_finds_the_governing_rule() -> None:
     """The question the old pipeline needed five hardcoded query rewrites for."""
     hits = search_rules("can a permFA sub for the same franchise twice in a row", book=RuleBook.COMPETITIVE, limit=3)
@@ -176,3 +204,61 @@ async def test_prompt_prefix_content_stays_small() -> None:
     """TOC and glossary sit in the cached system prompt on every query."""
     assert len(rulebook_toc()) < 4_000
     assert len(glossary_text()) < 8_000
+
+
+async def test_subtrees_are_contiguous_slices() -> None:
+    """`descendants` must return exactly the rules sharing the number prefix.
+
+    Behavioral 3.1.12.1 is parsed before 3.1.12 itself, so a slice of plain
+    document order would split that subtree.
+    """
+    indexes = await load_rulebooks()
+
+    for index in indexes.values():
+        for number in index.entries:
+            expected = {n for n in index.order if n.startswith(f"{number}.")}
+            assert set(index.descendants(number)) == expected, f"{index.book.value} {number}"
+
+
+def _artifacts(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.glob("rulebooks-v*.json"))
+
+
+async def test_compiled_artifact_round_trips(tmp_path: Path) -> None:
+    built = dict(await load_rulebooks(force=True, cache_dir=tmp_path))
+    [artifact] = _artifacts(tmp_path)
+    assert artifact.name.startswith(f"rulebooks-v{COMPILED_VERSION}-{rulebook_hash()[:16]}")
+
+    loaded = await load_rulebooks(force=True, cache_dir=tmp_path)
+
+    for book, index in built.items():
+        assert loaded[book] is not index
+        assert loaded[book].entries == index.entries
+        assert loaded[book].order == index.order
+        assert loaded[book].tree_order == index.tree_order
+        assert loaded[book].spans == index.spans
+        assert loaded[book].toc == index.toc
+        assert loaded[book].glossary == index.glossary
+    assert [hit.entry.citation for hit in search_rules("sub up to a higher tier")]
+
+
+async def test_corrupt_artifact_is_rebuilt(tmp_path: Path) -> None:
+    await load_rulebooks(force=True, cache_dir=tmp_path)
+    [artifact] = _artifacts(tmp_path)
+    artifact.write_text("{not json")
+
+    indexes = await load_rulebooks(force=True, cache_dir=tmp_path)
+
+    assert len(indexes[RuleBook.COMPETITIVE].entries) >= MIN_RULES[RuleBook.COMPETITIVE]
+    assert artifact.read_text().startswith('{"version"')
+
+
+async def test_stale_artifacts_are_pruned(tmp_path: Path) -> None:
+    stale = tmp_path / f"rulebooks-v{COMPILED_VERSION}-0000000000000000.json"
+    stale.write_text("{}")
+    older = tmp_path / "rulebooks-v0-0000000000000000.json"
+    older.write_text("{}")
+
+    await load_rulebooks(force=True, cache_dir=tmp_path)
+
+    assert [p.name for p in _artifacts(tmp_path)] == [f"rulebooks-v{COMPILED_VERSION}-{rulebook_hash()[:16]}.json"]
@@ -13,11 +13,12 @@ import pytest
 
 from rsc.llm.agent.context import AgentContext, UserIdentity
 from rsc.llm.agent.loop import _dispatch
+from rsc.llm.agent.subagents import SUBAGENT_SYSTEM, _gather_sections, _pack_sections
 from rsc.llm.agent.tools.league import get_franchise, list_franchises, list_players
 from rsc.llm.agent.tools.rules import ask_rulebook, get_rule, search_rules_tool
 from rsc.llm.agent.tools.stats import top_players
-from rsc.llm.config import TOOL_RESULT_MAX_CHARS
-from rsc.llm.rulebook import RuleBook, load_rulebooks
+from rsc.llm.config import RULES_SUBAGENT_MAX_CONTEXT_CHARS, TOOL_RESULT_MAX_CHARS
+from rsc.llm.rulebook import RuleBook, load_rulebooks, loaded_rulebooks, render_rule
 
 
 def fn_call(name: str, args: dict) -> SimpleNamespace:
@@ -341,6 +342,62 @@ async def test_ask_rulebook_sends_only_scoped_sections(ctx):
     assert len(sent) < 25_000, "sub-agent context should be section scoped, not the whole book"
 
 
+async def test_ask_rulebook_prefix_is_stable_across_books(ctx):
+    ctx.client.responses = MagicMock()
+    ctx.client.responses.create = AsyncMock(return_value=SimpleNamespace(output_text="ok", usage=None))
+
+    await ask_rulebook(ctx, "can a permFA sub twice in a row", book="competitive")
+    await ask_rulebook(ctx, "penalty for toxic behavior in chat", book="behavioral")
+
+    first, second = (call.kwargs for call in ctx.client.responses.create.await_args_list)
+    assert first["instructions"] == second["instructions"] == SUBAGENT_SYSTEM
+    assert first["prompt_cache_key"] == "rsc-rules-v1-competitive"
+    assert second["input"][0]["content"].startswith("Rulebook: Behavioral")
+
+
+def _sections(book: RuleBook, count: int) -> list[str]:
+    """`count` distinct sections of a book, last in the book first."""
+    index = loaded_rulebooks()[book]
+    numbers = list(dict.fromkeys(index.entries[n].section for n in index.order))
+    return numbers[::-1][:count]
+
+
+def test_pack_sections_keeps_book_order():
+    sections = _sections(RuleBook.COMPETITIVE, 3)
+
+    packed = _pack_sections(RuleBook.COMPETITIVE, sections)
+
+    assert [rendered.number for rendered in packed] == sections[::-1]
+    assert [rendered.text for rendered in packed] == [render_rule(RuleBook.COMPETITIVE, n) for n in sections[::-1]]
+
+
+def test_pack_sections_skips_a_section_that_would_overflow(monkeypatch):
+    first, second, third = sections = _sections(RuleBook.COMPETITIVE, 3)
+    sizes = {rendered.number: rendered.chars for rendered in _pack_sections(RuleBook.COMPETITIVE, sections)}
+    monkeypatch.setattr("rsc.llm.agent.subagents.RULES_SUBAGENT_MAX_CONTEXT_CHARS", sizes[first] + sizes[third] + 2)
+    monkeypatch.setitem(sizes, second, 10**6)
+    monkeypatch.setattr(
+        "rsc.llm.agent.subagents.rendered_section",
+        lambda book, n: SimpleNamespace(number=n, chars=sizes[n], text=render_rule(book, n)),
+    )
+
+    packed = _pack_sections(RuleBook.COMPETITIVE, sections)
+
+    # The oversized middle match is dropped whole rather than cut off
+    assert [rendered.number for rendered in packed] == [third, first]
+
+
+def test_gather_sections_cites_only_what_was_sent():
+    context, citations = _gather_sections("can a permFA sub up to a higher tier", RuleBook.COMPETITIVE)
+
+    index = loaded_rulebooks()[RuleBook.COMPETITIVE]
+    assert 0 < len(context) <= RULES_SUBAGENT_MAX_CONTEXT_CHARS
+    assert citations
+    for citation in citations:
+        section = index.entries[citation.rsplit(" ", 1)[-1]].section
+        assert render_rule(RuleBook.COMPETITIVE, section) in context
+
+
 # Output budget
 
 
@@ -0,0 +1,254 @@
+"""Tests for the logging pipeline in `rsc.logs`.
+
+Each test logs through its own logger under "red.rsc.tests.logs" with
+propagation off, into a `ListHandler` that keeps the formatted lines and the
+thread that wrote them. `Clock` drives `BurstFilter` windows by hand.
+"""
+
+import logging
+import sys
+import threading
+from pprint import pformat
+from unittest.mock import MagicMock
+
+import pytest
+
+from rsc.logs import BurstFilter, Deferred, GuildLogAdapter, QueuedLogging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.lines: list[str] = []
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.lines.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def logger(request):
+    logger = logging.getLogger(f"red.rsc.tests.logs.{request.node.name}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = ListHandler()
+    logger.addHandler(handler)
+    yield logger
+    for h in list(logger.handlers):
+        logger.removeHandler(h)
+
+
+def _handler(logger) -> ListHandler:
+    return next(h for h in logger.handlers if isinstance(h, ListHandler))
+
+
+def _record(msg: str = "tick", level: int = logging.DEBUG, lineno: int = 10) -> logging.LogRecord:
+    return logging.LogRecord("red.rsc.tests.logs", level, "loop.py", lineno, msg, None, None)
+
+
+class TestDeferred:
+    def test_not_built_when_the_level_is_off(self, logger, mock_guild):
+        logger.setLevel(logging.INFO)
+        build = MagicMock(return_value="payload")
+
+        GuildLogAdapter(logger).debug("Schema: %s", Deferred(build), guild=mock_guild)
+
+        build.assert_not_called()
+
+    def test_built_once_for_every_handler(self, logger, mock_guild):
+        logger.addHandler(ListHandler())
+        build = MagicMock(side_effect=pformat)
+
+        GuildLogAdapter(logger).debug("Schema: %s", Deferred(build, {"a": 1}), guild=mock_guild)
+
+        build.assert_called_once_with({"a": 1})
+        assert _handler(logger).lines == ["[RSC 3v3] Schema: {'a': 1}"]
+
+
+class TestLazyContext:
+    def test_callable_context_is_resolved_when_emitted(self, logger, mock_guild):
+        GuildLogAdapter(logger).info("Synced", guild=lambda: mock_guild)
+
+        assert _handler(logger).lines == ["[RSC 3v3] Synced"]
+
+    def test_callable_context_is_skipped_when_the_level_is_off(self, logger):
+        logger.setLevel(logging.INFO)
+        lookup = MagicMock()
+
+        GuildLogAdapter(logger).debug("Synced", guild=lookup, match=lookup)
+
+        lookup.assert_not_called()
+
+
+class TestBurstFilter:
+    def test_drops_repeats_past_the_limit(self):
+        burst = BurstFilter(limit=3, clock=Clock())
+
+        passed = [burst.filter(_record()) for _ in range(10)]
+
+        assert passed == [True] * 3 + [False] * 7
+        assert burst.suppressed == 7
+
+    def test_next_window_reports_what_was_dropped(self):
+        clock = Clock()
+        burst = BurstFilter(limit=2, window=10.0, clock=clock)
+        for _ in range(5):
+            burst.filter(_record())
+        clock.now = 10.0
+
+        record = _record()
+
+        assert burst.filter(record)
+        assert record.message == "tick (repeated 3 more times)"
+
+    def test_errors_always_pass(self):
+        burst = BurstFilter(limit=1, clock=Clock())
+
+        assert all(burst.filter(_record(level=logging.ERROR)) for _ in range(10))
+
+    def test_messages_and_call_sites_are_counted_apart(self):
+        burst = BurstFilter(limit=1, clock=Clock())
+
+        assert burst.filter(_record("tick"))
+        assert burst.filter(_record("tock"))
+        assert burst.filter(_record("tick", lineno=11))
+        assert not burst.filter(_record("tick"))
+
+    def test_counts_hold_across_threads(self):
+        # Switch threads as often as the interpreter allows, so an unguarded
+        # read-modify-write in `filter` is likely to interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            burst = BurstFilter(limit=1000, clock=Clock())
+            start = threading.Barrier(8)
+            passed = []
+
+            def log_from_a_thread():
+                start.wait()
+                passed.append(sum(burst.filter(_record()) for _ in range(5000)))
+
+            threads = [threading.Thread(target=log_from_a_thread) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert sum(passed) == 1000
+        assert burst.suppressed == 8 * 5000 - 1000
+
+    def test_tracked_messages_are_capped(self):
+        burst = BurstFilter(limit=1, maxkeys=100, clock=Clock())
+
+        for i in range(1000):
+            burst.filter(_record(f"player {i}"))
+
+        assert len(burst._bursts) == 100
+        # The oldest were evicted, so they pass again
+        assert burst.filter(_record("player 0"))
+
+
+class TestQueuedLogging:
+    def test_handlers_run_off_the_calling_thread(self, logger, mock_guild):
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        try:
+            for i in range(50):
+                GuildLogAdapter(logger).debug("Player %d", i, guild=mock_guild)
+        finally:
+            queued.stop()
+
+        handler = _handler(logger)
+        assert handler.lines == [f"[RSC 3v3] Player {i}" for i in range(50)]
+        assert threading.get_ident() not in handler.threads
+
+    def test_arguments_are_read_when_logged(self, logger):
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        try:
+            roster = ["a"]
+            logger.debug("Roster %s", roster)
+            roster.append("b")
+        finally:
+            queued.stop()
+
+        assert _handler(logger).lines == ["Roster ['a']"]
+
+    def test_handler_levels_still_apply(self, logger):
+        quiet = ListHandler(level=logging.WARNING)
+        logger.addHandler(quiet)
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        try:
+            logger.debug("noise")
+            logger.warning("careful")
+        finally:
+            queued.stop()
+
+        assert _handler(logger).lines == ["noise", "careful"]
+        assert quiet.lines == ["careful"]
+
+    def test_tracebacks_survive_the_queue(self, logger):
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("Failed")
+        finally:
+            queued.stop()
+
+        record = _handler(logger).records[0]
+        assert record.exc_info[0] is ValueError
+
+    def test_reaches_ancestor_handlers(self, logger):
+        child = logging.getLogger(f"{logger.name}.child")
+        queued = QueuedLogging(names=[child.name])
+        queued.start()
+        try:
+            child.info("from the child")
+            assert not child.propagate
+        finally:
+            queued.stop()
+
+        assert _handler(logger).lines == ["from the child"]
+        assert child.propagate
+        assert child.handlers == []
+
+    def test_stop_restores_the_logger(self, logger):
+        before = list(logger.handlers)
+        queued = QueuedLogging(names=[logger.name])
+        queued.start()
+        queued.start()
+
+        queued.stop()
+
+        assert not queued.running
+        assert logger.handlers == before
+        assert not logger.propagate
+
+    def test_bursts_are_suppressed(self, logger):
+        queued = QueuedLogging(names=[logger.name], burst=BurstFilter(limit=5, clock=Clock()))
+        queued.start()
+        try:
+            for _ in range(100):
+                logger.debug("Waiting on lock")
+        finally:
+            queued.stop()
+
+        assert len(_handler(logger).lines) == 5
+        assert queued.burst.suppressed == 95
@@ -0,0 +1,245 @@
+"""Tests for the bulk match import behind `/admin matches bulk`.
+
+`StubMatchApi` serves a 32 team league from `teams`, resolves odd names through
+`team_id_by_name`, and creates matches with a little latency, failing the rows
+it is told to. Config is a dict-backed stand-in for the "Admin" group's
+`MatchImports` value, shared between ledgers so a fresh ledger reading it back
+is a restart.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from rscapi.exceptions import ApiException
+
+from rsc.admin.match_import import ImportStatus, MatchImporter, MatchImportLedger
+from rsc.admin.models import CreateMatchData
+from rsc.exceptions import RscException
+
+GUILD_ID = 395806681994493964
+SEASON = 21
+TEAMS = [f"Team {i:02}" for i in range(32)]
+
+
+class FakeMatchImports:
+    def __init__(self):
+        self.store: dict[str, dict] = {}
+        self.writes = 0
+
+    async def __call__(self):
+        return {k: dict(v) for k, v in self.store.items()}
+
+    async def set(self, value):
+        self.writes += 1
+        self.store = {k: dict(v) for k, v in value.items()}
+
+    async def set_raw(self, key, *, value):
+        self.writes += 1
+        self.store[key] = dict(value)
+
+
+class FakeConfig:
+    def __init__(self):
+        self.imports = FakeMatchImports()
+
+    def custom(self, group, guild_id):
+        assert group == "Admin"
+        return MagicMock(MatchImports=self.imports)
+
+
+class StubMatchApi:
+    def __init__(self, fail_days: set[int] | None = None, latency: float = 0.001):
+        self.fail_days = fail_days or set()
+        self.latency = latency
+        self.team_lists = 0
+        self.name_lookups: list[str] = []
+        self.created: list[tuple[int, int, int]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._next_id = 5000
+
+    async def teams(self, guild):
+        self.team_lists += 1
+        return [SimpleNamespace(id=100 + i, name=name) for i, name in enumerate(TEAMS)]
+
+    async def team_id_by_name(self, guild, name):
+        self.name_lookups.append(name)
+        # The API's name filter is a partial match
+        hits = [i for i, t in enumerate(TEAMS) if name.casefold() in t.casefold()]
+        if len(hits) != 1:
+            raise ValueError(f"No team found with name {name}")
+        return 100 + hits[0]
+
+    async def create_match(self, guild, match_type, match_format, home_team_id, away_team_id, day):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if day in self.fail_days:
+                raise RscException(response=ApiException(status=500, reason="Server Error"))
+            self.created.append((day, home_team_id, away_team_id))
+            self._next_id += 1
+            return SimpleNamespace(id=self._next_id)
+        finally:
+            self.in_flight -= 1
+
+
+def _match(day: int, home: str, away: str) -> CreateMatchData:
+    return CreateMatchData.model_validate({"day": day, "type": "REG", "format": "BO3", "home": home, "away": away})
+
+
+def _schedule(days: int = 10) -> list[CreateMatchData]:
+    """A round robin slice: every team plays once per day, 16 matches a day."""
+    matches = []
+    for day in range(1, days + 1):
+        order = TEAMS[:1] + TEAMS[1:][day % 31 :] + TEAMS[1:][: day % 31]
+        matches.extend(_match(day, order[i], order[-1 - i]) for i in range(16))
+    return matches
+
+
+@pytest.fixture
+def guild():
+    return SimpleNamespace(id=GUILD_ID, name="RSC 3v3")
+
+
+@pytest.fixture
+def config():
+    return FakeConfig()
+
+
+@pytest.fixture
+def api():
+    return StubMatchApi()
+
+
+def _importer(api, config, **kwargs):
+    return MatchImporter(api, MatchImportLedger(config), **kwargs)
+
+
+class TestValidation:
+    async def test_every_team_comes_from_one_list_request(self, api, config, guild):
+        report = await _importer(api, config).run(guild, SEASON, _schedule())
+
+        assert len(report.created) == 160
+        assert api.team_lists == 1
+        assert api.name_lookups == []
+
+    async def test_unlisted_names_fall_back_to_a_lookup_once_each(self, api, config, guild):
+        matches = [_match(1, "team 03", "Team 04"), _match(2, "team 03", "Team 05")]
+
+        report = await _importer(api, config).run(guild, SEASON, matches)
+
+        assert api.name_lookups == ["team 03"]
+        assert len(report.created) == 2
+
+    async def test_one_bad_row_stops_the_whole_batch(self, api, config, guild):
+        matches = _schedule(3)
+        matches.insert(30, _match(2, "Team 01", "Nobody"))
+
+        report = await _importer(api, config).run(guild, SEASON, matches)
+
+        assert api.created == []
+        assert [o.row for o in report.invalid] == [31]
+        assert "Nobody" in report.invalid[0].error
+
+    async def test_self_play_and_duplicates_are_invalid(self, api, config, guild):
+        matches = [_match(1, "Team 01", "Team 02"), _match(1, "Team 03", "Team 03"), _match(1, "Team 01", "Team 02")]
+
+        report = await _importer(api, config).run(guild, SEASON, matches)
+
+        assert [(o.row, o.error) for o in report.invalid] == [(2, "A team cannot play itself"), (3, "Duplicate of row 1")]
+        assert api.created == []
+
+    async def test_a_failed_team_list_raises(self, api, config, guild):
+        async def api_down(guild):
+            raise RscException(response=ApiException(status=503, reason="Unavailable"))
+
+        api.teams = api_down
+
+        with pytest.raises(RscException):
+            await _importer(api, config).run(guild, SEASON, _schedule(1))
+
+
+class TestCreate:
+    async def test_creates_are_concurrent_but_bounded(self, api, config, guild):
+        await _importer(api, config, concurrency=4).run(guild, SEASON, _schedule())
+
+        assert api.peak == 4
+
+    async def test_a_failure_mid_batch_does_not_stop_the_rest(self, config, guild):
+        api = StubMatchApi(fail_days={4, 7})
+
+        report = await _importer(api, config).run(guild, SEASON, _schedule())
+
+        assert len(report.created) == 128
+        assert len(report.failed) == 32
+        assert {o.match.day for o in report.failed} == {4, 7}
+        assert [o.row for o in report.outcomes] == list(range(1, 161))
+
+    async def test_a_rerun_retries_only_what_failed(self, config, guild):
+        api = StubMatchApi(fail_days={4, 7})
+        await _importer(api, config).run(guild, SEASON, _schedule())
+        api.fail_days = set()
+        api.created.clear()
+
+        report = await _importer(api, config).run(guild, SEASON, _schedule())
+
+        assert len(report.skipped) == 128
+        assert len(report.created) == 32
+        assert {day for day, _, _ in api.created} == {4, 7}
+
+    async def test_the_ledger_survives_a_restart(self, api, config, guild):
+        first = await _importer(api, config).run(guild, SEASON, _schedule(2))
+        api.created.clear()
+
+        # A new ledger reads only what was persisted
+        report = await _importer(api, config).run(guild, SEASON, _schedule(2))
+
+        assert api.created == []
+        assert [o.match_id for o in report.skipped] == [o.match_id for o in first.created]
+
+    async def test_force_recreates_what_the_ledger_skips(self, api, config, guild):
+        first = await _importer(api, config).run(guild, SEASON, _schedule(2))
+        api.created.clear()
+
+        report = await _importer(api, config).run(guild, SEASON, _schedule(2), force=True)
+
+        assert len(report.created) == 32
+        assert len(api.created) == 32
+        # The ledger now points at the new matches
+        new_ids = {o.match_id for o in report.created}
+        assert new_ids.isdisjoint(o.match_id for o in first.created)
+        assert {v["match_id"] for v in config.imports.store.values()} == new_ids
+
+    async def test_a_new_season_starts_a_new_ledger(self, api, config, guild):
+        await _importer(api, config).run(guild, SEASON, _schedule(2))
+        api.created.clear()
+
+        report = await _importer(api, config).run(guild, SEASON + 1, _schedule(2))
+
+        assert len(report.created) == 32
+        assert all(k.startswith(f"{SEASON + 1}:") for k in config.imports.store)
+
+    async def test_outcomes_are_recorded_as_they_happen(self, config, guild):
+        api = StubMatchApi(fail_days={1})
+
+        await _importer(api, config).run(guild, SEASON, _schedule(2))
+
+        statuses = [v["status"] for v in config.imports.store.values()]
+        assert statuses.count(ImportStatus.FAILED) == 16
+        assert statuses.count(ImportStatus.CREATED) == 16
+        assert config.imports.writes == 32
+
+    async def test_progress_streams_to_the_caller(self, config, guild):
+        api = StubMatchApi(fail_days={3})
+        updates = []
+
+        async def progress(p):
+            updates.append(p)
+
+        await _importer(api, config, progress_every=10).run(guild, SEASON, _schedule(5), progress=progress)
+
+        assert [p.done for p in updates] == [10, 20, 30, 40, 50, 60, 70, 80]
+        assert (updates[-1].created, updates[-1].failed, updates[-1].total) == (64, 16, 80)
@@ -0,0 +1,378 @@
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from rsc.exceptions import RscException
+from rsc.members.joins import WELCOME_MESSAGE_MAX, JoinQueue, WelcomePlan, welcome_messages
+from rsc.members.members import MemberMixIn
+
+GUILD_ID = 395806681994493964
+
+
+def _create_mixin(**attrs):
+    saved = MemberMixIn.__abstractmethods__
+    MemberMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(MemberMixIn)
+    finally:
+        MemberMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+class FakeRole:
+    def __init__(self, id, default=False):
+        self.id = id
+        self._default = default
+
+    def is_default(self):
+        return self._default
+
+
+class FakeGuild:
+    """Just enough guild for the join pipeline, counting Discord writes."""
+
+    def __init__(self):
+        self.id = GUILD_ID
+        self.default_role = FakeRole(GUILD_ID, default=True)
+        self.members = {}
+        self.requests = Counter()
+
+    def get_member(self, id):
+        return self.members.get(id)
+
+    def join(self, id, name):
+        member = FakeMember(self, id, name)
+        self.members[id] = member
+        return member
+
+
+class FakeMember:
+    def __init__(self, guild, id, name):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.nick = None
+        self.roles = [guild.default_role]
+
+    @property
+    def mention(self):
+        return f"<@{self.id}>"
+
+    async def edit(self, *, nick=discord.utils.MISSING, roles=discord.utils.MISSING):
+        self.guild.requests["edit"] += 1
+        if nick is not discord.utils.MISSING:
+            self.nick = nick
+        if roles is not discord.utils.MISSING:
+            self.roles = [self.guild.default_role, *roles]
+
+    async def add_roles(self, *roles):
+        self.guild.requests["add_roles"] += 1
+        self.roles.extend(r for r in roles if r not in self.roles)
+
+
+def _api(known):
+    """`members` and `create_member` against a dict of discord_id -> rsc_name."""
+    calls = Counter()
+
+    async def members(guild, discord_id=None, limit=0, **kwargs):
+        calls["lookup"] += 1
+        name = known.get(discord_id)
+        return [MagicMock(rsc_name=name)] if name else []
+
+    async def create_member(guild, member, rsc_name=None):
+        calls["create"] += 1
+        known[member.id] = member.name
+
+    return calls, AsyncMock(side_effect=members), AsyncMock(side_effect=create_member)
+
+
+def _mixin(guild, known, plan):
+    calls, members, create_member = _api(known)
+    mixin = _create_mixin(
+        _api_conf={guild.id: MagicMock()},
+        members=members,
+        create_member=create_member,
+        welcome_plan=AsyncMock(return_value=plan),
+    )
+    return mixin, calls
+
+
+def _channel():
+    channel = MagicMock()
+    channel.send = AsyncMock()
+    return channel
+
+
+# --- JoinQueue ---
+
+
+class TestJoinQueue:
+    async def test_batches_joins_inside_window(self):
+        guild = FakeGuild()
+        flushed = []
+        queue = JoinQueue(AsyncMock(side_effect=lambda g, batch: flushed.append(batch)), window=0.01)
+
+        for i in range(5):
+            queue.put(guild.join(i, f"m{i}"))
+        await queue.join()
+
+        assert [len(b) for b in flushed] == [5]
+        assert queue.pending == 0
+
+    async def test_flushes_early_at_max_size(self):
+        guild = FakeGuild()
+        flushed = []
+        queue = JoinQueue(AsyncMock(side_effect=lambda g, batch: flushed.append(batch)), window=60, max_size=10)
+
+        for i in range(25):
+            queue.put(guild.join(i, f"m{i}"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # The remaining 5 are still inside the window
+        assert [len(b) for b in flushed] == [10, 10]
+        assert queue.pending == 5
+        await queue.close()
+
+    async def test_rejoin_inside_window_is_flushed_once(self):
+        guild = FakeGuild()
+        flushed = []
+        queue = JoinQueue(AsyncMock(side_effect=lambda g, batch: flushed.append(batch)), window=0.01)
+
+        first = guild.join(1, "m1")
+        queue.put(first)
+        again = guild.join(1, "m1")
+        queue.put(again)
+        await queue.join()
+
+        assert flushed == [[again]]
+
+    async def test_flush_error_does_not_stop_the_queue(self):
+        guild = FakeGuild()
+        flush = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        queue = JoinQueue(flush, window=0.01)
+
+        queue.put(guild.join(1, "m1"))
+        await queue.join()
+        queue.put(guild.join(2, "m2"))
+        await queue.join()
+
+        assert flush.await_count == 2
+
+    async def test_close_drops_pending(self):
+        guild = FakeGuild()
+        flush = AsyncMock()
+        queue = JoinQueue(flush, window=60)
+
+        queue.put(guild.join(1, "m1"))
+        await asyncio.sleep(0)
+        await queue.close()
+
+        flush.assert_not_awaited()
+        assert queue.pending == 0
+
+
+# --- welcome_messages ---
+
+
+class TestWelcomeMessages:
+    def test_packs_welcomes_one_per_line(self):
+        guild = FakeGuild()
+        members = [guild.join(i, f"m{i}") for i in range(3)]
+
+        assert welcome_messages("Hi {member.mention}", members) == ["Hi <@0>\nHi <@1>\nHi <@2>"]
+
+    def test_splits_at_discord_limit(self):
+        guild = FakeGuild()
+        members = [guild.join(10**17 + i, f"m{i}") for i in range(500)]
+
+        messages = welcome_messages("Welcome to RSC {member.mention}!", members)
+
+        assert all(len(m) <= WELCOME_MESSAGE_MAX for m in messages)
+        assert sum(m.count("\n") + 1 for m in messages) == 500
+        assert len(messages) < 20
+
+    def test_truncates_oversized_welcome(self):
+        guild = FakeGuild()
+        messages = welcome_messages("x" * 3000 + "{member.mention}", [guild.join(1, "m1"), guild.join(2, "m2")])
+
+        assert [len(m) for m in messages] == [WELCOME_MESSAGE_MAX, WELCOME_MESSAGE_MAX]
+
+
+# --- process_joins ---
+
+
+class TestProcessJoins:
+    async def test_existing_member_gets_roles_and_nick_in_one_edit(self):
+        guild = FakeGuild()
+        role = FakeRole(1)
+        member = guild.join(100, "discordname")
+        mixin, calls = _mixin(guild, {100: "RSCName"}, WelcomePlan(roles=[role]))
+
+        await mixin.process_joins(guild, [member])
+
+        assert guild.requests["edit"] == 1
+        assert member.nick == "RSCName"
+        assert role in member.roles
+        assert calls == Counter(lookup=1)
+
+    async def test_new_member_is_created_and_not_renamed(self):
+        guild = FakeGuild()
+        member = guild.join(100, "discordname")
+        mixin, calls = _mixin(guild, {}, WelcomePlan(roles=[FakeRole(1)]))
+
+        await mixin.process_joins(guild, [member])
+
+        assert calls == Counter(lookup=1, create=1)
+        assert member.nick is None
+        assert guild.requests["edit"] == 1
+
+    async def test_nothing_to_change_makes_no_edit(self):
+        guild = FakeGuild()
+        member = guild.join(100, "discordname")
+        member.nick = "RSCName"
+        mixin, _ = _mixin(guild, {100: "RSCName"}, WelcomePlan())
+
+        await mixin.process_joins(guild, [member])
+
+        assert guild.requests["edit"] == 0
+
+    async def test_member_who_left_is_skipped(self):
+        guild = FakeGuild()
+        member = guild.join(100, "discordname")
+        del guild.members[100]
+        mixin, calls = _mixin(guild, {100: "RSCName"}, WelcomePlan(roles=[FakeRole(1)]))
+
+        await mixin.process_joins(guild, [member])
+
+        assert not calls
+        mixin.welcome_plan.assert_not_awaited()
+
+    async def test_welcomes_without_api_settings(self):
+        guild = FakeGuild()
+        role = FakeRole(1)
+        member = guild.join(100, "discordname")
+        channel = _channel()
+        mixin, calls = _mixin(guild, {}, WelcomePlan(roles=[role], channel=channel, message="Hi {member.mention}"))
+        mixin._api_conf = {}
+
+        await mixin.process_joins(guild, [member])
+
+        assert not calls
+        assert role in member.roles
+        channel.send.assert_awaited_once()
+
+    async def test_lookup_failure_still_welcomes(self):
+        guild = FakeGuild()
+        role = FakeRole(1)
+        member = guild.join(100, "discordname")
+        mixin, _ = _mixin(guild, {}, WelcomePlan(roles=[role]))
+        mixin.members = AsyncMock(side_effect=RscException(message="API down"))
+
+        await mixin.process_joins(guild, [member])
+
+        assert role in member.roles
+        assert member.nick is None
+
+    async def test_forbidden_edit_is_logged_not_raised(self):
+        guild = FakeGuild()
+        member = guild.join(100, "discordname")
+        member.edit = AsyncMock(side_effect=discord.Forbidden(MagicMock(status=403), "Missing Permissions"))
+        mixin, _ = _mixin(guild, {100: "RSCName"}, WelcomePlan())
+
+        await mixin.process_joins(guild, [member])
+
+        member.edit.assert_awaited_once()
+
+    async def test_rejected_edit_retries_roles_and_nick_separately(self):
+        guild = FakeGuild()
+        role = FakeRole(1)
+        member = guild.join(100, "discordname")
+        forbidden = discord.Forbidden(MagicMock(status=403), "Missing Permissions")
+        member.edit = AsyncMock(side_effect=[forbidden, None])
+        mixin, _ = _mixin(guild, {100: "RSCName"}, WelcomePlan(roles=[role]))
+
+        await mixin.process_joins(guild, [member])
+
+        assert role in member.roles
+        assert guild.requests["add_roles"] == 1
+        assert member.edit.await_args_list[-1].kwargs == {"nick": "RSCName"}
+
+    async def test_failed_nick_retry_keeps_welcome_roles(self):
+        guild = FakeGuild()
+        role = FakeRole(1)
+        member = guild.join(100, "discordname")
+        member.edit = AsyncMock(side_effect=discord.HTTPException(MagicMock(status=400), "Invalid Form Body"))
+        mixin, _ = _mixin(guild, {100: "RSCName"}, WelcomePlan(roles=[role]))
+
+        await mixin.process_joins(guild, [member])
+
+        assert role in member.roles
+        assert member.edit.await_count == 2
+
+    async def test_edit_keeps_roles_granted_after_queueing(self):
+        guild = FakeGuild()
+        welcome, other = FakeRole(1), FakeRole(2)
+        queued = guild.join(100, "discordname")
+        # Another bot grants a role after the join was queued
+        fresh = FakeMember(guild, 100, "discordname")
+        fresh.roles.append(other)
+        guild.members[100] = fresh
+        mixin, _ = _mixin(guild, {}, WelcomePlan(roles=[welcome]))
+
+        await mixin.process_joins(guild, [queued])
+
+        assert welcome in fresh.roles
+        assert other in fresh.roles
+
+    async def test_welcomes_do_not_wait_for_edits(self):
+        guild = FakeGuild()
+        member = guild.join(100, "discordname")
+        channel = _channel()
+        released = asyncio.Event()
+
+        async def slow_edit(**kwargs):
+            await released.wait()
+
+        member.edit = slow_edit
+        mixin, _ = _mixin(guild, {100: "RSCName"}, WelcomePlan(roles=[FakeRole(1)], channel=channel, message="Hi {member.mention}"))
+
+        task = asyncio.create_task(mixin.process_joins(guild, [member]))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        channel.send.assert_awaited_once()
+        assert not task.done()
+        released.set()
+        await task
+
+
+# --- join burst ---
+
+
+class TestJoinBurst:
+    async def test_burst_of_500_joins(self):
+        guild = FakeGuild()
+        roles = [FakeRole(1), FakeRole(2)]
+        channel = _channel()
+        known = {i: f"Player{i}" for i in range(350)}
+        mixin, calls = _mixin(guild, dict(known), WelcomePlan(roles=roles, channel=channel, message="Welcome {member.mention}!"))
+        mixin._joins = JoinQueue(mixin.process_joins, window=0.01)
+
+        joined = [guild.join(i, f"user{i}") for i in range(500)]
+        for member in joined:
+            await mixin.on_join_member_processing(member)
+        await mixin._joins.join()
+
+        # One PATCH per member, no per role requests
+        assert guild.requests == Counter(edit=500)
+        assert calls == Counter(lookup=500, create=150)
+        assert mixin.welcome_plan.await_count == 5
+        assert channel.send.await_count < 50
+        assert all(all(r in m.roles for r in roles) for m in joined)
+        assert all(m.nick == known[m.id] for m in joined[:350])
+        assert all(m.nick is None for m in joined[350:])
@@ -0,0 +1,310 @@
+"""Tests for `MembershipAudit` and the prefetching `LeagueMixIn.player_pages` behind it.
+
+`StubLeagueApi` stands in for `players` and `total_players`: it serves a fixed
+league by offset, sleeps a little per request, and records how many requests
+were in flight at once. `FakeGuild` is 10,000 plain member objects, the size of
+the larger leagues, so the set lookups see realistic volume.
+"""
+
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import pytest
+
+from rsc.admin.membership import AUDIT_PROGRESS_PAGES, MembershipAudit
+from rsc.enums import ACTIVE_STATUSES, Status
+from rsc.leagues.leagues import LeagueMixIn
+
+GUILD_ID = 395806681994493964
+MEMBERS = 10_000
+# Discord ids of league players start here; members take the ids below it.
+PLAYER_ID_BASE = 1_000_000
+
+
+def _league_player(lp_id: int, discord_id: int | None, status: Status | str = Status.ROSTERED):
+    return SimpleNamespace(id=lp_id, status=str(status), player=SimpleNamespace(name=f"Player {lp_id}", discord_id=discord_id))
+
+
+class FakeGuild:
+    def __init__(self, member_ids):
+        self.id = GUILD_ID
+        self.members = [SimpleNamespace(id=i) for i in member_ids]
+
+
+class StubLeagueApi:
+    """`players` and `total_players` over a fixed list, with per request latency."""
+
+    def __init__(self, players, latency: float = 0.001):
+        self.league = players
+        self.latency = latency
+        self.requests = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def total_players(self, guild, status=None, season=None, **kwargs) -> int:
+        self.requests += 1
+        return len(self.league)
+
+    async def players(self, guild, status=None, season=None, limit=0, offset=0, **kwargs):
+        self.requests += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self.league[offset : offset + limit]
+        finally:
+            self.in_flight -= 1
+
+
+def _source(api: StubLeagueApi, **attrs):
+    """A `LeagueMixIn` whose API calls go to `api`."""
+    saved = LeagueMixIn.__abstractmethods__
+    LeagueMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(LeagueMixIn)
+    finally:
+        LeagueMixIn.__abstractmethods__ = saved
+    m.players = api.players
+    m.total_players = api.total_players
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def league():
+    """2,500 players, the first 2,450 in the server and 50 who left, plus a few edge rows."""
+    players = [_league_player(i, PLAYER_ID_BASE + i) for i in range(2500)]
+    players += [
+        _league_player(9000, None),
+        _league_player(9001, 900_001, Status.FORMER),
+        _league_player(9002, 900_002, "??"),
+    ]
+    return players
+
+
+@pytest.fixture
+def guild():
+    # 10k members: 7,550 non players plus the first 2,450 league players
+    return FakeGuild([*range(MEMBERS - 2450), *(PLAYER_ID_BASE + i for i in range(2450))])
+
+
+@pytest.fixture
+def api(league):
+    return StubLeagueApi(league)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def audit(clock):
+    return MembershipAudit(clock=clock)
+
+
+def _ids(players):
+    return sorted(lp.player.discord_id for lp in players)
+
+
+class TestPlayerPages:
+    async def test_yields_every_page_in_order(self, api, league, mock_guild):
+        source = _source(api)
+
+        pages = [page async for page in source.player_pages(mock_guild, per_page=100)]
+
+        assert [lp for page in pages for lp in page] == league
+        assert all(len(page) == 100 for page in pages[:-1])
+
+    async def test_keeps_pages_in_flight(self, api, mock_guild):
+        source = _source(api)
+
+        async for _ in source.player_pages(mock_guild, per_page=100, prefetch=4):
+            pass
+
+        assert api.peak == 4
+
+    async def test_players_added_after_the_count_are_not_lost(self, api, league, mock_guild):
+        # Counted at 2,500, on a page boundary, then 150 more arrive mid sweep
+        api.league = league[:2500]
+        source = _source(api)
+
+        seen = []
+        async for page in source.player_pages(mock_guild, per_page=100, total=2500):
+            if not seen:
+                api.league = api.league + [_league_player(10_000 + i, None) for i in range(150)]
+            seen.extend(page)
+
+        assert len(seen) == 2650
+
+    async def test_stopping_early_cancels_the_prefetch(self, api, mock_guild):
+        source = _source(api)
+
+        async with aclosing(source.player_pages(mock_guild, per_page=100, prefetch=4)) as pages:
+            async for _ in pages:
+                break
+        await asyncio.sleep(0.01)
+
+        assert api.in_flight == 0
+        assert api.requests <= 6
+
+
+class TestAudit:
+    async def test_reports_players_missing_from_a_large_guild(self, audit, api, guild):
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert _ids(result.missing) == [PLAYER_ID_BASE + i for i in range(2450, 2500)]
+        assert result.checked == 2503
+        assert result.total == 2503
+        assert result.active == 2500
+        assert [lp.id for lp in result.no_discord_id] == [9000]
+        assert not result.cached
+
+    async def test_an_explicit_status_narrows_the_scope(self, audit, api, guild):
+        result = await audit.run(_source(api), guild, statuses=frozenset({Status.FORMER}), season=42)
+
+        assert _ids(result.missing) == [900_001]
+        assert result.active == 1
+
+    async def test_a_player_with_rows_in_several_seasons_is_reported_once(self, audit, guild):
+        api = StubLeagueApi([_league_player(1, 900_077), _league_player(2, 900_077, Status.FREE_AGENT)])
+
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES)
+
+        assert _ids(result.missing) == [900_077]
+
+    async def test_progress_carries_partial_results(self, audit, api, guild):
+        updates = []
+
+        async def progress(p):
+            updates.append((p.checked, len(p.missing)))
+
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42, progress=progress)
+
+        assert len(updates) == 26 // AUDIT_PROGRESS_PAGES
+        assert updates[0] == (100 * AUDIT_PROGRESS_PAGES, 0)
+        assert [checked for checked, _ in updates] == sorted(checked for checked, _ in updates)
+        assert updates[-1][1] > 0
+
+    async def test_api_errors_propagate(self, audit, api, guild):
+        async def api_down(*args, **kwargs):
+            raise RuntimeError("api down")
+
+        source = _source(api, total_players=api_down)
+
+        with pytest.raises(RuntimeError):
+            await audit.run(source, guild, statuses=ACTIVE_STATUSES)
+        assert audit.snapshot(GUILD_ID, None) is None
+
+
+class TestSnapshot:
+    async def test_a_repeat_within_the_ttl_makes_no_requests(self, audit, api, guild, clock):
+        first = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        requests = api.requests
+        clock.now += audit.ttl / 2
+
+        second = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert api.requests == requests
+        assert second.cached
+        assert _ids(second.missing) == _ids(first.missing)
+
+    async def test_the_member_set_is_always_fresh(self, audit, api, guild, clock):
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        guild.members.append(SimpleNamespace(id=PLAYER_ID_BASE + 2450))
+
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert result.cached
+        assert PLAYER_ID_BASE + 2450 not in _ids(result.missing)
+
+    async def test_only_reportable_rows_are_kept_whole(self, audit, api, guild, league):
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        snapshot = audit.snapshot(GUILD_ID, 42)
+
+        assert len(snapshot.rows) == len(league)
+        # The 50 who left, plus the three edge rows, none of them members
+        assert len(snapshot.kept) == 53
+
+    async def test_a_member_who_left_since_forces_a_resweep(self, audit, api, guild):
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        requests = api.requests
+        left = guild.members.pop()
+
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert not result.cached
+        assert api.requests > requests
+        assert left.id in _ids(result.missing)
+
+    async def test_seasons_are_kept_apart(self, audit, api, guild):
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        requests = api.requests
+
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=43)
+
+        assert not result.cached
+        assert api.requests > requests
+
+    async def test_confirmed_departures_carry_over_a_resweep(self, audit, api, guild, clock):
+        first = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        audit.record_departed(GUILD_ID, 42, _ids(first.missing))
+        clock.now += audit.ttl + 1
+
+        second = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert not second.cached
+        assert second.confirmed == set(_ids(first.missing))
+        assert second.changed == 0
+
+    async def test_a_changed_row_is_confirmed_again(self, audit, api, guild, league, clock):
+        first = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        audit.record_departed(GUILD_ID, 42, _ids(first.missing))
+        league[2450].status = Status.FREE_AGENT.value
+        clock.now += audit.ttl + 1
+
+        second = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert second.changed == 1
+        assert PLAYER_ID_BASE + 2450 not in second.confirmed
+        assert len(second.confirmed) == 49
+
+    async def test_a_rejoined_member_is_no_longer_confirmed(self, audit, api, guild, clock):
+        first = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        audit.record_departed(GUILD_ID, 42, _ids(first.missing))
+        guild.members.append(SimpleNamespace(id=PLAYER_ID_BASE + 2450))
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        guild.members.pop()
+
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert PLAYER_ID_BASE + 2450 in _ids(result.missing)
+        assert PLAYER_ID_BASE + 2450 not in result.confirmed
+
+    async def test_invalidate_forces_a_resweep(self, audit, api, guild):
+        await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+        requests = api.requests
+
+        audit.invalidate(GUILD_ID)
+        result = await audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42)
+
+        assert not result.cached
+        assert api.requests > requests
+
+    async def test_concurrent_audits_share_one_sweep(self, audit, api, guild):
+        results = await asyncio.gather(*(audit.run(_source(api), guild, statuses=ACTIVE_STATUSES, season=42) for _ in range(3)))
+
+        # One count and 26 pages; the other two were served from the snapshot
+        assert api.requests == 1 + 26
+        assert [r.cached for r in results].count(False) == 1
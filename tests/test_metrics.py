@@ -0,0 +1,255 @@
+"""Tests for the in-process metrics registry and its instrumentation hooks."""
+
+import logging
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from rsc.core import RSC
+from rsc.logs import GuildLogAdapter
+from rsc.metrics import (
+    API_REQUEST_SECONDS,
+    API_REQUESTS,
+    DISCORD_REQUEST_SECONDS,
+    DISCORD_REQUESTS,
+    LOOP_ERRORS,
+    LOOP_LAST_RUN,
+    LOOP_SECONDS,
+    Histogram,
+    MetricsRegistry,
+    endpoint_label,
+    instrument_api_client,
+    instrument_discord_http,
+    timed_loop,
+    uninstrument_discord_http,
+)
+
+
+class TestHistogram:
+    def test_empty(self):
+        hist = Histogram()
+        assert hist.quantile(0.5) == 0.0
+        assert hist.mean == 0.0
+
+    def test_quantiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-3, 1.5) for _ in range(5_000))
+        hist = Histogram()
+        for v in values:
+            hist.record(v)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = values[round(q * len(values)) - 1]
+            assert hist.quantile(q) == pytest.approx(exact, rel=0.02, abs=2e-6)
+
+    def test_summary_fields(self):
+        hist = Histogram()
+        for v in (0.2, 0.1, 0.3):
+            hist.record(v)
+
+        assert hist.count == 3
+        assert hist.min == 0.1
+        assert hist.max == 0.3
+        assert hist.mean == pytest.approx(0.2)
+
+    def test_quantile_never_exceeds_max(self):
+        hist = Histogram()
+        hist.record(1.2345)
+        assert hist.quantile(0.99) == 1.2345
+
+    def test_buckets_stay_small(self):
+        hist = Histogram()
+        for micros in range(0, 60_000_000, 997):
+            hist.record(micros / 1_000_000)
+        assert len(hist.buckets) < 2_000
+
+
+class TestRegistry:
+    def test_same_labels_same_series(self):
+        registry = MetricsRegistry()
+        registry.counter("hits", a=1, b="x").inc()
+        registry.counter("hits", b="x", a="1").inc(2)
+
+        assert registry.counter("hits", a=1, b="x").value == 3
+        assert len(registry.samples("hits")) == 1
+
+    def test_timer_records_on_error(self):
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError), registry.timer("op"):
+            raise ValueError
+
+        assert registry.histogram("op").count == 1
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.counter("c").inc()
+        registry.reset()
+        assert registry.samples("c") == []
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.counter(API_REQUESTS, method="GET", endpoint="/a", status="200").inc(4)
+        registry.gauge(LOOP_LAST_RUN, loop="l").set(12.5)
+        registry.histogram(API_REQUEST_SECONDS, method="GET", endpoint='/a"b').record(0.25)
+
+        text = registry.render_prometheus()
+
+        assert f"# TYPE {API_REQUESTS} counter" in text
+        assert f'{API_REQUESTS}{{endpoint="/a",method="GET",status="200"}} 4' in text
+        assert f'{LOOP_LAST_RUN}{{loop="l"}} 12.5' in text
+        assert f"# TYPE {API_REQUEST_SECONDS} summary" in text
+        assert f'{API_REQUEST_SECONDS}{{endpoint="/a\\"b",method="GET",quantile="0.5"}}' in text
+        assert f'{API_REQUEST_SECONDS}_count{{endpoint="/a\\"b",method="GET"}} 1' in text
+        assert text.endswith("\n")
+
+
+class TestTimedLoop:
+    async def test_records_iteration(self):
+        registry = MetricsRegistry()
+
+        @timed_loop("demo", registry=registry)
+        async def body():
+            return 5
+
+        assert await body() == 5
+        assert registry.histogram(LOOP_SECONDS, loop="demo").count == 1
+        assert registry.gauge(LOOP_LAST_RUN, loop="demo").value > 0
+
+    async def test_counts_errors(self):
+        registry = MetricsRegistry()
+
+        @timed_loop("demo", registry=registry)
+        async def body():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await body()
+        assert registry.counter(LOOP_ERRORS, loop="demo").value == 1
+        assert registry.histogram(LOOP_SECONDS, loop="demo").count == 1
+
+
+class TestApiClientInstrumentation:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://api.rscna.com/api/v1/players/123/", "/api/v1/players/{id}/"),
+            ("https://api.rscna.com/api/v1/franchises/?league=1", "/api/v1/franchises/"),
+            ("/api/v1/teams/9/players/44", "/api/v1/teams/{id}/players/{id}"),
+        ],
+    )
+    def test_endpoint_label(self, url, expected):
+        assert endpoint_label(url) == expected
+
+    async def test_records_per_endpoint(self):
+        registry = MetricsRegistry()
+        client = MagicMock()
+        client.call_api = AsyncMock(return_value=MagicMock(status=200))
+        instrument_api_client(client, registry=registry)
+
+        await client.call_api("GET", "https://x/api/v1/players/1/")
+        await client.call_api("GET", "https://x/api/v1/players/2/")
+
+        assert registry.histogram(API_REQUEST_SECONDS, method="GET", endpoint="/api/v1/players/{id}/").count == 2
+        assert registry.counter(API_REQUESTS, method="GET", endpoint="/api/v1/players/{id}/", status="200").value == 2
+
+    async def test_records_failures(self):
+        registry = MetricsRegistry()
+        client = MagicMock()
+        client.call_api = AsyncMock(side_effect=OSError)
+        instrument_api_client(client, registry=registry)
+
+        with pytest.raises(OSError):
+            await client.call_api("POST", "https://x/api/v1/transactions/sign/")
+
+        assert registry.counter(API_REQUESTS, method="POST", endpoint="/api/v1/transactions/sign/", status="error").value == 1
+
+
+class FakeHTTP:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+
+    async def request(self, route, **kwargs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return {"id": "1"}
+
+
+class TestDiscordInstrumentation:
+    async def test_records_per_route(self):
+        registry = MetricsRegistry()
+        http = FakeHTTP()
+        instrument_discord_http(http, registry=registry)  # ty: ignore[invalid-argument-type]
+
+        route = discord.http.Route("POST", "/channels/{channel_id}/messages", channel_id=1)
+        assert await http.request(route) == {"id": "1"}
+
+        assert registry.histogram(DISCORD_REQUEST_SECONDS, method="POST", route="/channels/{channel_id}/messages").count == 1
+        assert registry.counter(DISCORD_REQUESTS, method="POST", route="/channels/{channel_id}/messages", status="ok").value == 1
+
+    async def test_records_http_status(self):
+        registry = MetricsRegistry()
+        http = FakeHTTP(error=discord.Forbidden(MagicMock(status=403), "nope"))
+        instrument_discord_http(http, registry=registry)  # ty: ignore[invalid-argument-type]
+
+        route = discord.http.Route("PATCH", "/guilds/{guild_id}/members/{user_id}", guild_id=1, user_id=2)
+        with pytest.raises(discord.Forbidden):
+            await http.request(route)
+
+        assert registry.counter(DISCORD_REQUESTS, method="PATCH", route=route.path, status="403").value == 1
+
+    async def test_idempotent_and_reversible(self):
+        registry = MetricsRegistry()
+        http = FakeHTTP()
+        instrument_discord_http(http, registry=registry)  # ty: ignore[invalid-argument-type]
+        instrument_discord_http(http, registry=registry)  # ty: ignore[invalid-argument-type]
+
+        route = discord.http.Route("GET", "/users/@me")
+        await http.request(route)
+        assert registry.histogram(DISCORD_REQUEST_SECONDS, method="GET", route="/users/@me").count == 1
+
+        uninstrument_discord_http(http)  # ty: ignore[invalid-argument-type]
+        await http.request(route)
+        assert registry.histogram(DISCORD_REQUEST_SECONDS, method="GET", route="/users/@me").count == 1
+        assert http.calls == 2
+
+
+class TestLazyGuildLogging:
+    def test_percent_in_guild_name_with_args(self, mock_guild, caplog):
+        mock_guild.name = "100% Gaming"
+        log = GuildLogAdapter(logging.getLogger("red.rsc.tests.metrics"))
+
+        with caplog.at_level(logging.DEBUG, logger="red.rsc.tests.metrics"):
+            log.debug("Synced %d members", 5, guild=mock_guild)
+            log.debug("Plain 50% message", guild=mock_guild)
+
+        assert caplog.messages == ["[100% Gaming] Synced 5 members", "[100% Gaming] Plain 50% message"]
+
+    def test_args_not_formatted_when_disabled(self, mock_guild):
+        log = GuildLogAdapter(logging.getLogger("red.rsc.tests.metrics.quiet"))
+        log.logger.setLevel(logging.INFO)
+        arg = MagicMock()
+
+        log.debug("value %s", arg, guild=mock_guild)
+
+        arg.__str__.assert_not_called()
+
+
+class TestPerfEmbed:
+    def test_rows_sorted_by_total_time(self):
+        registry = MetricsRegistry()
+        registry.histogram(API_REQUEST_SECONDS, method="GET", endpoint="/fast/").record(0.01)
+        for _ in range(3):
+            registry.histogram(API_REQUEST_SECONDS, method="GET", endpoint="/slow/").record(0.5)
+
+        embed = RSC._perf_embed("RSC API", registry.samples(API_REQUEST_SECONDS), ("method", "endpoint"))
+
+        lines = embed.description.splitlines()
+        assert lines[2].startswith("GET /slow/")
+        assert lines[3].startswith("GET /fast/")
+
+    def test_no_samples(self):
+        assert RSC._perf_embed("Discord", [], ("route",)).description == "No samples yet."
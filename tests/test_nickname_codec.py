@@ -0,0 +1,161 @@
+"""Tests for `NicknameCodec`, the single pass display name parser.
+
+The `legacy_*` functions are the helpers `rsc/utils/utils.py` used before the
+codec, one `split` or `count` or `replace` pass each. They are the oracle: the
+codec is checked against them over thousands of seeded random display names
+built from the characters that make nicknames awkward (pipes, stray spaces,
+accolade emoji mid name, other emoji and CJK).
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from rsc import const
+from rsc.types import Accolades
+from rsc.utils import utils
+from rsc.utils.nicknames import NicknameCodec
+
+TROPHY = const.TROPHY_EMOJI
+STAR = const.STAR_EMOJI
+CROWN = const.DEV_LEAGUE_EMOJI
+COOKIE = const.COOKIE_EMOJI
+CUP = const.COMBINE_CUP_EMOJI
+ACCOLADES = (TROPHY, STAR, CROWN, COOKIE, CUP)
+
+# Weighted toward the separator and the emoji, so most samples exercise them
+ALPHABET = [*"abcXYZ019_'-.", " ", " ", " | ", " | ", "|", *ACCOLADES, *ACCOLADES, "\U0001f525", "東", "\U0001d5d4"]
+SAMPLES = 5000
+
+
+def legacy_remove_prefix(display_name: str) -> str:
+    result = display_name.split(" | ", maxsplit=1)
+    return result[0].strip() if len(result) == 1 else result[1].strip()
+
+
+def legacy_get_prefix(display_name: str) -> str | None:
+    result = display_name.split(" | ", maxsplit=1)
+    return None if len(result) == 1 else result[0].strip()
+
+
+def legacy_strip_accolades(value: str) -> str:
+    for emoji in ACCOLADES:
+        value = value.replace(emoji, "")
+    return value.strip()
+
+
+def legacy_accolades(display_name: str) -> Accolades:
+    return Accolades(
+        trophy=display_name.count(TROPHY),
+        star=display_name.count(STAR),
+        devleague=display_name.count(CROWN) + display_name.count(COOKIE) * 4,
+        combine_cup=display_name.count(CUP),
+    )
+
+
+def legacy_format_prefix(display_name: str, prefix: str | None) -> str:
+    accolades = legacy_accolades(display_name)
+    name = legacy_strip_accolades(legacy_remove_prefix(display_name))
+    if prefix:
+        return f"{prefix} | {name} {accolades}".strip()
+    return f"{name} {accolades}".strip()
+
+
+def _random_names(seed: int, count: int = SAMPLES) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choices(ALPHABET, k=rng.randrange(0, 16))) for _ in range(count)]
+
+
+def _fields(a: Accolades) -> tuple[int, int, int, int]:
+    return (a.trophy, a.star, a.devleague, a.combine_cup)
+
+
+@pytest.fixture
+def codec():
+    return NicknameCodec()
+
+
+@pytest.mark.parametrize("seed", range(4))
+class TestEquivalence:
+    def test_prefix_and_name(self, codec, seed):
+        for display_name in _random_names(seed):
+            parsed = codec.parse(display_name)
+            assert parsed.prefix == legacy_get_prefix(display_name), display_name
+            assert parsed.unprefixed == legacy_remove_prefix(display_name), display_name
+            assert parsed.name == legacy_strip_accolades(legacy_remove_prefix(display_name)), display_name
+            assert parsed.bare == legacy_strip_accolades(display_name), display_name
+
+    def test_accolades(self, codec, seed):
+        for display_name in _random_names(seed):
+            assert _fields(codec.parse(display_name).accolades) == _fields(legacy_accolades(display_name)), display_name
+
+    def test_reprefix(self, codec, seed):
+        for display_name in _random_names(seed):
+            for prefix in ("TQD", "FA", "", None):
+                assert codec.reprefix(display_name, prefix) == legacy_format_prefix(display_name, prefix), display_name
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("seed", range(4))
+    def test_render_then_parse(self, codec, seed):
+        rng = random.Random(seed)
+        for _ in range(1000):
+            # What the bot itself writes: no emoji in the name, no separator in
+            # the prefix. Without a prefix, a name with a pipe of its own reads
+            # back as one, so only prefixed names get pipes.
+            prefix = rng.choice([None, "FA", "DE", "TQD", "<0>"])
+            alphabet = [*"abcXYZ019_'-. ", "東", *(["|"] if prefix else [])]
+            name = "".join(rng.choices(alphabet, k=rng.randrange(1, 12))).strip() or "x"
+            accolades = Accolades(trophy=rng.randrange(3), star=rng.randrange(3), devleague=rng.randrange(9), combine_cup=rng.randrange(2))
+
+            parsed = codec.parse(codec.render(name, accolades, prefix))
+
+            assert parsed.prefix == prefix
+            assert parsed.name == name
+            assert _fields(parsed.accolades) == _fields(accolades)
+
+    def test_cookies_are_four_crowns(self, codec):
+        assert codec.render("Dev", Accolades(devleague=9)) == f"Dev {CROWN}{COOKIE * 2}"
+        assert codec.parse(f"Dev {CROWN}{COOKIE * 2}").devleague == 9
+
+
+class TestCache:
+    def test_repeat_parse_is_a_hit(self, codec):
+        first = codec.parse(f"TQD | Pumpkin {TROPHY}")
+
+        assert codec.parse(f"TQD | Pumpkin {TROPHY}") is first
+        assert (codec.hits, codec.misses) == (1, 1)
+
+    def test_accolades_are_not_shared(self, codec):
+        # Trophy commands add to what they are handed
+        codec.parse(f"Pumpkin {TROPHY}").accolades.trophy += 1
+
+        assert codec.parse(f"Pumpkin {TROPHY}").accolades.trophy == 1
+
+    def test_least_recently_used_is_evicted(self):
+        codec = NicknameCodec(maxsize=2)
+        codec.parse("a")
+        codec.parse("b")
+        codec.parse("a")
+        codec.parse("c")
+
+        assert len(codec) == 2
+        codec.parse("a")
+        assert codec.misses == 3
+        codec.parse("b")
+        assert codec.misses == 4
+
+
+class TestHelpers:
+    """The async helpers in `rsc.utils.utils` answer through the shared codec."""
+
+    async def test_helpers_match_legacy(self):
+        for display_name in _random_names(seed=99, count=500):
+            member = SimpleNamespace(display_name=display_name)
+            assert await utils.remove_prefix(member) == legacy_remove_prefix(display_name)
+            assert await utils.get_prefix(member) == legacy_get_prefix(display_name)
+            assert await utils.strip_discord_accolades(display_name) == legacy_strip_accolades(display_name)
+            assert await utils.devleague_count(member) == legacy_accolades(display_name).devleague
+            assert _fields(await utils.member_accolades(member)) == _fields(legacy_accolades(display_name))
+            assert await utils.format_discord_prefix(member, "OCE") == legacy_format_prefix(display_name, "OCE")
@@ -0,0 +1,216 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from rsc.utils.nicknames import FORBIDDEN_REASON, OWNER_REASON, NicknameRewrite, apply_nicknames, errors_embed, plan_nicknames
+
+
+def _http_exception(status: int, text: str = ""):
+    exc = discord.HTTPException(MagicMock(status=status), {"message": text, "code": 0})
+    exc.text = text
+    return exc
+
+
+class FakeGuild:
+    """Members whose nickname edits take `latency` seconds, tracking requests in flight."""
+
+    def __init__(self, latency=0.001):
+        self.id = 395806681994493964
+        self.owner_id = 1
+        self.latency = latency
+        self.members = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.errors: dict[int, discord.HTTPException] = {}
+
+    def add_member(self, id, name):
+        member = FakeMember(self, id, name)
+        self.members[id] = member
+        return member
+
+    async def request(self, member):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if exc := self.errors.get(member.id):
+                raise exc
+        finally:
+            self.in_flight -= 1
+
+
+class FakeMember:
+    def __init__(self, guild, id, name):
+        self.guild = guild
+        self.id = id
+        self.display_name = name
+        self.mention = f"<@{id}>"
+
+    async def edit(self, *, nick=None, reason=None):
+        await self.guild.request(self)
+        self.display_name = nick
+
+    def __hash__(self):
+        return self.id
+
+
+def _franchise(members=60, prefix="OLD"):
+    guild = FakeGuild()
+    for i in range(100, 100 + members):
+        guild.add_member(i, f"{prefix} | Player{i}")
+    return guild
+
+
+async def _rebrand(m):
+    return f"NEW | {m.display_name.split(' | ', 1)[-1]}"
+
+
+class TestPlanNicknames:
+    async def test_targets_computed_up_front(self):
+        guild = _franchise(members=5)
+
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        assert list(plan.targets.values()) == [f"NEW | Player{i}" for i in range(100, 105)]
+        assert guild.requests == 0
+
+    async def test_noop_edits_are_dropped(self):
+        guild = _franchise(members=5)
+        guild.members[102].display_name = "NEW | Player102"
+
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        assert plan.total == 4
+        assert plan.unchanged == 1
+
+    async def test_invalid_is_recorded(self):
+        guild = _franchise(members=3)
+
+        async def rewrite(m):
+            if m.id == 101:
+                raise ValueError("Discord name is too long")
+            return await _rebrand(m)
+
+        plan = await plan_nicknames(guild.members.values(), rewrite)
+
+        assert plan.total == 2
+        assert plan.invalid == {guild.members[101]: "Discord name is too long"}
+
+
+class TestApplyNicknames:
+    async def test_renames_everyone(self):
+        guild = _franchise()
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        await apply_nicknames(guild, plan, concurrency=8)
+
+        assert all(m.display_name.startswith("NEW | ") for m in guild.members.values())
+        assert len(plan.renamed) == plan.done == 60
+        assert guild.max_in_flight == 8
+
+    async def test_failures_do_not_abort(self):
+        guild = _franchise(members=20)
+        guild.errors = {103: discord.Forbidden(MagicMock(status=403), "Missing Permissions"), 107: _http_exception(500, "oops")}
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        await apply_nicknames(guild, plan)
+
+        assert len(plan.renamed) == 18
+        assert plan.failed == {guild.members[103]: FORBIDDEN_REASON, guild.members[107]: "Discord API error (oops)"}
+        assert guild.members[103].display_name == "OLD | Player103"
+
+    async def test_owner_is_not_attempted(self):
+        guild = _franchise(members=3)
+        guild.owner_id = 101
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        await apply_nicknames(guild, plan)
+
+        assert plan.failed == {guild.members[101]: OWNER_REASON}
+        assert guild.requests == 2
+
+    async def test_reapply_retries_only_failures(self):
+        guild = _franchise(members=20)
+        guild.errors = {105: _http_exception(503, "unavailable")}
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+        await apply_nicknames(guild, plan)
+        assert guild.requests == 20
+
+        guild.errors = {}
+        await apply_nicknames(guild, plan)
+
+        assert guild.requests == 21
+        assert not plan.failed
+        assert len(plan.renamed) == 20
+
+    async def test_resumes_after_interruption(self):
+        guild = _franchise(members=200)
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+
+        task = asyncio.create_task(apply_nicknames(guild, plan, concurrency=4))
+        while guild.requests < 50:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        done = len(plan.renamed)
+        assert 0 < done < 200
+
+        # A fresh plan over the same members picks up where the last left off
+        resumed = await plan_nicknames(guild.members.values(), _rebrand)
+        await apply_nicknames(guild, resumed, concurrency=4)
+
+        assert resumed.unchanged >= done
+        assert all(m.display_name.startswith("NEW | ") for m in guild.members.values())
+
+    async def test_renamed_since_plan_is_skipped(self):
+        guild = _franchise(members=3)
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+        guild.members[102].display_name = "NEW | Player102"
+
+        await apply_nicknames(guild, plan, concurrency=1)
+
+        assert plan.skipped == 1
+        assert guild.requests == 2
+
+    async def test_progress_every_n(self):
+        guild = _franchise(members=25)
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+        seen: list[int] = []
+
+        async def progress(p: NicknameRewrite):
+            seen.append(p.done)
+
+        await apply_nicknames(guild, plan, progress=progress, every=10)
+
+        assert seen == [10, 20]
+
+    async def test_progress_failure_does_not_stop_rewrite(self):
+        guild = _franchise(members=20)
+        plan = await plan_nicknames(guild.members.values(), _rebrand)
+        progress = AsyncMock(side_effect=discord.NotFound(MagicMock(status=404), "Unknown Webhook"))
+
+        await apply_nicknames(guild, plan, progress=progress, every=5)
+
+        assert progress.await_count == 3
+        assert len(plan.renamed) == 20
+
+
+def test_errors_embed_lists_every_member():
+    guild = _franchise(members=4)
+    members = list(guild.members.values())
+    plan = NicknameRewrite(
+        targets={m: "x" for m in members[:3]},
+        invalid={members[3]: "too long"},
+        renamed=members[:2],
+        failed={members[2]: FORBIDDEN_REASON},
+    )
+
+    embed = errors_embed(plan, "Rebrand Nickname Errors")
+
+    assert "**2/4**" in embed.description
+    assert embed.fields[0].name == "Errors (2)"
+    assert "<@103>: too long" in embed.fields[0].value
+    assert f"<@102>: {FORBIDDEN_REASON}" in embed.fields[0].value
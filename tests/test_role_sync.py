@@ -0,0 +1,182 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from rsc.utils.roles import RoleSyncProgress, interaction_progress, sync_role
+
+
+class FakeRole:
+    def __init__(self, guild, id=1, name="Missing"):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.mention = f"<@&{id}>"
+
+    @property
+    def members(self):
+        return [m for m in self.guild.members.values() if self in m.roles]
+
+
+class FakeGuild:
+    """Members whose role edits take `latency` seconds, tracking requests in flight."""
+
+    def __init__(self, latency=0.001):
+        self.id = 395806681994493964
+        self.latency = latency
+        self.members = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.fail_ids: set[int] = set()
+
+    def get_member(self, id):
+        return self.members.get(id)
+
+    def add_member(self, id, *roles):
+        member = FakeMember(self, id, list(roles))
+        self.members[id] = member
+        return member
+
+    async def request(self, member):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if member.id in self.fail_ids:
+                raise discord.Forbidden(MagicMock(status=403), "Missing Permissions")
+        finally:
+            self.in_flight -= 1
+
+
+class FakeMember:
+    def __init__(self, guild, id, roles):
+        self.guild = guild
+        self.id = id
+        self.roles = roles
+
+    async def add_roles(self, *roles, reason=None):
+        await self.guild.request(self)
+        self.roles.extend(roles)
+
+    async def remove_roles(self, *roles, reason=None):
+        await self.guild.request(self)
+        self.roles = [r for r in self.roles if r not in roles]
+
+
+def _setup(members=1000, holders=range(0, 300), wanted=range(200, 1200)):
+    guild = FakeGuild()
+    role = FakeRole(guild)
+    for i in range(members):
+        guild.add_member(i, *([role] if i in holders else []))
+    return guild, role, set(wanted)
+
+
+class TestSyncRole:
+    async def test_final_role_state(self):
+        guild, role, wanted = _setup()
+
+        result = await sync_role(guild, role, wanted, concurrency=8)
+
+        assert {m.id for m in role.members} == set(range(200, 1000))
+        assert len(result.added) == 700
+        assert len(result.removed) == 200
+        assert result.done == result.total == 900
+        # Unchanged members and IDs not in the guild cost nothing
+        assert guild.requests == 900
+
+    async def test_concurrency_bound(self):
+        guild, role, wanted = _setup()
+
+        await sync_role(guild, role, wanted, concurrency=8)
+
+        assert guild.max_in_flight == 8
+
+    async def test_nothing_to_do(self):
+        guild, role, _ = _setup(holders=range(0, 10))
+        progress = AsyncMock()
+
+        result = await sync_role(guild, role, range(0, 10), progress=progress)
+
+        assert result.total == 0
+        assert guild.requests == 0
+        progress.assert_not_awaited()
+
+    async def test_failures_are_recorded(self):
+        guild, role, wanted = _setup(members=20, holders=(), wanted=range(20))
+        guild.fail_ids = {3, 7}
+
+        result = await sync_role(guild, role, wanted)
+
+        assert sorted(m.id for m in result.failed) == [3, 7]
+        assert len(result.added) == 18
+        assert {m.id for m in role.members} == set(range(20)) - {3, 7}
+
+    async def test_resumes_after_interruption(self):
+        guild, role, wanted = _setup(members=200, holders=(), wanted=range(200))
+
+        task = asyncio.create_task(sync_role(guild, role, wanted, concurrency=4))
+        while guild.requests < 50:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        done = len(role.members)
+        assert 0 < done < 200
+
+        result = await sync_role(guild, role, wanted, concurrency=4)
+
+        assert len(result.added) == 200 - done
+        assert len(role.members) == 200
+
+    async def test_member_changed_since_diff_is_skipped(self):
+        guild, role, wanted = _setup(members=10, holders=(), wanted=range(10))
+
+        async def grant_early(member, *roles, reason=None):
+            # Another sync got to member 9 first
+            guild.members[9].roles.append(role)
+            await FakeMember.add_roles(member, *roles, reason=reason)
+
+        guild.members[0].add_roles = lambda *roles, reason=None: grant_early(guild.members[0], *roles, reason=reason)
+
+        result = await sync_role(guild, role, wanted, concurrency=1)
+
+        assert result.skipped == 1
+        assert len(result.added) == 9
+        assert len(role.members) == 10
+
+    async def test_streams_progress(self):
+        guild, role, wanted = _setup(members=100, holders=(), wanted=range(100))
+        guild.latency = 0.005
+        seen: list[int] = []
+
+        async def progress(p: RoleSyncProgress):
+            seen.append(p.done)
+
+        await sync_role(guild, role, wanted, concurrency=4, progress=progress, interval=0.02)
+
+        assert seen
+        assert seen == sorted(seen)
+        assert all(0 < done <= 100 for done in seen)
+
+    async def test_progress_failure_does_not_stop_sync(self):
+        guild, role, wanted = _setup(members=40, holders=(), wanted=range(40))
+        guild.latency = 0.005
+        progress = AsyncMock(side_effect=discord.NotFound(MagicMock(status=404), "Unknown Webhook"))
+
+        result = await sync_role(guild, role, wanted, concurrency=2, progress=progress, interval=0.01)
+
+        assert progress.await_count > 0
+        assert len(result.added) == 40
+
+
+async def test_interaction_progress_edits_original_response():
+    guild, role, _ = _setup(members=0)
+    interaction = MagicMock()
+    interaction.edit_original_response = AsyncMock()
+
+    await interaction_progress(interaction, "Intent Role Sync")(RoleSyncProgress(role=role, to_add=10, added=[MagicMock()] * 4))
+
+    embed = interaction.edit_original_response.await_args.kwargs["embed"]
+    assert embed.title == "Intent Role Sync"
+    assert "**4/10**" in embed.description
@@ -0,0 +1,303 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rsc.enums import EventCategory, MatchType
+from rsc.events.handlers import handle_object_changed
+from rsc.exceptions import RscException
+from rsc.matches.cache import ScheduleFields, SeasonCache, StandingsFields
+from rsc.matches.matches import MatchMixIn
+from rsc.stats.stats import StatsMixIn
+
+
+def _create(cls, **attrs):
+    saved = cls.__abstractmethods__
+    cls.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(cls)
+    finally:
+        cls.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+def _hl_match(day, home, away, match_type=MatchType.REGULAR, tier="Elite"):
+    m = MagicMock()
+    m.day = day
+    m.match_type = match_type
+    m.var_date = datetime(2025, 1, day)
+    m.home_team.name = home
+    m.home_team.tier = tier
+    m.away_team.name = away
+    return m
+
+
+def _franchise_standing(rank, name, wins, losses):
+    return MagicMock(franchise_standings_rank=rank, franchise=name, wins=wins, losses=losses)
+
+
+def _team_standing(rank, name, won, lost):
+    return MagicMock(rank=rank, team=name, games_won=won, games_lost=lost)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# --- SeasonCache ---
+
+
+class TestSeasonCache:
+    async def test_hit_after_first_fetch(self):
+        cache = SeasonCache()
+        fetch = AsyncMock(return_value="value")
+
+        for _ in range(5):
+            assert await cache.get_or_fetch(1, ("k",), fetch) == "value"
+
+        assert fetch.await_count == 1
+        assert (cache.hits, cache.misses) == (4, 1)
+
+    async def test_none_is_cached(self):
+        cache = SeasonCache()
+        fetch = AsyncMock(return_value=None)
+
+        await cache.get_or_fetch(1, ("k",), fetch)
+        await cache.get_or_fetch(1, ("k",), fetch)
+
+        assert fetch.await_count == 1
+
+    async def test_errors_are_not_cached(self):
+        cache = SeasonCache()
+        fetch = AsyncMock(side_effect=[RscException(message="down"), "value"])
+
+        with pytest.raises(RscException):
+            await cache.get_or_fetch(1, ("k",), fetch)
+        assert await cache.get_or_fetch(1, ("k",), fetch) == "value"
+
+    async def test_expires(self):
+        clock = Clock()
+        cache = SeasonCache(ttl=300, clock=clock)
+        fetch = AsyncMock(return_value="value")
+
+        await cache.get_or_fetch(1, ("k",), fetch)
+        clock.now = 299
+        await cache.get_or_fetch(1, ("k",), fetch)
+        clock.now = 301
+        await cache.get_or_fetch(1, ("k",), fetch)
+
+        assert fetch.await_count == 2
+
+    async def test_invalidate_is_per_guild(self):
+        cache = SeasonCache()
+        fetch = AsyncMock(return_value="value")
+
+        await cache.get_or_fetch(1, ("k",), fetch)
+        await cache.get_or_fetch(2, ("k",), fetch)
+        cache.invalidate(1)
+        await cache.get_or_fetch(1, ("k",), fetch)
+        await cache.get_or_fetch(2, ("k",), fetch)
+
+        assert fetch.await_count == 3
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        cache = SeasonCache()
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        fetch = AsyncMock(side_effect=slow)
+        results = await asyncio.gather(*(cache.get_or_fetch(1, ("k",), fetch) for _ in range(50)))
+
+        assert set(results) == {"value"}
+        assert fetch.await_count == 1
+
+    async def test_invalidated_mid_fetch_is_not_stored(self):
+        cache = SeasonCache()
+
+        async def fetch():
+            cache.invalidate(1)
+            return "stale"
+
+        await cache.get_or_fetch(1, ("k",), fetch)
+
+        assert len(cache) == 0
+
+
+# --- field rendering ---
+
+
+class TestFields:
+    def test_schedule_orders_regular_then_postseason(self):
+        schedule = [
+            _hl_match(3, "C", "D", MatchType.POSTSEASON),
+            _hl_match(1, "A", "B"),
+            _hl_match(2, "B", "A", MatchType.PRESEASON),
+        ]
+
+        fields = ScheduleFields.from_matches(schedule, preseason=False)
+
+        assert fields.home == "A\nC"
+        assert fields.away == "B\nD"
+        assert fields.date == "1/1\n1/3"
+        assert fields.tier == "Elite"
+        assert ScheduleFields.from_matches(schedule, preseason=True).home == "B"
+
+    def test_schedule_missing_name(self):
+        with pytest.raises(ValueError):
+            ScheduleFields.from_matches([_hl_match(1, None, "B")], preseason=False)
+
+    def test_empty(self):
+        assert ScheduleFields.from_matches([], preseason=False) is None
+        assert StandingsFields.from_franchises([]) is None
+        assert StandingsFields.from_teams([]) is None
+
+    def test_franchise_standings_sorted_by_rank(self):
+        fields = StandingsFields.from_franchises([_franchise_standing(2, "B", 5, 5), _franchise_standing(1, "A", 9, 1)])
+
+        assert fields.rank == "1\n2"
+        assert fields.name == "A\nB"
+        assert fields.record == "9 - 1\n5 - 5"
+
+
+# --- MatchMixIn ---
+
+
+@pytest.fixture
+def match_mixin():
+    return _create(
+        MatchMixIn,
+        season_matches=AsyncMock(return_value=[_hl_match(1, "A", "B"), _hl_match(2, "B", "A")]),
+        next_match=AsyncMock(return_value=MagicMock()),
+        match_by_day=AsyncMock(return_value=MagicMock()),
+    )
+
+
+class TestMatchCache:
+    async def test_schedule_hits(self, match_mixin, mock_guild):
+        for _ in range(100):
+            fields = await match_mixin.team_schedule(mock_guild, 10)
+
+        assert fields.home == "A\nB"
+        assert match_mixin.season_matches.await_count == 1
+        assert match_mixin.season_cache().hits == 99
+
+    async def test_schedule_keyed_by_team_and_preseason(self, match_mixin, mock_guild):
+        await match_mixin.team_schedule(mock_guild, 10)
+        await match_mixin.team_schedule(mock_guild, 11)
+        await match_mixin.team_schedule(mock_guild, 10, preseason=True)
+
+        assert match_mixin.season_matches.await_count == 3
+
+    async def test_upcoming_match_hits(self, match_mixin, mock_guild):
+        for _ in range(10):
+            await match_mixin.upcoming_match(mock_guild, 10)
+            await match_mixin.upcoming_match(mock_guild, 10, day=3)
+
+        assert match_mixin.next_match.await_count == 1
+        match_mixin.match_by_day.assert_awaited_once_with(mock_guild, 10, 3, preseason=False)
+
+    async def test_report_match_invalidates(self, match_mixin, mock_guild, monkeypatch):
+        api = MagicMock()
+        api.matches_score_report_create = AsyncMock(return_value=MagicMock())
+        monkeypatch.setattr("rsc.matches.matches.MatchesApi", MagicMock(return_value=api))
+        client = MagicMock()
+        client.__aenter__ = AsyncMock(return_value=MagicMock())
+        client.__aexit__ = AsyncMock(return_value=False)
+        match_mixin.api_client = MagicMock(return_value=client)
+
+        await match_mixin.team_schedule(mock_guild, 10)
+        await match_mixin.report_match(mock_guild, 1, "group", 3, 1, MagicMock(id=1))
+        await match_mixin.team_schedule(mock_guild, 10)
+
+        assert match_mixin.season_matches.await_count == 2
+
+    async def test_failed_report_keeps_cache(self, match_mixin, mock_guild):
+        match_mixin.api_client = MagicMock(side_effect=RscException(message="down"))
+
+        await match_mixin.team_schedule(mock_guild, 10)
+        with pytest.raises(RscException):
+            await match_mixin.report_match(mock_guild, 1, "group", 3, 1, MagicMock(id=1))
+        await match_mixin.team_schedule(mock_guild, 10)
+
+        assert match_mixin.season_matches.await_count == 1
+
+    async def test_object_event_invalidates(self, match_mixin, mock_guild):
+        match_mixin.invalidate_franchise_index = MagicMock()
+        event = MagicMock(event_category=EventCategory.OBJECT)
+
+        await match_mixin.team_schedule(mock_guild, 10)
+        await handle_object_changed(match_mixin, mock_guild, event)
+        await match_mixin.team_schedule(mock_guild, 10)
+
+        assert match_mixin.season_matches.await_count == 2
+
+
+# --- /standings ---
+
+
+@pytest.fixture
+def interaction(mock_guild):
+    interaction = MagicMock()
+    interaction.guild = mock_guild
+    interaction.response.defer = AsyncMock()
+    interaction.followup.send = AsyncMock()
+    return interaction
+
+
+@pytest.fixture
+def stats_mixin():
+    cache = SeasonCache()
+    season = MagicMock(id=20, number=20)
+    return _create(
+        StatsMixIn,
+        season_cache=lambda: cache,
+        current_season=AsyncMock(return_value=season),
+        seasons=AsyncMock(return_value=[season]),
+        tiers=AsyncMock(return_value=[MagicMock(id=3)]),
+        franchise_standings=AsyncMock(return_value=[_franchise_standing(1, "A", 9, 1)]),
+        tier_standings=AsyncMock(return_value=[_team_standing(1, "Onions", 30, 6)]),
+    )
+
+
+class TestStandingsCache:
+    async def test_franchise_standings_hits(self, stats_mixin, interaction):
+        for _ in range(20):
+            await StatsMixIn._franchise_standings_cmd.callback(stats_mixin, interaction)
+
+        assert stats_mixin.current_season.await_count == 1
+        assert stats_mixin.franchise_standings.await_count == 1
+        embed = interaction.followup.send.await_args.kwargs["embed"]
+        assert [f.value for f in embed.fields] == ["1", "A", "9 - 1"]
+
+    async def test_past_season_does_not_consume_cached_list(self, stats_mixin, interaction):
+        await StatsMixIn._franchise_standings_cmd.callback(stats_mixin, interaction, 20)
+        await StatsMixIn._franchise_standings_cmd.callback(stats_mixin, interaction, 20)
+
+        assert stats_mixin.seasons.await_count == 1
+        assert stats_mixin.franchise_standings.await_count == 1
+
+    async def test_tier_standings_hits(self, stats_mixin, interaction):
+        for _ in range(20):
+            await StatsMixIn._tier_standings_cmd.callback(stats_mixin, interaction, "Elite")
+
+        assert stats_mixin.tiers.await_count == 1
+        assert stats_mixin.tier_standings.await_count == 1
+        stats_mixin.tier_standings.assert_awaited_once_with(interaction.guild, tier_id=3, season=20)
+        embed = interaction.followup.send.await_args.kwargs["embed"]
+        assert [f.value for f in embed.fields] == ["1", "Onions", "30 - 6"]
+
+    async def test_invalidate_refetches_standings(self, stats_mixin, interaction):
+        await StatsMixIn._tier_standings_cmd.callback(stats_mixin, interaction, "Elite")
+        stats_mixin.season_cache().invalidate(interaction.guild.id)
+        await StatsMixIn._tier_standings_cmd.callback(stats_mixin, interaction, "Elite")
+
+        assert stats_mixin.tier_standings.await_count == 2
@@ -186,6 +186,7 @@ class TestSetupGuild:
             franchises=AsyncMock(),
             teams=AsyncMock(),
             _populate_free_agent_cache=AsyncMock(),
+            recover_combine_lobbies=AsyncMock(),
             prepare_ballchasing=AsyncMock(),
             setup_persistent_activity_check=AsyncMock(),
         )
@@ -204,6 +205,7 @@ class TestSetupGuild:
             prepare_api=AsyncMock(),
             prepare_league=AsyncMock(),
             _populate_free_agent_cache=AsyncMock(),
+            recover_combine_lobbies=AsyncMock(),
         )
 
         await cog._setup_guild(mock_guild)
@@ -221,6 +223,7 @@ class TestSetupGuild:
             franchises=AsyncMock(),
             teams=AsyncMock(),
             _populate_free_agent_cache=AsyncMock(),
+            recover_combine_lobbies=AsyncMock(),
             prepare_ballchasing=AsyncMock(),
             setup_persistent_activity_check=AsyncMock(),
         )
@@ -246,6 +249,7 @@ class TestSetupGuild:
             franchises=AsyncMock(),
             teams=AsyncMock(),
             _populate_free_agent_cache=AsyncMock(),
+            recover_combine_lobbies=AsyncMock(),
             prepare_ballchasing=AsyncMock(),
             setup_persistent_activity_check=AsyncMock(),
         )
@@ -276,6 +280,7 @@ class TestSetupGuild:
             franchises=AsyncMock(),
             teams=AsyncMock(),
             _populate_free_agent_cache=AsyncMock(),
+            recover_combine_lobbies=AsyncMock(),
             prepare_ballchasing=AsyncMock(),
             setup_persistent_activity_check=AsyncMock(),
         )
@@ -349,18 +354,59 @@ class TestStartWebapp:
         mock_web.AppRunner.assert_not_called()
         assert cog._web_runner is existing
 
-    async def test_bind_failure_is_not_fatal(self):
+    async def test_bind_failure_is_not_fatal(self, tmp_path):
         """A dead webhook listener must not stop the guild caches from loading."""
-        cog = _create_cog(_web_runner=None, _web_site=None)
+        cog = _create_cog(_web_runner=None, _web_site=None, _webhooks=None)
 
         runner = AsyncMock()
         site = AsyncMock()
         site.start.side_effect = OSError("address already in use")
 
-        with patch("rsc.core.web") as mock_web:
+        with patch("rsc.core.web") as mock_web, patch("rsc.core.cog_data_path", return_value=tmp_path):
             mock_web.AppRunner.return_value = runner
             mock_web.TCPSite.return_value = site
             await cog.start_webapp()
 
         runner.cleanup.assert_awaited_once()
         assert cog._web_runner is None
+        # No workers draining a journal nothing can post to
+        assert cog._webhooks is None
+
+    async def test_ingest_starts_before_the_site(self, tmp_path):
+        """A post accepted before the journal loads would be queued twice, or by no worker at all."""
+        cog = _create_cog(_web_runner=None, _web_site=None, _webhooks=None)
+        order = []
+        ingest = MagicMock()
+        ingest.start = AsyncMock(side_effect=lambda: order.append("ingest"))
+        site = AsyncMock()
+        site.start.side_effect = lambda: order.append("site")
+
+        with (
+            patch("rsc.core.web") as mock_web,
+            patch("rsc.core.cog_data_path", return_value=tmp_path),
+            patch("rsc.core.WebhookIngest", return_value=ingest),
+        ):
+            mock_web.AppRunner.return_value = AsyncMock()
+            mock_web.TCPSite.return_value = site
+            await cog.start_webapp()
+
+        assert order == ["ingest", "site"]
+        assert cog._webhooks is ingest
+
+    async def test_bind_failure_stops_the_ingest(self, tmp_path):
+        cog = _create_cog(_web_runner=None, _web_site=None, _webhooks=None)
+        ingest = MagicMock(start=AsyncMock(), stop=AsyncMock())
+        site = AsyncMock()
+        site.start.side_effect = OSError("address already in use")
+
+        with (
+            patch("rsc.core.web") as mock_web,
+            patch("rsc.core.cog_data_path", return_value=tmp_path),
+            patch("rsc.core.WebhookIngest", return_value=ingest),
+        ):
+            mock_web.AppRunner.return_value = AsyncMock()
+            mock_web.TCPSite.return_value = site
+            await cog.start_webapp()
+
+        ingest.stop.assert_awaited_once()
+        assert cog._webhooks is None
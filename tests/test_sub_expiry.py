@@ -0,0 +1,269 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import discord
+import pytest
+
+from rsc.transactions import transactions as transactions_module
+from rsc.assets import AssetHost
+from rsc.transactions.expiry import SubstituteIndex, expiry_cutoff
+from rsc.transactions.transactions import TransactionMixIn
+from rsc.types import Substitute
+
+EASTERN = ZoneInfo("America/New_York")
+PACIFIC = ZoneInfo("America/Los_Angeles")
+TOKYO = ZoneInfo("Asia/Tokyo")
+
+
+def _create_mixin(**attrs):
+    saved = TransactionMixIn.__abstractmethods__
+    TransactionMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(TransactionMixIn)
+    finally:
+        TransactionMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+def _sub(date: str, player_in: int = 1, player_out: int = 2, tier: str = "Elite") -> Substitute:
+    return Substitute(
+        date=date,
+        franchise="The Garden",
+        gm=999,
+        player_in=player_in,
+        player_out=player_out,
+        team="Onions",
+        tier=tier,
+    )
+
+
+# --- expiry_cutoff / SubstituteIndex ---
+
+
+class TestExpiryCutoff:
+    def test_is_local_midnight(self):
+        # 03:00 UTC on the 10th is still the 9th in New York
+        cutoff = expiry_cutoff(datetime(2025, 3, 10, 3, tzinfo=UTC), EASTERN)
+        assert cutoff == datetime(2025, 3, 9, tzinfo=EASTERN)
+
+    def test_dst_change(self):
+        # Clocks went forward at 02:00 on 2025-03-09. Midnight is still -05:00.
+        cutoff = expiry_cutoff(datetime(2025, 3, 9, 17, tzinfo=UTC), EASTERN)
+        assert cutoff.utcoffset().total_seconds() == -5 * 3600
+        assert cutoff.astimezone(UTC) == datetime(2025, 3, 9, 5, tzinfo=UTC)
+
+
+class TestSubstituteIndex:
+    def test_orders_by_signing_date(self):
+        subs = [_sub("2025-01-03 12:00:00-05:00", 3), _sub("2025-01-01 12:00:00-05:00", 1), _sub("2025-01-02 12:00:00-05:00", 2)]
+        index = SubstituteIndex(subs, EASTERN)
+
+        due = index.due(datetime(2025, 1, 10, 17, tzinfo=UTC))
+        assert [s["player_in"] for s in due] == [1, 2, 3]
+
+    def test_same_day_is_not_due(self):
+        sub = _sub("2025-01-09 09:00:00-05:00")
+        index = SubstituteIndex([sub], EASTERN)
+
+        assert index.due(datetime(2025, 1, 9, 17, tzinfo=UTC)) == []
+        assert index.due(datetime(2025, 1, 10, 17, tzinfo=UTC)) == [sub]
+
+    def test_late_night_signing_uses_guild_local_date(self):
+        # 23:30 in New York is already the next day in UTC
+        sub = _sub("2025-01-09 23:30:00-05:00")
+        index = SubstituteIndex([sub], EASTERN)
+
+        # Noon eastern the following day: signed yesterday, due
+        assert index.due(datetime(2025, 1, 10, 17, tzinfo=UTC)) == [sub]
+
+    def test_signed_under_other_timezone(self):
+        # Signed at 08:00 on the 10th Tokyo time, 18:00 on the 9th in New York.
+        sub = _sub("2025-01-10 08:00:00+09:00")
+        index = SubstituteIndex([sub], EASTERN)
+
+        # 07:00 eastern on the 10th: signed yesterday in the guild's timezone
+        assert index.due(datetime(2025, 1, 10, 12, tzinfo=UTC)) == [sub]
+        # But signed today for a guild in Tokyo on the same instant
+        assert SubstituteIndex([sub], TOKYO).due(datetime(2025, 1, 10, 12, tzinfo=UTC)) == []
+
+    def test_naive_date_is_guild_local(self):
+        sub = _sub("2025-01-09")
+        assert SubstituteIndex([sub], PACIFIC).due(datetime(2025, 1, 10, 7, tzinfo=UTC)) == []
+        assert SubstituteIndex([sub], PACIFIC).due(datetime(2025, 1, 10, 8, tzinfo=UTC)) == [sub]
+
+    def test_add_and_remove(self):
+        first = _sub("2025-01-01 12:00:00-05:00", 1)
+        index = SubstituteIndex([first], EASTERN)
+        later = _sub("2025-01-05 12:00:00-05:00", 2)
+        index.add(later)
+
+        assert index.due(datetime(2025, 1, 3, 17, tzinfo=UTC)) == [first]
+        assert index.remove(first)
+        assert not index.remove(first)
+        assert len(index) == 1
+
+
+# --- expire_substitutes ---
+
+
+class FakeConfigValue:
+    def __init__(self, store):
+        self.store = store
+        self.reads = 0
+        self.writes = 0
+
+    async def __call__(self):
+        self.reads += 1
+        return list(self.store)
+
+    async def set(self, value):
+        self.writes += 1
+        self.store[:] = value
+
+
+@pytest.fixture
+def substitutes():
+    return FakeConfigValue([])
+
+
+@pytest.fixture
+def channel():
+    chan = MagicMock(spec=discord.TextChannel)
+    chan.send = AsyncMock(return_value=MagicMock(edit=AsyncMock()))
+    return chan
+
+
+@pytest.fixture
+def mixin(substitutes, channel, monkeypatch):
+    monkeypatch.setattr(transactions_module, "SUB_SEND_PACING_DELAY", 0)
+    config = MagicMock()
+    config.custom.return_value.Substitutes = substitutes
+    return _create_mixin(
+        config=config,
+        timezone=AsyncMock(return_value=EASTERN),
+        _trans_channel=AsyncMock(return_value=channel),
+    )
+
+
+@pytest.fixture
+def subbed_out_role():
+    return MagicMock(spec=discord.Role)
+
+
+@pytest.fixture
+def guild(mock_guild, subbed_out_role):
+    members = {}
+    for pid in range(1, 21):
+        m = MagicMock(spec=discord.Member)
+        m.id = pid
+        m.display_name = f"Player{pid}"
+        m.roles = [subbed_out_role]
+        m.remove_roles = AsyncMock()
+        members[pid] = m
+    mock_guild.get_member = MagicMock(side_effect=members.get)
+    return mock_guild
+
+
+class TestExpireSubstitutes:
+    async def test_expires_only_due_in_one_write(self, mixin, guild, substitutes, channel, subbed_out_role):
+        due = [_sub("2025-01-08 12:00:00-05:00", i, i + 10) for i in range(1, 4)]
+        pending = [_sub("2025-01-10 09:00:00-05:00", 5, 15)]
+        substitutes.store[:] = [pending[0], *due]
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(return_value=subbed_out_role)):
+            expired = await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+
+        assert expired == due
+        assert substitutes.store == pending
+        assert substitutes.writes == 1
+        assert channel.send.await_count == 3
+        for i in range(1, 4):
+            guild.get_member(i + 10).remove_roles.assert_awaited_once_with(subbed_out_role)
+        guild.get_member(15).remove_roles.assert_not_awaited()
+
+    async def test_nothing_due_touches_nothing(self, mixin, guild, substitutes, channel):
+        substitutes.store[:] = [_sub("2025-01-10 09:00:00-05:00")]
+
+        await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+        await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 18, tzinfo=UTC))
+
+        # One read to build the index, then served from memory
+        assert substitutes.reads == 1
+        assert substitutes.writes == 0
+        channel.send.assert_not_awaited()
+
+    async def test_index_follows_new_substitutes(self, mixin, guild, substitutes):
+        now = datetime(2025, 1, 10, 17, tzinfo=UTC)
+        await mixin.expire_substitutes(guild, now=now)
+        await mixin._add_substitute(guild, _sub("2025-01-08 12:00:00-05:00"))
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)):
+            expired = await mixin.expire_substitutes(guild, now=now)
+
+        assert len(expired) == 1
+        assert substitutes.store == []
+
+    async def test_timezone_change_rebuilds_index(self, mixin, guild, substitutes):
+        # Signed 20:00 eastern on the 9th, already the 10th in Tokyo
+        substitutes.store[:] = [_sub("2025-01-09 20:00:00-05:00")]
+        now = datetime(2025, 1, 10, 14, tzinfo=UTC)  # 23:00 on the 10th in Tokyo
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)):
+            mixin.timezone.return_value = TOKYO
+            assert await mixin.expire_substitutes(guild, now=now) == []
+            mixin.timezone.return_value = EASTERN
+            assert len(await mixin.expire_substitutes(guild, now=now)) == 1
+
+    async def test_failed_announcement_still_expires(self, mixin, guild, substitutes, channel):
+        substitutes.store[:] = [_sub("2025-01-08 12:00:00-05:00", i) for i in range(1, 4)]
+        channel.send.side_effect = discord.Forbidden(MagicMock(status=403), "Missing Access")
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)):
+            await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+
+        # Permanent failure stops announcing after the first attempt
+        assert channel.send.await_count == 1
+        assert substitutes.store == []
+
+    async def test_no_channel_still_expires(self, mixin, guild, substitutes):
+        mixin._trans_channel.return_value = None
+        substitutes.store[:] = [_sub("2025-01-08 12:00:00-05:00")]
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)):
+            await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+
+        assert substitutes.store == []
+
+    async def test_attaches_images_without_asset_channel(self, mixin, guild, substitutes, channel):
+        substitutes.store[:] = [_sub("2025-01-08 12:00:00-05:00", i) for i in range(1, 6)]
+
+        with (
+            patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)),
+            patch.object(transactions_module.utils, "tier_color_by_name", AsyncMock(return_value=discord.Color.blue())) as color,
+        ):
+            await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+
+        assert color.await_count == 1
+        files = [call.kwargs["files"] for call in channel.send.await_args_list]
+        assert all(f[0].filename == "ContractExpired.png" for f in files)
+        # Every message gets its own file objects
+        assert len({id(f[0]) for f in files}) == 5
+
+    async def test_hosted_images_upload_once(self, mixin, guild, substitutes, channel):
+        substitutes.store[:] = [_sub("2025-01-08 12:00:00-05:00", i) for i in range(1, 6)]
+        assets = MagicMock(spec=discord.TextChannel, id=42)
+        uploaded = MagicMock(id=1, attachments=[MagicMock(url="https://cdn.discordapp.com/attachments/42/1/x.png")])
+        assets.send = AsyncMock(return_value=uploaded)
+        mixin._get_asset_channel = AsyncMock(return_value=assets)
+        mixin._asset_host = AssetHost()
+
+        with patch.object(transactions_module.utils, "get_subbed_out_role", AsyncMock(side_effect=ValueError)):
+            await mixin.expire_substitutes(guild, now=datetime(2025, 1, 10, 17, tzinfo=UTC))
+
+        # Banner and FA icon, once each
+        assert assets.send.await_count == 2
+        assert all(call.kwargs["files"] == [] for call in channel.send.await_args_list)
+        assert channel.send.await_args.kwargs["embed"].image.url == uploaded.attachments[0].url
@@ -9,6 +9,8 @@ from rscapi.models.team_list import TeamList
 
 from rsc.enums import Status
 from rsc.exceptions import RscException
+from rsc.franchises.franchises import FranchiseMixIn
+from rsc.franchises.index import FranchiseIndex, FranchiseIndexEntry
 from rsc.teams.teams import TeamMixIn
 
 GUILD_ID = 395806681994493964
@@ -338,12 +340,17 @@ class TestFranchiseCaptains:
 
 
 class TestBuildFranchiseTeamsEmbed:
+    def _index(self, agm_ids=()):
+        return FranchiseIndex(
+            [FranchiseIndexEntry(id=10, name="Eagles", prefix="EGL", gm_id=999, gm_name="TestGM", agm_ids=tuple(agm_ids))]
+        )
+
     async def test_builds_embed(self, mock_guild):
         t1 = _make_team_list(name="Team A", tier_name="Premier", tier_pos=2)
         t2 = _make_team_list(name="Team B", tier_name="Master", tier_pos=1)
         mixin = _create_mixin()
         mixin.franchise_logo = AsyncMock(return_value=None)
-        mixin.fetch_franchise = AsyncMock(return_value=_make_franchise_list())
+        mixin.franchise_index = AsyncMock(return_value=self._index())
 
         embed = await mixin.build_franchise_teams_embed(mock_guild, [t1, t2])
         assert isinstance(embed, discord.Embed)
@@ -353,25 +360,37 @@ class TestBuildFranchiseTeamsEmbed:
         t = _make_team_list(gm_discord_id=999)
         mixin = _create_mixin()
         mixin.franchise_logo = AsyncMock(return_value=None)
-        mixin.fetch_franchise = AsyncMock(return_value=_make_franchise_list(agm_discord_ids=[111, 222]))
+        mixin.franchise_index = AsyncMock(return_value=self._index(agm_ids=[111, 222]))
+        mixin.fetch_franchise = AsyncMock()
 
         embed = await mixin.build_franchise_teams_embed(mock_guild, [t])
         assert embed.description == "GM: <@!999>\nAGM: <@!111>, <@!222>"
+        mixin.fetch_franchise.assert_not_awaited()
 
     async def test_description_omits_agm_line_when_franchise_has_none(self, mock_guild):
         t = _make_team_list(gm_discord_id=999)
         mixin = _create_mixin()
         mixin.franchise_logo = AsyncMock(return_value=None)
-        mixin.fetch_franchise = AsyncMock(return_value=_make_franchise_list())
+        mixin.franchise_index = AsyncMock(return_value=self._index())
 
         embed = await mixin.build_franchise_teams_embed(mock_guild, [t])
         assert embed.description == "GM: <@!999>"
 
+    async def test_unindexed_franchise_is_fetched(self, mock_guild):
+        t = _make_team_list(gm_discord_id=999)
+        mixin = _create_mixin()
+        mixin.franchise_logo = AsyncMock(return_value=None)
+        mixin.franchise_index = AsyncMock(return_value=FranchiseIndex(()))
+        mixin.fetch_franchise = AsyncMock(return_value=_make_franchise_list(agm_discord_ids=[111]))
+
+        embed = await mixin.build_franchise_teams_embed(mock_guild, [t])
+        assert embed.description == "GM: <@!999>\nAGM: <@!111>"
+
     async def test_agm_lookup_failure_does_not_break_embed(self, mock_guild):
         t = _make_team_list(gm_discord_id=999)
         mixin = _create_mixin()
         mixin.franchise_logo = AsyncMock(return_value=None)
-        mixin.fetch_franchise = AsyncMock(side_effect=RscException(response="boom"))
+        mixin.franchise_index = AsyncMock(side_effect=RscException(response="boom"))
 
         embed = await mixin.build_franchise_teams_embed(mock_guild, [t])
         assert embed.description == "GM: <@!999>"
@@ -388,6 +407,71 @@ class TestBuildFranchiseTeamsEmbed:
             await mixin.build_franchise_teams_embed(mock_guild, [t])
 
 
+# --- build_roster_embed ---
+
+
+class _RosterCog(TeamMixIn, FranchiseMixIn):
+    pass
+
+
+class TestBuildRosterEmbed:
+    LOGO = "https://cdn.example.com/media/franchises/10/Eagles.png"
+
+    @pytest.fixture
+    def cog(self, mock_guild):
+        saved = _RosterCog.__abstractmethods__
+        _RosterCog.__abstractmethods__ = frozenset()
+        try:
+            cog = object.__new__(_RosterCog)
+        finally:
+            _RosterCog.__abstractmethods__ = saved
+        cog._league = {mock_guild.id: 1}
+        cog._franchise_cache = {}
+        cog._get_api_url = AsyncMock(return_value="https://api.example.com/")
+        client = MagicMock()
+        client.__aenter__ = AsyncMock(return_value=MagicMock())
+        client.__aexit__ = AsyncMock(return_value=False)
+        cog.api_client = MagicMock(return_value=client)
+        return cog
+
+    @pytest.fixture
+    def api(self):
+        f = _make_franchise_list(agm_discord_ids=[222])
+        f.prefix = "EGL"
+        f.gm = MagicMock(discord_id=999, rsc_name="TestGM")
+        f.logo = self.LOGO
+        api = AsyncMock()
+        api.franchises_list.return_value = [f]
+        with patch("rsc.franchises.franchises.FranchisesApi", return_value=api):
+            yield api
+
+    async def test_warm_render_makes_no_api_calls(self, cog, api, mock_guild):
+        players = [_make_league_player(discord_id=i, name=f"Player{i}", captain=i == 111) for i in (111, 999, 333)]
+        await cog.build_roster_embed(mock_guild, players)
+        cog.api_client.reset_mock()
+        cog._get_api_url.reset_mock()
+
+        for _ in range(5):
+            embed = await cog.build_roster_embed(mock_guild, players)
+
+        assert embed.thumbnail.url == self.LOGO
+        cog.api_client.assert_not_called()
+        cog._get_api_url.assert_not_awaited()
+        api.franchises_list.assert_awaited_once()
+        api.franchises_logo_retrieve.assert_not_awaited()
+
+    async def test_franchise_event_refreshes_logo(self, cog, api, mock_guild):
+        players = [_make_league_player()]
+        await cog.build_roster_embed(mock_guild, players)
+
+        api.franchises_list.return_value[0].logo = "https://cdn.example.com/new.png"
+        cog.invalidate_franchise_index(mock_guild)
+        embed = await cog.build_roster_embed(mock_guild, players)
+
+        assert embed.thumbnail.url == "https://cdn.example.com/new.png"
+        assert api.franchises_list.await_count == 2
+
+
 # --- API wrappers ---
 
 
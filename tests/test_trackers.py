@@ -1,8 +1,11 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
 import pytest
 from rscapi.exceptions import ApiException
 
+from rsc.enums import TrackerLinksStatus
 from rsc.exceptions import RscException
 from rsc.trackers.trackers import TrackerMixIn
 
@@ -82,6 +85,91 @@ class TestTrackersApi:
         assert call_kwargs["discord_id"] == 12345
 
 
+class TestTrackerCountApi:
+    async def test_reads_count_from_one_row_page(self, mock_guild):
+        resp = MagicMock()
+        resp.count = 4321
+        mixin = _create_mixin(_api_conf={mock_guild.id: MagicMock()})
+
+        with patch("rsc.abc.ApiClient") as mock_client:
+            mock_api = AsyncMock()
+            mock_api.tracker_links_list.return_value = resp
+            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
+            with patch("rsc.trackers.trackers.TrackerLinksApi", return_value=mock_api):
+                result = await mixin.tracker_count(mock_guild, TrackerLinksStatus.NEW)
+
+        assert result == 4321
+        mock_api.tracker_links_list.assert_awaited_once_with(status="NEW", limit=1, offset=0)
+
+
+def _tracker(rscid, last_updated):
+    t = MagicMock()
+    t.rscid = rscid
+    t.member_name = f"player{rscid}"
+    t.last_updated = last_updated
+    return t
+
+
+class TestTrackerCommands:
+    @pytest.fixture
+    def interaction(self, mock_guild):
+        user = MagicMock(spec=discord.Member)
+        user.guild_permissions = MagicMock()
+        user.guild_permissions.manage_guild = True
+
+        interaction = MagicMock(spec=discord.Interaction)
+        interaction.guild = mock_guild
+        interaction.user = user
+        interaction.response = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+        return interaction
+
+    @pytest.fixture
+    def mixin(self):
+        mixin = _create_mixin()
+        mixin.timezone = AsyncMock(return_value=UTC)
+        mixin.tracker_count = AsyncMock(return_value=0)
+        return mixin
+
+    async def test_recent_lists_the_newest_25_with_unpulled_last(self, mixin, interaction):
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        trackers = [_tracker(i, base + timedelta(days=i)) for i in range(40)]
+        trackers.insert(3, _tracker(999, None))
+        mixin.trackers = AsyncMock(return_value=trackers)
+
+        await TrackerMixIn._trackers_recent_pull.callback(mixin, interaction)
+
+        embed = interaction.followup.send.await_args.kwargs["embed"]
+        ids = embed.fields[0].value.split("\n")
+        assert ids == [str(i) for i in range(39, 14, -1)]
+        mixin.trackers.assert_awaited_once()
+
+    async def test_old_counts_from_one_fetch(self, mixin, interaction):
+        now = datetime.now(UTC)
+        trackers = [_tracker(1, now), _tracker(2, now - timedelta(days=200)), _tracker(3, None)]
+        mixin.trackers = AsyncMock(return_value=trackers)
+
+        await TrackerMixIn._trackers_old.callback(mixin, interaction)
+
+        embed = interaction.followup.send.await_args.kwargs["embed"]
+        assert "**2/3 PULLED**" in embed.description
+        mixin.trackers.assert_awaited_once()
+        mixin.tracker_count.assert_not_awaited()
+
+    async def test_old_new_links_use_the_count_alone(self, mixin, interaction):
+        mixin.trackers = AsyncMock()
+        mixin.tracker_count = AsyncMock(return_value=812)
+
+        await TrackerMixIn._trackers_old.callback(mixin, interaction, TrackerLinksStatus.NEW)
+
+        embed = interaction.followup.send.await_args.kwargs["embed"]
+        assert "**812/812 NEW**" in embed.description
+        mixin.trackers.assert_not_awaited()
+
+
 class TestTrackerStatsApi:
     async def test_returns_stats(self, mock_guild):
         stats = [MagicMock()]
@@ -18,7 +18,9 @@ from rscapi.models.trade_object import TradeObject
 from rscapi.models.trade_player import TradePlayer
 from rscapi.models.league_player import LeaguePlayer
 
+from rsc.assets import transaction_asset
 from rsc.enums import Status, TransactionType
+from rsc.franchises.index import FranchiseIndex, FranchiseIndexEntry
 from rsc.exceptions import (
     MalformedTransactionResponse,
     RscException,
@@ -532,15 +534,9 @@ class TestBuildTransactionEmbed:
         with pytest.raises(MalformedTransactionResponse, match="type not returned"):
             await mixin.build_transaction_embed(mock_guild, response, mock_member)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
-    @patch("rsc.transactions.transactions.utils.fa_img_from_tier", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_cut_embed(self, mock_tier_color, mock_fa_img, mock_trans_img, mixin, mock_guild, mock_member):
+    async def test_cut_embed(self, mock_tier_color, mixin, mock_guild, mock_member):
         # Setup
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Cut.png"
-        mock_trans_img.return_value = mock_img
-        mock_fa_img.return_value = None
         mock_tier_color.return_value = discord.Color.blue()
 
         old_team = MagicMock()
@@ -562,12 +558,8 @@ class TestBuildTransactionEmbed:
         assert isinstance(embed, discord.Embed)
         assert len(files) >= 1
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_pickup_embed(self, mock_tier_color, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Signed.png"
-        mock_trans_img.return_value = mock_img
+    async def test_pickup_embed(self, mock_tier_color, mixin, mock_guild, mock_member):
         mock_tier_color.return_value = discord.Color.green()
 
         new_team = MagicMock()
@@ -588,12 +580,8 @@ class TestBuildTransactionEmbed:
         embed, files = await mixin.build_transaction_embed(mock_guild, response, mock_member)
         assert isinstance(embed, discord.Embed)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_resign_embed(self, mock_tier_color, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "ReSigned.png"
-        mock_trans_img.return_value = mock_img
+    async def test_resign_embed(self, mock_tier_color, mixin, mock_guild, mock_member):
         mock_tier_color.return_value = discord.Color.green()
 
         new_team = MagicMock()
@@ -614,12 +602,8 @@ class TestBuildTransactionEmbed:
         embed, files = await mixin.build_transaction_embed(mock_guild, response, mock_member)
         assert isinstance(embed, discord.Embed)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_retire_embed(self, mock_tier_color, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Retired.png"
-        mock_trans_img.return_value = mock_img
+    async def test_retire_embed(self, mock_tier_color, mixin, mock_guild, mock_member):
         mock_tier_color.return_value = discord.Color.blue()
 
         ptu = _make_ptu(mock_member.id, "TestPlayer")
@@ -636,12 +620,8 @@ class TestBuildTransactionEmbed:
         embed, files = await mixin.build_transaction_embed(mock_guild, response, mock_member)
         assert isinstance(embed, discord.Embed)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_temp_fa_embed(self, mock_tier_color, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "TempFA.png"
-        mock_trans_img.return_value = mock_img
+    async def test_temp_fa_embed(self, mock_tier_color, mixin, mock_guild, mock_member):
         mock_tier_color.return_value = discord.Color.blue()
 
         new_team = MagicMock()
@@ -662,11 +642,7 @@ class TestBuildTransactionEmbed:
         embed, files = await mixin.build_transaction_embed(mock_guild, response, mock_member)
         assert isinstance(embed, discord.Embed)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
-    async def test_cut_embed_malformed_no_old_team(self, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Cut.png"
-        mock_trans_img.return_value = mock_img
+    async def test_cut_embed_malformed_no_old_team(self, mixin, mock_guild, mock_member):
 
         ptu = _make_ptu(mock_member.id, "TestPlayer", old_team=None)
         mixin.league_player_from_transaction.return_value = ptu
@@ -680,11 +656,7 @@ class TestBuildTransactionEmbed:
         with pytest.raises(MalformedTransactionResponse):
             await mixin.build_transaction_embed(mock_guild, response, mock_member)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
-    async def test_pickup_embed_malformed_no_new_team(self, mock_trans_img, mixin, mock_guild, mock_member):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Signed.png"
-        mock_trans_img.return_value = mock_img
+    async def test_pickup_embed_malformed_no_new_team(self, mixin, mock_guild, mock_member):
 
         ptu = _make_ptu(mock_member.id, "TestPlayer", new_team=None)
         mixin.league_player_from_transaction.return_value = ptu
@@ -698,11 +670,7 @@ class TestBuildTransactionEmbed:
         with pytest.raises(MalformedTransactionResponse):
             await mixin.build_transaction_embed(mock_guild, response, mock_member)
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
-    async def test_build_embed_with_player_out(self, mock_trans_img, mixin, mock_guild, mock_member, mock_player_out):
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "TempFA.png"
-        mock_trans_img.return_value = mock_img
+    async def test_build_embed_with_player_out(self, mixin, mock_guild, mock_member, mock_player_out):
 
         new_team = MagicMock()
         new_team.tier = "Elite"
@@ -738,21 +706,13 @@ class TestIrCutTransactionType:
     async def test_has_a_transaction_image(self):
         """The real lookup raises NotImplementedError on an unhandled type, and no
         `build_transaction_embed` caller catches that -- only the
-        MalformedTransactionResponse the type conversion would have raised first.
-        Every other embed test mocks this call, so it needs its own check."""
-        img = await utils.transaction_image_from_type(TransactionType.IR_CUT)
-        assert img.filename == "Released.png"
+        MalformedTransactionResponse the type conversion would have raised first."""
+        assert transaction_asset(TransactionType.IR_CUT).name == "Released.png"
 
-    @patch("rsc.transactions.transactions.utils.transaction_image_from_type", new_callable=AsyncMock)
-    @patch("rsc.transactions.transactions.utils.fa_img_from_tier", new_callable=AsyncMock)
     @patch("rsc.transactions.transactions.utils.tier_color_by_name", new_callable=AsyncMock)
-    async def test_builds_a_release_embed(self, mock_tier_color, mock_fa_img, mock_trans_img, mock_guild, mock_member):
+    async def test_builds_a_release_embed(self, mock_tier_color, mock_guild, mock_member):
         """Same roster movement as a plain cut, so it reuses that arm rather than
         falling through to the `NotImplementedError` default."""
-        mock_img = MagicMock(spec=discord.File)
-        mock_img.filename = "Released.png"
-        mock_trans_img.return_value = mock_img
-        mock_fa_img.return_value = None
         mock_tier_color.return_value = discord.Color.blue()
 
         mixin = _create_mixin()
@@ -1023,6 +983,64 @@ class TestParseTradeText:
         with pytest.raises(TradeParserException):
             await mixin.parse_trade_text(guild=mock_guild, data="")
 
+    @staticmethod
+    def _index():
+        return FranchiseIndex(
+            [
+                FranchiseIndexEntry(id=1, name="Wolves", prefix="WLV", gm_id=100, gm_name="nickm"),
+                FranchiseIndexEntry(id=2, name="Flares", prefix="FLR", gm_id=200, gm_name="Tinsel"),
+                FranchiseIndexEntry(id=3, name="Comets", prefix="CMT", gm_id=300, gm_name="nicky"),
+            ]
+        )
+
+    @staticmethod
+    def _league_role(*members):
+        role = MagicMock(spec=discord.Role)
+        role.members = list(members)
+        return role
+
+    async def test_resolves_gms_without_api_calls(self, mixin, mock_guild):
+        player = MagicMock(spec=discord.Member)
+        player.id = 555
+        player.display_name = "WLV | Striker"
+
+        pdata = MagicMock()
+        pdata.team.franchise.id = 1
+        pdata.team.franchise.name = "Wolves"
+
+        mixin.franchise_index = AsyncMock(return_value=self._index())
+        mixin.franchises = AsyncMock()
+        mixin.players = AsyncMock(return_value=[pdata])
+        mixin.teams = AsyncMock()
+
+        data = "nickm receives:\n1st Round Master (4)\n---\nTinsel receives:\n@WLV | Striker to Blaze"
+        with patch.object(utils, "get_league_role", AsyncMock(return_value=self._league_role(player))):
+            trades = await mixin.parse_trade_text(guild=mock_guild, data=data)
+
+        mixin.franchises.assert_not_called()
+        assert len(trades) == 2
+        pick, move = trades
+        assert pick.destination.id == 1
+        assert pick.source.id == 2
+        assert pick.value.pick.number == 4
+        assert move.destination.name == "Flares"
+        assert move.source.name == "Wolves"
+        assert move.value.player.team == "Blaze"
+
+    async def test_ambiguous_gm_raises(self, mixin, mock_guild):
+        mixin.franchise_index = AsyncMock(return_value=self._index())
+        data = "nick receives:\n1st Round Master (4)\n---\nTinsel receives:\n2nd Round Master (9)"
+        with patch.object(utils, "get_league_role", AsyncMock(return_value=self._league_role())):
+            with pytest.raises(TradeParserException, match="ambiguous"):
+                await mixin.parse_trade_text(guild=mock_guild, data=data)
+
+    async def test_unknown_gm_raises(self, mixin, mock_guild):
+        mixin.franchise_index = AsyncMock(return_value=self._index())
+        data = "Nobody receives:\n1st Round Master (4)"
+        with patch.object(utils, "get_league_role", AsyncMock(return_value=self._league_role())):
+            with pytest.raises(TradeParserException, match="Unable to parse GM"):
+                await mixin.parse_trade_text(guild=mock_guild, data=data)
+
 
 # --- build_trade_embed Tests ---
 
@@ -1079,6 +1097,7 @@ class TestSignApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -1121,6 +1140,7 @@ class TestCutApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -1165,6 +1185,7 @@ class TestResignApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -1232,6 +1253,7 @@ class TestRetireApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -1249,6 +1271,7 @@ class TestRetireApi:
 
         result = await mixin.retire(mock_guild, mock_member, mock_executor)
         assert result is expected
+        mixin.membership_audit().invalidate.assert_called_once_with(mock_guild.id)
 
 
 class TestInactiveReserveApi:
@@ -1257,6 +1280,7 @@ class TestInactiveReserveApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -1339,6 +1363,7 @@ class TestDraftApi:
         m = _create_mixin()
         m._api_conf = {mock_guild.id: MagicMock()}
         m._league = {mock_guild.id: 1}
+        m.membership_audit = MagicMock()
         return m
 
     @patch("rsc.transactions.transactions.TransactionsApi")
@@ -0,0 +1,133 @@
+"""Tests for the event loop watchdog and the CPU pool behind `offload`.
+
+Each watchdog runs against its own `MetricsRegistry` with a short interval and
+threshold, so a deliberate `time.sleep` on the loop is a stall within a test's
+runtime and real lag from the test runner is not.
+"""
+
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from rsc.metrics import EVENT_LOOP_LAG_SECONDS, EVENT_LOOP_STALLS, MetricsRegistry
+from rsc.utils import executor
+from rsc.utils.executor import offload, shutdown_cpu_executor
+from rsc.utils.utils import resize_image
+from rsc.watchdog import LoopWatchdog
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+async def watchdog(registry):
+    dog = LoopWatchdog(interval=0.02, threshold=0.2, registry=registry)
+    dog.start()
+    yield dog
+    await dog.stop()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    yield
+    shutdown_cpu_executor()
+
+
+@pytest.fixture(scope="module")
+def large_png() -> bytes:
+    # Built before the watchdog starts, so encoding it is not a stall
+    with io.BytesIO() as buf:
+        Image.new("RGB", (4000, 4000), (200, 30, 30)).save(buf, format="PNG")
+        return buf.getvalue()
+
+
+async def blocks_the_loop(seconds: float) -> None:
+    # Deliberately blocking, the bug the watchdog exists to find
+    time.sleep(seconds)
+
+
+class TestWatchdog:
+    async def test_blocking_call_is_recorded_with_its_stack(self, watchdog, registry):
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(blocks_the_loop(0.5), name="logo-upload")
+        await asyncio.sleep(0.05)
+
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert stall.seconds >= 0.3
+        assert "logo-upload" in stall.task
+        assert "blocks_the_loop" in "".join(stall.stack)
+        assert registry.counter(EVENT_LOOP_STALLS).value == 1
+
+    async def test_idle_loop_records_lag_but_no_stalls(self, watchdog, registry):
+        await asyncio.sleep(0.3)
+
+        assert registry.histogram(EVENT_LOOP_LAG_SECONDS).count >= 5
+        assert not watchdog.stalls
+        assert registry.counter(EVENT_LOOP_STALLS).value == 0
+
+    async def test_stop_ends_the_monitor_thread(self, registry):
+        dog = LoopWatchdog(interval=0.02, registry=registry)
+        dog.start()
+        assert dog.running
+
+        await dog.stop()
+
+        assert not dog.running
+        assert not any(t.name == "rsc-loop-watchdog" for t in threading.enumerate())
+
+
+class TestOffload:
+    async def test_large_resize_does_not_stall(self, large_png, watchdog, registry):
+        results = await asyncio.gather(*(resize_image(large_png, 512, 512, "PNG") for _ in range(4)))
+
+        assert all(_png_size(r) == (512, 512) for r in results)
+        assert not watchdog.stalls
+        assert registry.histogram(EVENT_LOOP_LAG_SECONDS).max < watchdog.threshold
+
+    async def test_runs_off_the_loop_thread(self):
+        assert await offload(threading.current_thread) is not threading.current_thread()
+        assert (await offload(threading.current_thread)).name.startswith("rsc-cpu")
+
+    async def test_queue_is_bounded(self, monkeypatch):
+        # More workers than slots, so the slots are the only limit
+        monkeypatch.setattr(executor, "CPU_WORKERS", 4)
+        monkeypatch.setattr(executor, "CPU_QUEUE_LIMIT", 2)
+        shutdown_cpu_executor()
+        release = threading.Event()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            release.wait(5)
+            with lock:
+                running -= 1
+
+        tasks = [asyncio.create_task(offload(work)) for _ in range(6)]
+        await asyncio.sleep(0.1)
+        assert peak == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_pool_restarts_after_shutdown(self):
+        first = executor.cpu_executor()
+        shutdown_cpu_executor()
+
+        assert await offload(sum, [1, 2, 3]) == 6
+        assert executor.cpu_executor() is not first
+
+
+def _png_size(data: bytes) -> tuple[int, int]:
+    with Image.open(io.BytesIO(data)) as img:
+        return img.size
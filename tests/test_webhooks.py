@@ -0,0 +1,419 @@
+"""Tests for journaled webhook ingestion.
+
+Requests go through aiohttp's test client against a real `web.Application`, and
+the journal is a real file under `tmp_path`, so a restart is a fresh ingest
+reading the same file back. `LaggingGuild` stands in for a guild whose
+gateway events arrive after the REST calls that caused them return.
+"""
+
+import asyncio
+import json
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from rsc.combines.runner import CombineRunnerMixIn
+from rsc.webhooks import JournalEntry, WebhookIngest, WebhookJournal, WebhookRejectedError, WebhookRoute
+
+GUILD_ID = 395806681994493964
+
+
+def _lobby(id: int, guild_id: int = GUILD_ID) -> dict:
+    players = [
+        {"discord_id": 1000 + id * 10 + i, "rsc_id": f"RSC{id}{i}", "match_id": id, "team": "home", "name": f"p{i}"} for i in range(3)
+    ]
+    return {
+        "id": id,
+        "lobby_user": f"rsc{id}",
+        "lobby_pass": "pass",
+        "home_wins": 0,
+        "away_wins": 0,
+        "reported_rsc_id": None,
+        "confirmed_rsc_id": None,
+        "completed": False,
+        "cancelled": False,
+        "tier": "Elite",
+        "guild_id": guild_id,
+        "home": players,
+        "away": players,
+    }
+
+
+class Recorder:
+    """A route whose jobs can be held open, to stand in for slow lobby creation."""
+
+    def __init__(self):
+        self.handled: list[dict] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def prepare(self, data):
+        if data.get("reject"):
+            raise WebhookRejectedError(503, "not now")
+        if not isinstance(data.get("jobs"), list):
+            raise ValueError("jobs must be a list")
+        return data["jobs"]
+
+    async def handle(self, job):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            if job.get("fail"):
+                raise RuntimeError("boom")
+            self.handled.append(job)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "webhooks.jsonl"
+
+
+def _ingest(journal_path, recorder, **kwargs) -> WebhookIngest:
+    return WebhookIngest(WebhookJournal(journal_path, **kwargs), [WebhookRoute("jobs", recorder.prepare, recorder.handle)])
+
+
+async def _client(ingest: WebhookIngest) -> TestClient:
+    app = web.Application()
+    app.router.add_post("/jobs", ingest.handler("jobs"))
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    await ingest.start()
+    return client
+
+
+@pytest.fixture
+async def ingest(journal_path, recorder):
+    ingest = _ingest(journal_path, recorder)
+    yield ingest
+    await ingest.stop()
+
+
+@pytest.fixture
+async def client(ingest):
+    client = await _client(ingest)
+    yield client
+    await client.close()
+
+
+class TestIngest:
+    async def test_accepts_before_handling(self, client, ingest, recorder):
+        recorder.release.clear()
+
+        resp = await client.post("/jobs", json={"jobs": [{"n": 1}, {"n": 2}]})
+
+        assert resp.status == 202
+        assert await resp.json() == {"accepted": 2, "duplicates": 0}
+        assert recorder.handled == []
+
+        recorder.release.set()
+        await ingest.join()
+        assert recorder.handled == [{"n": 1}, {"n": 2}]
+
+    async def test_duplicate_is_acknowledged_once(self, client, ingest, recorder):
+        first = await client.post("/jobs", json={"jobs": [{"n": 1}]})
+        await ingest.join()
+        # Upstream timed out and retried the same body
+        retry = await client.post("/jobs", json={"jobs": [{"n": 1}, {"n": 2}]})
+        await ingest.join()
+
+        assert first.status == retry.status == 202
+        assert await retry.json() == {"accepted": 1, "duplicates": 1}
+        assert recorder.handled == [{"n": 1}, {"n": 2}]
+
+    async def test_idempotency_key_header(self, client, ingest, recorder):
+        headers = {"Idempotency-Key": "abc"}
+
+        await client.post("/jobs", json={"jobs": [{"n": 1}]}, headers=headers)
+        resp = await client.post("/jobs", json={"jobs": [{"n": 1, "retried_at": 5}]}, headers=headers)
+        await ingest.join()
+
+        assert await resp.json() == {"accepted": 0, "duplicates": 1}
+        assert recorder.handled == [{"n": 1}]
+
+    async def test_duplicate_while_in_flight(self, client, ingest, recorder):
+        recorder.release.clear()
+        await client.post("/jobs", json={"jobs": [{"n": 1}]})
+
+        resp = await client.post("/jobs", json={"jobs": [{"n": 1}]})
+        recorder.release.set()
+        await ingest.join()
+
+        assert await resp.json() == {"accepted": 0, "duplicates": 1}
+        assert len(recorder.handled) == 1
+
+    async def test_worker_pool_is_bounded(self, client, ingest, recorder):
+        recorder.release.clear()
+
+        resp = await client.post("/jobs", json={"jobs": [{"n": i} for i in range(60)]})
+        await asyncio.sleep(0.01)
+        assert recorder.in_flight == 4
+
+        recorder.release.set()
+        await ingest.join()
+        assert (await resp.json())["accepted"] == 60
+        assert len(recorder.handled) == 60
+        assert recorder.max_in_flight == 4
+
+    @pytest.mark.parametrize(
+        ("body", "status"),
+        [
+            (b"not json", 400),
+            (json.dumps({"jobs": "nope"}).encode(), 400),
+            (json.dumps({"jobs": []}).encode(), 400),
+            (json.dumps({"reject": True}).encode(), 503),
+        ],
+    )
+    async def test_rejected_requests_are_not_journaled(self, client, journal_path, body, status):
+        resp = await client.post("/jobs", data=body, headers={"Content-Type": "application/json"})
+
+        assert resp.status == status
+        assert not journal_path.exists()
+
+    async def test_failed_job_is_not_replayed(self, client, ingest, recorder, journal_path):
+        await client.post("/jobs", json={"jobs": [{"fail": True}, {"n": 1}]})
+        await ingest.join()
+        await ingest.stop()
+
+        restarted = _ingest(journal_path, recorder)
+        await restarted.start()
+        await restarted.join()
+        await restarted.stop()
+
+        assert recorder.handled == [{"n": 1}]
+
+
+class TestRecovery:
+    async def test_replays_unfinished_jobs_after_restart(self, journal_path, recorder):
+        ingest = _ingest(journal_path, recorder)
+        client = await _client(ingest)
+        recorder.release.clear()
+        try:
+            resp = await client.post("/jobs", json={"jobs": [{"n": i} for i in range(10)]})
+            assert resp.status == 202
+            # The bot goes down with every job accepted and none finished
+            await ingest.stop()
+        finally:
+            await client.close()
+
+        recorder.release.set()
+        restarted = _ingest(journal_path, recorder)
+        client = await _client(restarted)
+        try:
+            await restarted.join()
+            assert sorted(job["n"] for job in recorder.handled) == list(range(10))
+
+            # A retry that arrives after the restart is still a duplicate
+            resp = await client.post("/jobs", json={"jobs": [{"n": 3}]})
+            assert await resp.json() == {"accepted": 0, "duplicates": 1}
+        finally:
+            await restarted.stop()
+            await client.close()
+
+    async def test_torn_last_line_is_skipped(self, journal_path, recorder):
+        journal = WebhookJournal(journal_path)
+        await journal.accept([_entry("a")])
+        with journal_path.open("a") as fp:
+            fp.write('{"op":"accept","key":"b","rou')
+
+        assert [e.key for e in WebhookJournal(journal_path).load()] == ["a"]
+
+    async def test_compaction_keeps_pending_and_dedup(self, journal_path):
+        journal = WebhookJournal(journal_path, compact_after=3)
+        await journal.accept([_entry(k) for k in "abcde"])
+        for key in "abc":
+            await journal.finish(key)
+
+        assert len(journal_path.read_text().splitlines()) == 5
+        reloaded = WebhookJournal(journal_path)
+        assert [e.key for e in reloaded.load()] == ["d", "e"]
+        assert all(reloaded.seen(k) for k in "abcde")
+
+    async def test_dedup_window_is_bounded(self, journal_path):
+        journal = WebhookJournal(journal_path, dedup_window=2)
+        await journal.accept([_entry(k) for k in "abc"])
+        for key in "abc":
+            await journal.finish(key)
+
+        assert not journal.seen("a")
+        assert journal.seen("c")
+
+
+def _entry(key: str) -> JournalEntry:
+    return JournalEntry(key, "jobs", {"key": key})
+
+
+# --- Combines routes ---
+
+
+def _create_runner(**attrs):
+    saved = CombineRunnerMixIn.__abstractmethods__
+    CombineRunnerMixIn.__abstractmethods__ = frozenset()
+    try:
+        m = object.__new__(CombineRunnerMixIn)
+    finally:
+        CombineRunnerMixIn.__abstractmethods__ = saved
+    for k, v in attrs.items():
+        setattr(m, k, v)
+    return m
+
+
+@pytest.fixture
+def runner(mock_guild):
+    bot = MagicMock()
+    bot.get_guild = MagicMock(side_effect=lambda id: mock_guild if id == GUILD_ID else None)
+    return _create_runner(
+        bot=bot,
+        _get_combines_active=AsyncMock(return_value=True),
+        create_combine_lobby_channel=AsyncMock(),
+    )
+
+
+class TestCombinesRoutes:
+    async def test_match_splits_into_one_job_per_lobby(self, runner, journal_path):
+        ingest = WebhookIngest(WebhookJournal(journal_path), runner.combines_webhook_routes())
+        app = web.Application()
+        app.router.add_post("/combines_match", ingest.handler("combines_match"))
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        await ingest.start()
+        payload = {str(i): _lobby(i) for i in range(60)}
+        try:
+            resp = await client.post("/combines_match", json=payload)
+            retry = await client.post("/combines_match", json=payload)
+            await ingest.join()
+            assert resp.status == 202
+            assert await retry.json() == {"accepted": 0, "duplicates": 60}
+        finally:
+            await ingest.stop()
+            await client.close()
+
+        created = sorted(call.args[0].id for call in runner.create_combine_lobby_channel.await_args_list)
+        assert created == list(range(60))
+
+    async def test_match_refused_when_combines_unavailable(self, runner):
+        runner._get_combines_active.return_value = False
+
+        with pytest.raises(WebhookRejectedError) as exc:
+            await runner._prepare_combines_match({"1": _lobby(1)})
+        assert exc.value.status == 503
+
+        with pytest.raises(WebhookRejectedError):
+            await runner._prepare_combines_match({"1": _lobby(1, guild_id=1)})
+
+    async def test_event_validation(self, runner):
+        event = {
+            "actor": {"nickname": "nickm", "discord_id": 1},
+            "status": "success",
+            "message_type": "Finished Game",
+            "message": "done",
+            "match_id": 7,
+            "guild_id": GUILD_ID,
+        }
+
+        assert await runner._prepare_combines_event(event) == [{**event, "message_type": "Finished Game"}]
+        for changes, status in (({"match_id": None}, 400), ({"message_type": "Checked In"}, 501), ({"guild_id": 1}, 503)):
+            with pytest.raises(WebhookRejectedError) as exc:
+                await runner._prepare_combines_event({**event, **changes})
+            assert exc.value.status == status
+
+
+class LaggingGuild:
+    """Channels it creates only show up in `channels` once the gateway catches up.
+
+    Categories serve their channels from the guild's cache by category id, as
+    discord.py does, so a count taken before the gateway event undercounts.
+    """
+
+    def __init__(self):
+        self.id = GUILD_ID
+        self.name = "RSC Combines"
+        self.default_role = MagicMock()
+        self.live: list[MagicMock] = []
+        self.ids = iter(range(10_000, 20_000))
+        self.category = self._category("Combines")
+        self.live.append(self.category)
+        self.created_categories: list[str] = []
+
+    def _category(self, name: str) -> MagicMock:
+        category = MagicMock(spec=discord.CategoryChannel)
+        category.id = next(self.ids)
+        category.name = name
+        type(category).channels = property(lambda c: [ch for ch in self.live if getattr(ch, "category_id", None) == c.id])
+        category.create_voice_channel = AsyncMock(side_effect=partial(self._voice, category))
+        return category
+
+    async def _voice(self, category, name: str, **kwargs) -> MagicMock:
+        await asyncio.sleep(0)
+        channel = MagicMock(spec=discord.VoiceChannel)
+        channel.id = next(self.ids)
+        channel.name = name
+        channel.category_id = category.id
+        self._deliver(channel)
+        return channel
+
+    async def create_category(self, name: str, **kwargs) -> MagicMock:
+        await asyncio.sleep(0)
+        self.created_categories.append(name)
+        category = self._category(name)
+        self._deliver(category)
+        return category
+
+    def _deliver(self, channel) -> None:
+        asyncio.get_running_loop().call_later(0.005, self.live.append, channel)
+
+    @property
+    def channels(self):
+        return list(self.live)
+
+
+class TestLobbyCreation:
+    async def test_concurrent_lobbies_share_overflow_categories(self, journal_path):
+        guild = LaggingGuild()
+        bot = MagicMock()
+        bot.get_guild = MagicMock(return_value=guild)
+        registry = MagicMock(add=AsyncMock())
+        runner = _create_runner(
+            bot=bot,
+            _get_combines_active=AsyncMock(return_value=True),
+            _get_combines_category=AsyncMock(return_value=guild.category),
+            combine_players_from_lobby=AsyncMock(return_value=[MagicMock()]),
+            announce_combines_lobby=AsyncMock(),
+            combine_lobbies=MagicMock(return_value=registry),
+        )
+        utils = MagicMock(get_muted_role=AsyncMock(return_value=None), get_league_role=AsyncMock(return_value=MagicMock()))
+        ingest = WebhookIngest(WebhookJournal(journal_path), runner.combines_webhook_routes())
+        app = web.Application()
+        app.router.add_post("/combines_match", ingest.handler("combines_match"))
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        await ingest.start()
+        with patch("rsc.combines.runner.utils", utils):
+            try:
+                resp = await client.post("/combines_match", json={str(i): _lobby(i) for i in range(60)})
+                await ingest.join()
+            finally:
+                await ingest.stop()
+                await client.close()
+            await asyncio.sleep(0.01)
+
+        assert resp.status == 202
+
+        # 120 channels: 42 in the primary, 42 in "-2", the rest in "-3"
+        assert registry.add.await_count == 60
+        assert guild.created_categories == ["Combines-2", "Combines-3"]
+        by_category = {c.name: len(c.channels) for c in guild.live if isinstance(c, discord.CategoryChannel)}
+        assert by_category == {"Combines": 42, "Combines-2": 42, "Combines-3": 36}